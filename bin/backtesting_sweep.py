@@ -0,0 +1,76 @@
+import argparse
+import asyncio
+import logging
+import os
+
+import pandas as pd
+import path_util  # noqa: F401
+import yaml
+
+from hummingbot import data_path
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.parameter_sweep import ParameterSweep
+
+
+def parse_timestamp(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+    return int(pd.Timestamp(value, tz="UTC").timestamp())
+
+
+def load_config(config_path: str) -> dict:
+    if os.path.exists(config_path):
+        with open(config_path, "r") as file:
+            return yaml.safe_load(file)
+    return BacktestingEngineBase.load_controller_config(config_path)
+
+
+def load_grid(args: argparse.Namespace) -> dict:
+    grid = {}
+    if args.grid is not None:
+        with open(args.grid, "r") as file:
+            grid.update(yaml.safe_load(file))
+    for parameter in args.parameter:
+        name, values = parameter.split("=", 1)
+        values = yaml.safe_load(values)
+        grid[name] = values if isinstance(values, list) else [values]
+    return grid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest a grid of parameters of a controller configuration")
+    parser.add_argument("config", type=str,
+                        help="The controller configuration, a file of conf/controllers or a path.")
+    parser.add_argument("--grid", type=str, default=None,
+                        help="A yml (or json) file with the list of values to sweep by parameter.")
+    parser.add_argument("-p", "--parameter", action="append", default=[],
+                        help="The values to sweep of a parameter, e.g. -p 'take_profit=[0.01, 0.02]'.")
+    parser.add_argument("--start", type=parse_timestamp, required=True, help="Start timestamp or date.")
+    parser.add_argument("--end", type=parse_timestamp, required=True, help="End timestamp or date.")
+    parser.add_argument("--resolution", type=str, default="1m", help="The backtesting resolution.")
+    parser.add_argument("--trade-cost", type=float, default=0.0006, help="The cost per trade.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes, defaults to the number of CPUs.")
+    parser.add_argument("--results", type=str, default=None,
+                        help="The CSV results table. A sweep interrupted is resumed by running it again with the "
+                             "same results table.")
+    parser.add_argument("--no-vectorized", action="store_true",
+                        help="Simulate the executors by iterating the candles instead of the vectorized mode.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    base_config = load_config(args.config)
+    configs = ParameterSweep.expand_grid(base_config, load_grid(args))
+    results_path = args.results or os.path.join(
+        data_path(), f"sweep_{base_config.get('controller_name')}_{args.start}_{args.end}.csv")
+    sweep = ParameterSweep(configs=configs,
+                           start=args.start,
+                           end=args.end,
+                           results_path=results_path,
+                           backtesting_resolution=args.resolution,
+                           trade_cost=args.trade_cost,
+                           max_workers=args.workers,
+                           vectorized=not args.no_vectorized)
+    results = asyncio.run(sweep.run())
+    print(results.sort_values("net_pnl_quote", ascending=False).head(20).to_string(index=False))
+    print(f"\nResults of the {len(results)} configurations saved to {results_path}")
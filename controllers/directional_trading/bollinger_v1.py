@@ -1,6 +1,5 @@
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -9,6 +8,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
 )
+from hummingbot.strategy_v2.utils.indicators import BollingerBands, CandlesIndicators
 
 
 class BollingerV1ControllerConfig(DirectionalTradingControllerConfigBase):
@@ -76,6 +76,7 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = CandlesIndicators([BollingerBands(length=config.bb_length, std=config.bb_std)])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -84,7 +85,7 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+        df = self.indicators.update(df)
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
 
         # Generate signal
@@ -2,7 +2,6 @@ import time
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -14,6 +13,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
 )
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
 from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop
+from hummingbot.strategy_v2.utils.indicators import BollingerBands, CandlesIndicators
 
 
 class DManV3ControllerConfig(DirectionalTradingControllerConfigBase):
@@ -161,6 +161,7 @@ class DManV3Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = CandlesIndicators([BollingerBands(length=config.bb_length, std=config.bb_std)])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -169,7 +170,7 @@ class DManV3Controller(DirectionalTradingControllerBase):
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+        df = self.indicators.update(df)
 
         # Generate signal
         long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
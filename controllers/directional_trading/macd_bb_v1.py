@@ -1,6 +1,5 @@
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -9,6 +8,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
 )
+from hummingbot.strategy_v2.utils.indicators import MACD, BollingerBands, CandlesIndicators
 
 
 class MACDBBV1ControllerConfig(DirectionalTradingControllerConfigBase):
@@ -92,6 +92,10 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = CandlesIndicators([
+            BollingerBands(length=config.bb_length, std=config.bb_std),
+            MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal),
+        ])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -100,8 +104,7 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
+        df = self.indicators.update(df)
 
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
         macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
@@ -1,7 +1,6 @@
 from decimal import Decimal
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -11,6 +10,7 @@ from hummingbot.strategy_v2.controllers.market_making_controller_base import (
     MarketMakingControllerConfigBase,
 )
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.utils.indicators import MACD, NATR, CandlesIndicators
 
 
 class PMMDynamicControllerConfig(MarketMakingControllerConfigBase):
@@ -95,6 +95,10 @@ class PMMDynamicController(MarketMakingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = CandlesIndicators([
+            NATR(length=config.natr_length),
+            MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal),
+        ])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -102,12 +106,11 @@ class PMMDynamicController(MarketMakingControllerBase):
                                                            trading_pair=self.config.candles_trading_pair,
                                                            interval=self.config.interval,
                                                            max_records=self.max_records)
-        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=self.config.natr_length) / 100
-        macd_output = ta.macd(candles["close"], fast=self.config.macd_fast,
-                              slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        candles = self.indicators.update(candles)
+        natr = candles[f"NATR_{self.config.natr_length}"] / 100
+        macd = candles[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macd_signal = - (macd - macd.mean()) / macd.std()
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macdh = candles[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
         max_price_shift = natr / 2
         price_multiplier = ((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift).iloc[-1]
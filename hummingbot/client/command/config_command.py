@@ -87,6 +87,14 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "order_book_recording_enabled",
+                             "json_codec",
+                             "connection_pool",
+                             "connection_limit_per_host",
+                             "keepalive_timeout",
+                             "dns_cache_ttl",
+                             "per_host_sessions",
+                             "candles_cache",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
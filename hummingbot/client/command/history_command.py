@@ -3,12 +3,12 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceTracker
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -17,6 +17,12 @@ from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
+# Relative difference tolerated between the incremental and the recalculated performance (the trades database stores
+# the prices and amounts as floats)
+PERFORMANCE_VERIFICATION_TOLERANCE = Decimal("1e-8")
+PERFORMANCE_VERIFICATION_FIELDS = ("num_buys", "num_sells", "b_vol_base", "s_vol_base", "b_vol_quote", "s_vol_quote",
+                                   "start_price", "cur_price", "hold_value", "cur_value", "trade_pnl", "fee_in_quote",
+                                   "total_pnl", "return_pct")
 
 
 if TYPE_CHECKING:
@@ -31,16 +37,30 @@ class HistoryCommand:
     def history(self,  # type: HummingbotApplication
                 days: float = 0,
                 verbose: bool = False,
-                precision: Optional[int] = None
+                precision: Optional[int] = None,
+                verify: bool = False
                 ):
+        """
+        Reports the performance of the current session from the trades accumulated by the markets recorder. The
+        performance since a number of days ago, or when `verify` is set, is recalculated from the trades database.
+        """
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.history, days, verbose, precision)
+            self.ev_loop.call_soon_threadsafe(self.history, days, verbose, precision, verify)
             return
 
         if self.strategy_file_name is None:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        performance_tracker = self._session_performance_tracker() if days == 0 else None
+        if performance_tracker is not None and not verify:
+            if performance_tracker.num_trades == 0:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.performance_report(start_time, performance_tracker, precision))
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -51,7 +71,10 @@ class HistoryCommand:
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            if verify and performance_tracker is not None:
+                safe_ensure_future(self.verify_performance_report(start_time, trades, performance_tracker, precision))
+            else:
+                safe_ensure_future(self.history_report(start_time, trades, precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -70,21 +93,126 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
+        performances = await self._recalculate_performances(trades)
+        return self._report_performances(start_time, performances, precision, display_report)
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 performance_tracker: PerformanceTracker,
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
+        performances = await self._tracked_performances(performance_tracker)
+        return self._report_performances(start_time, performances, precision, display_report)
+
+    async def verify_performance_report(self,  # type: HummingbotApplication
+                                        start_time: float,
+                                        trades: List[TradeFill],
+                                        performance_tracker: PerformanceTracker,
+                                        precision: Optional[int] = None) -> List[str]:
+        """
+        Reports the performance recalculated from all the trades, and compares it with the incrementally accumulated
+        performance.
+        :return: the differences found
+        """
+        performances = await self._recalculate_performances(trades)
+        self._report_performances(start_time, performances, precision, display_report=True)
+        tracked_performances = await self._tracked_performances(performance_tracker)
+
+        differences = []
+        for market, symbol in sorted(set(performances) | set(tracked_performances)):
+            perf = performances.get((market, symbol))
+            tracked_perf = tracked_performances.get((market, symbol))
+            if perf is None or tracked_perf is None:
+                differences.append(f"{market} / {symbol}: the trades are only in the "
+                                   f"{'recalculated' if tracked_perf is None else 'incremental'} performance")
+                continue
+            for field in PERFORMANCE_VERIFICATION_FIELDS:
+                value, tracked_value = Decimal(getattr(perf, field)), Decimal(getattr(tracked_perf, field))
+                if abs(value - tracked_value) > PERFORMANCE_VERIFICATION_TOLERANCE * max(abs(value), Decimal("1")):
+                    differences.append(f"{market} / {symbol}: {field} is {tracked_value} incrementally and {value} "
+                                       f"recalculated")
+            if dict(perf.fees) != dict(tracked_perf.fees):
+                differences.append(f"{market} / {symbol}: fees are {dict(tracked_perf.fees)} incrementally and "
+                                   f"{dict(perf.fees)} recalculated")
+
+        if differences:
+            self.notify("\nThe incremental performance differs from the recalculated performance:\n  " +
+                        "\n  ".join(differences))
+        else:
+            self.notify(f"\nThe incremental performance matches the recalculated performance of {len(trades)} trades.")
+        return differences
+
+    async def get_performance_json(self,  # type: HummingbotApplication
+                                   ) -> Dict[str, Any]:
+        """
+        The performance of each market of the current session, as accumulated by the markets recorder.
+        """
+        performance_tracker = self._session_performance_tracker()
+        if performance_tracker is None:
+            return {}
+        performances = await self._tracked_performances(performance_tracker)
+        return {
+            "start_timestamp": performance_tracker.start_timestamp,
+            "num_trades": performance_tracker.num_trades,
+            "markets": [
+                {
+                    "market": market,
+                    "trading_pair": symbol,
+                    "num_trades": perf.num_trades,
+                    "tot_vol_base": str(perf.tot_vol_base),
+                    "tot_vol_quote": str(perf.tot_vol_quote),
+                    "trade_pnl": str(perf.trade_pnl),
+                    "fees": {token: str(amount) for token, amount in perf.fees.items()},
+                    "total_pnl": str(perf.total_pnl),
+                    "return_pct": str(perf.return_pct),
+                }
+                for (market, symbol), perf in performances.items()
+            ],
+        }
+
+    def _session_performance_tracker(self,  # type: HummingbotApplication
+                                     ) -> Optional[PerformanceTracker]:
+        return self.markets_recorder.performance_tracker if self.markets_recorder is not None else None
+
+    async def _recalculate_performances(self,  # type: HummingbotApplication
+                                        trades: List[TradeFill]) -> Dict[Tuple[str, str], PerformanceMetrics]:
         market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        performances = {}
+        for market, symbol in market_info:
+            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+            cur_balances = await self._get_current_balances_for_report(market)
+            performances[(market, symbol)] = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+        return performances
+
+    async def _tracked_performances(self,  # type: HummingbotApplication
+                                    performance_tracker: PerformanceTracker
+                                    ) -> Dict[Tuple[str, str], PerformanceMetrics]:
+        performances = {}
+        for (market, symbol), performance in list(performance_tracker.accumulators.items()):
+            cur_balances = await self._get_current_balances_for_report(market)
+            performances[(market, symbol)] = await performance.metrics(cur_balances)
+        return performances
+
+    async def _get_current_balances_for_report(self,  # type: HummingbotApplication
+                                               market: str) -> Dict[str, Decimal]:
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            return await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+
+    def _report_performances(self,  # type: HummingbotApplication
+                             start_time: float,
+                             performances: Dict[Tuple[str, str], PerformanceMetrics],
+                             precision: Optional[int] = None,
+                             display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+        for (market, symbol), perf in performances.items():
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -206,15 +334,8 @@ class HistoryCommand:
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
-        start_time = self.init_time
-
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
-        return avg_return
+        return await self.performance_report(self.init_time, self.markets_recorder.performance_tracker,
+                                             display_report=False)
 
     def list_trades(self,  # type: HummingbotApplication
                     start_time: float):
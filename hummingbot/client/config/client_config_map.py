@@ -26,6 +26,12 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionPoolSettings,
+    set_default_connection_pool_settings,
+)
+from hummingbot.core.web_assistant.connections.json_codec import AUTO_JSON_CODEC, JSON_CODECS, set_default_json_codec
+from hummingbot.data_feed.candles_feed.candles_store import build_default_candles_store, set_default_candles_store
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 if TYPE_CHECKING:
@@ -33,6 +39,7 @@ if TYPE_CHECKING:
 
 PMM_SCRIPT_ENABLED_KEY = "pmm_script_enabled"
 PMM_SCRIPT_FILE_PATH_KEY = "pmm_script_file_path"
+JSON_CODEC_NAMES = [AUTO_JSON_CODEC] + list(JSON_CODECS)
 
 
 def generate_client_id() -> str:
@@ -168,11 +175,92 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    order_book_recording_enabled: bool = Field(
+        default=False,
+        description="Record every order book snapshot, diff and trade received in binary files (data/order_book_records)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the recording of every order book snapshot, diff and trade"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
 
+class ConnectionPoolConfigMap(BaseClientModel):
+    connection_limit_per_host: int = Field(
+        default=ConnectionPoolSettings.limit_per_host,
+        ge=0,
+        description="Maximum number of simultaneous connections to a single exchange host (0 for no limit)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of simultaneous connections to a single host (Default=50, 0 for no limit)"
+            ),
+        ),
+    )
+    keepalive_timeout: float = Field(
+        default=ConnectionPoolSettings.keepalive_timeout,
+        ge=0,
+        description="Seconds an idle connection is kept open to be reused (0 to close the connections after each"
+                    " request)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time in seconds idle connections are kept open to be reused (Default=30)"
+            ),
+        ),
+    )
+    dns_cache_ttl: int = Field(
+        default=ConnectionPoolSettings.dns_cache_ttl,
+        ge=0,
+        description="Seconds the resolved exchange host addresses are cached (0 to disable the cache)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time in seconds the DNS resolutions are cached (Default=300)"
+            ),
+        ),
+    )
+    per_host_sessions: bool = Field(
+        default=ConnectionPoolSettings.per_host_sessions,
+        description="Use a separate connection pool for each exchange host",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Use a separate connection pool for each exchange host? (Yes/No)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "connection_pool"
+
+    @validator("per_host_sessions", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+    # === post-validations ===
+
+    @root_validator()
+    def post_validations(cls, values: Dict):
+        cls.connection_pool_on_validated(values)
+        return values
+
+    @classmethod
+    def connection_pool_on_validated(cls, values: Dict):
+        if all(key in values for key in cls.__fields__):
+            set_default_connection_pool_settings(ConnectionPoolSettings(
+                limit_per_host=values["connection_limit_per_host"],
+                keepalive_timeout=values["keepalive_timeout"],
+                dns_cache_ttl=values["dns_cache_ttl"],
+                per_host_sessions=values["per_host_sessions"],
+            ))
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -1066,6 +1154,29 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    json_codec: ClientConfigEnum(
+        value="JSONCodecs",  # noqa: F821
+        names={e: e for e in JSON_CODEC_NAMES},
+        type=str,
+    ) = Field(
+        default=AUTO_JSON_CODEC,
+        description=("JSON library used to encode and decode the messages exchanged with the exchanges"
+                     f" ({'/'.join(JSON_CODEC_NAMES)})."
+                     f"\n{AUTO_JSON_CODEC} selects the fastest one installed. The standard json library is used if the"
+                     " selected one is not installed."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: f"Which JSON library do you want to use? ({'/'.join(JSON_CODEC_NAMES)})",
+        ),
+    )
+    connection_pool: ConnectionPoolConfigMap = Field(default=ConnectionPoolConfigMap())
+    candles_cache: bool = Field(
+        default=True,
+        description=("Whether to keep the historical candles fetched from the exchanges on disk (in the data folder)"
+                     " to only fetch the missing candles the next time"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to keep the historical candles fetched on disk? (Yes/No)",
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -1100,7 +1211,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", "candles_cache", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -1161,6 +1272,13 @@ class ClientConfigMap(BaseClientModel):
         """Used for client-friendly error output."""
         return super().validate_decimal(v, field)
 
+    @validator("json_codec", pre=True)
+    def validate_json_codec(cls, v: str):
+        """Used for client-friendly error output."""
+        if v not in JSON_CODEC_NAMES:
+            raise ValueError(f"Invalid JSON library, please choose a value from {JSON_CODEC_NAMES}.")
+        return v
+
     @validator("tick_size", pre=True)
     def validate_tick_size(cls, v: float):
         """Used for client-friendly error output."""
@@ -1174,6 +1292,8 @@ class ClientConfigMap(BaseClientModel):
     @root_validator()
     def post_validations(cls, values: Dict):
         cls.rate_oracle_source_on_validated(values)
+        cls.json_codec_on_validated(values)
+        cls.candles_cache_on_validated(values)
         return values
 
     @classmethod
@@ -1181,3 +1301,13 @@ class ClientConfigMap(BaseClientModel):
         rate_source_mode: RateSourceModeBase = values["rate_oracle_source"]
         RateOracle.get_instance().source = rate_source_mode.build_rate_source()
         RateOracle.get_instance().quote_token = values["global_token"].global_token_name
+
+    @classmethod
+    def json_codec_on_validated(cls, values: Dict):
+        if "json_codec" in values:
+            set_default_json_codec(values["json_codec"])
+
+    @classmethod
+    def candles_cache_on_validated(cls, values: Dict):
+        if "candles_cache" in values:
+            set_default_candles_store(build_default_candles_store() if values["candles_cache"] else None)
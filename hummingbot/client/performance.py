@@ -6,7 +6,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
-from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
+from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -196,6 +197,12 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_totals_and_averages()
+
+        return buys, sells
+
+    def _calculate_totals_and_averages(self):
+        self.num_trades = self.num_buys + self.num_sells
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +213,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +253,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +310,38 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_portfolio_values(trading_pair=trading_pair,
+                                               current_balances=current_balances,
+                                               start_price=Decimal(str(trades[0].price)),
+                                               last_price=Decimal(str(trades[-1].price)))
+        # The fees are calculated first, since aggregating the derivative orders changes the price and amount of
+        # their first fill
+        await self._calculate_fees(quote, trades)
+
+        self._calculate_trade_pnl(buys, sells)
+
+        self._calculate_total_pnl()
+
+    async def _calculate_portfolio_values(self,
+                                          trading_pair: str,
+                                          current_balances: Dict[str, Decimal],
+                                          start_price: Decimal,
+                                          last_price: Decimal):
+        """
+        Calculates the balances and portfolio values at the start and now, from the current balances and the volumes
+        :param start_price: the price of the first trade
+        :param last_price: the price of the last trade, used if the rate oracle does not have the current price
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +349,290 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
 
+    def _calculate_total_pnl(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class _PositionOrder:
+    """
+    The fills of a derivative order, aggregated as PerformanceMetrics.aggregate_orders does: the average of the fill
+    prices and the sum of the fill amounts.
+    """
+    __slots__ = ("position", "price_sum", "fills", "amount", "index")
+
+    def __init__(self, position: str, index: int):
+        self.position = position
+        self.price_sum = s_decimal_0
+        self.fills = 0
+        self.amount = s_decimal_0
+        self.index = index
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills
+
+
+class PerformanceAccumulator:
+    """
+    Performance of the trades of one market trading pair, updated one fill at a time.
+
+    It keeps the sums the performance metrics are derived from: the number of trades and the volumes, the fees paid
+    per token and the P&L of the closed derivative positions. `metrics` completes them with the current balances and
+    price, so its cost does not depend on the number of trades. The result is the same as `PerformanceMetrics.create`
+    with all the trades, which is kept to verify it.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair = trading_pair
+        self.num_buys = 0
+        self.num_sells = 0
+        self.b_vol_base = s_decimal_0
+        self.s_vol_base = s_decimal_0
+        self.b_vol_quote = s_decimal_0
+        self.s_vol_quote = s_decimal_0
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        self.last_fill_timestamp = 0
+        self.closed_positions_pnl = s_decimal_0
+        self._buys_without_position = 0
+        self._sells_without_position = 0
+        # Aggregated derivative orders by side and order id, and by side and position in order of arrival
+        self._position_orders: Dict[Tuple[bool, str], _PositionOrder] = {}
+        self._orders_by_position: Dict[Tuple[bool, str], List[_PositionOrder]] = defaultdict(list)
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        return ((self.num_buys > 0 and self._buys_without_position == 0)
+                or (self.num_sells > 0 and self._sells_without_position == 0))
+
+    def add_fill(self,
+                 order_id: str,
+                 trade_type: TradeType,
+                 price: Decimal,
+                 amount: Decimal,
+                 trade_fee: TradeFeeBase,
+                 position: Optional[str] = None,
+                 timestamp: int = 0):
+        """
+        Adds a trade to the performance
+        :param timestamp: the trade timestamp in milliseconds
+        """
+        _, quote = split_hb_trading_pair(self.trading_pair)
+        position = position or PositionAction.NIL.value
+        is_buy = trade_type == TradeType.BUY
+        if is_buy:
+            self.num_buys += 1
+            self._buys_without_position += position == PositionAction.NIL.value
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+        elif trade_type == TradeType.SELL:
+            self.num_sells += 1
+            self._sells_without_position += position == PositionAction.NIL.value
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+        if isinstance(trade_fee, DeductedFromReturnsTradeFee):
+            self.s_vol_quote -= amount * price * trade_fee.percent
+
+        self.fees[quote] += price * amount * trade_fee.percent
+        for flat_fee in trade_fee.flat_fees:
+            self.fees[flat_fee.token] += flat_fee.amount
+
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+        self.last_fill_timestamp = max(self.last_fill_timestamp, timestamp)
+
+        is_position_trade = position in (PositionAction.OPEN.value, PositionAction.CLOSE.value)
+        if is_position_trade and (is_buy or trade_type == TradeType.SELL):
+            self._add_position_fill(is_buy=is_buy, order_id=order_id, position=position, price=price, amount=amount)
+
+    def add_trade_fill(self, trade: TradeFill):
+        self.add_fill(order_id=trade.order_id,
+                      trade_type=TradeType[trade.trade_type.upper()],
+                      price=Decimal(str(trade.price)),
+                      amount=Decimal(str(trade.amount)),
+                      trade_fee=TradeFeeBase.from_json(trade.trade_fee),
+                      position=trade.position,
+                      timestamp=trade.timestamp)
+
+    async def metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        _, quote = split_hb_trading_pair(self.trading_pair)
+        performance = PerformanceMetrics()
+        performance.num_buys = self.num_buys
+        performance.num_sells = self.num_sells
+        performance.b_vol_base = self.b_vol_base
+        performance.s_vol_base = self.s_vol_base
+        performance.b_vol_quote = self.b_vol_quote
+        performance.s_vol_quote = self.s_vol_quote
+        performance._calculate_totals_and_averages()
+
+        if self.num_trades > 0:
+            await performance._calculate_portfolio_values(trading_pair=self.trading_pair,
+                                                          current_balances=current_balances,
+                                                          start_price=self.start_price,
+                                                          last_price=self.last_price)
+        performance.trade_pnl = (self.closed_positions_pnl
+                                 if self.is_derivative
+                                 else performance.cur_value - performance.hold_value)
+
+        performance.fees.update(self.fees)
+        await performance._calculate_fee_in_quote(quote)
+        performance._calculate_total_pnl()
+        return performance
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "start_price": None if self.start_price is None else str(self.start_price),
+            "last_price": None if self.last_price is None else str(self.last_price),
+            "last_fill_timestamp": self.last_fill_timestamp,
+            "buys_without_position": self._buys_without_position,
+            "sells_without_position": self._sells_without_position,
+            "position_orders": [
+                [is_buy, order_id, order.position, str(order.price_sum), order.fills, str(order.amount)]
+                for (is_buy, order_id), order in self._position_orders.items()
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceAccumulator":
+        accumulator = PerformanceAccumulator(trading_pair=data["trading_pair"])
+        accumulator.num_buys = data["num_buys"]
+        accumulator.num_sells = data["num_sells"]
+        accumulator.b_vol_base = Decimal(data["b_vol_base"])
+        accumulator.s_vol_base = Decimal(data["s_vol_base"])
+        accumulator.b_vol_quote = Decimal(data["b_vol_quote"])
+        accumulator.s_vol_quote = Decimal(data["s_vol_quote"])
+        accumulator.fees.update({token: Decimal(amount) for token, amount in data["fees"].items()})
+        accumulator.start_price = None if data["start_price"] is None else Decimal(data["start_price"])
+        accumulator.last_price = None if data["last_price"] is None else Decimal(data["last_price"])
+        accumulator.last_fill_timestamp = data["last_fill_timestamp"]
+        accumulator._buys_without_position = data["buys_without_position"]
+        accumulator._sells_without_position = data["sells_without_position"]
+        for is_buy, order_id, position, price_sum, fills, amount in data["position_orders"]:
+            order = accumulator._position_order(is_buy=is_buy, order_id=order_id, position=position)
+            order.price_sum = Decimal(price_sum)
+            order.fills = fills
+            order.amount = Decimal(amount)
+        accumulator.closed_positions_pnl = sum(
+            (accumulator._pair_pnl(is_long=is_long, index=index)
+             for is_long in (True, False)
+             for index in range(len(accumulator._orders_by_position[(not is_long, PositionAction.CLOSE.value)]))),
+            s_decimal_0)
+        return accumulator
+
+    def _position_order(self, is_buy: bool, order_id: str, position: str) -> _PositionOrder:
+        order = self._position_orders.get((is_buy, order_id))
+        if order is None:
+            orders = self._orders_by_position[(is_buy, position)]
+            order = _PositionOrder(position=position, index=len(orders))
+            orders.append(order)
+            self._position_orders[(is_buy, order_id)] = order
+        return order
+
+    def _add_position_fill(self, is_buy: bool, order_id: str, position: str, price: Decimal, amount: Decimal):
+        """
+        The open and close orders are paired in order of arrival, as PerformanceMetrics.position_order does: the n-th
+        buy opening a position with the n-th sell closing one (long positions), and the n-th sell opening a position
+        with the n-th buy closing one (short positions). Only the P&L of the pair of the order changes.
+        """
+        order = self._position_order(is_buy=is_buy, order_id=order_id, position=position)
+        is_long = is_buy == (order.position == PositionAction.OPEN.value)
+        previous_pair_pnl = self._pair_pnl(is_long=is_long, index=order.index)
+        order.price_sum += price
+        order.fills += 1
+        order.amount += amount
+        self.closed_positions_pnl += self._pair_pnl(is_long=is_long, index=order.index) - previous_pair_pnl
+
+    def _pair_pnl(self, is_long: bool, index: int) -> Decimal:
+        open_orders = self._orders_by_position[(is_long, PositionAction.OPEN.value)]
+        close_orders = self._orders_by_position[(not is_long, PositionAction.CLOSE.value)]
+        if index >= len(open_orders) or index >= len(close_orders):
+            return s_decimal_0
+        open_order, close_order = open_orders[index], close_orders[index]
+        if open_order.fills == 0 or close_order.fills == 0:
+            return s_decimal_0
+        price_difference = close_order.price - open_order.price
+        return (price_difference if is_long else -price_difference) * close_order.amount
+
+
+class PerformanceTracker:
+    """
+    Performance of the trades of a strategy in each of its markets and trading pairs, fed with the order filled
+    events so that the trades do not have to be reloaded to report it.
+    """
+
+    def __init__(self, start_timestamp: int):
+        """
+        :param start_timestamp: the timestamp in milliseconds of the first trades tracked
+        """
+        self.start_timestamp = start_timestamp
+        self._accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceAccumulator]:
+        """
+        :return: the performance of each market and trading pair with trades
+        """
+        return self._accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    @property
+    def last_fill_timestamp(self) -> int:
+        return max((accumulator.last_fill_timestamp for accumulator in self._accumulators.values()), default=0)
+
+    def add_order_filled_event(self, market: str, event: OrderFilledEvent, timestamp: int):
+        """
+        :param market: the display name of the connector
+        :param timestamp: the fill timestamp in milliseconds
+        """
+        self._accumulator(market, event.trading_pair).add_fill(
+            order_id=event.order_id,
+            trade_type=event.trade_type,
+            price=Decimal(str(event.price)),
+            amount=Decimal(str(event.amount)),
+            trade_fee=event.trade_fee,
+            position=event.position,
+            timestamp=timestamp)
+
+    def add_trade_fill(self, trade: TradeFill):
+        self._accumulator(trade.market, trade.symbol).add_trade_fill(trade)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "start_timestamp": self.start_timestamp,
+            "markets": [[market, accumulator.to_json()]
+                        for (market, _), accumulator in self._accumulators.items()],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceTracker":
+        tracker = PerformanceTracker(start_timestamp=data["start_timestamp"])
+        for market, accumulator_data in data["markets"]:
+            accumulator = PerformanceAccumulator.from_json(accumulator_data)
+            tracker._accumulators[(market, accumulator.trading_pair)] = accumulator
+        return tracker
+
+    def _accumulator(self, market: str, trading_pair: str) -> PerformanceAccumulator:
+        accumulator = self._accumulators.get((market, trading_pair))
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(trading_pair=trading_pair)
+            self._accumulators[(market, trading_pair)] = accumulator
+        return accumulator
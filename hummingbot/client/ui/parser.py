@@ -90,6 +90,8 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
                                 dest="verbose", help="List all trades")
     history_parser.add_argument("-p", "--precision", default=None, type=int,
                                 dest="precision", help="Level of precions for values displayed")
+    history_parser.add_argument("--verify", action="store_true", default=False, dest="verify",
+                                help="Recalculate the performance from all the trades and compare it")
     history_parser.set_defaults(func=hummingbot.history)
 
     gateway_parser = subparsers.add_parser("gateway", help="Helper comands for Gateway server.")
@@ -1,9 +1,9 @@
 import asyncio
 import logging
 from collections import defaultdict
+from collections.abc import ItemsView, Mapping, ValuesView
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
 from cachetools import TTLCache
 
@@ -29,6 +29,68 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersView(Mapping):
+    """
+    Read-only view of the orders of one or more dictionaries of the tracker, mapped by client order ID.
+
+    The lookups go to the underlying dictionaries without copying them. The iterations go over a snapshot of the
+    orders taken when they start, so the tracker can keep updating the orders while the view is iterated (e.g. around
+    an await).
+    """
+
+    __slots__ = ("_maps",)
+
+    def __init__(self, *maps: Mapping):
+        self._maps = maps
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        for orders in self._maps:
+            if client_order_id in orders:
+                return orders[client_order_id]
+        raise KeyError(client_order_id)
+
+    def __contains__(self, client_order_id) -> bool:
+        return any(client_order_id in orders for orders in self._maps)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([client_order_id for client_order_id, _ in self._items()])
+
+    def __len__(self) -> int:
+        if len(self._maps) == 1:
+            return len(self._maps[0])
+        return len(self._items())
+
+    def __repr__(self) -> str:
+        return repr(dict(self._items()))
+
+    def copy(self) -> Dict[str, InFlightOrder]:
+        return dict(self._items())
+
+    def items(self) -> ItemsView:
+        return _OrdersItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _OrdersValuesView(self)
+
+    def _items(self) -> List[Tuple[str, InFlightOrder]]:
+        if len(self._maps) == 1:
+            return list(self._maps[0].items())
+        items = {}
+        for orders in self._maps:
+            items.update(orders.items())
+        return list(items.items())
+
+
+class _OrdersItemsView(ItemsView):
+    def __iter__(self):
+        return iter(self._mapping._items())
+
+
+class _OrdersValuesView(ValuesView):
+    def __iter__(self):
+        return iter([order for _, order in self._mapping._items()])
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -61,6 +123,14 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        self._last_order_update_timestamps: Dict[str, float] = {}
+
+        # Secondary indexes of the orders tracked with start_tracking_order. The entries of the orders no longer tracked
+        # (e.g. evicted from the cache) are ignored by the lookups and swept when they outnumber the tracked orders.
+        self._indexed_orders: Dict[str, InFlightOrder] = {}
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -70,53 +140,47 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return OrdersView(self._cached_orders)
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return OrdersView(self._in_flight_orders, self._cached_orders)
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return OrdersView(self._in_flight_orders, self._cached_orders, self._lost_orders)
 
     @property
     def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
+        To look up a single order prefer `fetch_order_by_exchange_order_id`, that does not build the dictionary.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return {order.exchange_order_id: order for order in self.all_fillable_orders.values()}
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return OrdersView(self._in_flight_orders, self._lost_orders)
 
     @property
     def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return {order.exchange_order_id: order for order in self.all_updatable_orders.values()}
 
     @property
     def current_timestamp(self) -> int:
@@ -126,11 +190,11 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return OrdersView(self._lost_orders)
 
     @property
     def lost_order_count_limit(self) -> int:
@@ -142,6 +206,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -149,6 +214,7 @@ class ClientOrderTracker:
             del self._in_flight_orders[client_order_id]
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
+            self._last_order_update_timestamps.pop(client_order_id, None)
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -162,6 +228,14 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
+
+    def last_order_update_timestamp(self, client_order_id: str) -> Optional[float]:
+        """
+        Returns the timestamp when the last status update of the active order was processed, whatever its source
+        (order creation or cancelation response, user stream event, status request). None if no update was processed.
+        """
+        return self._last_order_update_timestamps.get(client_order_id)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -174,12 +248,14 @@ class ClientOrderTracker:
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
+        if client_order_id in self._in_flight_orders:
+            found_order = self._in_flight_orders[client_order_id]
+        elif client_order_id in self._cached_orders:
+            found_order = self._cached_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+            order = self._fetch_indexed_order(exchange_order_id=exchange_order_id)
+            if order is not None and order is self.all_orders.get(order.client_order_id):
+                found_order = order
 
         return found_order
 
@@ -191,12 +267,33 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            order = self._fetch_indexed_order(exchange_order_id=exchange_order_id)
+            if order is not None and order is self._lost_orders.get(order.client_order_id):
+                found_order = order
 
         return found_order
 
+    def fetch_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Looks up the order with the exchange order ID among the fillable orders (active, cached and lost orders).
+        """
+        order = self._fetch_indexed_order(exchange_order_id=exchange_order_id)
+        if order is not None and order is not self.all_fillable_orders.get(order.client_order_id):
+            order = None
+        return order
+
+    def fetch_orders_by_trading_pair(self, trading_pair: str) -> Dict[str, InFlightOrder]:
+        """
+        Returns the fillable orders (active, cached and lost orders) of the trading pair, mapped by client order ID.
+        """
+        self._reindex_if_outdated()
+        fillable_orders = self.all_fillable_orders
+        return {
+            client_order_id: order
+            for client_order_id, order in list(self._orders_by_trading_pair.get(trading_pair, {}).items())
+            if order is fillable_orders.get(client_order_id)
+        }
+
     def process_order_update(self, order_update: OrderUpdate):
         return safe_ensure_future(self._process_order_update(order_update))
 
@@ -288,9 +385,11 @@ class ClientOrderTracker:
                     )
 
             previous_state: OrderState = tracked_order.current_state
-
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                # Recorded before the completion, that stops tracking the order
+                if tracked_order.client_order_id in self._in_flight_orders:
+                    self._last_order_update_timestamps[tracked_order.client_order_id] = self.current_timestamp
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -439,6 +538,61 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _index_order(self, order: InFlightOrder):
+        self._indexed_orders[order.client_order_id] = order
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        self._orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        if len(self._indexed_orders) > 2 * max(self._tracked_order_count(), self.MAX_CACHE_SIZE):
+            self._reindex()
+
+    def _tracked_order_count(self) -> int:
+        return len(self._in_flight_orders) + len(self._cached_orders) + len(self._lost_orders)
+
+    def _reindex(self):
+        """
+        Rebuilds the indexes from the tracked orders, dropping the entries of the orders no longer tracked.
+        """
+        orders = list(self.all_fillable_orders.values())
+        self._indexed_orders.clear()
+        self._orders_by_exchange_order_id.clear()
+        self._orders_without_exchange_order_id.clear()
+        self._orders_by_trading_pair.clear()
+        for order in orders:
+            self._indexed_orders[order.client_order_id] = order
+            if order.exchange_order_id is None:
+                self._orders_without_exchange_order_id[order.client_order_id] = order
+            else:
+                self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            self._orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+
+    def _reindex_if_outdated(self):
+        # Orders added to the dictionaries directly, instead of with start_tracking_order, are not indexed yet
+        if self._tracked_order_count() > len(self._indexed_orders):
+            self._reindex()
+
+    def _fetch_indexed_order(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Looks up an indexed order by exchange order ID. The caller checks the order is still tracked.
+        """
+        self._reindex_if_outdated()
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is not None and order.exchange_order_id != exchange_order_id:
+            # The exchange order ID of the order changed after it was indexed
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+            order = None
+        if order is None and len(self._orders_without_exchange_order_id) > 0:
+            # The exchange order IDs are usually assigned after the orders start being tracked
+            for client_order_id, pending_order in list(self._orders_without_exchange_order_id.items()):
+                if pending_order.exchange_order_id is not None:
+                    del self._orders_without_exchange_order_id[client_order_id]
+                    self._orders_by_exchange_order_id[pending_order.exchange_order_id] = pending_order
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        return order
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from contextlib import nullcontext
 from decimal import Decimal
 from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
@@ -348,6 +349,14 @@ cdef class ConnectorBase(NetworkIterator):
         for order in orders_to_cancel:
             self.cancel(trading_pair=order.trading_pair, client_order_id=order.client_order_id)
 
+    def batched_orders(self):
+        """
+        Returns a context manager grouping the orders created and cancelled while it is open into batch requests, for
+        the exchanges that implement this feature. The default implementation sends the requests discretely (one by
+        one) as they are issued.
+        """
+        return nullcontext()
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
@@ -557,7 +557,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         Example Trade:
         """
         exchange_order_id = str(trade.get("oid", ""))
-        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracked_order = self._order_tracker.fetch_order_by_exchange_order_id(exchange_order_id)
 
         if tracked_order is None:
             all_orders = self._order_tracker.all_fillable_orders
@@ -54,6 +54,21 @@ class BinanceAuth(AuthBase):
 
         return request_params
 
+    def add_ws_api_auth_to_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds the API key, the server time and the signature to the parameters of a WebSocket API request. The
+        signature of the WebSocket API is calculated with the parameters sorted by name.
+        :param params: the parameters of the request
+        """
+        request_params = dict(params)
+        request_params["apiKey"] = self.api_key
+        request_params["timestamp"] = int(self.time_provider.time() * 1e3)
+
+        request_params = OrderedDict(sorted(request_params.items()))
+        request_params["signature"] = self._generate_signature(params=request_params)
+
+        return request_params
+
     def header_for_authentication(self) -> Dict[str, str]:
         return {"X-MBX-APIKEY": self.api_key}
 
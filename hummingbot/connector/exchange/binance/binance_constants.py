@@ -9,6 +9,7 @@ MAX_ORDER_ID_LEN = 32
 # Base URL
 REST_URL = "https://api.binance.{}/api/"
 WSS_URL = "wss://stream.binance.{}:9443/ws"
+WSS_API_URL = "wss://ws-api.binance.{}:443/ws-api/v3"
 
 PUBLIC_API_VERSION = "v3"
 PRIVATE_API_VERSION = "v3"
@@ -27,6 +28,10 @@ MY_TRADES_PATH_URL = "/myTrades"
 ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
+# WebSocket API methods, they share the rate limits of the equivalent REST endpoints
+WS_API_ORDER_PLACE_METHOD = "order.place"
+WS_API_ORDER_CANCEL_METHOD = "order.cancel"
+
 WS_HEARTBEAT_TIME_INTERVAL = 30
 
 # Binance params
@@ -25,6 +25,7 @@ from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_request_transport import WSRequestTransport
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -42,10 +43,12 @@ class BinanceExchange(ExchangePyBase):
                  trading_pairs: Optional[List[str]] = None,
                  trading_required: bool = True,
                  domain: str = CONSTANTS.DEFAULT_DOMAIN,
+                 binance_ws_order_entry: bool = False,
                  ):
         self.api_key = binance_api_key
         self.secret_key = binance_api_secret
         self._domain = domain
+        self._ws_order_entry = binance_ws_order_entry
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
         self._last_trades_poll_binance_timestamp = 1.0
@@ -159,6 +162,14 @@ class BinanceExchange(ExchangePyBase):
             domain=self.domain,
         )
 
+    def _create_ws_order_entry_transport(self) -> Optional[WSRequestTransport]:
+        if not self._ws_order_entry:
+            return None
+        return WSRequestTransport(
+            api_factory=self._web_assistants_factory,
+            ws_url=web_utils.wss_api_url(domain=self._domain),
+            ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+
     def _get_fee(self,
                  base_currency: str,
                  quote_currency: str,
@@ -179,20 +190,13 @@ class BinanceExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
         order_result = None
-        amount_str = f"{amount:f}"
-        type_str = BinanceExchange.binance_order_type(order_type)
-        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        api_params = {"symbol": symbol,
-                      "side": side_str,
-                      "quantity": amount_str,
-                      "type": type_str,
-                      "newClientOrderId": order_id}
-        if order_type is OrderType.LIMIT or order_type is OrderType.LIMIT_MAKER:
-            price_str = f"{price:f}"
-            api_params["price"] = price_str
-        if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        api_params = await self._order_api_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price)
 
         try:
             order_result = await self._api_post(
@@ -212,6 +216,56 @@ class BinanceExchange(ExchangePyBase):
                 raise
         return o_id, transact_time
 
+    async def _place_order_through_ws(self,
+                                      transport: WSRequestTransport,
+                                      order_id: str,
+                                      trading_pair: str,
+                                      amount: Decimal,
+                                      trade_type: TradeType,
+                                      order_type: OrderType,
+                                      price: Decimal,
+                                      **kwargs) -> Tuple[str, float]:
+        api_params = await self._order_api_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price)
+        response = await self._ws_api_request(
+            transport=transport,
+            method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+            params=api_params,
+            throttler_limit_id=CONSTANTS.ORDER_PATH_URL)
+        if response.get("status") == 503:
+            # The request reached the exchange, but the result of the order creation is unknown
+            return "UNKNOWN", self._time_synchronizer.time()
+        order_result = self._ws_api_result(method=CONSTANTS.WS_API_ORDER_PLACE_METHOD, response=response)
+        return str(order_result["orderId"]), order_result["transactTime"] * 1e-3
+
+    async def _order_api_params(self,
+                                order_id: str,
+                                trading_pair: str,
+                                amount: Decimal,
+                                trade_type: TradeType,
+                                order_type: OrderType,
+                                price: Decimal) -> Dict[str, Any]:
+        amount_str = f"{amount:f}"
+        type_str = BinanceExchange.binance_order_type(order_type)
+        side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        api_params = {"symbol": symbol,
+                      "side": side_str,
+                      "quantity": amount_str,
+                      "type": type_str,
+                      "newClientOrderId": order_id}
+        if order_type is OrderType.LIMIT or order_type is OrderType.LIMIT_MAKER:
+            price_str = f"{price:f}"
+            api_params["price"] = price_str
+        if order_type == OrderType.LIMIT:
+            api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         api_params = {
@@ -226,6 +280,40 @@ class BinanceExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_cancel_through_ws(self,
+                                       transport: WSRequestTransport,
+                                       order_id: str,
+                                       tracked_order: InFlightOrder) -> bool:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
+        api_params = {
+            "symbol": symbol,
+            "origClientOrderId": order_id,
+        }
+        response = await self._ws_api_request(
+            transport=transport,
+            method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD,
+            params=api_params,
+            throttler_limit_id=CONSTANTS.ORDER_PATH_URL)
+        cancel_result = self._ws_api_result(method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD, response=response)
+        return cancel_result.get("status") == "CANCELED"
+
+    async def _ws_api_request(self,
+                              transport: WSRequestTransport,
+                              method: str,
+                              params: Dict[str, Any],
+                              throttler_limit_id: str) -> Dict[str, Any]:
+        # The request is signed after the throttler wait, the timestamp must be within the exchange receive window
+        return await transport.request(
+            payload=lambda: {"method": method, "params": self._auth.add_ws_api_auth_to_params(params=params)},
+            throttler_limit_id=throttler_limit_id)
+
+    @staticmethod
+    def _ws_api_result(method: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        if response.get("status") != 200:
+            raise IOError(f"Error executing WebSocket API request {method}. Status is {response.get('status')}. "
+                          f"Error: {response.get('error')}")
+        return response["result"]
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
         Example:
@@ -1,9 +1,10 @@
 from decimal import Decimal
 from typing import Any, Dict
 
-from pydantic import Field, SecretStr
+from pydantic import Field, SecretStr, validator
 
 from hummingbot.client.config.config_data_types import BaseConnectorConfigMap, ClientFieldData
+from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 CENTRALIZED = True
@@ -58,10 +59,28 @@ class BinanceConfigMap(BaseConnectorConfigMap):
             prompt_on_new=True,
         )
     )
+    binance_ws_order_entry: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Do you want to place and cancel the orders through the WebSocket API? (Yes/No)",
+            is_secure=False,
+            is_connect_key=True,
+            prompt_on_new=False,
+        )
+    )
 
     class Config:
         title = "binance"
 
+    @validator("binance_ws_order_entry", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 KEYS = BinanceConfigMap.construct()
 
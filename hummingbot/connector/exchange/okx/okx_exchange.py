@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -96,6 +96,14 @@ class OkxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.BATCH_ORDERS_MAX_SIZE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.BATCH_ORDERS_MAX_SIZE
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -185,6 +193,65 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        exchange_order_id = await self._api_request(
+            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+        )
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        results_by_order_id = {result["clOrdId"]: result for result in response["data"]}
+        results = []
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            if result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response}"))
+            elif result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {result['sMsg']}"))
+            else:
+                results.append((str(result["ordId"]), self.current_timestamp))
+        return results
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, str]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cash",
@@ -198,18 +265,7 @@ class OkxExchange(ExchangePyBase):
         else:
             # Specify that the the order quantity for market orders is denominated in base currency
             data["tgtCcy"] = "base_ccy"
-
-        exchange_order_id = await self._api_request(
-            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
-            method=RESTMethod.POST,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
-        )
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -237,6 +293,30 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+            }
+            for order in orders
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        results_by_order_id = {result["clOrdId"]: result for result in response["data"]}
+        results = []
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            # 51400 and 51401: the order does not exist or has already been cancelled
+            if result is not None and result["sCode"] in ("0", "51400", "51401"):
+                results.append(True)
+            else:
+                results.append(IOError(f"Error cancelling order {order.client_order_id}: {result or response}"))
+        return results
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.exchange.paper_trade.fill_model import FillModel
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
@@ -16,9 +17,13 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
         raise Exception(f"Connector {connector_name} OrderBookTracker class not found ({exception})")
 
 
-def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
+def create_paper_trade_market(exchange_name: str,
+                              client_config_map: ClientConfigAdapter,
+                              trading_pairs: List[str],
+                              fill_model: Optional[FillModel] = None):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
     return PaperTradeExchange(client_config_map,
                               tracker,
                               get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+                              exchange_name=exchange_name,
+                              fill_model=fill_model)
@@ -0,0 +1,211 @@
+import math
+import random
+from typing import Dict, Optional, Sequence
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+
+class LatencyDistribution:
+    """
+    Distribution of a latency, in seconds. The samples are drawn from a seeded generator, so that the replays of a
+    backtest are deterministic.
+    """
+
+    def __init__(self, seed: Optional[int] = 0):
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        raise NotImplementedError
+
+
+class ConstantLatency(LatencyDistribution):
+    def __init__(self, latency: float):
+        super().__init__()
+        self._latency = latency
+
+    def sample(self) -> float:
+        return self._latency
+
+
+class LogNormalLatency(LatencyDistribution):
+    """
+    Log-normal latency, the usual shape of network round trips: most samples close to the median, with a long tail.
+    """
+
+    def __init__(self, median: float, sigma: float, minimum: float = 0.0, seed: Optional[int] = 0):
+        """
+        :param median: median of the latency above the minimum
+        :param sigma: standard deviation of the logarithm of the latency, the longer the tail the higher
+        :param minimum: latency that is always incurred
+        """
+        super().__init__(seed)
+        self._mu = math.log(median)
+        self._sigma = sigma
+        self._minimum = minimum
+
+    def sample(self) -> float:
+        return self._minimum + self._random.lognormvariate(self._mu, self._sigma)
+
+
+class EmpiricalLatency(LatencyDistribution):
+    """
+    Resamples measured latencies, e.g. the order creation and cancellation round trips of a live bot.
+    """
+
+    def __init__(self, samples: Sequence[float], seed: Optional[int] = 0):
+        super().__init__(seed)
+        if len(samples) == 0:
+            raise ValueError("At least one latency sample is required.")
+        self._samples = list(samples)
+
+    def sample(self) -> float:
+        return self._random.choice(self._samples)
+
+
+class FillModel:
+    """
+    Decides when the limit orders of the paper trade exchange are filled.
+
+    The default model fills a limit order as soon as it is crossed: when a trade prints through its price, or when the
+    opposite side of the order book reaches its price. The orders are placed and cancelled without latency.
+    """
+
+    def add_order(self, order_id: str, trading_pair: str, is_buy: bool, price: float, amount: float, timestamp: float):
+        """
+        Called when a limit order is placed.
+        """
+        pass
+
+    def remove_order(self, order_id: str):
+        """
+        Called when a limit order is filled or cancelled.
+        """
+        pass
+
+    def cancel_latency(self) -> float:
+        """
+        :return: the delay before a cancel request removes the order, the order can still be filled in the meantime
+        """
+        return 0.0
+
+    def update(self, timestamp: float, order_books: Dict[str, OrderBook]):
+        """
+        Called on every tick of the paper trade exchange, before the crossed limit orders are filled.
+        """
+        pass
+
+    def is_filled_by_trade(self,
+                           order_id: str,
+                           is_buy: bool,
+                           price: float,
+                           trade: OrderBookTradeEvent,
+                           order_book: OrderBook) -> bool:
+        """
+        Called for the limit orders at the trade price or crossed by it, on the side the trade takes liquidity from.
+        """
+        return price > float(trade.price) if is_buy else price < float(trade.price)
+
+    def is_filled_by_cross(self, order_id: str, timestamp: float) -> bool:
+        """
+        Called for the limit orders crossed by the opposite side of the order book.
+        """
+        return True
+
+
+class _QueuedOrder:
+    __slots__ = ("trading_pair", "is_buy", "price", "amount", "active_at", "queue_ahead", "level_amount", "filled")
+
+    def __init__(self, trading_pair: str, is_buy: bool, price: float, amount: float, active_at: float):
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.amount = amount
+        self.active_at = active_at
+        self.queue_ahead: Optional[float] = None
+        self.level_amount = 0.0
+        self.filled = 0.0
+
+
+class QueuePositionFillModel(FillModel):
+    """
+    Fills the limit orders according to their estimated position in the queue of their price level.
+
+    An order reaches the exchange after the order entry latency. Its queue position is then the amount of the order
+    book at its price, the orders placed later at the same price are behind it. The trades at its price consume the
+    queue ahead first, and the order is filled once the amount traded behind the queue covers it. The cancels at the
+    level, seen as a level amount decreasing more than the trades explain, move the order up the queue in proportion
+    of the queue ahead of it. A trade through the price or a crossed book fills the order at once.
+    """
+
+    def __init__(self,
+                 order_entry_latency: Optional[LatencyDistribution] = None,
+                 cancel_latency: Optional[LatencyDistribution] = None):
+        self._order_entry_latency = order_entry_latency
+        self._cancel_latency = cancel_latency
+        self._orders: Dict[str, _QueuedOrder] = {}
+
+    def queue_ahead(self, order_id: str) -> Optional[float]:
+        """
+        :return: the amount ahead of the order in the queue of its price level, None if it has not reached the
+            exchange yet
+        """
+        order = self._orders.get(order_id)
+        return None if order is None else order.queue_ahead
+
+    def add_order(self, order_id: str, trading_pair: str, is_buy: bool, price: float, amount: float, timestamp: float):
+        latency = 0.0 if self._order_entry_latency is None else self._order_entry_latency.sample()
+        self._orders[order_id] = _QueuedOrder(trading_pair, is_buy, price, amount, timestamp + latency)
+
+    def remove_order(self, order_id: str):
+        self._orders.pop(order_id, None)
+
+    def cancel_latency(self) -> float:
+        return 0.0 if self._cancel_latency is None else self._cancel_latency.sample()
+
+    def update(self, timestamp: float, order_books: Dict[str, OrderBook]):
+        for order in self._orders.values():
+            order_book = order_books.get(order.trading_pair)
+            if order_book is None:
+                continue
+            if order.queue_ahead is None:
+                if timestamp >= order.active_at:
+                    self._enter_queue(order, order_book)
+                continue
+            level_amount = order_book.get_level_amount(order.is_buy, order.price)
+            if level_amount < order.level_amount:
+                cancelled = order.level_amount - level_amount
+                order.queue_ahead -= cancelled * order.queue_ahead / order.level_amount
+            order.queue_ahead = min(order.queue_ahead, level_amount)
+            order.level_amount = level_amount
+
+    def is_filled_by_trade(self,
+                           order_id: str,
+                           is_buy: bool,
+                           price: float,
+                           trade: OrderBookTradeEvent,
+                           order_book: OrderBook) -> bool:
+        order = self._orders.get(order_id)
+        if order is None:
+            return super().is_filled_by_trade(order_id, is_buy, price, trade, order_book)
+        if trade.timestamp < order.active_at:
+            return False
+        if order.queue_ahead is None:
+            self._enter_queue(order, order_book)
+        if price != float(trade.price):
+            return True
+        amount = float(trade.amount)
+        order.filled += max(amount - order.queue_ahead, 0.0)
+        order.queue_ahead = max(order.queue_ahead - amount, 0.0)
+        # The level decreases by the amount traded when the order book diff arrives, that is not a cancel
+        order.level_amount = max(order.level_amount - amount, 0.0)
+        return order.filled >= order.amount
+
+    def is_filled_by_cross(self, order_id: str, timestamp: float) -> bool:
+        order = self._orders.get(order_id)
+        return order is None or timestamp >= order.active_at
+
+    @staticmethod
+    def _enter_queue(order: _QueuedOrder, order_book: OrderBook):
+        order.level_amount = order_book.get_level_amount(order.is_buy, order.price)
+        order.queue_ahead = order.level_amount
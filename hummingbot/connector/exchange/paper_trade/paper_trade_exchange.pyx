@@ -1,6 +1,7 @@
 # distutils: sources=['hummingbot/core/cpp/Utils.cpp', 'hummingbot/core/cpp/LimitOrder.cpp', 'hummingbot/core/cpp/OrderExpirationEntry.cpp']
 
 import asyncio
+import heapq
 import math
 import random
 from collections import defaultdict, deque
@@ -14,6 +15,7 @@ from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.fill_model import FillModel
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -157,6 +159,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        fill_model: Optional[FillModel] = None,
     ):
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
@@ -173,6 +176,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._fill_model = fill_model or FillModel()
+        # Cancel requests waiting for the cancel latency: (due timestamp, trading pair, client order id)
+        self._pending_cancels = []
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -238,6 +244,14 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             return False
 
+    @property
+    def fill_model(self) -> FillModel:
+        return self._fill_model
+
+    @fill_model.setter
+    def fill_model(self, fill_model: FillModel):
+        self._fill_model = fill_model
+
     @property
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
@@ -317,7 +331,9 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
+        self.c_process_pending_cancels(timestamp)
         self.c_process_market_orders()
+        self._fill_model.update(timestamp, self.order_books)
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -370,6 +386,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._fill_model.add_order(order_id, trading_pair_str, True, float(quantized_price),
+                                       float(quantized_amount), self._current_timestamp)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -430,6 +448,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._fill_model.add_order(order_id, trading_pair_str, False, float(quantized_price),
+                                       float(quantized_amount), self._current_timestamp)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -629,6 +649,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            self._fill_model.remove_order(deref(orders_it).getClientOrderID().decode("utf8"))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -870,7 +891,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                 inc(orders_it)
 
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            cpp_limit_order_ptr = address(deref(orders_it))
+            if self._fill_model.is_filled_by_cross(cpp_limit_order_ptr.getClientOrderID().decode("utf8"),
+                                                   self._current_timestamp):
+                self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
@@ -893,7 +917,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
-        Trigger limit orders when incoming market orders have crossed the limit order's price.
+        Trigger limit orders when incoming market orders have reached the limit order's price, as decided by the fill
+        model.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -912,6 +937,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        if len(self._pending_cancels) > 0:
+            self.c_process_pending_cancels(order_book_trade_event.timestamp)
+            map_it = limit_orders_map_ptr.find(cpp_trading_pair)
         if map_it == limit_orders_map_ptr.end():
             return
 
@@ -920,7 +948,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() < trade_price:
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -929,13 +957,22 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() > trade_price:
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        if process_order_its.size() == 0:
+            return
+        order_book = self.order_books.get(order_book_trade_event.trading_pair)
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+            cpp_limit_order_ptr = address(deref(orders_it))
+            if self._fill_model.is_filled_by_trade(cpp_limit_order_ptr.getClientOrderID().decode("utf8"),
+                                                   is_maker_buy,
+                                                   float(<object>cpp_limit_order_ptr.getPrice()),
+                                                   order_book_trade_event,
+                                                   order_book):
+                self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
     # </editor-fold>
 
@@ -999,6 +1036,23 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error(f"Error canceling order.", exc_info=True)
 
     cdef c_cancel(self, str trading_pair_str, str client_order_id):
+        cdef:
+            double cancel_latency = self._fill_model.cancel_latency()
+        if cancel_latency > 0:
+            heapq.heappush(self._pending_cancels,
+                           (self._current_timestamp + cancel_latency, trading_pair_str, client_order_id))
+        else:
+            self.c_cancel_limit_order(trading_pair_str, client_order_id)
+
+    cdef c_process_pending_cancels(self, double timestamp):
+        cdef:
+            str trading_pair_str
+            str client_order_id
+        while len(self._pending_cancels) > 0 and self._pending_cancels[0][0] <= timestamp:
+            _, trading_pair_str, client_order_id = heapq.heappop(self._pending_cancels)
+            self.c_cancel_limit_order(trading_pair_str, client_order_id)
+
+    cdef c_cancel_limit_order(self, str trading_pair_str, str client_order_id):
         cdef:
             string cpp_trading_pair = trading_pair_str.encode("utf8")
             string cpp_client_order_id = client_order_id.encode("utf8")
@@ -418,7 +418,7 @@ class PolkadexExchange(ExchangePyBase):
             self._order_tracker.process_order_update(order_update=order_update_to_process)
 
     def _process_user_trade_update(self, trade_update: TradeUpdate):
-        tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(trade_update.exchange_order_id)
+        tracked_order = self._order_tracker.fetch_order_by_exchange_order_id(trade_update.exchange_order_id)
 
         if tracked_order is not None:
             self.logger().debug(f"Processing trade update {trade_update}\nFillable order {tracked_order.to_json()}")
@@ -3,8 +3,10 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -14,12 +16,14 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -31,12 +35,32 @@ from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_request_transport import WSRequestNotSentError, WSRequestTransport
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
 
+class _OrderBatch:
+    """
+    The orders created and cancelled by a task in a batched_orders context.
+    """
+    __slots__ = ("orders_to_create", "orders_to_cancel", "task")
+
+    def __init__(self):
+        self.orders_to_create: List[Dict[str, Any]] = []
+        self.orders_to_cancel: List[Tuple[str, str]] = []
+        self.task: Optional[asyncio.Task] = self.current_task()
+
+    @staticmethod
+    def current_task() -> Optional[asyncio.Task]:
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None
+
+
 class ExchangePyBase(ExchangeBase, ABC):
     _logger = None
 
@@ -45,12 +69,17 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of order status or order fills requests in flight at once, the throttler paces them
+    MAX_CONCURRENT_ORDER_UPDATE_REQUESTS = 20
+    # Active orders whose status was confirmed more recently are not requested while the user stream is alive
+    ORDER_UPDATE_CONFIRMATION_INTERVAL = 30.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
 
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
+        self._last_trades_poll_timestamp: Optional[float] = None
         self._trading_rules = {}
         self._trading_fees = {}
 
@@ -62,7 +91,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = SlidingWindowThrottler(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -70,6 +99,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        self._ws_order_entry_transport: Optional[WSRequestTransport] = None
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
@@ -83,6 +113,10 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        # Orders created and cancelled in a batched_orders context, sent in batches when the context exits. Each task
+        # has its own batch, the orders of other tasks are never held by it
+        self._order_batch: ContextVar[Optional[_OrderBatch]] = ContextVar(f"order_batch_{id(self)}", default=None)
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -149,6 +183,22 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        The maximum number of orders the exchange accepts in a single order creation request. 0 if the exchange has no
+        batch order creation endpoint, the orders are then created one by one.
+        """
+        return 0
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        The maximum number of orders the exchange accepts in a single order cancelation request. 0 if the exchange has
+        no batch order cancelation endpoint, the orders are then cancelled one by one.
+        """
+        return 0
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -280,14 +330,14 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        self._schedule_order_creation(
             trade_type=TradeType.BUY,
             order_id=order_id,
             trading_pair=trading_pair,
             amount=amount,
             order_type=order_type,
             price=price,
-            **kwargs))
+            **kwargs)
         return order_id
 
     def sell(self,
@@ -310,14 +360,14 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
+        self._schedule_order_creation(
             trade_type=TradeType.SELL,
             order_id=order_id,
             trading_pair=trading_pair,
             amount=amount,
             order_type=order_type,
             price=price,
-            **kwargs))
+            **kwargs)
         return order_id
 
     def get_fee(self,
@@ -354,9 +404,56 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         :return: the client id of the order to cancel
         """
-        safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
+        batch = self._current_order_batch()
+        if batch is not None and self.batch_order_cancel_max_size > 0:
+            batch.orders_to_cancel.append((trading_pair, client_order_id))
+        else:
+            safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates the orders with as few requests as the exchange batch order creation endpoint allows. The orders are
+        sent one by one if the exchange has no such endpoint.
+
+        :param orders_to_create: the orders to create, their client ids can be blank
+
+        :return: the orders to create, with the client ids assigned by the connector
+        """
+        with self.batched_orders():
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels the orders with as few requests as the exchange batch order cancelation endpoint allows. The orders are
+        cancelled one by one if the exchange has no such endpoint.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        with self.batched_orders():
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+
+    @contextmanager
+    def batched_orders(self) -> Iterator[None]:
+        """
+        The orders created with buy and sell, and cancelled with cancel, while the context is open are not sent right
+        away. When the outermost context exits they are sent grouped in requests of up to batch_order_create_max_size
+        and batch_order_cancel_max_size orders. Without batch endpoints the orders are sent one by one, as usual.
+        The orders are batched per asyncio task, the context only holds the orders of the task that opened it.
+        """
+        if self._current_order_batch() is not None:
+            yield
+            return
+        batch = _OrderBatch()
+        token = self._order_batch.set(batch)
+        try:
+            yield
+        finally:
+            self._order_batch.reset(token)
+            self._send_batched_orders(batch)
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -366,7 +463,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
+        if self.batch_order_cancel_max_size > 0:
+            tasks = [self._execute_order_cancel_batch(orders=orders)
+                     for orders in self._split_in_batches(incomplete_orders, self.batch_order_cancel_max_size)]
+        else:
+            tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
@@ -376,10 +477,11 @@ class ExchangePyBase(ExchangeBase, ABC):
                 for cr in cancellation_results:
                     if isinstance(cr, Exception):
                         continue
-                    client_order_id = cr
-                    if client_order_id is not None:
-                        order_id_set.remove(client_order_id)
-                        successful_cancellations.append(CancellationResult(client_order_id, True))
+                    # The batch cancelations return the list of the cancelled orders
+                    for client_order_id in (cr if isinstance(cr, list) else [cr]):
+                        if client_order_id is not None:
+                            order_id_set.remove(client_order_id)
+                            successful_cancellations.append(CancellationResult(client_order_id, True))
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.",
@@ -407,6 +509,47 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = self._start_tracking_and_validate_new_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    def _start_tracking_and_validate_new_order(self,
+                                               trade_type: TradeType,
+                                               order_id: str,
+                                               trading_pair: str,
+                                               amount: Decimal,
+                                               order_type: OrderType,
+                                               price: Optional[Decimal] = None,
+                                               **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking a new order, with its price and amount quantized, and checks it against the trading rules
+
+        :return: the order to send to the exchange, None if the order is invalid (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,48 +576,35 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            return None
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        with request_priority(RequestPriority.CREATE):
+            exchange_order_id, update_timestamp = await self._place_order_with_ws_fallback(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -487,6 +617,44 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return exchange_order_id
 
+    async def _place_order_with_ws_fallback(self,
+                                            order_id: str,
+                                            trading_pair: str,
+                                            amount: Decimal,
+                                            trade_type: TradeType,
+                                            order_type: OrderType,
+                                            price: Decimal,
+                                            **kwargs) -> Tuple[str, float]:
+        """
+        Places the order through the websocket order entry transport if the connector has one connected, and through
+        the REST API otherwise or when the request could not be sent through the websocket
+        """
+        transport = self._ws_order_entry_transport
+        if transport is not None and transport.is_connected:
+            try:
+                return await self._place_order_through_ws(
+                    transport=transport,
+                    order_id=order_id,
+                    trading_pair=trading_pair,
+                    amount=amount,
+                    trade_type=trade_type,
+                    order_type=order_type,
+                    price=price,
+                    **kwargs,
+                )
+            except WSRequestNotSentError as exception:
+                self.logger().warning(f"The order {order_id} could not be sent through the websocket ({exception}). "
+                                      f"Sending it through the REST API.")
+        return await self._place_order(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+
     def _on_order_failure(
         self,
         order_id: str,
@@ -501,7 +669,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self.logger().network(
             f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
             f"{amount} {trading_pair} {price}.",
-            exc_info=True,
+            exc_info=exception,
             app_warning_msg=f"Failed to submit {trade_type.name.upper()} order to {self.name_cap}. Check API key and network connection."
         )
         self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
@@ -522,37 +690,59 @@ class ExchangePyBase(ExchangeBase, ABC):
                 return order.client_order_id
         except asyncio.CancelledError:
             raise
-        except asyncio.TimeoutError:
+        except Exception as ex:
+            await self._on_order_cancelation_failure(order=order, exception=ex)
+
+    async def _on_order_cancelation_failure(self, order: InFlightOrder, exception: Exception):
+        if isinstance(exception, asyncio.TimeoutError):
             # some exchanges do not allow cancels with the client/user order id
             # so log a warning and wait for the creation of the order to complete
             self.logger().warning(
                 f"Failed to cancel the order {order.client_order_id} because it does not have an exchange order id yet"
             )
             await self._order_tracker.process_order_not_found(order.client_order_id)
-        except Exception as ex:
-            if self._is_order_not_found_during_cancelation_error(cancelation_exception=ex):
-                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
-                await self._order_tracker.process_order_not_found(order.client_order_id)
-            else:
-                self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
+        elif self._is_order_not_found_during_cancelation_error(cancelation_exception=exception):
+            self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+            await self._order_tracker.process_order_not_found(order.client_order_id)
+        else:
+            self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=exception)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.CANCEL):
+            cancelled = await self._place_cancel_with_ws_fallback(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._update_order_after_cancelation(order=order)
         return cancelled
 
+    async def _place_cancel_with_ws_fallback(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        """
+        Cancels the order through the websocket order entry transport if the connector has one connected, and through
+        the REST API otherwise or when the request could not be sent through the websocket
+        """
+        transport = self._ws_order_entry_transport
+        if transport is not None and transport.is_connected:
+            try:
+                return await self._place_cancel_through_ws(
+                    transport=transport, order_id=order_id, tracked_order=tracked_order)
+            except WSRequestNotSentError as exception:
+                self.logger().warning(f"The cancelation of {order_id} could not be sent through the websocket "
+                                      f"({exception}). Sending it through the REST API.")
+        return await self._place_cancel(order_id, tracked_order)
+
+    def _update_order_after_cancelation(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -567,6 +757,118 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    # === Batch orders placing ===
+
+    def _schedule_order_creation(self, **order_params):
+        batch = self._current_order_batch()
+        if batch is not None and self.batch_order_create_max_size > 0:
+            batch.orders_to_create.append(order_params)
+        else:
+            safe_ensure_future(self._create_order(**order_params))
+
+    def _current_order_batch(self) -> Optional[_OrderBatch]:
+        batch = self._order_batch.get()
+        # The tasks created in a batched_orders context inherit its batch, but their orders are not held by it
+        if batch is not None and batch.task is _OrderBatch.current_task():
+            return batch
+        return None
+
+    def _send_batched_orders(self, batch: _OrderBatch):
+        orders_to_create = batch.orders_to_create
+        orders_to_cancel = batch.orders_to_cancel
+        # A single order does not need the batch endpoints
+        if len(orders_to_create) == 1:
+            safe_ensure_future(self._create_order(**orders_to_create[0]))
+        elif len(orders_to_create) > 1:
+            safe_ensure_future(self._create_orders_in_batches(orders_params=orders_to_create))
+        if len(orders_to_cancel) == 1:
+            safe_ensure_future(self._execute_cancel(*orders_to_cancel[0]))
+        elif len(orders_to_cancel) > 1:
+            safe_ensure_future(self._cancel_orders_in_batches(order_ids=[order_id for _, order_id in orders_to_cancel]))
+
+    @staticmethod
+    def _split_in_batches(orders: List[InFlightOrder], batch_size: int) -> List[List[InFlightOrder]]:
+        return [orders[i:i + batch_size] for i in range(0, len(orders), batch_size)]
+
+    def _results_for_each_order(self, orders: List[InFlightOrder], results: List[Any]) -> List[Any]:
+        # The orders without a result in the batch response are considered failed, instead of being left untouched
+        if len(results) != len(orders):
+            self.logger().warning(f"The batch response has {len(results)} results for {len(orders)} orders.")
+            missing_result = IOError("The batch response does not include a result for the order")
+            results = list(results[:len(orders)]) + [missing_result] * (len(orders) - len(results))
+        return results
+
+    async def _create_orders_in_batches(self, orders_params: List[Dict[str, Any]]):
+        # The orders are tracked before the first await, so that they can be cancelled in the meantime
+        orders = []
+        for order_params in orders_params:
+            order = self._start_tracking_and_validate_new_order(**order_params)
+            if order is not None:
+                orders.append(order)
+        await safe_gather(*[self._execute_order_create_batch(orders=batch)
+                            for batch in self._split_in_batches(orders, self.batch_order_create_max_size)])
+
+    async def _execute_order_create_batch(self, orders: List[InFlightOrder]):
+        try:
+            with request_priority(RequestPriority.CREATE):
+                results = await self._place_orders_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            results = [ex] * len(orders)
+        results = self._results_for_each_order(orders=orders, results=results)
+
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=result,
+                )
+            else:
+                exchange_order_id, update_timestamp = result
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    async def _cancel_orders_in_batches(self, order_ids: List[str]):
+        orders = [order for order in map(self._order_tracker.fetch_tracked_order, order_ids) if order is not None]
+        await safe_gather(*[self._execute_order_cancel_batch(orders=batch)
+                            for batch in self._split_in_batches(orders, self.batch_order_cancel_max_size)])
+
+    async def _execute_order_cancel_batch(self, orders: List[InFlightOrder]) -> List[str]:
+        """
+        Cancels the orders with a single request
+
+        :return: the client ids of the orders cancelled
+        """
+        try:
+            with request_priority(RequestPriority.CANCEL):
+                results = await self._place_cancels_batch(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            results = [ex] * len(orders)
+        results = self._results_for_each_order(orders=orders, results=results)
+
+        cancelled_order_ids = []
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                await self._on_order_cancelation_failure(order=order, exception=result)
+            elif result:
+                self._update_order_after_cancelation(order=order)
+                cancelled_order_ids.append(order.client_order_id)
+        return cancelled_order_ids
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +942,59 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    def _create_ws_order_entry_transport(self) -> Optional[WSRequestTransport]:
+        """
+        Connectors that accept order entry through a websocket return the transport to use, and implement
+        _place_order_through_ws and _place_cancel_through_ws. Orders go through the REST API while it is not connected.
+        """
+        return None
+
+    async def _place_order_through_ws(self,
+                                      transport: WSRequestTransport,
+                                      order_id: str,
+                                      trading_pair: str,
+                                      amount: Decimal,
+                                      trade_type: TradeType,
+                                      order_type: OrderType,
+                                      price: Decimal,
+                                      **kwargs,
+                                      ) -> Tuple[str, float]:
+        """
+        Same as _place_order, using the websocket order entry transport. WSRequestNotSentError must be propagated for
+        the order to be sent through the REST API.
+        """
+        raise NotImplementedError
+
+    async def _place_cancel_through_ws(self,
+                                       transport: WSRequestTransport,
+                                       order_id: str,
+                                       tracked_order: InFlightOrder) -> bool:
+        """
+        Same as _place_cancel, using the websocket order entry transport. WSRequestNotSentError must be propagated
+        for the cancelation to be sent through the REST API.
+        """
+        raise NotImplementedError
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with a single request. Only called if batch_order_create_max_size is not 0, with at most
+        that many orders.
+
+        :return: for each order, in the same order, the exchange order id and the creation timestamp, or the exception
+            describing why the order was rejected
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with a single request. Only called if batch_order_cancel_max_size is not 0, with at most
+        that many orders.
+
+        :return: for each order, in the same order, True if the order was cancelled, or the exception describing why
+            the cancelation failed
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -664,6 +1019,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The polling loops to update the trading rules and trading fees
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
+        - The websocket order entry connection, for the connectors that support it
         """
         self._stop_network()
         self.order_book_tracker.start()
@@ -674,6 +1030,9 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            self._ws_order_entry_transport = self._create_ws_order_entry_transport()
+            if self._ws_order_entry_transport is not None:
+                self._ws_order_entry_transport.start()
 
     async def stop_network(self):
         """
@@ -713,6 +1072,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._user_stream_tracker_task is not None:
             self._user_stream_tracker_task.cancel()
             self._user_stream_tracker_task = None
+        if self._ws_order_entry_transport is not None:
+            self._ws_order_entry_transport.stop()
+            self._ws_order_entry_transport = None
         if self._user_stream_event_listener_task is not None:
             self._user_stream_event_listener_task.cancel()
             self._user_stream_event_listener_task = None
@@ -777,7 +1139,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                with request_priority(RequestPriority.STATUS_POLLING):
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -816,7 +1179,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.STATUS_POLLING):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -893,6 +1257,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             return_err: bool = False,
             limit_id: Optional[str] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
             **kwargs,
     ) -> Dict[str, Any]:
 
@@ -912,6 +1277,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                     return_err=return_err,
                     throttler_limit_id=limit_id if limit_id else path_url,
                     headers=headers,
+                    priority=priority,
                 )
 
                 return request_result
@@ -937,7 +1303,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _update_all_balances(self):
         try:
-            await self._update_balances()
+            with request_priority(RequestPriority.BALANCE):
+                await self._update_balances()
             if not self.real_time_balance_update:
                 # This is only required for exchanges that do not provide balance update notifications through websocket
                 self._in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.in_flight_orders.items()}
@@ -951,18 +1318,56 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        if len(orders) == 0:
+            return
+        if await self._update_all_orders_fills_since_last_poll(orders=orders):
+            return
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS)
+
+        async def update_order_fills(order: InFlightOrder):
+            async with semaphore:
+                try:
+                    trade_updates = await self._all_trade_updates_for_order(order=order)
+                    for trade_update in trade_updates:
+                        self._order_tracker.process_trade_update(trade_update)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as request_error:
+                    self.logger().warning(
+                        f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                        exc_info=request_error,
+                    )
+
+        await safe_gather(*[update_order_fills(order) for order in orders])
+
+    async def _update_all_orders_fills_since_last_poll(self, orders: List[InFlightOrder]) -> bool:
+        """
+        Processes the trades of the account since the previous poll with a single bulk request, when the connector
+        supports it (see `_all_trade_updates_since`).
+
+        :return: True if the fills were updated, False if they have to be requested order by order
+        """
+        since = self._last_trades_poll_timestamp
+        if since is None:
+            since = min(order.creation_timestamp for order in orders)
+        poll_timestamp = self._time_synchronizer.time()
+        try:
+            trade_updates = await self._all_trade_updates_since(timestamp=since)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the trade updates since {since}. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return False
+        if trade_updates is None:
+            return False
+        for trade_update in trade_updates:
+            self._order_tracker.process_trade_update(trade_update)
+        self._last_trades_poll_timestamp = max(self._last_trades_poll_timestamp or since, poll_timestamp)
+        return True
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -991,25 +1396,83 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+        if len(orders) == 0:
+            return
+        orders = await self._update_orders_with_bulk_request(orders=orders)
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS)
+
+        async def update_order(order: InFlightOrder):
+            async with semaphore:
+                try:
+                    order_update = await self._request_order_status(tracked_order=order)
+                    self._order_tracker.process_order_update(order_update)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as request_error:
+                    await error_handler(order, request_error)
+
+        await safe_gather(*[update_order(order) for order in orders])
+
+    async def _update_orders_with_bulk_request(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Processes the status updates the connector gets for the orders with a bulk request (see
+        `_request_orders_status`).
+
+        :return: the orders without status update, to request one by one
+        """
+        try:
+            order_updates = await self._request_orders_status(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of {len(orders)} orders at once. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+        updated_client_order_ids = set()
+        updated_exchange_order_ids = set()
+        for order_update in order_updates:
+            self._order_tracker.process_order_update(order_update)
+            updated_client_order_ids.add(order_update.client_order_id)
+            updated_exchange_order_ids.add(order_update.exchange_order_id)
+        updated_exchange_order_ids.discard(None)
+        return [
+            order for order in orders
+            if order.client_order_id not in updated_client_order_ids
+            and order.exchange_order_id not in updated_exchange_order_ids
+        ]
 
     async def _update_orders(self):
-        orders_to_update = self.in_flight_orders.copy()
+        orders_to_update = [
+            order for order in self.in_flight_orders.values() if not self._is_order_status_recently_confirmed(order)
+        ]
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_active_order
+            orders=orders_to_update, error_handler=self._handle_update_error_for_active_order
+        )
+
+    def _is_order_status_recently_confirmed(self, order: InFlightOrder) -> bool:
+        """
+        Checks if the status of the active order was updated since the previous poll and less than
+        ORDER_UPDATE_CONFIRMATION_INTERVAL ago (by the user stream or by the order creation or cancelation responses),
+        while the user stream is alive. Such orders do not need a status request.
+        """
+        last_update_timestamp = self._order_tracker.last_order_update_timestamp(order.client_order_id)
+        user_stream_alive = (
+            self._user_stream_tracker is not None
+            and self.current_timestamp - self._user_stream_tracker.last_recv_time <= self.TICK_INTERVAL_LIMIT
+        )
+        return (
+            user_stream_alive
+            and last_update_timestamp is not None
+            and last_update_timestamp > self._last_poll_timestamp
+            and self.current_timestamp - last_update_timestamp < self.ORDER_UPDATE_CONFIRMATION_INTERVAL
         )
 
     async def _update_lost_orders(self):
-        orders_to_update = self._order_tracker.lost_orders.copy()
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_lost_order
+            orders=list(self._order_tracker.lost_orders.values()), error_handler=self._handle_update_error_for_lost_order
         )
 
     async def _update_order_status(self):
@@ -1050,6 +1513,29 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_orders_status(self, orders: List[InFlightOrder]) -> List[OrderUpdate]:
+        """
+        Requests the status of several orders at once, e.g. with the "open orders" endpoint of the exchange.
+        Connectors supporting bulk requests override this method. The orders left without an update in the result
+        (e.g. the orders no longer open) are requested one by one with `_request_order_status`.
+
+        :param orders: the orders to update
+        :return: the status updates, mapped to the orders by client order id or by exchange order id
+        """
+        return []
+
+    async def _all_trade_updates_since(self, timestamp: float) -> Optional[List[TradeUpdate]]:
+        """
+        Requests all the trades of the account since the timestamp, e.g. with the "my trades" endpoint of the exchange.
+        Connectors supporting bulk requests override this method, the trades of the orders that are not tracked are
+        ignored. Otherwise the trades are requested order by order with `_all_trade_updates_for_order`.
+
+        :param timestamp: the timestamp (in seconds) of the previous successful request, or the creation of the oldest
+            order for the first one
+        :return: the trade updates, or None if the connector does not support the request
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
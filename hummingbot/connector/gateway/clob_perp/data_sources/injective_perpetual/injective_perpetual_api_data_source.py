@@ -911,7 +911,7 @@ class InjectivePerpetualAPIDataSource(CLOBPerpAPIDataSourceBase):
     def _process_trade_stream_event(self, message: StreamTradesResponse):
         trade_message: DerivativeTrade = message.trade
         exchange_order_id = trade_message.order_hash
-        tracked_order = self._gateway_order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracked_order = self._gateway_order_tracker.fetch_order_by_exchange_order_id(exchange_order_id)
         client_order_id = "" if tracked_order is None else tracked_order.client_order_id
         trade_ob_msg, trade_update = self._parse_backend_trade(
             client_order_id=client_order_id, backend_trade=trade_message
@@ -1076,7 +1076,7 @@ class InjectivePerpetualAPIDataSource(CLOBPerpAPIDataSourceBase):
         order_update_msg: DerivativeOrderHistory = message.order
         order_hash: str = order_update_msg.order_hash
 
-        in_flight_order = self._gateway_order_tracker.all_fillable_orders_by_exchange_order_id.get(order_hash)
+        in_flight_order = self._gateway_order_tracker.fetch_order_by_exchange_order_id(order_hash)
         if in_flight_order is not None:
             market_id = order_update_msg.market_id
             trading_pair = self._get_trading_pair_from_market_id(market_id=market_id)
@@ -734,7 +734,7 @@ class InjectiveAPIDataSource(CLOBAPIDataSourceBase):
     def _process_trade_stream_event(self, message: StreamTradesResponse):
         trade_message: SpotTrade = message.trade
         exchange_order_id = trade_message.order_hash
-        tracked_order = self._gateway_order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracked_order = self._gateway_order_tracker.fetch_order_by_exchange_order_id(exchange_order_id)
         client_order_id = "" if tracked_order is None else tracked_order.client_order_id
         trade_ob_msg, trade_update = self._parse_backend_trade(
             client_order_id=client_order_id, backend_trade=trade_message
@@ -758,7 +758,7 @@ class InjectiveAPIDataSource(CLOBAPIDataSourceBase):
 
     def _parse_order_stream_update(self, order: StreamOrdersResponse):
         order_hash = order.order.order_hash
-        in_flight_order = self._gateway_order_tracker.all_fillable_orders_by_exchange_order_id.get(order_hash)
+        in_flight_order = self._gateway_order_tracker.fetch_order_by_exchange_order_id(order_hash)
         if in_flight_order is not None:
             market_id = order.order.market_id
             trading_pair = self._get_trading_pair_from_market_id(market_id=market_id)
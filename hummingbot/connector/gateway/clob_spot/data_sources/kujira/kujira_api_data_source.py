@@ -281,7 +281,7 @@ class KujiraAPIDataSource(GatewayCLOBAPIDataSourceBase):
             await self._update_order_status()
             active_order = self._gateway_order_tracker.active_orders.get(order.client_order_id)
 
-        fillable = self._gateway_order_tracker.all_fillable_orders_by_exchange_order_id.get(
+        fillable = self._gateway_order_tracker.fetch_order_by_exchange_order_id(
             active_order.exchange_order_id
         )
 
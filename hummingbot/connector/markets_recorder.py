@@ -6,16 +6,19 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -35,6 +38,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.batched_sql_writer import BatchedSQLWriter
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
@@ -42,6 +46,7 @@ from hummingbot.model.market_data import MarketData
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.performance_snapshot import PerformanceSnapshot
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
@@ -51,6 +56,20 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class MarketsRecorder:
+    """
+    Records the orders, trades and market states of the connectors in the trades database.
+
+    The records are written behind by a `BatchedSQLWriter`, so the events are handled without waiting for the database.
+    The connectors tracking states are saved every `market_states_save_interval` seconds (only for the connectors with
+    order changes) instead of on every event. The read methods only return what is already written, await
+    `wait_until_written` first from the event loop (or call `flush` from other threads) to include everything recorded
+    so far. `stop` writes all the pending records.
+
+    The performance of the trades since `performance_start_timestamp` is accumulated by `performance_tracker` as they
+    are filled. The trades already in the database are loaded once, from the last performance snapshot saved by `stop`
+    when there is one for the same configuration and start.
+    """
+
     _logger = None
     _shared_instance: "MarketsRecorder" = None
     market_event_tag_map: Dict[int, MarketEvent] = {
@@ -75,7 +94,9 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 market_states_save_interval: float = 1.0,
+                 performance_start_timestamp: Optional[int] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -86,6 +107,13 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._order_book_recorders: List[OrderBookRecorder] = []
+        self._writer: BatchedSQLWriter = BatchedSQLWriter(sql)
+        self._market_states_save_interval: float = market_states_save_interval
+        self._market_states_save_task: Optional[asyncio.Task] = None
+        self._markets_with_unsaved_states: Set[ConnectorBase] = set()
+        self._performance_tracker: PerformanceTracker = self._load_performance_tracker(
+            self.db_timestamp if performance_start_timestamp is None else performance_start_timestamp)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -129,6 +157,20 @@ class MarketsRecorder:
     def _start_market_data_recording(self):
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
+    def _start_order_book_recording(self):
+        for market in self._markets:
+            order_book_tracker = getattr(market, "order_book_tracker", None)
+            if order_book_tracker is not None:
+                order_book_tracker.recorder = OrderBookRecorder(connector_name=market.name)
+                self._order_book_recorders.append(order_book_tracker.recorder)
+
+    def _stop_order_book_recording(self):
+        for market in self._markets:
+            order_book_tracker = getattr(market, "order_book_tracker", None)
+            if order_book_tracker is not None and order_book_tracker.recorder in self._order_book_recorders:
+                order_book_tracker.recorder = None
+        self._order_book_recorders.clear()
+
     async def _record_market_data(self):
         while True:
             try:
@@ -143,6 +185,7 @@ class MarketsRecorder:
                                     best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
                                     order_book = market.get_order_book(trading_pair)
                                     depth = self._market_data_collection_config.market_data_collection_depth + 1
+                                    bids, asks = order_book.top_n(depth)
                                     market_data = MarketData(
                                         timestamp=self.db_timestamp,
                                         exchange=exchange,
@@ -151,8 +194,8 @@ class MarketsRecorder:
                                         best_bid=best_bid,
                                         best_ask=best_ask,
                                         order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
+                                            "bid": self._order_book_levels_json(bids),
+                                            "ask": self._order_book_levels_json(asks)}
                                     )
                                     session.add(market_data)
             except asyncio.CancelledError:
@@ -162,6 +205,23 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    @staticmethod
+    def _order_book_levels_json(levels: np.ndarray) -> List[List[Union[float, int]]]:
+        """
+        The [price, amount, update_id] rows of the order book levels, with the update ids as integers.
+        """
+        return [[price, amount, int(update_id)] for price, amount, update_id in levels.tolist()]
+
+    async def _save_market_states_loop(self):
+        while True:
+            try:
+                await self._sleep(self._market_states_save_interval)
+                self._save_changed_market_states()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error while saving the market states.", exc_info=True)
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -174,6 +234,10 @@ class MarketsRecorder:
     def strategy_name(self) -> str:
         return self._strategy_name
 
+    @property
+    def performance_tracker(self) -> PerformanceTracker:
+        return self._performance_tracker
+
     @property
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
@@ -184,6 +248,9 @@ class MarketsRecorder:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._market_data_collection_config.order_book_recording_enabled:
+            self._start_order_book_recording()
+        self._market_states_save_task = self._ev_loop.create_task(self._save_market_states_loop())
 
     def stop(self):
         for market in self._markets:
@@ -191,6 +258,28 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        self._stop_order_book_recording()
+        if self._market_states_save_task is not None:
+            self._market_states_save_task.cancel()
+            self._market_states_save_task = None
+        self._save_changed_market_states()
+        self._save_performance_snapshot()
+        self._writer.stop()
+
+    def flush(self):
+        """
+        Blocks until all the events recorded so far, and the current market states, are written to the database.
+        """
+        self._save_changed_market_states()
+        self._writer.flush()
+
+    async def wait_until_written(self):
+        """
+        Waits, without blocking the event loop, until all the events recorded so far, and the current market states,
+        are written to the database.
+        """
+        self._save_changed_market_states()
+        await self._writer.wait_until_written()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -256,18 +345,24 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
-    def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
+    def save_market_states(self,
+                           config_file_path: str,
+                           market: ConnectorBase,
+                           session: Session,
+                           saved_state: Optional[Dict[str, Any]] = None,
+                           timestamp: Optional[int] = None):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        saved_state = market.tracking_states if saved_state is None else saved_state
+        timestamp = self.db_timestamp if timestamp is None else timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -288,6 +383,76 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _market_states_changed(self, market: ConnectorBase):
+        self._markets_with_unsaved_states.add(market)
+
+    def _save_changed_market_states(self):
+        """
+        Queues the writing of the tracking states of the markets with order changes since the last save.
+        The states are taken here, in the event loop thread, the writer thread only stores them.
+        """
+        markets, self._markets_with_unsaved_states = self._markets_with_unsaved_states, set()
+        for market in markets:
+            saved_state = market.tracking_states
+            timestamp = self.db_timestamp
+
+            def write(session: Session, market: ConnectorBase = market, saved_state: Dict[str, Any] = saved_state,
+                      timestamp: int = timestamp):
+                self.save_market_states(
+                    self._config_file_path, market, session=session, saved_state=saved_state, timestamp=timestamp)
+
+            self._writer.submit(write)
+
+    def _load_performance_tracker(self, start_timestamp: int) -> PerformanceTracker:
+        with self._sql_manager.get_new_session() as session:
+            snapshot: Optional[PerformanceSnapshot] = self._get_performance_snapshot(start_timestamp, session=session)
+            if snapshot is not None:
+                performance_tracker = PerformanceTracker.from_json(snapshot.snapshot)
+                trades_start_timestamp = snapshot.timestamp + 1
+            else:
+                performance_tracker = PerformanceTracker(start_timestamp=start_timestamp)
+                trades_start_timestamp = start_timestamp
+            trades: List[TradeFill] = (session
+                                       .query(TradeFill)
+                                       .filter(TradeFill.config_file_path == self._config_file_path,
+                                               TradeFill.timestamp >= trades_start_timestamp)
+                                       .order_by(TradeFill.timestamp)
+                                       .all())
+            for trade in trades:
+                performance_tracker.add_trade_fill(trade)
+        return performance_tracker
+
+    def _get_performance_snapshot(self, start_timestamp: int, session: Session) -> Optional[PerformanceSnapshot]:
+        query: Query = (session
+                        .query(PerformanceSnapshot)
+                        .filter(PerformanceSnapshot.config_file_path == self._config_file_path,
+                                PerformanceSnapshot.start_timestamp == start_timestamp))
+        return query.one_or_none()
+
+    def _save_performance_snapshot(self):
+        """
+        Queues the writing of the performance accumulated so far. It is saved when the recorder is stopped, so that no
+        trade is recorded after the snapshot.
+        """
+        performance_tracker = self._performance_tracker
+        if performance_tracker.num_trades == 0:
+            return
+        saved_snapshot = performance_tracker.to_json()
+        timestamp = performance_tracker.last_fill_timestamp
+
+        def write(session: Session):
+            snapshot = self._get_performance_snapshot(performance_tracker.start_timestamp, session=session)
+            if snapshot is not None:
+                snapshot.snapshot = saved_snapshot
+                snapshot.timestamp = timestamp
+            else:
+                session.add(PerformanceSnapshot(config_file_path=self._config_file_path,
+                                                start_timestamp=performance_tracker.start_timestamp,
+                                                timestamp=timestamp,
+                                                snapshot=saved_snapshot))
+
+        self._writer.submit(write)
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -300,31 +465,33 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._writer.submit(write)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._market_states_changed(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -339,57 +506,58 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            return lambda: self.append_to_csv(trade_fill_record)
+
+        self._writer.submit(write)
+        self._performance_tracker.add_order_filled_event(market=market.display_name, event=evt, timestamp=timestamp)
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._market_states_changed(market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -400,20 +568,21 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._writer.submit(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -459,18 +628,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._writer.submit(write)
+        self._market_states_changed(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -506,15 +676,13 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._writer.submit(lambda session: session.add(rp_update))
+        self._market_states_changed(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -524,17 +692,15 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._writer.submit(lambda session: session.add(rp_fees))
+        self._market_states_changed(connector)
 
     @staticmethod
     async def _sleep(delay):
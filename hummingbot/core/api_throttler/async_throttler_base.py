@@ -3,13 +3,30 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import DEFAULT_REQUEST_PRIORITY, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.logger import HummingbotLogger
 
+_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=DEFAULT_REQUEST_PRIORITY)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority of the API requests executed within the context (including the tasks it creates) that don't
+    specify their own priority.
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -85,6 +102,13 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    @staticmethod
+    def get_request_priority(priority: Optional[RequestPriority] = None) -> RequestPriority:
+        """
+        :return: The given priority, or the priority set for the current context if none was given
+        """
+        return _request_priority.get() if priority is None else priority
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
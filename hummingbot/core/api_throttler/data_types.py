@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,21 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the API requests. When the rate limits are tight, requests with a higher priority are served
+    first.
+    """
+    STATUS_POLLING = 0
+    MARKET_DATA = 1
+    BALANCE = 2
+    CREATE = 3
+    CANCEL = 4
+
+
+DEFAULT_REQUEST_PRIORITY = RequestPriority.MARKET_DATA
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -0,0 +1,289 @@
+import asyncio
+import math
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import DEFAULT_REQUEST_PRIORITY, RateLimit, RequestPriority
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity consumed on a single RateLimit.
+    The window keeps the (timestamp, weight) of each acquisition in arrival order together with their running total, so
+    expiring old acquisitions and checking the capacity are amortized O(1).
+    It also counts by priority the requests waiting because the limit doesn't have capacity for them.
+    """
+
+    __slots__ = ("limit", "period", "_entries", "_used", "_waiting")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self._entries: Deque[Tuple[float, float]] = deque()
+        self._used: float = 0.0
+        self._waiting: List[int] = [0] * len(RequestPriority)
+        self.update_limit(rate_limit, safety_margin_pct)
+
+    @property
+    def used(self) -> float:
+        return self._used
+
+    def update_limit(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.limit: float = float(rate_limit.limit)
+        self.period: float = float(rate_limit.time_interval) * (1 + safety_margin_pct)
+
+    def flush(self, now: float):
+        entries = self._entries
+        # An acquisition is released once a full period (safety margin included) has elapsed
+        while entries and now - entries[0][0] >= self.period:
+            self._used -= entries.popleft()[1]
+        if not entries:
+            self._used = 0.0
+
+    def capacity(self, weight: float, capacity_pct: float = 1.0) -> float:
+        """
+        The part of the limit available for a request, a request never gets less than its own weight.
+        """
+        if capacity_pct >= 1:
+            return self.limit
+        return min(self.limit, max(self.limit * capacity_pct, weight))
+
+    def has_capacity(self, weight: float, capacity_pct: float = 1.0) -> bool:
+        return self._used + weight <= self.capacity(weight, capacity_pct)
+
+    def time_to_capacity(self, now: float, weight: float, capacity_pct: float = 1.0) -> Optional[float]:
+        """
+        Seconds until enough acquisitions expire for an additional `weight` to fit in the window.
+        :return: The waiting time, or None if the weight is larger than the limit itself
+        """
+        excess = self._used + weight - self.capacity(weight, capacity_pct)
+        if excess <= 0:
+            return 0.0
+        for timestamp, entry_weight in self._entries:
+            excess -= entry_weight
+            if excess <= 0:
+                return max(0.0, timestamp + self.period - now)
+        return None
+
+    def record(self, now: float, weight: float):
+        self._entries.append((now, weight))
+        self._used += weight
+
+    def add_waiting(self, priority: RequestPriority, count: int = 1):
+        self._waiting[priority] += count
+
+    def has_waiting_above(self, priority: RequestPriority) -> bool:
+        return any(self._waiting[priority + 1:])
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits until all the rate limits of the request have capacity.
+    Instead of polling, a waiting request sleeps until the time at which the capacity it needs is freed.
+
+    A request waiting for capacity is counted as waiting only on the limits that don't have capacity for it. Other
+    requests don't take capacity from those limits while a request with a higher priority is waiting on them, they wait
+    until the throttler wakes them up when the waiting requests change.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
+                 capacity_pct: float = 1.0,
+                 ):
+        """
+        :param throttler: The throttler that owns the rate limit windows
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        :param safety_margin_pct: Percentage of the limits time interval added as a safety margin
+        :param retry_interval: Minimum time between two capacity checks
+        :param priority: The priority of this API Request
+        :param capacity_pct: Fraction of the limits this API Request is allowed to use
+        """
+        self._throttler: SlidingWindowThrottler = throttler
+        self._rate_limit: Optional[RateLimit] = rate_limit
+        self._related_limits: List[Tuple[RateLimit, int]] = related_limits
+        self._safety_margin_pct: float = safety_margin_pct
+        self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._capacity_pct: float = capacity_pct
+        self._limits: List[Tuple[RateLimit, RateLimitWindow, float]] = []
+        self._waiting_windows: List[RateLimitWindow] = []
+        if rate_limit is not None:
+            self._limits = [
+                (limit, throttler.get_window(limit), float(weight))
+                for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits
+            ]
+
+    def flush(self):
+        """
+        Remove acquisitions that have passed the rate limit periods
+        """
+        now = self._time()
+        for _, window, _ in self._limits:
+            window.flush(now)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task is within the defined RateLimit(s). Logs a warning message if the limit is about to
+        be reached.
+        :return: True if it is within capacity to add a new task
+        """
+        wait_time, _ = self._time_to_capacity(self._time())
+        return wait_time is None
+
+    def _time_to_capacity(self, now: float) -> Tuple[Optional[float], List[RateLimitWindow]]:
+        """
+        :return: None if all the limits have capacity for the task, otherwise the time to wait before checking again
+            (infinite when the task has to wait for higher priority requests). And the limits without capacity.
+        """
+        wait_time = None
+        saturated_windows = []
+        for rate_limit, window, weight in self._limits:
+            window.flush(now)
+            if not window.has_capacity(weight, self._capacity_pct):
+                limit_wait_time = window.time_to_capacity(now, weight, self._capacity_pct)
+                if limit_wait_time is None:
+                    limit_wait_time = self._retry_interval
+                wait_time = max(wait_time or 0.0, limit_wait_time)
+                saturated_windows.append(window)
+                self._log_capacity_reached(rate_limit, window, now)
+            elif window.has_waiting_above(self._priority):
+                wait_time = math.inf
+        return wait_time, saturated_windows
+
+    def _set_waiting(self, windows: List[RateLimitWindow]):
+        """
+        Counts the task as waiting only on the given limits, and wakes up the other waiting tasks if it stopped waiting
+        on any limit.
+        """
+        stopped_waiting = False
+        for window in self._waiting_windows:
+            if window not in windows:
+                window.add_waiting(self._priority, -1)
+                stopped_waiting = True
+        for window in windows:
+            if window not in self._waiting_windows:
+                window.add_waiting(self._priority, 1)
+        self._waiting_windows = windows
+        if stopped_waiting:
+            self._throttler.notify_waiting_changed()
+
+    def _log_capacity_reached(self, rate_limit: RateLimit, window: RateLimitWindow, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {window.used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    async def acquire(self):
+        now = self._time()
+        wait_time, saturated_windows = self._time_to_capacity(now)
+        if wait_time is not None:
+            try:
+                while wait_time is not None:
+                    self._set_waiting(saturated_windows)
+                    if wait_time == math.inf:
+                        await self._throttler.wait_waiting_changed()
+                    else:
+                        await self._sleep(wait_time)
+                    now = self._time()
+                    wait_time, saturated_windows = self._time_to_capacity(now)
+            finally:
+                self._set_waiting([])
+        for _, window, weight in self._limits:
+            window.record(now, weight)
+
+    def _time(self) -> float:
+        return time.time()
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in replacement for AsyncThrottler that keeps one sliding window per RateLimit instead of scanning a shared list
+    of task logs on every acquisition.
+    Requests that don't fit wait for the computed time at which capacity becomes available instead of polling.
+
+    Requests are served by priority when the limits are tight (cancels first, status polling last), and status polling
+    requests can only use `polling_capacity_pct` of each limit, keeping the rest for order management.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 polling_capacity_pct: float = 0.8,
+                 ):
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._polling_capacity_pct: float = polling_capacity_pct
+        self._waiting_changed_event: asyncio.Event = asyncio.Event()
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+        for rate_limit in self._rate_limits:
+            self.get_window(rate_limit)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # Keep the capacity already consumed on the limits that are still defined
+        self._windows = {
+            limit_id: window for limit_id, window in self._windows.items() if limit_id in self._id_to_limit_map
+        }
+        for limit_id, window in self._windows.items():
+            window.update_limit(self._id_to_limit_map[limit_id], self._safety_margin_pct)
+
+    def get_window(self, rate_limit: RateLimit) -> RateLimitWindow:
+        window = self._windows.get(rate_limit.limit_id)
+        if window is None:
+            window = RateLimitWindow(rate_limit, self._safety_margin_pct)
+            self._windows[rate_limit.limit_id] = window
+        return window
+
+    async def wait_waiting_changed(self):
+        """
+        Waits until a request stops waiting on any of the limits.
+        """
+        await self._waiting_changed_event.wait()
+
+    def notify_waiting_changed(self):
+        waiting_changed_event, self._waiting_changed_event = self._waiting_changed_event, asyncio.Event()
+        waiting_changed_event.set()
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the API request, defaults to the priority set for the current context
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        priority = self.get_request_priority(priority)
+        return SlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            priority=priority,
+            capacity_pct=self._polling_capacity_pct if priority == RequestPriority.STATUS_POLLING else 1.0,
+        )
@@ -0,0 +1,203 @@
+#ifndef _ORDER_BOOK_DEPTH_H
+#define _ORDER_BOOK_DEPTH_H
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <limits>
+#include <numeric>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Cumulative depth walks over the native order book sets.
+//
+// A buy walks the ask book from the lowest price up, a sell walks the bid book from the highest price down. Every
+// walk stops at the first level that answers the query, and the arithmetic mirrors the row-by-row Python
+// implementation so both paths produce bit-identical results.
+
+namespace orderbookdepth {
+
+const double NaN = std::numeric_limits<double>::quiet_NaN();
+
+template <typename Iterator>
+double priceForVolume(Iterator it, Iterator end, double volume, bool quote, double &cumulativeVolume) {
+    cumulativeVolume = 0;
+    for (; it != end; ++it) {
+        cumulativeVolume += quote ? it->getAmount() * it->getPrice() : it->getAmount();
+        if (cumulativeVolume >= volume) {
+            return it->getPrice();
+        }
+    }
+    return NaN;
+}
+
+// The division is left to the caller so that a zero volume query fails the same way as the Python implementation.
+template <typename Iterator>
+bool vwapForVolume(Iterator it, Iterator end, double volume, double &totalCost, double &totalVolume) {
+    totalCost = 0;
+    totalVolume = 0;
+    for (; it != end; ++it) {
+        const double price = it->getPrice();
+        const double amount = it->getAmount();
+        totalCost += amount * price;
+        totalVolume += amount;
+        if (totalVolume >= volume) {
+            totalCost -= amount * price;
+            totalVolume -= amount;
+            const double incrementalAmount = volume - totalVolume;
+            totalCost += incrementalAmount * price;
+            totalVolume += incrementalAmount;
+            return true;
+        }
+    }
+    return false;
+}
+
+template <typename Iterator>
+double quoteVolumeForBaseAmount(Iterator it, Iterator end, double baseAmount) {
+    double cumulativeVolume = 0;
+    double cumulativeBaseAmount = 0;
+    for (; it != end; ++it) {
+        double rowAmount = it->getAmount();
+        if (rowAmount + cumulativeBaseAmount >= baseAmount) {
+            rowAmount = baseAmount - cumulativeBaseAmount;
+        }
+        cumulativeBaseAmount += rowAmount;
+        cumulativeVolume += rowAmount * it->getPrice();
+        if (cumulativeBaseAmount >= baseAmount) {
+            break;
+        }
+    }
+    return cumulativeVolume;
+}
+
+template <typename Iterator>
+double volumeForPrice(Iterator it, Iterator end, bool isBuy, double price, bool quote, double &cumulativeVolume) {
+    double resultPrice = NaN;
+    cumulativeVolume = 0;
+    for (; it != end; ++it) {
+        const double rowPrice = it->getPrice();
+        if (isBuy ? rowPrice > price : rowPrice < price) {
+            break;
+        }
+        cumulativeVolume += quote ? it->getAmount() * rowPrice : it->getAmount();
+        resultPrice = rowPrice;
+    }
+    return resultPrice;
+}
+
+// Query indices ordered by volume, NaN volumes last so they are never satisfied (like the single queries).
+inline std::vector<size_t> ascendingOrder(const std::vector<double> &volumes) {
+    std::vector<size_t> order(volumes.size());
+    std::iota(order.begin(), order.end(), 0);
+    std::stable_sort(order.begin(), order.end(), [&volumes](size_t a, size_t b) {
+        return volumes[a] < volumes[b] || (!std::isnan(volumes[a]) && std::isnan(volumes[b]));
+    });
+    return order;
+}
+
+template <typename Iterator>
+void pricesForVolumes(Iterator it, Iterator end, const std::vector<double> &volumes,
+                      std::vector<double> &prices, std::vector<double> &cumulativeVolumes) {
+    const std::vector<size_t> order = ascendingOrder(volumes);
+    const size_t count = volumes.size();
+    size_t next = 0;
+    double cumulativeVolume = 0;
+    prices.assign(count, NaN);
+    cumulativeVolumes.assign(count, 0);
+    for (; it != end && next < count; ++it) {
+        cumulativeVolume += it->getAmount();
+        while (next < count && cumulativeVolume >= volumes[order[next]]) {
+            prices[order[next]] = it->getPrice();
+            cumulativeVolumes[order[next]] = cumulativeVolume;
+            ++next;
+        }
+    }
+    for (; next < count; ++next) {
+        cumulativeVolumes[order[next]] = cumulativeVolume;
+    }
+}
+
+template <typename Iterator>
+void vwapsForVolumes(Iterator it, Iterator end, const std::vector<double> &volumes,
+                     std::vector<double> &totalCosts, std::vector<double> &totalVolumes) {
+    const std::vector<size_t> order = ascendingOrder(volumes);
+    const size_t count = volumes.size();
+    size_t next = 0;
+    double totalCost = 0;
+    double totalVolume = 0;
+    totalCosts.assign(count, NaN);
+    totalVolumes.assign(count, 0);
+    for (; it != end && next < count; ++it) {
+        const double price = it->getPrice();
+        const double amount = it->getAmount();
+        totalCost += amount * price;
+        totalVolume += amount;
+        while (next < count && totalVolume >= volumes[order[next]]) {
+            const double volume = volumes[order[next]];
+            double queryCost = totalCost - amount * price;
+            double queryVolume = totalVolume - amount;
+            const double incrementalAmount = volume - queryVolume;
+            queryCost += incrementalAmount * price;
+            queryVolume += incrementalAmount;
+            totalCosts[order[next]] = queryCost;
+            totalVolumes[order[next]] = queryVolume;
+            ++next;
+        }
+    }
+    for (; next < count; ++next) {
+        totalVolumes[order[next]] = totalVolume;
+    }
+}
+
+}  // namespace orderbookdepth
+
+inline double getPriceForVolume(const std::set<OrderBookEntry> &book, bool isBuy, double volume,
+                                double &cumulativeVolume) {
+    return isBuy ? orderbookdepth::priceForVolume(book.begin(), book.end(), volume, false, cumulativeVolume)
+                 : orderbookdepth::priceForVolume(book.rbegin(), book.rend(), volume, false, cumulativeVolume);
+}
+
+inline double getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, bool isBuy, double quoteVolume,
+                                     double &cumulativeVolume) {
+    return isBuy ? orderbookdepth::priceForVolume(book.begin(), book.end(), quoteVolume, true, cumulativeVolume)
+                 : orderbookdepth::priceForVolume(book.rbegin(), book.rend(), quoteVolume, true, cumulativeVolume);
+}
+
+inline bool getVWAPForVolume(const std::set<OrderBookEntry> &book, bool isBuy, double volume,
+                             double &totalCost, double &totalVolume) {
+    return isBuy ? orderbookdepth::vwapForVolume(book.begin(), book.end(), volume, totalCost, totalVolume)
+                 : orderbookdepth::vwapForVolume(book.rbegin(), book.rend(), volume, totalCost, totalVolume);
+}
+
+inline double getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, bool isBuy, double baseAmount) {
+    return isBuy ? orderbookdepth::quoteVolumeForBaseAmount(book.begin(), book.end(), baseAmount)
+                 : orderbookdepth::quoteVolumeForBaseAmount(book.rbegin(), book.rend(), baseAmount);
+}
+
+inline double getVolumeForPrice(const std::set<OrderBookEntry> &book, bool isBuy, double price, bool quote,
+                                double &cumulativeVolume) {
+    return isBuy ? orderbookdepth::volumeForPrice(book.begin(), book.end(), isBuy, price, quote, cumulativeVolume)
+                 : orderbookdepth::volumeForPrice(book.rbegin(), book.rend(), isBuy, price, quote, cumulativeVolume);
+}
+
+inline void getPricesForVolumes(const std::set<OrderBookEntry> &book, bool isBuy, const std::vector<double> &volumes,
+                                std::vector<double> &prices, std::vector<double> &cumulativeVolumes) {
+    if (isBuy) {
+        orderbookdepth::pricesForVolumes(book.begin(), book.end(), volumes, prices, cumulativeVolumes);
+    } else {
+        orderbookdepth::pricesForVolumes(book.rbegin(), book.rend(), volumes, prices, cumulativeVolumes);
+    }
+}
+
+inline void getVWAPsForVolumes(const std::set<OrderBookEntry> &book, bool isBuy, const std::vector<double> &volumes,
+                               std::vector<double> &totalCosts, std::vector<double> &totalVolumes) {
+    if (isBuy) {
+        orderbookdepth::vwapsForVolumes(book.begin(), book.end(), volumes, totalCosts, totalVolumes);
+    } else {
+        orderbookdepth::vwapsForVolumes(book.rbegin(), book.rend(), volumes, totalCosts, totalVolumes);
+    }
+}
+
+#endif
@@ -0,0 +1,21 @@
+# distutils: language=c++
+
+from libcpp cimport bool as cppbool
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepth.h":
+    double getPriceForVolume(const set[OrderBookEntry] &book, cppbool isBuy, double volume,
+                             double &cumulativeVolume)
+    double getPriceForQuoteVolume(const set[OrderBookEntry] &book, cppbool isBuy, double quoteVolume,
+                                  double &cumulativeVolume)
+    cppbool getVWAPForVolume(const set[OrderBookEntry] &book, cppbool isBuy, double volume, double &totalCost,
+                             double &totalVolume)
+    double getQuoteVolumeForBaseAmount(const set[OrderBookEntry] &book, cppbool isBuy, double baseAmount)
+    double getVolumeForPrice(const set[OrderBookEntry] &book, cppbool isBuy, double price, cppbool quote,
+                             double &cumulativeVolume)
+    void getPricesForVolumes(const set[OrderBookEntry] &book, cppbool isBuy, const vector[double] &volumes,
+                             vector[double] &prices, vector[double] &cumulativeVolumes)
+    void getVWAPsForVolumes(const set[OrderBookEntry] &book, cppbool isBuy, const vector[double] &volumes,
+                            vector[double] &totalCosts, vector[double] &totalVolumes)
@@ -20,6 +20,7 @@ cdef class CompositeOrderBook(OrderBook):
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._native_depth = False
 
     @property
     def traded_order_book(self) -> OrderBook:
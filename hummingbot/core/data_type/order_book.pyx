@@ -3,7 +3,9 @@
 import bisect
 import logging
 import time
+from itertools import islice
 from typing import (
+    Any,
     Dict,
     Iterator,
     List,
@@ -24,6 +26,15 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.OrderBookDepth cimport (
+    getPriceForQuoteVolume,
+    getPriceForVolume,
+    getPricesForVolumes,
+    getQuoteVolumeForBaseAmount,
+    getVolumeForPrice,
+    getVWAPForVolume,
+    getVWAPsForVolumes,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
@@ -31,11 +42,37 @@ from hummingbot.core.event.events import (
 )
 
 cimport numpy as np
+from libc.math cimport isnan
 
 ob_logger = None
 NaN = float("nan")
 
 
+cdef void c_append_levels(vector[OrderBookEntry] *entries, object levels, int64_t update_id) except *:
+    # Exchange native [price, amount, ...] levels, the prices and amounts being strings or numbers.
+    entries.reserve(entries.size() + len(levels))
+    for level in levels:
+        entries.push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+
+
+cdef void c_append_rows(vector[OrderBookEntry] *entries, object rows) except *:
+    for row in rows:
+        entries.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+
+
+cdef class OrderBookLevels:
+    """
+    The bids and asks of an order book message, parsed into native order book entries.
+    """
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()) for entry in self._bids]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()) for entry in self._asks]
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -55,6 +92,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        # Depth queries walk the native books directly. Subclasses that override bid_entries()/ask_entries() must
+        # turn this off so that the queries see the overridden rows.
+        self._native_depth = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -171,32 +211,148 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the bid and ask sides as DataFrames with the OrderBookRow columns, best prices first.
+        Only the first `depth` levels of each side are included when a depth is given.
+        """
+        bids, asks = self.top_n(depth)
+        bids_df = pd.DataFrame(data=bids, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def top_n(self,
+              depth: Optional[int] = None,
+              bids_out: Optional[np.ndarray] = None,
+              asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the top `depth` levels of both sides of the book, see `to_numpy`.
+        """
+        return self.to_numpy(True, depth, bids_out), self.to_numpy(False, depth, asks_out)
+
+    def to_numpy(self, is_bid: bool, depth: Optional[int] = None, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copies the top `depth` levels of one side of the book into a float64 array of [price, amount, update_id]
+        rows, best price first. The whole side is copied when no depth is given.
+
+        A preallocated C-contiguous float64 array with 3 columns can be passed as `out` to avoid allocating a new
+        array on every call. It is filled in place and the view of the rows that were written is returned.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            np.float64_t[:, ::1] buffer
+            Py_ssize_t rows = deref(book).size()
+            Py_ssize_t i = 0
+
+        if out is not None and (out.dtype != np.float64 or out.ndim != 2 or out.shape[1] != 3
+                                or not out.flags.c_contiguous):
+            raise ValueError("The output buffer must be a C-contiguous float64 array of shape (n, 3).")
+        if depth is not None:
+            rows = max(min(rows, depth), 0)
+
+        if not self._native_depth:
+            entries = list(islice(self.bid_entries() if is_bid else self.ask_entries(), rows))
+            if out is None:
+                return np.array(entries, dtype=np.float64).reshape((len(entries), 3))
+            rows = min(len(entries), out.shape[0])
+            out[:rows] = entries[:rows]
+            return out[:rows]
+
+        if out is None:
+            out = np.empty((rows, 3), dtype=np.float64)
+        rows = min(rows, out.shape[0])
+        buffer = out
+
+        if is_bid:
+            while i < rows:
+                buffer[i, 0] = deref(bid_it).getPrice()
+                buffer[i, 1] = deref(bid_it).getAmount()
+                buffer[i, 2] = deref(bid_it).getUpdateId()
+                inc(bid_it)
+                i += 1
+        else:
+            while i < rows:
+                buffer[i, 0] = deref(ask_it).getPrice()
+                buffer[i, 1] = deref(ask_it).getAmount()
+                buffer[i, 2] = deref(ask_it).getUpdateId()
+                inc(ask_it)
+                i += 1
+        return out[:rows]
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-        for row in bids:
-            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        for row in asks:
-            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        c_append_rows(&cpp_bids, bids)
+        c_append_rows(&cpp_asks, asks)
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-        for row in bids:
-            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
-        for row in asks:
-            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        c_append_rows(&cpp_bids, bids)
+        c_append_rows(&cpp_asks, asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_levels(self, bids: List[List[Any]], asks: List[List[Any]], update_id: int):
+        """
+        Applies diffs given as exchange native [price, amount, ...] levels, with prices and amounts as strings or
+        numbers, without building intermediate OrderBookRow objects.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_append_levels(&cpp_bids, bids, update_id)
+        c_append_levels(&cpp_asks, asks, update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_snapshot_levels(self, bids: List[List[Any]], asks: List[List[Any]], update_id: int):
+        """
+        Applies a snapshot given as exchange native [price, amount, ...] levels, see `apply_diff_levels`.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_append_levels(&cpp_bids, bids, update_id)
+        c_append_levels(&cpp_asks, asks, update_id)
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diff_message(self, message: OrderBookMessage):
+        cdef OrderBookLevels levels = self.c_get_message_levels(message)
+        self.c_apply_diffs(levels._bids, levels._asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        cdef OrderBookLevels levels = self.c_get_message_levels(message)
+        self.c_apply_snapshot(levels._bids, levels._asks, message.update_id)
+
+    cdef OrderBookLevels c_get_message_levels(self, object message):
+        """
+        Parses the bids and asks of a message into native entries the first time the message is applied, and caches
+        them on the message so that snapshot replays don't parse the same diffs again.
+        """
+        cdef:
+            OrderBookLevels levels = message.parsed_levels
+            int64_t update_id
+
+        if levels is None:
+            levels = OrderBookLevels()
+            message_class = type(message)
+            if message_class.bids is OrderBookMessage.bids and message_class.asks is OrderBookMessage.asks:
+                update_id = message.update_id
+                c_append_levels(&levels._bids, message.content["bids"], update_id)
+                c_append_levels(&levels._asks, message.content["asks"], update_id)
+            else:
+                # Connector specific messages define their own row semantics
+                c_append_rows(&levels._bids, message.bids)
+                c_append_rows(&levels._asks, message.asks)
+            message.parsed_levels = levels
+        return levels
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -318,12 +474,29 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        """
+        :return: the amount of the exchange order book at exactly the price, 0 if there is no such level
+        """
+        return self.c_get_level_amount(is_bid, price)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
+        if self._native_depth:
+            result_price = getPriceForVolume(deref(book), is_buy, volume, cumulative_volume)
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
                 if cumulative_volume >= volume:
@@ -340,10 +513,14 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
+        if self._native_depth:
+            if getVWAPForVolume(deref(book), is_buy, volume, total_cost, total_volume):
+                result_vwap = total_cost / total_volume
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
                 total_volume += order_book_row.amount
@@ -372,10 +549,13 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
+        if self._native_depth:
+            result_price = getPriceForQuoteVolume(deref(book), is_buy, quote_volume, cumulative_volume)
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
                 if cumulative_volume >= quote_volume:
@@ -392,11 +572,14 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
 
-        if is_buy:
+        if self._native_depth:
+            cumulative_volume = getQuoteVolumeForBaseAmount(deref(book), is_buy, base_amount)
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 row_amount = order_book_row.amount
                 if row_amount + cumulative_base_amount >= base_amount:
@@ -419,10 +602,13 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
+        if self._native_depth:
+            result_price = getVolumeForPrice(deref(book), is_buy, price, False, cumulative_volume)
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -439,10 +625,13 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
+        if self._native_depth:
+            result_price = getVolumeForPrice(deref(book), is_buy, price, True, cumulative_volume)
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -457,12 +646,60 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef list c_get_price_for_volumes(self, bint is_buy, vector[double] volumes):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            vector[double] result_prices
+            vector[double] cumulative_volumes
+            size_t i
+
+        if not self._native_depth:
+            return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+        getPricesForVolumes(deref(book), is_buy, volumes, result_prices, cumulative_volumes)
+        return [
+            OrderBookQueryResult(NaN, volumes[i], result_prices[i], min(cumulative_volumes[i], volumes[i]))
+            for i in range(volumes.size())
+        ]
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, vector[double] volumes):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            vector[double] total_costs
+            vector[double] total_volumes
+            list results = []
+            double result_vwap
+            size_t i
+
+        if not self._native_depth:
+            return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+        getVWAPsForVolumes(deref(book), is_buy, volumes, total_costs, total_volumes)
+        for i in range(volumes.size()):
+            result_vwap = NaN if isnan(total_costs[i]) else total_costs[i] / total_volumes[i]
+            results.append(OrderBookQueryResult(NaN, volumes[i], result_vwap, min(total_volumes[i], volumes[i])))
+        return results
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
     def get_vwap_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_vwap_for_volume(is_buy, volume)
 
+    def get_price_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        """
+        Answers several price-for-volume queries with a single walk of the book.
+        The results are returned in the same order as the requested volumes.
+        """
+        return self.c_get_price_for_volumes(is_buy, volumes)
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        """
+        Answers several VWAP-for-volume queries with a single walk of the book.
+        The results are returned in the same order as the requested volumes.
+        """
+        return self.c_get_vwap_for_volumes(is_buy, volumes)
+
     def get_price_for_quote_volume(self, is_buy: bool, quote_volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_quote_volume(is_buy, quote_volume)
 
@@ -478,6 +715,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
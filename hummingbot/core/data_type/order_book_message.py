@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -64,6 +64,17 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def parsed_levels(self) -> Optional[Any]:
+        """
+        The bids and asks in the order book native representation, cached by the order book that applied the message.
+        """
+        return self.__dict__.get("_parsed_levels")
+
+    @parsed_levels.setter
+    def parsed_levels(self, levels: Any):
+        self.__dict__["_parsed_levels"] = levels
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
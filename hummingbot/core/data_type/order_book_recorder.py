@@ -0,0 +1,491 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+FILE_MAGIC = b"HBOB"
+CHUNK_MAGIC = b"HBCK"
+FORMAT_VERSION = 1
+FILE_EXTENSION = ".hbob"
+# The magic and the length of the JSON header that follows
+_HEADER_STRUCT = struct.Struct("<4sI")
+
+# Columns of the messages of a chunk, one value per message
+MESSAGE_COLUMNS: Dict[str, str] = {
+    "received": "<f8",
+    "timestamp": "<f8",
+    "type": "u1",
+    "trading_pair": "<u2",
+    "update_id": "<i8",
+    "first_update_id": "<i8",
+    "bids": "<u4",
+    "asks": "<u4",
+    "price": "<f8",
+    "amount": "<f8",
+    "trade_type": "u1",
+    "trade_id_end": "<u4",
+}
+# Columns of the bids and asks of the snapshot and diff messages, in the order of the messages (bids first)
+LEVEL_COLUMNS: Dict[str, str] = {
+    "level_price": "<f8",
+    "level_amount": "<f8",
+}
+
+
+def build_default_records_path() -> str:
+    return os.path.join(data_path(), "order_book_records")
+
+
+class OrderBookRecordChunk(NamedTuple):
+    """
+    The columns of a chunk of recorded messages. The levels of the message i are the rows
+    level_ends[i - 1]:level_ends[i] of the level columns, its bids first.
+    """
+    trading_pairs: List[str]
+    messages: Dict[str, np.ndarray]
+    levels: Dict[str, np.ndarray]
+    trade_ids: List[str]
+
+    @property
+    def level_ends(self) -> np.ndarray:
+        return np.cumsum(self.messages["bids"].astype(np.int64) + self.messages["asks"])
+
+
+class OrderBookRecorder:
+    """
+    Append-only recorder of the order book snapshots, diffs and trades received by an order book tracker, in a
+    compact binary columnar format.
+
+    The messages are buffered and written by chunks (every chunk_size messages or flush_interval seconds), by a
+    dedicated writer thread so the order book tracker never waits for the conversion, compression or write. Each chunk
+    is a small JSON header followed by its columns, one contiguous array per field, byte-shuffled and compressed with
+    zlib: the columns of similar numbers (timestamps, update ids, prices) compress a lot better than rows. The files
+    rotate every rotation_interval seconds (hourly by default) of the reception time of the messages, a file is never
+    modified after the last chunk is appended, except to remove a chunk partially written when the bot stopped.
+
+    The chunks handed to the writer thread are written before the interpreter exits, call join to wait for them before
+    reading the files. The files are read with OrderBookRecordReader.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 connector_name: str,
+                 root_path: Optional[str] = None,
+                 chunk_size: int = 10000,
+                 flush_interval: float = 10.0,
+                 rotation_interval: int = 3600,
+                 compression_level: int = 1):
+        self._connector_name = connector_name
+        self._root_path = root_path or build_default_records_path()
+        self._chunk_size = chunk_size
+        self._flush_interval = flush_interval
+        self._rotation_interval = rotation_interval
+        self._compression_level = compression_level
+        self._pending: List[Tuple[float, OrderBookMessage]] = []
+        self._period_start: Optional[float] = None
+        self._last_flush_time: float = 0.0
+        # A single thread writes the chunks in order, the file is only accessed by it. It is started with the first
+        # write and stopped when the recorder is closed
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._file_path: Optional[str] = None
+        self._file_size: int = 0
+
+    @property
+    def connector_name(self) -> str:
+        return self._connector_name
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(self._root_path, self._connector_name)
+
+    def file_path(self, timestamp: float) -> str:
+        """
+        :return: the path of the file the messages received at the timestamp are written to
+        """
+        period_start = timestamp - timestamp % self._rotation_interval
+        file_name = datetime.fromtimestamp(period_start, tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+        return os.path.join(self.directory, f"{file_name}{FILE_EXTENSION}")
+
+    def record(self, message: OrderBookMessage, received: Optional[float] = None):
+        """
+        Adds a message to the next chunk. The messages are only converted to columns when the chunk is written, the
+        chunk is written when a message comes after chunk_size messages or flush_interval seconds.
+        :param received: the time the message was received, the current time by default
+        """
+        received = self._time() if received is None else received
+        if self._period_start is None:
+            self._period_start = received - received % self._rotation_interval
+            self._last_flush_time = received
+        elif received >= self._period_start + self._rotation_interval:
+            self.flush()
+            self._period_start = received - received % self._rotation_interval
+        self._pending.append((received, message))
+        if len(self._pending) >= self._chunk_size or received - self._last_flush_time >= self._flush_interval:
+            self.flush()
+            self._last_flush_time = received
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, received: Optional[float] = None):
+        """
+        Records the current state of an order book as a snapshot, e.g. the initial snapshot of a tracker.
+        """
+        received = self._time() if received is None else received
+        bids, asks = order_book.snapshot
+        self.record(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": order_book.snapshot_uid,
+            "bids": bids[["price", "amount"]].to_numpy().tolist(),
+            "asks": asks[["price", "amount"]].to_numpy().tolist(),
+        }, timestamp=received), received=received)
+
+    def flush(self):
+        """
+        Hands the buffered messages to the writer thread, to be written to the file of the current period.
+        """
+        if len(self._pending) > 0:
+            pending, self._pending = self._pending, []
+            self._submit(self._write_pending, self.file_path(self._period_start), pending)
+
+    def close(self):
+        """
+        Writes the buffered messages, closes the file and stops the writer thread. The recorder can still be used, the
+        thread is started again with the next write.
+        """
+        self.flush()
+        if self._writer is not None:
+            self._writer.submit(self._close_file)
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+    def join(self):
+        """
+        Blocks until all the messages handed to the writer thread are written, e.g. before reading the files.
+        """
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    def _submit(self, function, *args):
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1,
+                                              thread_name_prefix=f"OrderBookRecorder-{self._connector_name}")
+        self._writer.submit(function, *args)
+
+    def _write_pending(self, path: str, pending: List[Tuple[float, OrderBookMessage]]):
+        try:
+            self._write_chunk(path, self._build_chunk(pending))
+        except Exception:
+            self._close_file()
+            self.logger().error(f"Error writing {len(pending)} order book messages of {self._connector_name}.",
+                                exc_info=True)
+
+    def _close_file(self):
+        self._file_path = None
+
+    def _build_chunk(self, pending: List[Tuple[float, OrderBookMessage]]) -> OrderBookRecordChunk:
+        count = len(pending)
+        messages = {name: np.zeros(count, dtype=dtype) for name, dtype in MESSAGE_COLUMNS.items()}
+        messages["price"][:] = np.nan
+        messages["amount"][:] = np.nan
+        trading_pairs: Dict[str, int] = {}
+        trade_ids: List[str] = []
+        levels: List[list] = []
+        for index, (received, message) in enumerate(pending):
+            messages["received"][index] = received
+            messages["timestamp"][index] = message.timestamp if message.timestamp is not None else received
+            messages["type"][index] = message.type.value
+            messages["trading_pair"][index] = trading_pairs.setdefault(message.trading_pair, len(trading_pairs))
+            messages["update_id"][index] = self._to_int(message.update_id)
+            if message.type is OrderBookMessageType.TRADE:
+                messages["price"][index] = float(message.content["price"])
+                messages["amount"][index] = float(message.content["amount"])
+                messages["trade_type"][index] = int(float(message.content["trade_type"]))
+                trade_id = str(message.trade_id)
+            else:
+                messages["first_update_id"][index] = self._to_int(message.first_update_id)
+                bids, asks = message.bids, message.asks
+                messages["bids"][index] = len(bids)
+                messages["asks"][index] = len(asks)
+                levels.extend((row.price, row.amount) for row in bids)
+                levels.extend((row.price, row.amount) for row in asks)
+                trade_id = ""
+            trade_ids.append(trade_id)
+            messages["trade_id_end"][index] = len(trade_id.encode())
+        messages["trade_id_end"] = np.cumsum(messages["trade_id_end"], dtype=MESSAGE_COLUMNS["trade_id_end"])
+        levels_array = np.array(levels, dtype=float).reshape(-1, 2)
+        return OrderBookRecordChunk(
+            trading_pairs=list(trading_pairs),
+            messages=messages,
+            levels={"level_price": levels_array[:, 0], "level_amount": levels_array[:, 1]},
+            trade_ids=trade_ids,
+        )
+
+    def _write_chunk(self, path: str, chunk: OrderBookRecordChunk):
+        columns = [(name, chunk.messages[name].astype(dtype, copy=False)) for name, dtype in MESSAGE_COLUMNS.items()]
+        columns.extend((name, chunk.levels[name].astype(dtype, copy=False)) for name, dtype in LEVEL_COLUMNS.items())
+        columns.append(("trade_id", np.frombuffer("".join(chunk.trade_ids).encode(), dtype="u1")))
+        payloads = [zlib.compress(_shuffle(array), self._compression_level) for _, array in columns]
+        header = json.dumps({
+            "messages": len(chunk.messages["received"]),
+            "levels": len(chunk.levels["level_price"]),
+            "start": float(chunk.messages["received"].min()),
+            "end": float(chunk.messages["received"].max()),
+            "trading_pairs": chunk.trading_pairs,
+            "columns": [[name, array.dtype.str, len(payload)] for (name, array), payload in zip(columns, payloads)],
+        }).encode()
+
+        if path != self._file_path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._file_path = path
+            self._file_size = OrderBookRecordReader.valid_size(path)
+        content = [_HEADER_STRUCT.pack(CHUNK_MAGIC, len(header)), header] + payloads
+        if self._file_size == 0:
+            file_header = json.dumps({"version": FORMAT_VERSION, "connector": self._connector_name}).encode()
+            content = [_HEADER_STRUCT.pack(FILE_MAGIC, len(file_header)), file_header] + content
+        with open(path, "r+b" if os.path.exists(path) else "wb") as file:
+            # Anything after the last complete chunk (a chunk partially written when the bot stopped) is overwritten
+            file.truncate(self._file_size)
+            file.seek(self._file_size)
+            file.write(b"".join(content))
+            self._file_size = file.tell()
+
+    @staticmethod
+    def _to_int(value) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return -1
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class OrderBookRecordReader:
+    """
+    Reads the files written by OrderBookRecorder. The files are memory-mapped and only the headers of the chunks are
+    read to index them, the columns of a chunk are decompressed when the chunk is read, so reading a period of a file
+    only decompresses the chunks of that period.
+    """
+
+    def __init__(self, paths: Sequence[str]):
+        self._paths = sorted(paths)
+
+    @classmethod
+    def from_directory(cls,
+                       connector_name: str,
+                       root_path: Optional[str] = None,
+                       start: Optional[float] = None,
+                       end: Optional[float] = None) -> "OrderBookRecordReader":
+        """
+        :return: a reader of the files of the connector, limited to the files that can have messages received between
+            start and end
+        """
+        directory = os.path.join(root_path or build_default_records_path(), connector_name)
+        file_names = sorted(name for name in os.listdir(directory) if name.endswith(FILE_EXTENSION)) \
+            if os.path.isdir(directory) else []
+        periods = [datetime.strptime(name[:-len(FILE_EXTENSION)], "%Y%m%d-%H%M%S").replace(
+            tzinfo=timezone.utc).timestamp() for name in file_names]
+        paths = [os.path.join(directory, name) for index, name in enumerate(file_names)
+                 if (end is None or periods[index] <= end)
+                 and (start is None or index + 1 == len(periods) or periods[index + 1] > start)]
+        return cls(paths)
+
+    @property
+    def paths(self) -> List[str]:
+        return self._paths
+
+    @staticmethod
+    def valid_size(path: str) -> int:
+        """
+        :return: the size of the file up to the end of its last complete chunk, 0 if there is no valid file
+        """
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return 0
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            chunks = list(OrderBookRecordReader._index(data))
+            if len(chunks) == 0:
+                return OrderBookRecordReader._data_start(data)
+            _, offset, header = chunks[-1]
+            return offset + sum(size for _, _, size in header["columns"])
+
+    def chunks(self,
+               start: Optional[float] = None,
+               end: Optional[float] = None,
+               trading_pairs: Optional[Sequence[str]] = None) -> Iterator[OrderBookRecordChunk]:
+        """
+        Reads the chunks with messages received between start and end (inclusive), in the order they were recorded.
+        The chunks are not filtered by message, only skipped when none of their messages is in the period.
+        """
+        for path in self._paths:
+            if os.path.getsize(path) == 0:
+                continue
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for _, offset, header in self._index(data):
+                    if (start is not None and header["end"] < start) or (end is not None and header["start"] > end):
+                        continue
+                    if trading_pairs is not None and not set(trading_pairs).intersection(header["trading_pairs"]):
+                        continue
+                    yield self._read_chunk(data, offset, header)
+
+    def messages(self,
+                 start: Optional[float] = None,
+                 end: Optional[float] = None,
+                 trading_pairs: Optional[Sequence[str]] = None) -> Iterator[Tuple[float, OrderBookMessage]]:
+        """
+        Replays the recorded messages received between start and end (inclusive).
+        :return: the reception time and the message, in the order they were recorded
+        """
+        for chunk in self.chunks(start, end, trading_pairs):
+            messages = chunk.messages
+            level_ends = chunk.level_ends
+            prices = chunk.levels["level_price"].tolist()
+            amounts = chunk.levels["level_amount"].tolist()
+            for index in self._selected_indexes(chunk, start, end, trading_pairs):
+                received = float(messages["received"][index])
+                trading_pair = chunk.trading_pairs[messages["trading_pair"][index]]
+                message_type = OrderBookMessageType(int(messages["type"][index]))
+                timestamp = float(messages["timestamp"][index])
+                if message_type is OrderBookMessageType.TRADE:
+                    content = {
+                        "trading_pair": trading_pair,
+                        "trade_type": float(messages["trade_type"][index]),
+                        "trade_id": chunk.trade_ids[index],
+                        "update_id": int(messages["update_id"][index]),
+                        "price": float(messages["price"][index]),
+                        "amount": float(messages["amount"][index]),
+                    }
+                else:
+                    levels_end = int(level_ends[index])
+                    bids_end = levels_end - int(messages["asks"][index])
+                    levels_start = bids_end - int(messages["bids"][index])
+                    content = {
+                        "trading_pair": trading_pair,
+                        "update_id": int(messages["update_id"][index]),
+                        "first_update_id": int(messages["first_update_id"][index]),
+                        "bids": [[price, amount] for price, amount in zip(prices[levels_start:bids_end],
+                                                                          amounts[levels_start:bids_end])],
+                        "asks": [[price, amount] for price, amount in zip(prices[bids_end:levels_end],
+                                                                          amounts[bids_end:levels_end])],
+                    }
+                yield received, OrderBookMessage(message_type, content, timestamp=timestamp)
+
+    def trades_df(self,
+                  start: Optional[float] = None,
+                  end: Optional[float] = None,
+                  trading_pairs: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        :return: the recorded trades received between start and end, with a row per trade
+        """
+        frames = []
+        for chunk in self.chunks(start, end, trading_pairs):
+            indexes = self._selected_indexes(chunk, start, end, trading_pairs)
+            indexes = indexes[chunk.messages["type"][indexes] == OrderBookMessageType.TRADE.value]
+            frames.append(pd.DataFrame({
+                "received": chunk.messages["received"][indexes],
+                "timestamp": chunk.messages["timestamp"][indexes],
+                "trading_pair": [chunk.trading_pairs[index] for index in chunk.messages["trading_pair"][indexes]],
+                "price": chunk.messages["price"][indexes],
+                "amount": chunk.messages["amount"][indexes],
+                "trade_type": [TradeType(value).name for value in chunk.messages["trade_type"][indexes]],
+                "trade_id": [chunk.trade_ids[index] for index in indexes],
+            }))
+        if len(frames) == 0:
+            return pd.DataFrame(columns=["received", "timestamp", "trading_pair", "price", "amount", "trade_type",
+                                         "trade_id"])
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _selected_indexes(chunk: OrderBookRecordChunk,
+                          start: Optional[float],
+                          end: Optional[float],
+                          trading_pairs: Optional[Sequence[str]]) -> np.ndarray:
+        received = chunk.messages["received"]
+        selected = np.ones(len(received), dtype=bool)
+        if start is not None:
+            selected &= received >= start
+        if end is not None:
+            selected &= received <= end
+        if trading_pairs is not None:
+            pair_indexes = [index for index, pair in enumerate(chunk.trading_pairs) if pair in trading_pairs]
+            selected &= np.isin(chunk.messages["trading_pair"], pair_indexes)
+        return np.flatnonzero(selected)
+
+    @staticmethod
+    def _data_start(data: mmap.mmap) -> int:
+        if len(data) < _HEADER_STRUCT.size:
+            return 0
+        magic, header_size = _HEADER_STRUCT.unpack_from(data, 0)
+        if magic != FILE_MAGIC or len(data) < _HEADER_STRUCT.size + header_size:
+            return 0
+        return _HEADER_STRUCT.size + header_size
+
+    @staticmethod
+    def _index(data: mmap.mmap) -> Iterator[Tuple[int, int, dict]]:
+        """
+        :return: the offset of each complete chunk, the offset of its columns and its header
+        """
+        offset = OrderBookRecordReader._data_start(data)
+        if offset == 0:
+            return
+        while offset + _HEADER_STRUCT.size <= len(data):
+            magic, header_size = _HEADER_STRUCT.unpack_from(data, offset)
+            columns_offset = offset + _HEADER_STRUCT.size + header_size
+            if magic != CHUNK_MAGIC or columns_offset > len(data):
+                return
+            try:
+                header = json.loads(data[offset + _HEADER_STRUCT.size:columns_offset])
+            except ValueError:
+                return
+            chunk_end = columns_offset + sum(size for _, _, size in header["columns"])
+            if chunk_end > len(data):
+                return
+            yield offset, columns_offset, header
+            offset = chunk_end
+
+    @staticmethod
+    def _read_chunk(data: mmap.mmap, offset: int, header: dict) -> OrderBookRecordChunk:
+        columns = {}
+        for name, dtype, size in header["columns"]:
+            columns[name] = _unshuffle(zlib.decompress(data[offset:offset + size]), np.dtype(dtype))
+            offset += size
+        trade_id_bytes = columns.pop("trade_id").tobytes()
+        trade_id_ends = columns["trade_id_end"].tolist()
+        trade_ids = [trade_id_bytes[trade_id_start:trade_id_end].decode()
+                     for trade_id_start, trade_id_end in zip([0] + trade_id_ends[:-1], trade_id_ends)]
+        return OrderBookRecordChunk(
+            trading_pairs=header["trading_pairs"],
+            messages={name: columns[name] for name in MESSAGE_COLUMNS},
+            levels={name: columns[name] for name in LEVEL_COLUMNS},
+            trade_ids=trade_ids,
+        )
+
+
+def _shuffle(array: np.ndarray) -> bytes:
+    # Groups the bytes of the values by significance, the high bytes of similar numbers are the same and compress well
+    array = np.ascontiguousarray(array)
+    return array.view(np.uint8).reshape(-1, array.dtype.itemsize).T.tobytes()
+
+
+def _unshuffle(raw: bytes, dtype: np.dtype) -> np.ndarray:
+    return np.frombuffer(raw, dtype=np.uint8).reshape(dtype.itemsize, -1).T.copy().view(dtype).ravel()
@@ -0,0 +1,118 @@
+import asyncio
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecordReader
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source replaying the messages recorded by OrderBookRecorder instead of connecting to an exchange.
+
+    When the order book tracker is started, the recorded messages are streamed to it in the order they were received,
+    at speed times the recorded pace, or as fast as possible if speed is None. For deterministic backtests, use a
+    ReplayClock instead of starting the tracker: the clock applies the messages to the order books between its ticks.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 reader: OrderBookRecordReader,
+                 start: Optional[float] = None,
+                 end: Optional[float] = None,
+                 speed: Optional[float] = 1.0):
+        """
+        :param trading_pairs: the trading pairs to replay
+        :param reader: the reader of the recorded files
+        :param start: replay the messages received from this time, all the messages are replayed if None
+        :param end: replay the messages received until this time (inclusive), all the messages are replayed if None
+        :param speed: multiplier of the recorded pace when streaming to a started tracker, None to stream as fast as
+            possible
+        """
+        super().__init__(trading_pairs=trading_pairs)
+        if speed is not None and speed <= 0:
+            raise ValueError(f"The replay speed must be positive (got {speed}).")
+        self._reader = reader
+        self._start = start
+        self._end = end
+        self._speed = speed
+        self._initial_snapshots: Dict[str, OrderBookMessage] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def speed(self) -> Optional[float]:
+        return self._speed
+
+    def messages(self) -> Iterator[Tuple[float, OrderBookMessage]]:
+        """
+        Replays the recorded messages of the trading pairs, starting with the first snapshot of each trading pair. The
+        diffs and trades received before the first snapshot of their trading pair are skipped.
+
+        :return: the reception time and the message, in the order they were received
+        """
+        snapshot_received = set()
+        for received, message in self._reader.messages(self._start, self._end, self._trading_pairs):
+            trading_pair = message.trading_pair
+            if trading_pair not in snapshot_received:
+                if message.type is not OrderBookMessageType.SNAPSHOT:
+                    continue
+                snapshot_received.add(trading_pair)
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[trading_pair] = float(message.content["price"])
+            yield received, message
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs if trading_pair in self._last_traded_prices}
+
+    async def listen_for_subscriptions(self):
+        """
+        Streams the recorded messages after the initial snapshots to the message queues, at the replay speed.
+        """
+        initialized = set()
+        first_received: Optional[float] = None
+        start_time: float = self._time()
+        for received, message in self.messages():
+            if message.trading_pair not in initialized:
+                # The first snapshot is the one the order book is created from
+                initialized.add(message.trading_pair)
+                continue
+            if first_received is None:
+                first_received = received
+            delay = 0.0
+            if self._speed is not None:
+                delay = start_time + (received - first_received) / self._speed - self._time()
+            await self._sleep(max(delay, 0.0))
+            self._message_queue[self._queue_key(message)].put_nowait(message)
+        # The recorded messages are exhausted, the order books do not change anymore
+        await asyncio.Event().wait()
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        if trading_pair not in self._initial_snapshots:
+            for _, message in self._reader.messages(self._start, self._end, [trading_pair]):
+                if message.type is OrderBookMessageType.SNAPSHOT:
+                    self._initial_snapshots[trading_pair] = message
+                    break
+            else:
+                raise ValueError(f"No order book snapshot recorded for {trading_pair}.")
+        return self._initial_snapshots[trading_pair]
+
+    async def _request_order_book_snapshots(self, output: asyncio.Queue):
+        # The snapshots are replayed from the records, there is no exchange to request them from
+        pass
+
+    async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def _queue_key(self, message: OrderBookMessage) -> str:
+        if message.type is OrderBookMessageType.TRADE:
+            return self._trade_messages_queue_key
+        if message.type is OrderBookMessageType.DIFF:
+            return self._diff_messages_queue_key
+        return self._snapshot_messages_queue_key
@@ -10,9 +10,10 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +24,7 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_CONCURRENT_INITIALIZATIONS: int = 10
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +33,19 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_initializations: Optional[int] = None):
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._max_concurrent_initializations: int = (
+            max_concurrent_initializations or self.MAX_CONCURRENT_INITIALIZATIONS
+        )
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +55,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._recorder: Optional[OrderBookRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +79,31 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair in self._trading_pairs
+                if self._order_book_initialized_events[trading_pair].is_set()]
+
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookRecorder]):
+        """
+        :param recorder: the recorder of all the snapshots, diffs and trades received, None to stop recording. The
+            order books already initialized are recorded as snapshots first.
+        """
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder = recorder
+        if recorder is not None:
+            for trading_pair, order_book in self._order_books.items():
+                recorder.record_order_book(trading_pair, order_book)
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return self._order_book_initialized_events[trading_pair].is_set()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,10 +174,44 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for event in self._order_book_initialized_events.values():
+            event.clear()
+        if self._recorder is not None:
+            self._recorder.flush()
+
+    def apply_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot, diff or trade message to its order book right away, without going through the message
+        streams. Used to replay recorded messages in a deterministic order.
+        The first snapshot of a trading pair creates its order book, the diffs and trades received before are ignored.
+        """
+        trading_pair: str = message.trading_pair
+        order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            if order_book is None:
+                order_book = self._data_source.order_book_create_function()
+                order_book.apply_snapshot_message(message)
+                self._order_books[trading_pair] = order_book
+                self._order_book_initialized_events[trading_pair].set()
+                if all(pair in self._order_books for pair in self._trading_pairs):
+                    self._order_books_initialized.set()
+            else:
+                order_book.restore_from_snapshot_and_diffs(message, list(self._past_diffs_windows[trading_pair]))
+        elif order_book is None:
+            return
+        elif message.type is OrderBookMessageType.DIFF:
+            if order_book.snapshot_uid <= message.update_id:
+                order_book.apply_diff_message(message)
+                self._past_diffs_windows[trading_pair].append(message)
+        elif message.type is OrderBookMessageType.TRADE:
+            order_book.apply_trade(self._trade_event(message))
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_initialized_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -174,15 +244,29 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books.
+        Snapshots are requested concurrently, up to the configured number of requests in flight. The snapshot requests
+        go through the data source throttler, so the pace is set by the exchange rate limits. Each order book is
+        tracked and marked as ready as soon as its own snapshot is available.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        semaphore = asyncio.Semaphore(self._max_concurrent_initializations)
+        initialized_count = 0
+
+        async def init_order_book(trading_pair: str):
+            nonlocal initialized_count
+            async with semaphore:
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+            if self._recorder is not None:
+                self._recorder.record_order_book(trading_pair, order_book)
+            self._order_books[trading_pair] = order_book
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            self._order_book_initialized_events[trading_pair].set()
+            initialized_count += 1
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+                               f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
     async def _order_book_diff_router(self):
@@ -197,6 +281,8 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                if self._recorder is not None:
+                    self._recorder.record(ob_message)
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
@@ -242,6 +328,8 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                if self._recorder is not None:
+                    self._recorder.record(ob_message)
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
                     continue
@@ -272,7 +360,7 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -303,6 +391,8 @@ class OrderBookTracker:
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                if self._recorder is not None:
+                    self._recorder.record(trade_message)
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
@@ -310,15 +400,7 @@ class OrderBookTracker:
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    trade_id=trade_message.trade_id,
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                order_book.apply_trade(self._trade_event(trade_message))
 
                 messages_accepted += 1
 
@@ -340,6 +422,18 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _trade_event(trade_message: OrderBookMessage) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            trade_id=trade_message.trade_id,
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        )
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
@@ -0,0 +1,110 @@
+import heapq
+import math
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class ReplayClock(Clock):
+    """
+    Backtesting clock driven by the messages recorded by OrderBookRecorder.
+
+    The recorded snapshots, diffs and trades of the order book trackers (with an OrderBookReplayDataSource) are applied
+    to their order books in the order they were received, each one after the clock ticks preceding its reception time.
+    The child iterators (connectors, strategies) see the same order books at the same ticks on every replay, so the
+    backtests are deterministic. The replay runs as fast as possible, or at speed times real time.
+    """
+
+    def __init__(self,
+                 order_book_trackers: List[OrderBookTracker],
+                 tick_size: float = 1.0,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 speed: Optional[float] = None):
+        """
+        :param order_book_trackers: the trackers to replay the messages of, they must use an OrderBookReplayDataSource
+        :param tick_size: time interval of each tick
+        :param start_time: start of the simulation, the tick of the first recorded message if None. The messages
+            received before are applied before the first tick.
+        :param end_time: end of the simulation for backtest(), the reception time of the last message if None
+        :param speed: multiplier of the real time pace of the ticks, None to replay as fast as possible
+        """
+        for tracker in order_book_trackers:
+            if not isinstance(tracker.data_source, OrderBookReplayDataSource):
+                raise ValueError(f"The order book tracker {tracker} does not replay recorded messages.")
+        if speed is not None and speed <= 0:
+            raise ValueError(f"The replay speed must be positive (got {speed}).")
+
+        self._order_book_trackers = order_book_trackers
+        self._messages: Iterator[Tuple[float, int, OrderBookMessage]] = heapq.merge(
+            *[self._tracker_messages(index, tracker) for index, tracker in enumerate(order_book_trackers)],
+            key=lambda item: item[0])
+        self._next_message: Optional[Tuple[float, int, OrderBookMessage]] = next(self._messages, None)
+        if start_time is None:
+            start_time = 0.0 if self._next_message is None else (self._next_message[0] // tick_size) * tick_size
+        super().__init__(ClockMode.BACKTEST, tick_size, start_time, end_time or 0.0)
+        self._replay_end_time = end_time
+        self._last_message_timestamp: Optional[float] = None
+        self._speed = speed
+        self._pace_start: Optional[Tuple[float, float]] = None
+
+    @property
+    def speed(self) -> Optional[float]:
+        return self._speed
+
+    @property
+    def next_message_timestamp(self) -> Optional[float]:
+        """
+        :return: the reception time of the next message to replay, None if all the messages have been replayed
+        """
+        return None if self._next_message is None else self._next_message[0]
+
+    def backtest_til(self, timestamp: float):
+        """
+        Replays the messages received until the timestamp (inclusive), then ticks the clock until the timestamp.
+        An infinite timestamp replays all the messages and stops at the tick of the last one.
+        """
+        while self._next_message is not None and self._next_message[0] <= timestamp:
+            received, index, message = self._next_message
+            self._tick_before(received)
+            self._order_book_trackers[index].apply_message(message)
+            self._last_message_timestamp = received
+            self._next_message = next(self._messages, None)
+        if math.isinf(timestamp):
+            timestamp = self._last_message_timestamp if self._last_message_timestamp is not None else self.start_time
+        self._tick_before(timestamp)
+        self._tick(timestamp)
+
+    def backtest(self):
+        self.backtest_til(math.inf if self._replay_end_time is None else self._replay_end_time)
+
+    def _tick_before(self, timestamp: float):
+        """
+        Runs all the ticks strictly before the timestamp.
+        """
+        tick_size = self.tick_size
+        if self._speed is None and self.current_timestamp + 2 * tick_size < timestamp:
+            # Stops one tick or less before the timestamp
+            Clock.backtest_til(self, timestamp - 1.5 * tick_size)
+        while self.current_timestamp + tick_size < timestamp:
+            self._tick(self.current_timestamp + tick_size)
+
+    def _tick(self, timestamp: float):
+        if self._speed is not None:
+            if self._pace_start is None:
+                self._pace_start = (time.perf_counter(), self.current_timestamp)
+            wall_start, replay_start = self._pace_start
+            delay = wall_start + (timestamp - replay_start) / self._speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        Clock.backtest_til(self, timestamp)
+
+    @staticmethod
+    def _tracker_messages(index: int, tracker: OrderBookTracker) -> Iterator[Tuple[float, int, OrderBookMessage]]:
+        for received, message in tracker.data_source.messages():
+            yield received, index, message
@@ -0,0 +1,117 @@
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+
+import aiohttp
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSettings:
+    """Connection pool settings of the aiohttp sessions created by the `ConnectionsFactory`.
+
+    :param limit_per_host: maximum number of simultaneous connections to a single host (0 for no limit)
+    :param keepalive_timeout: seconds an idle connection is kept open for reuse (0 closes connections after each
+        request)
+    :param dns_cache_ttl: seconds the resolved host addresses are cached (0 for no caching)
+    :param per_host_sessions: if True each host gets its own session (and pool), otherwise all the hosts share one
+    """
+
+    limit_per_host: int = 50
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    per_host_sessions: bool = True
+
+    def build_connector(self, limit_per_host: Optional[int] = None) -> aiohttp.TCPConnector:
+        limit_per_host = self.limit_per_host if limit_per_host is None else limit_per_host
+        keepalive_kwargs = (
+            {"keepalive_timeout": self.keepalive_timeout} if self.keepalive_timeout > 0 else {"force_close": True}
+        )
+        return aiohttp.TCPConnector(
+            # The total limit is left to the hosts limit, a shared session must not cap the number of hosts
+            limit=0,
+            limit_per_host=limit_per_host,
+            use_dns_cache=self.dns_cache_ttl > 0,
+            ttl_dns_cache=self.dns_cache_ttl or None,
+            **keepalive_kwargs,
+        )
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    """Usage statistics of the connection pool of a session, collected through aiohttp request tracing.
+
+    A request waits in the pool queue when all the connections allowed for its host are in use.
+    """
+
+    limit_per_host: int = 0
+    requests: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued: int = 0
+    queued_requests: int = 0
+    total_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+
+    @property
+    def occupancy(self) -> float:
+        """
+        :return: the fraction of the host connections limit in use by the requests in flight, the requests waiting for a
+            connection excluded (0 if there is no limit)
+        """
+        return (self.in_flight - self.queued) / self.limit_per_host if self.limit_per_host > 0 else 0.0
+
+    @property
+    def average_queue_wait(self) -> float:
+        return self.total_queue_wait / self.queued_requests if self.queued_requests > 0 else 0.0
+
+    def build_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_end)
+        trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self.in_flight -= 1
+
+    async def _on_connection_queued_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        context.queued_timestamp = time.perf_counter()
+        self.queued += 1
+        self.queued_requests += 1
+
+    async def _on_connection_queued_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        wait_time = time.perf_counter() - context.queued_timestamp
+        self.queued -= 1
+        self.total_queue_wait += wait_time
+        self.max_queue_wait = max(self.max_queue_wait, wait_time)
+
+    async def _on_connection_create_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self.connections_reused += 1
+
+
+_default_pool_settings = ConnectionPoolSettings()
+
+
+def get_default_connection_pool_settings() -> ConnectionPoolSettings:
+    return _default_pool_settings
+
+
+def set_default_connection_pool_settings(settings: ConnectionPoolSettings):
+    """Sets the settings used by the sessions created from now on (the existing sessions are not modified)."""
+    global _default_pool_settings
+    _default_pool_settings = settings
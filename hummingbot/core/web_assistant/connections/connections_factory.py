@@ -1,10 +1,19 @@
-from typing import Optional
+from typing import Dict, Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionPoolMetrics,
+    ConnectionPoolSettings,
+    get_default_connection_pool_settings,
+)
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
+WS_SESSION_KEY = "ws"
+SHARED_REST_SESSION_KEY = "rest"
+
 
 class ConnectionsFactory:
     """This class is a thin wrapper around the underlying REST and WebSocket third-party library.
@@ -12,28 +21,75 @@ class ConnectionsFactory:
     The purpose of the class is to isolate the general `web_assistant` infrastructure from the underlying library
     (in this case, `aiohttp`) to enable dependency change with minimal refactoring of the code.
 
+    REST requests to each host go through a session of their own, so a slow host can only exhaust its own connection
+    pool. WebSocket connections are kept for the lifetime of the stream, so they use a separate session without
+    connection limits and never take the connections of the REST requests.
+    The pools usage can be inspected through `pool_metrics`.
+
     Note: One future possibility is to enable injection of a specific connection factory implementation in the
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(self, pool_settings: Optional[ConnectionPoolSettings] = None):
+        """
+        :param pool_settings: the connection pool settings, the settings from the client configuration are used if
+            not specified
+        """
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._pool_settings: Optional[ConnectionPoolSettings] = pool_settings
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._pool_metrics: Dict[str, ConnectionPoolMetrics] = {}
+
+    @property
+    def pool_settings(self) -> ConnectionPoolSettings:
+        return self._pool_settings or get_default_connection_pool_settings()
+
+    @property
+    def pool_metrics(self) -> Dict[str, ConnectionPoolMetrics]:
+        """
+        :return: the connection pool metrics of each session, by host (or `ws` for the WebSocket connections)
+        """
+        return dict(self._pool_metrics)
 
     async def get_rest_connection(self) -> RESTConnection:
-        shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(session_provider=self._get_rest_session)
         return connection
 
-    async def get_ws_connection(self) -> WSConnection:
-        shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+    async def get_ws_connection(self, json_codec: Optional[JSONCodec] = None) -> WSConnection:
+        ws_session = self._ws_independent_session or self._get_session(WS_SESSION_KEY, limit_per_host=0)
+        connection = WSConnection(aiohttp_client_session=ws_session, json_codec=json_codec)
         return connection
 
-    async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
-        return self._shared_client
+    async def close(self):
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+
+    def _get_rest_session(self, url: str) -> aiohttp.ClientSession:
+        return self._get_session(self._rest_session_key(url))
+
+    def _rest_session_key(self, url: str) -> str:
+        if not self.pool_settings.per_host_sessions:
+            return SHARED_REST_SESSION_KEY
+        # Faster than a full URL parse, the requests are always made to absolute URLs
+        scheme, _, rest = url.partition("://")
+        return f"{scheme}://{rest.partition('/')[0].partition('?')[0]}"
+
+    def _get_session(self, key: str, limit_per_host: Optional[int] = None) -> aiohttp.ClientSession:
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            settings = self.pool_settings
+            metrics = ConnectionPoolMetrics(
+                limit_per_host=settings.limit_per_host if limit_per_host is None else limit_per_host
+            )
+            session = aiohttp.ClientSession(
+                connector=settings.build_connector(limit_per_host=limit_per_host),
+                trace_configs=[metrics.build_trace_config()],
+            )
+            self._sessions[key] = session
+            self._pool_metrics[key] = metrics
+        return session
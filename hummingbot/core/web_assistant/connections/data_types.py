@@ -1,11 +1,14 @@
+import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Union
 
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, get_json_codec
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -35,6 +38,21 @@ class RESTRequest:
     is_auth_required: bool = False
     throttler_limit_id: Optional[str] = None
 
+    def copy(self) -> "RESTRequest":
+        """Returns a copy of the request that can be updated without changing the original.
+
+        Only the `params`, `data` and `headers` containers are copied, pre-processors and authenticators replace or
+        update them but never modify the values they contain.
+        """
+        request = copy.copy(self)
+        if isinstance(self.params, (dict, list)):
+            request.params = self.params.copy()
+        if isinstance(self.data, (dict, list)):
+            request.data = self.data.copy()
+        if isinstance(self.headers, dict):
+            request.headers = self.headers.copy()
+        return request
+
 
 @dataclass
 class EndpointRESTRequest(RESTRequest, ABC):
@@ -109,7 +127,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=get_json_codec().loads)
         return json_
 
     async def text(self) -> str:
@@ -153,6 +171,38 @@ class WSBinaryRequest(WSRequest):
         await connection._send_binary(payload=self.payload)
 
 
-@dataclass
+@dataclass(init=False)
 class WSResponse:
+    """A message received through a WebSocket.
+
+    Text frames are kept `raw` and decoded as JSON the first time `data` is accessed, so that processors can inspect
+    (or discard) a message without paying for a full decoding. Payloads that are not valid JSON are returned as
+    received.
+    """
     data: Any
+
+    def __init__(self, data: Any = None, raw: Optional[Union[str, bytes]] = None, json_codec: Optional[JSONCodec] = None):
+        self._data = data
+        self._raw = raw
+        self._json_codec = json_codec
+        self._decoded = raw is None
+
+    @property
+    def data(self) -> Any:
+        if not self._decoded:
+            try:
+                self._data = (self._json_codec or get_json_codec()).loads(self._raw)
+            except ValueError:
+                self._data = self._raw
+            self._decoded = True
+        return self._data
+
+    @data.setter
+    def data(self, data: Any):
+        self._data = data
+        self._decoded = True
+
+    @property
+    def raw(self) -> Optional[Union[str, bytes]]:
+        """The payload of the frame as received, None for responses created from already decoded data."""
+        return self._raw
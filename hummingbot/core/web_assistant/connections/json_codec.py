@@ -0,0 +1,115 @@
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+class JSONCodec:
+    """Encodes and decodes the JSON payloads sent and received by the web assistants using the standard library.
+
+    Decoding errors are raised as `ValueError`s (`json.JSONDecodeError` is a subclass) by all the codecs.
+    """
+
+    name = "json"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec backed by `ujson`."""
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj, escape_forward_slashes=False)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by `orjson`.
+
+    Payloads `orjson` can't handle (e.g. integers above 64 bits, or NaN values in the received documents) are
+    processed by the standard library instead.
+    """
+
+    name = "orjson"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return orjson is not None
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+class SimdjsonCodec(JSONCodec):
+    """Decodes with `simdjson` (pysimdjson), encodes with the standard library."""
+
+    name = "simdjson"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return simdjson is not None
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return simdjson.loads(data)
+
+
+JSON_CODECS: Dict[str, Type[JSONCodec]] = {
+    codec.name: codec for codec in (JSONCodec, UjsonCodec, OrjsonCodec, SimdjsonCodec)
+}
+# Selects the fastest installed codec
+AUTO_JSON_CODEC = "auto"
+AUTO_JSON_CODEC_PREFERENCE = (OrjsonCodec, UjsonCodec, JSONCodec)
+
+_default_json_codec: Optional[JSONCodec] = None
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    :param name: the name of the codec (or `auto`), the default codec is returned if not specified
+    :return: the JSON codec, the standard library codec is used if the requested one is not installed
+    """
+    global _default_json_codec
+    if name is None:
+        if _default_json_codec is None:
+            _default_json_codec = get_json_codec(AUTO_JSON_CODEC)
+        return _default_json_codec
+    if name == AUTO_JSON_CODEC:
+        return next(codec for codec in AUTO_JSON_CODEC_PREFERENCE if codec.is_available())()
+    codec_class = JSON_CODECS.get(name, JSONCodec)
+    return codec_class() if codec_class.is_available() else JSONCodec()
+
+
+def set_default_json_codec(name: str):
+    global _default_json_codec
+    _default_json_codec = get_json_codec(name)
@@ -1,13 +1,26 @@
+from typing import Callable, Optional
+
 import aiohttp
+
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
 
 
 class RESTConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        aiohttp_client_session: Optional[aiohttp.ClientSession] = None,
+        session_provider: Optional[Callable[[str], aiohttp.ClientSession]] = None,
+    ):
+        """
+        :param aiohttp_client_session: the session used for all the requests
+        :param session_provider: returns the session to use for a request URL, used if no session is specified
+        """
         self._client_session = aiohttp_client_session
+        self._session_provider = session_provider
 
     async def call(self, request: RESTRequest) -> RESTResponse:
-        aiohttp_resp = await self._client_session.request(
+        client_session = self._client_session or self._session_provider(request.url)
+        aiohttp_resp = await client_session.request(
             method=request.method.value,
             url=request.url,
             params=request.params,
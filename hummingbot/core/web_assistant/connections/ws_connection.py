@@ -1,16 +1,17 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, get_json_codec
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodec] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or get_json_codec()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -117,7 +118,7 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=self._json_codec.dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
@@ -125,14 +126,9 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
-            data = msg.data
+            response = WSResponse(msg.data)
         else:
-            try:
-                data = msg.json()
-            except JSONDecodeError:
-                data = msg.data
-        response = WSResponse(data)
+            response = WSResponse(raw=msg.data, json_codec=self._json_codec)
         return response
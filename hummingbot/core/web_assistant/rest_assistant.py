@@ -1,15 +1,18 @@
-import json
 from asyncio import wait_for
-from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RequestPriority
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, get_json_codec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
+_JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+_FORM_CONTENT_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 
 class RESTAssistant:
     """A helper class to contain all REST-related logic.
@@ -17,6 +20,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    The requests passed to `call` are never modified. They are copied only when a pre-processor or the authenticator
+    is going to process them.
     """
     def __init__(
         self,
@@ -25,12 +31,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._json_codec = json_codec or get_json_codec()
 
     async def execute_request(
         self,
@@ -43,6 +51,7 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        priority: Optional[RequestPriority] = None,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -54,6 +63,7 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            priority=priority,
         )
         response_json = await response.json()
         return response_json
@@ -69,16 +79,13 @@ class RESTAssistant:
             return_err: bool = False,
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
     ) -> RESTResponse:
 
-        headers = headers or {}
-
-        local_headers = {
-            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
-
-        local_headers.update(headers)
+        local_headers = _JSON_CONTENT_HEADERS if method != RESTMethod.GET else _FORM_CONTENT_HEADERS
+        local_headers = {**local_headers, **headers} if headers else local_headers.copy()
 
-        data = json.dumps(data) if data is not None else data
+        data = self._json_codec.dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
@@ -90,7 +97,7 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -102,11 +109,13 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
-        request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
+        if self._rest_pre_processors or (self._auth is not None and request.is_auth_required):
+            request = request.copy()
+            request = await self._pre_process_request(request)
+            request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
-        resp = await self._post_process_response(resp)
+        if self._rest_post_processors:
+            resp = await self._post_process_response(resp)
         return resp
 
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import ConnectionPoolMetrics
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -29,6 +31,7 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
         self._connections_factory = ConnectionsFactory()
         self._rest_pre_processors = rest_pre_processors or []
@@ -37,6 +40,8 @@ class WebAssistantsFactory:
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._json_codec = json_codec
+        self._rest_assistant: Optional[RESTAssistant] = None
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
@@ -46,19 +51,26 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_pool_metrics(self) -> Dict[str, ConnectionPoolMetrics]:
+        return self._connections_factory.pool_metrics
+
     async def get_rest_assistant(self) -> RESTAssistant:
-        connection = await self._connections_factory.get_rest_connection()
-        assistant = RESTAssistant(
-            connection=connection,
-            throttler=self._throttler,
-            rest_pre_processors=self._rest_pre_processors,
-            rest_post_processors=self._rest_post_processors,
-            auth=self._auth
-        )
-        return assistant
+        # REST assistants don't keep any state between requests, so all the callers share the same one
+        if self._rest_assistant is None:
+            connection = await self._connections_factory.get_rest_connection()
+            self._rest_assistant = RESTAssistant(
+                connection=connection,
+                throttler=self._throttler,
+                rest_pre_processors=self._rest_pre_processors,
+                rest_post_processors=self._rest_post_processors,
+                auth=self._auth,
+                json_codec=self._json_codec,
+            )
+        return self._rest_assistant
 
     async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+        connection = await self._connections_factory.get_ws_connection(json_codec=self._json_codec)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
@@ -8,6 +8,9 @@ class WSPostProcessorBase(abc.ABC):
 
     The logic provided by a class implementing this interface is applied to a response
     before it is returned to the caller.
+
+    Text messages are decoded only when `response.data` is accessed. Processors that can handle a message from its
+    undecoded payload (e.g. to discard heartbeats) should use `response.raw` instead.
     """
 
     @abc.abstractmethod
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class WSRequestNotSentError(ConnectionError):
+    """
+    Raised when a request could not be sent because the websocket is not connected. The exchange never received it,
+    so it is safe to send it again through another transport.
+    """
+
+
+class WSRequestTransport:
+    """Sends requests through a persistent websocket connection and returns the matching responses.
+
+    Each request gets a new id, and the response carrying the same id is returned to the caller. The messages without
+    a pending request id (e.g. pushed events) are passed to `_process_unmatched_message`. The requests are paced by the
+    throttler of the assistants factory, with the limit id of the equivalent REST request when the exchange shares the
+    rate limits between both APIs.
+
+    The connection is kept open by a background task and re-established when it drops. The requests pending when the
+    connection drops fail with a `ConnectionError`, since they could have been received by the exchange. The requests
+    made while the websocket is disconnected fail with `WSRequestNotSentError`.
+
+    By default the request id is set in the "id" field of the payload and read from the "id" field of the responses.
+    Exchanges with a different protocol override `_request_payload` and `_response_request_id`, and
+    `_authenticate_connection` if the connection requires a login.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(
+        self,
+        api_factory: WebAssistantsFactory,
+        ws_url: str,
+        request_timeout: float = 10.0,
+        ping_timeout: float = 10.0,
+        reconnect_delay: float = 1.0,
+    ):
+        self._api_factory = api_factory
+        self._ws_url = ws_url
+        self._request_timeout = request_timeout
+        self._ping_timeout = ping_timeout
+        self._reconnect_delay = reconnect_delay
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._connected_event = asyncio.Event()
+        self._connection_task: Optional[asyncio.Task] = None
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._last_request_id = 0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected_event.is_set()
+
+    @property
+    def pending_requests_count(self) -> int:
+        return len(self._pending_requests)
+
+    def start(self):
+        if self._connection_task is None:
+            self._connection_task = safe_ensure_future(self._connection_loop())
+
+    def stop(self):
+        if self._connection_task is not None:
+            self._connection_task.cancel()
+            self._connection_task = None
+        self._connected_event.clear()
+        self._fail_pending_requests(ConnectionError("The websocket request transport was stopped."))
+
+    async def wait_connected(self):
+        await self._connected_event.wait()
+
+    async def request(
+        self,
+        payload: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+        throttler_limit_id: str,
+        is_auth_required: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Sends a request and waits for its response.
+
+        :param payload: the request content, without the request id. Or a function returning it, called once the
+            throttler lets the request through, for the requests signed with the current time
+        :param throttler_limit_id: the rate limit the request counts for
+        :param is_auth_required: if True the request is authenticated by the auth of the assistants factory
+        :param timeout: seconds to wait for the response, the transport request timeout by default
+
+        :return: the response data
+        """
+        ws_assistant = self._ws_assistant
+        if ws_assistant is None or not self.is_connected:
+            raise WSRequestNotSentError(f"The websocket connection to {self._ws_url} is not established.")
+
+        self._last_request_id += 1
+        request_id = str(self._last_request_id)
+        response_future = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = response_future
+        try:
+            async with self._api_factory.throttler.execute_task(limit_id=throttler_limit_id):
+                if ws_assistant is not self._ws_assistant:
+                    raise WSRequestNotSentError(f"The websocket connection to {self._ws_url} was closed.")
+                if callable(payload):
+                    payload = payload()
+                request = WSJSONRequest(payload=self._request_payload(request_id=request_id, payload=payload),
+                                        is_auth_required=is_auth_required)
+                try:
+                    await ws_assistant.send(request)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exception:
+                    raise WSRequestNotSentError(f"Error sending the websocket request ({exception})") from exception
+            return await asyncio.wait_for(response_future, timeout or self._request_timeout)
+        finally:
+            self._pending_requests.pop(request_id, None)
+            if response_future.done() and not response_future.cancelled():
+                # Marks the exception of a request that was never sent as retrieved
+                response_future.exception()
+
+    async def _connection_loop(self):
+        while True:
+            ws_assistant = None
+            try:
+                ws_assistant = await self._api_factory.get_ws_assistant()
+                await ws_assistant.connect(ws_url=self._ws_url, ping_timeout=self._ping_timeout)
+                await self._authenticate_connection(ws_assistant=ws_assistant)
+                self._ws_assistant = ws_assistant
+                self._connected_event.set()
+                await self._process_websocket_messages(ws_assistant=ws_assistant)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket request connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(f"Unexpected error in the websocket request connection to {self._ws_url}.")
+            finally:
+                self._connected_event.clear()
+                self._ws_assistant = None
+                self._fail_pending_requests(
+                    ConnectionError("The websocket connection was closed before the response was received."))
+                ws_assistant and await ws_assistant.disconnect()
+            await self._sleep(self._reconnect_delay)
+
+    async def _process_websocket_messages(self, ws_assistant: WSAssistant):
+        async for ws_response in ws_assistant.iter_messages():
+            message = ws_response.data
+            request_id = self._response_request_id(message=message)
+            response_future = self._pending_requests.get(request_id) if request_id is not None else None
+            if response_future is None:
+                await self._process_unmatched_message(message=message)
+            elif not response_future.done():
+                response_future.set_result(message)
+
+    def _fail_pending_requests(self, exception: Exception):
+        for response_future in self._pending_requests.values():
+            if not response_future.done():
+                response_future.set_exception(exception)
+        self._pending_requests.clear()
+
+    def _request_payload(self, request_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": request_id, **payload}
+
+    def _response_request_id(self, message: Any) -> Optional[str]:
+        request_id = message.get("id") if isinstance(message, dict) else None
+        return None if request_id is None else str(request_id)
+
+    async def _authenticate_connection(self, ws_assistant: WSAssistant):
+        """
+        Called after the connection is established and before any request is sent through it. Exchanges that require
+        a login request on the connection override it.
+        """
+        pass
+
+    async def _process_unmatched_message(self, message: Any):
+        pass
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
@@ -1,6 +1,6 @@
 import asyncio
 import os
-from collections import deque
+import time
 from typing import List, Optional
 
 import numpy as np
@@ -14,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore, get_default_candles_store
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a columnar ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -50,12 +52,13 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(columns=self.columns, maxlen=max_records)
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self._candles_store: Optional[CandlesStore] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -90,7 +93,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -140,13 +143,33 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame. The DataFrame is only
+        rebuilt when a candle is added, it shares the memory of the buffer so it includes the updates of the last
+        candle.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self._candles.to_df()
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
+    @property
+    def connector_name(self) -> str:
+        """
+        This property returns the name of the connector, the feed name without the trading pair.
+        """
+        return self.name[:-len(self._trading_pair) - 1]
+
+    @property
+    def candles_store(self) -> Optional[CandlesStore]:
+        """
+        This property returns the store the historical candles are read from before fetching them from the exchange.
+        """
+        return self._candles_store if self._candles_store is not None else get_default_candles_store()
+
+    @candles_store.setter
+    def candles_store(self, candles_store: Optional[CandlesStore]):
+        self._candles_store = candles_store
+
     def load_candles_from_csv(self, data_path: str):
         """
         This method loads the candles from a CSV file.
@@ -163,28 +186,52 @@ class CandlesBase(NetworkBase):
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
         try:
             await self.initialize_exchange_data()
-            all_candles = []
-            current_end_time = config.end_time + self.interval_in_seconds
-            current_start_time = config.start_time - self.interval_in_seconds
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                fetched_candles = await self.fetch_candles(end_time=current_end_time, limit=missing_records)
-                if fetched_candles.size <= 1:
-                    break
-                all_candles.append(fetched_candles)
-                last_timestamp = self.ensure_timestamp_in_seconds(
-                    fetched_candles[0][0])  # Assuming the first column is the timestamp
-                current_end_time = last_timestamp - self.interval_in_seconds
-                self.check_candles_sorted_and_equidistant(all_candles)
-            final_candles = np.concatenate(all_candles[::-1], axis=0) if all_candles else np.array([])
-            candles_df = pd.DataFrame(final_candles, columns=self.columns)
-            candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-            candles_df = candles_df[
-                (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
+            candles_store = self.candles_store
+            if candles_store is None:
+                return await self._fetch_historical_candles(config.start_time, config.end_time)
+            # Only the closed candles are stored, the ones in progress are returned as fetched
+            last_closed_time = min(config.end_time, int(self._time()) - self.interval_in_seconds)
+            candles_in_progress = []
+            for start_time, end_time in candles_store.get_missing_ranges(
+                    self.connector_name, self._trading_pair, self.interval, config.start_time, config.end_time):
+                candles_df = await self._fetch_historical_candles(start_time, end_time)
+                if start_time <= last_closed_time:
+                    candles_store.write(self.connector_name, self._trading_pair, self.interval, candles_df,
+                                        start_time, min(end_time, last_closed_time))
+                candles_in_progress.append(candles_df[candles_df["timestamp"] > last_closed_time])
+            candles_df = candles_store.read(self.connector_name, self._trading_pair, self.interval,
+                                            config.start_time, min(config.end_time, last_closed_time))
+            if len(candles_in_progress) > 0:
+                candles_df = pd.concat([candles_df] + candles_in_progress, ignore_index=True)
             return candles_df
         except Exception as e:
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
 
+    async def _fetch_historical_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        """
+        This method fetches from the exchange the candles between start_time and end_time.
+        """
+        all_candles = []
+        current_end_time = end_time + self.interval_in_seconds
+        current_start_time = start_time - self.interval_in_seconds
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            fetched_candles = await self.fetch_candles(end_time=current_end_time, limit=missing_records)
+            if fetched_candles.size <= 1:
+                break
+            all_candles.append(fetched_candles)
+            last_timestamp = self.ensure_timestamp_in_seconds(
+                fetched_candles[0][0])  # Assuming the first column is the timestamp
+            # The candles are fetched up to the end time excluded, the duplicated candles are dropped below
+            current_end_time = last_timestamp
+            self.check_candles_sorted_and_equidistant(all_candles)
+        final_candles = np.concatenate(all_candles[::-1], axis=0) if all_candles else np.array([])
+        candles_df = pd.DataFrame(final_candles, columns=self.columns)
+        candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+        candles_df = candles_df[
+            (candles_df["timestamp"] <= end_time) & (candles_df["timestamp"] >= start_time)]
+        return candles_df
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -266,14 +313,17 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
             try:
                 end_timestamp = int(self._candles[0][0])
                 missing_records = self._candles.maxlen - len(self._candles)
-                candles: np.ndarray = await self.fetch_candles(end_time=end_timestamp, limit=missing_records)
+                candles: Optional[np.ndarray] = self._read_stored_candles(end_timestamp, missing_records)
+                if candles is None:
+                    candles = await self.fetch_candles(end_time=end_timestamp, limit=missing_records)
+                    self._store_candles(candles, end_timestamp)
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
             except asyncio.CancelledError:
@@ -287,6 +337,35 @@ class CandlesBase(NetworkBase):
                 await self._sleep(1.0)
         self.check_candles_sorted_and_equidistant(self._candles)
 
+    def _read_stored_candles(self, end_timestamp: int, limit: int) -> Optional[np.ndarray]:
+        """
+        This method returns the stored candles preceding end_timestamp, or None if the store doesn't have all of them.
+        """
+        candles_store = self.candles_store
+        if candles_store is None:
+            return None
+        start_timestamp = end_timestamp - limit * self.interval_in_seconds
+        candles_df = candles_store.read(self.connector_name, self._trading_pair, self.interval,
+                                        start_timestamp, end_timestamp - 1)
+        if len(candles_df) < limit:
+            return None
+        return candles_df[self.columns].to_numpy(dtype=float)
+
+    def _store_candles(self, candles: np.ndarray, end_timestamp: int):
+        """
+        This method stores the candles fetched to fill the historical candles, the ones preceding end_timestamp are
+        closed.
+        """
+        candles_store = self.candles_store
+        if candles_store is None or len(candles) == 0:
+            return
+        try:
+            candles_df = pd.DataFrame(candles, columns=self.columns)
+            candles_store.write(self.connector_name, self._trading_pair, self.interval, candles_df,
+                                int(candles_df["timestamp"].min()), end_timestamp - 1)
+        except Exception:
+            self.logger().exception("Unexpected error storing the historical candles.")
+
     async def listen_for_subscriptions(self):
         """
         Connects to the candlestick websocket endpoint and listens to the messages sent by the
@@ -406,6 +485,10 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
     @staticmethod
     async def _sleep(delay):
         """
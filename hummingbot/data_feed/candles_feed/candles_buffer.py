@@ -0,0 +1,130 @@
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class CandlesBuffer:
+    """
+    Fixed size buffer of candles stored by column, with the interface of the `deque` it replaces (append, extend,
+    extendleft, indexing, len, maxlen and clear).
+
+    The candles are stored in a preallocated float64 array with one contiguous row per column, twice as long as the
+    maximum number of candles. New candles are written after the last one, the window of the last `maxlen` candles is
+    moved to the start of a new array only when the end of the array is reached, so appending a candle or updating the
+    last one in place doesn't allocate memory (amortized).
+
+    The DataFrame of the candles is built without copying the candles (its columns are views of the array) and is
+    cached until a candle is added, so the updates of the last candle are visible in the DataFrames already returned.
+    The arrays of the previous DataFrames are never overwritten by the new candles.
+    """
+
+    def __init__(self, columns: List[str], maxlen: int):
+        self._columns = list(columns)
+        self._maxlen = maxlen
+        self._data = np.empty((len(self._columns), 2 * max(maxlen, 1)), dtype=float)
+        self._start = 0
+        self._end = 0
+        self._df: Optional[pd.DataFrame] = None
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._data[:, self._position(index)].copy()
+
+    def __setitem__(self, index: int, candle: Iterable[float]):
+        self._data[:, self._position(index)] = np.asarray(candle, dtype=float)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for position in range(self._start, self._end):
+            yield self._data[:, position].copy()
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        :return: a read-only view of the values of a column, oldest candle first
+        """
+        values = self._data[self._columns.index(name), self._start:self._end]
+        values.flags.writeable = False
+        return values
+
+    def append(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if self._end == self._data.shape[1]:
+            self._reallocate(self._window()[:, len(self) - self._maxlen + 1:])
+        self._data[:, self._end] = np.asarray(candle, dtype=float)
+        self._end += 1
+        if len(self) > self._maxlen:
+            self._start += 1
+        self._df = None
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        candles = self._to_columns(candles)
+        if candles.shape[1] > 0:
+            window = np.concatenate([self._window(), candles], axis=1)
+            self._reallocate(window[:, max(window.shape[1] - self._maxlen, 0):])
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        """
+        Adds the candles before the first one, in reverse order like `deque.extendleft`. The last candles are
+        discarded if the buffer is full.
+        """
+        candles = self._to_columns(candles)
+        if candles.shape[1] > 0:
+            window = np.concatenate([candles[:, ::-1], self._window()], axis=1)
+            self._reallocate(window[:, :self._maxlen])
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self._df = None
+
+    def to_df(self) -> pd.DataFrame:
+        """
+        :return: a read-only DataFrame of the candles, sharing the memory of the buffer
+        """
+        if self._df is None:
+            # The transposed window is stored by pandas as a single block without copying it. It is read-only, so the
+            # callers can't overwrite the candles of the buffer
+            values = self._window().T
+            values.flags.writeable = False
+            self._df = pd.DataFrame(values, columns=self._columns, copy=False)
+        # A shallow copy so the columns added by the callers are not added to the cached DataFrame
+        return self._df.copy(deep=False)
+
+    def _window(self) -> np.ndarray:
+        return self._data[:, self._start:self._end]
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("candles index out of range")
+        return self._start + index
+
+    def _to_columns(self, candles: Iterable[Iterable[float]]) -> np.ndarray:
+        candles = np.asarray(list(candles), dtype=float)
+        if candles.size == 0:
+            return np.empty((len(self._columns), 0), dtype=float)
+        if candles.ndim != 2 or candles.shape[1] != len(self._columns):
+            raise ValueError(f"The candles must be rows of {len(self._columns)} values ({', '.join(self._columns)}).")
+        return candles.T
+
+    def _reallocate(self, window: np.ndarray):
+        # A new array is allocated instead of moving the candles, the DataFrames already built keep their values
+        data = np.empty_like(self._data)
+        data[:, :window.shape[1]] = window
+        self._data = data
+        self._start = 0
+        self._end = window.shape[1]
+        self._df = None
@@ -0,0 +1,170 @@
+import json
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+
+
+class CandlesStore:
+    """Persistent local store of the historical candles fetched from the exchanges.
+
+    The candles of each (connector, trading pair, interval) are kept in a columnar NumPy file (one contiguous array per
+    column, sorted by timestamp) that is memory-mapped when read, so reading a period only loads the rows of that
+    period. The time ranges already fetched from the exchange are recorded next to the candles, including the ranges
+    without candles (e.g. before the listing of the trading pair), so only the missing ranges are fetched again.
+
+    Only closed candles must be written, the candle in progress changes until its interval ends.
+    """
+
+    candles_file_name = "candles.npy"
+    metadata_file_name = "metadata.json"
+
+    def __init__(self, root_path: str):
+        """
+        :param root_path: the directory of the store, created when the first candles are written
+        """
+        self._root_path = root_path
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path
+
+    def get_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self._root_path, connector_name, f"{trading_pair}_{interval}")
+
+    def get_covered_ranges(self, connector_name: str, trading_pair: str, interval: str) -> List[Tuple[int, int]]:
+        """
+        :return: the sorted and disjoint time ranges (inclusive) the store has all the candles of
+        """
+        metadata = self._read_metadata(self.get_path(connector_name, trading_pair, interval))
+        return [(int(start), int(end)) for start, end in metadata.get("ranges", [])]
+
+    def get_missing_ranges(self,
+                           connector_name: str,
+                           trading_pair: str,
+                           interval: str,
+                           start_time: int,
+                           end_time: int) -> List[Tuple[int, int]]:
+        """
+        :return: the time ranges (inclusive) between start_time and end_time the store doesn't have the candles of
+        """
+        missing_ranges = []
+        current_start = start_time
+        for range_start, range_end in self.get_covered_ranges(connector_name, trading_pair, interval):
+            if range_end < current_start:
+                continue
+            if range_start > end_time:
+                break
+            if range_start > current_start:
+                missing_ranges.append((current_start, range_start - 1))
+            current_start = max(current_start, range_end + 1)
+            if current_start > end_time:
+                break
+        if current_start <= end_time:
+            missing_ranges.append((current_start, end_time))
+        return missing_ranges
+
+    def read(self,
+             connector_name: str,
+             trading_pair: str,
+             interval: str,
+             start_time: Optional[int] = None,
+             end_time: Optional[int] = None) -> pd.DataFrame:
+        """
+        :return: the stored candles with a timestamp between start_time and end_time (inclusive), an empty DataFrame
+            if there are none
+        """
+        path = self.get_path(connector_name, trading_pair, interval)
+        metadata = self._read_metadata(path)
+        candles_path = os.path.join(path, self.candles_file_name)
+        if not os.path.exists(candles_path):
+            return pd.DataFrame(columns=metadata.get("columns", []))
+        candles = np.load(candles_path, mmap_mode="r")
+        timestamps = candles[0]
+        start_index = 0 if start_time is None else int(np.searchsorted(timestamps, start_time, side="left"))
+        end_index = len(timestamps) if end_time is None else int(np.searchsorted(timestamps, end_time, side="right"))
+        return pd.DataFrame(np.array(candles[:, start_index:end_index]).T, columns=metadata["columns"])
+
+    def write(self,
+              connector_name: str,
+              trading_pair: str,
+              interval: str,
+              candles_df: pd.DataFrame,
+              start_time: int,
+              end_time: int):
+        """
+        Merges the candles fetched for a time range into the store. The candles already stored with the same
+        timestamps are replaced.
+        :param candles_df: the candles of the range, with a timestamp column first
+        :param start_time: the start of the time range the candles were fetched for
+        :param end_time: the end of the time range the candles were fetched for
+        """
+        path = self.get_path(connector_name, trading_pair, interval)
+        metadata = self._read_metadata(path)
+        candles_df = candles_df[(candles_df["timestamp"] >= start_time) & (candles_df["timestamp"] <= end_time)]
+        columns = metadata.get("columns", list(candles_df.columns))
+        new_candles = candles_df[columns].to_numpy(dtype=float).T
+        candles_path = os.path.join(path, self.candles_file_name)
+        if os.path.exists(candles_path):
+            # The new candles come last so they are the ones kept for the duplicated timestamps
+            new_candles = np.concatenate([np.load(candles_path), new_candles], axis=1)
+        _, unique_indexes = np.unique(new_candles[0][::-1], return_index=True)
+        candles = new_candles[:, new_candles.shape[1] - 1 - unique_indexes]
+
+        ranges = sorted(metadata.get("ranges", []) + [[int(start_time), int(end_time)]])
+        merged_ranges = [ranges[0]]
+        for range_start, range_end in ranges[1:]:
+            if range_start <= merged_ranges[-1][1] + 1:
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], range_end)
+            else:
+                merged_ranges.append([range_start, range_end])
+
+        os.makedirs(path, exist_ok=True)
+        self._replace_file(candles_path, lambda file: np.save(file, np.ascontiguousarray(candles)))
+        # The metadata is written last, the ranges it records are always stored
+        self._replace_file(os.path.join(path, self.metadata_file_name),
+                           lambda file: file.write(json.dumps({"columns": columns, "ranges": merged_ranges}).encode()))
+
+    def _read_metadata(self, path: str) -> dict:
+        metadata_path = os.path.join(path, self.metadata_file_name)
+        if not os.path.exists(metadata_path):
+            return {}
+        with open(metadata_path, "r") as file:
+            return json.load(file)
+
+    @staticmethod
+    def _replace_file(file_path: str, write_function):
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            write_function(file)
+        os.replace(temporary_path, file_path)
+
+
+_default_candles_store: Optional[CandlesStore] = None
+_candles_store_enabled: bool = True
+
+
+def build_default_candles_store() -> CandlesStore:
+    return CandlesStore(os.path.join(data_path(), "candles"))
+
+
+def get_default_candles_store() -> Optional[CandlesStore]:
+    """
+    :return: the store the candles feeds read the historical candles from, None if the store is disabled
+    """
+    global _default_candles_store
+    if _default_candles_store is None and _candles_store_enabled:
+        _default_candles_store = build_default_candles_store()
+    return _default_candles_store
+
+
+def set_default_candles_store(candles_store: Optional[CandlesStore]):
+    """
+    :param candles_store: the store the candles feeds use, None to disable it
+    """
+    global _default_candles_store, _candles_store_enabled
+    _default_candles_store = candles_store
+    _candles_store_enabled = candles_store is not None
@@ -80,8 +80,7 @@ class KucoinPerpetualCandles(CandlesBase):
 
     @property
     def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
-        return df.sort_values(by="timestamp", ascending=True)
+        return super().candles_df.sort_values(by="timestamp", ascending=True)
 
     @property
     def _ping_payload(self):
@@ -1,5 +1,5 @@
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -159,16 +159,18 @@ class MarketDataProvider:
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
-    def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def get_order_book_snapshot(self, connector_name, trading_pair,
+                                depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
         DataFrame format.
         :param connector_name: str
         :param trading_pair: str
+        :param depth: Number of levels per side to include. All levels are included if None.
         :return: Tuple of bid and ask in DataFrame format.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.snapshot
+        return order_book.get_snapshot(depth)
 
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float, is_buy: bool) -> OrderBookQueryResult:
         """
@@ -0,0 +1,128 @@
+import asyncio
+import atexit
+import logging
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A write operation adds its records to the session. It can return a callback to run once the records are committed.
+WriteOperation = Callable[[Session], Optional[Callable[[], None]]]
+
+
+class BatchedSQLWriter:
+    """
+    Write-behind persistence for the trades database.
+
+    The write operations are queued and executed in order by a dedicated thread, so the event loop never waits for the
+    database. All the operations queued while a transaction is running are written together in the next transaction.
+    If a batch fails it is written again one operation per transaction, so a single invalid record doesn't discard the
+    rest of the batch.
+
+    The pending operations are written when the writer is stopped, or when the interpreter exits.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+    _STOP = object()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: SQLConnectionManager, max_batch_size: int = 500):
+        self._sql_manager: SQLConnectionManager = sql
+        self._max_batch_size: int = max_batch_size
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock: threading.Lock = threading.Lock()
+
+    @property
+    def pending_operations(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def submit(self, operation: WriteOperation):
+        self._ensure_started()
+        self._queue.put(operation)
+
+    def flush(self):
+        """
+        Blocks until all the operations submitted so far are written.
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    async def wait_until_written(self):
+        """
+        Waits, without blocking the event loop, until all the operations submitted so far are written.
+        """
+        if self._thread is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def stop(self):
+        """
+        Writes all the pending operations and stops the writer thread (it is started again by the next submission).
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(self._STOP)
+            atexit.unregister(self.stop)
+        thread.join()
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="BatchedSQLWriter", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.stop)
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            operations: List[WriteOperation] = [self._queue.get()]
+            while len(operations) < self._max_batch_size and operations[-1] is not self._STOP:
+                try:
+                    operations.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if operations[-1] is self._STOP:
+                operations.pop()
+                stopped = True
+            try:
+                self._write(operations)
+            finally:
+                for _ in range(len(operations) + (1 if stopped else 0)):
+                    self._queue.task_done()
+
+    def _write(self, operations: List[WriteOperation]):
+        if len(operations) == 0:
+            return
+        try:
+            self._write_batch(operations)
+        except Exception:
+            if len(operations) == 1:
+                self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+                return
+            self.logger().warning(f"Error writing a batch of {len(operations)} operations to the database, "
+                                  f"writing them one by one.", exc_info=True)
+            for operation in operations:
+                self._write([operation])
+
+    def _write_batch(self, operations: List[WriteOperation]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                callbacks = [operation(session) for operation in operations]
+            for callback in callbacks:
+                if callback is not None:
+                    try:
+                        callback()
+                    except Exception:
+                        self.logger().error("Unexpected error after writing to the database.", exc_info=True)
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class PerformanceSnapshot(HummingbotBase):
+    """
+    The accumulated performance of the trades of a strategy since the start timestamp (see `PerformanceTracker`),
+    as of the trade with the snapshot timestamp.
+    """
+    __tablename__ = "PerformanceSnapshot"
+    __table_args__ = (Index("ps_config_start_timestamp_index",
+                            "config_file_path", "start_timestamp", unique=True),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    start_timestamp = Column(BigInteger, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    snapshot = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"PerformanceSnapshot(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"start_timestamp={self.start_timestamp}, timestamp={self.timestamp}, snapshot={self.snapshot})"
@@ -301,6 +301,11 @@ class MQTTCommands:
                     timeout=timeout
                 )
                 response.msg = res if res is not None else ''
+                response.data = call_sync(
+                    self._hb_app.get_performance_json(),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
         except asyncio.exceptions.TimeoutError:
             response.msg = f'Hummingbot status command timed out after {timeout} seconds'
             response.status = MQTT_STATUS_CODE.ERROR
@@ -1181,8 +1181,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            with self._market_info.market.batched_orders():
+                for order in active_orders:
+                    self.c_cancel_order(self._market_info, order.client_order_id)
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1212,10 +1213,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # The orders of all the levels are cancelled together, with batch requests if the exchange supports them
+            with self._market_info.market.batched_orders():
+                for order in self.active_non_hanging_orders:
+                    # If is about to be added to hanging_orders then don't cancel
+                    if not self._hanging_orders_tracker.is_potential_hanging_order(order):
+                        self.c_cancel_order(self._market_info, order.client_order_id)
         # else:
         #     self.set_timers()
 
@@ -1226,13 +1229,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object price = self.get_price()
         active_orders = [order for order in active_orders
                          if order.client_order_id not in self.hanging_order_ids]
-        for order in active_orders:
-            negation = -1 if order.is_buy else 1
-            if (negation * (order.price - price) / price) < self._minimum_spread:
-                self.logger().info(f"Order is below minimum spread ({self._minimum_spread})."
-                                   f" Canceling Order: ({'Buy' if order.is_buy else 'Sell'}) "
-                                   f"ID - {order.client_order_id}")
-                self.c_cancel_order(self._market_info, order.client_order_id)
+        with self._market_info.market.batched_orders():
+            for order in active_orders:
+                negation = -1 if order.is_buy else 1
+                if (negation * (order.price - price) / price) < self._minimum_spread:
+                    self.logger().info(f"Order is below minimum spread ({self._minimum_spread})."
+                                       f" Canceling Order: ({'Buy' if order.is_buy else 'Sell'}) "
+                                       f"ID - {order.client_order_id}")
+                    self.c_cancel_order(self._market_info, order.client_order_id)
 
     cdef bint c_to_create_orders(self, object proposal):
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
@@ -1251,51 +1255,53 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
-        if len(proposal.buys) > 0:
-            if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
-                price_quote_str = [f"{buy.size.normalize()} {self.base_asset}, "
-                                   f"{buy.price.normalize()} {self.quote_asset}"
-                                   for buy in proposal.buys]
-                self.logger().info(
-                    f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
-                    f"at (Size, Price): {price_quote_str}"
-                )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
-        if len(proposal.sells) > 0:
-            if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
-                price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
-                                   f"{sell.price.normalize()} {self.quote_asset}"
-                                   for sell in proposal.sells]
-                self.logger().info(
-                    f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
-                    f"orders at (Size, Price): {price_quote_str}"
-                )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+        # The orders of all the levels are created together, with batch requests if the exchange supports them
+        with self._market_info.market.batched_orders():
+            if len(proposal.buys) > 0:
+                if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
+                    price_quote_str = [f"{buy.size.normalize()} {self.base_asset}, "
+                                       f"{buy.price.normalize()} {self.quote_asset}"
+                                       for buy in proposal.buys]
+                    self.logger().info(
+                        f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
+                        f"at (Size, Price): {price_quote_str}"
+                    )
+                for idx, buy in enumerate(proposal.buys):
+                    bid_order_id = self.c_buy_with_specific_market(
+                        self._market_info,
+                        buy.size,
+                        order_type=self._limit_order_type,
+                        price=buy.price,
+                        expiration_seconds=expiration_seconds
+                    )
+                    orders_created = True
+                    if idx < number_of_pairs:
+                        order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
+                        if order:
+                            self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                                CreatedPairOfOrders(order, None))
+            if len(proposal.sells) > 0:
+                if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
+                    price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
+                                       f"{sell.price.normalize()} {self.quote_asset}"
+                                       for sell in proposal.sells]
+                    self.logger().info(
+                        f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
+                        f"orders at (Size, Price): {price_quote_str}"
+                    )
+                for idx, sell in enumerate(proposal.sells):
+                    ask_order_id = self.c_sell_with_specific_market(
+                        self._market_info,
+                        sell.size,
+                        order_type=self._limit_order_type,
+                        price=sell.price,
+                        expiration_seconds=expiration_seconds
+                    )
+                    orders_created = True
+                    if idx < number_of_pairs:
+                        order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
+                        if order:
+                            self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
         if orders_created:
             self.set_timers()
 
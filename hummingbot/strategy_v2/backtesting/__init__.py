@@ -3,9 +3,11 @@ from hummingbot.strategy_v2.backtesting.controllers_backtesting.directional_trad
     DirectionalTradingBacktesting,
 )
 from hummingbot.strategy_v2.backtesting.controllers_backtesting.market_making_backtesting import MarketMakingBacktesting
+from hummingbot.strategy_v2.backtesting.parameter_sweep import ParameterSweep
 
 __all__ = [
     "DirectionalTradingBacktesting",
     "MarketMakingBacktesting",
     "BacktestingDataProvider",
+    "ParameterSweep",
 ]
@@ -13,9 +13,11 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_rows import BacktestingRows
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.backtesting.vectorized_simulation import ExecutorsInfoView, ScheduledSimulation
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
@@ -30,12 +32,17 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class BacktestingEngineBase:
-    def __init__(self):
+    def __init__(self, vectorized: bool = False):
+        """
+        :param vectorized: if True the execution is simulated on NumPy arrays instead of iterating the market data
+            DataFrame (see `simulate_execution_vectorized`). Both modes produce the same results.
+        """
         self.controller = None
         self.backtesting_resolution = None
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
+        self.vectorized = vectorized
 
     @classmethod
     def load_controller_config(cls,
@@ -118,6 +125,8 @@ class BacktestingEngineBase:
         Returns:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
         """
+        if self.vectorized:
+            return self.simulate_execution_vectorized(trade_cost)
         processed_features = self.prepare_market_data()
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
@@ -135,6 +144,82 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    def simulate_execution_vectorized(self, trade_cost: float) -> list:
+        """
+        Simulates the strategy as `simulate_execution`, on NumPy arrays.
+
+        The market data rows are read from column arrays, each executor is indexed on the backtesting ticks once when
+        it is created, and the executors info is only built at the ticks the controller reads it.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        timestamps = processed_features["timestamp"].to_numpy(dtype=float)
+        rows = BacktestingRows(processed_features)
+        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        self.scheduled_simulations: Dict[str, ScheduledSimulation] = {}
+        for tick in range(len(rows)):
+            row = rows[tick]
+            self.update_market_data(row)
+            self.update_processed_data(row)
+            self.update_executors_info_at_tick(tick, timestamps)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    end = self.get_simulation_end_index(action.executor_config, timestamps)
+                    executor_simulation = self.simulate_executor(action.executor_config,
+                                                                 processed_features.iloc[tick:end], trade_cost)
+                    if executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, row["timestamp"])
+
+        self.controller.executors_info = list(self.controller.executors_info)
+        return self.controller.executors_info
+
+    def update_executors_info_at_tick(self, tick: int, timestamps: np.ndarray):
+        """
+        Vectorized counterpart of `update_executors_info`, the controller gets a lazy view of the executors info.
+
+        Args:
+            tick (int): The index of the current row of market data.
+            timestamps (np.ndarray): The timestamps of all the rows of market data.
+        """
+        active_simulations = []
+        for executor in self.active_executor_simulations:
+            scheduled_simulation = self.scheduled_simulations.get(executor.config.id)
+            if scheduled_simulation is None:
+                scheduled_simulation = ScheduledSimulation(executor, tick, timestamps)
+                self.scheduled_simulations[executor.config.id] = scheduled_simulation
+            if tick >= scheduled_simulation.end_tick:
+                self.stopped_executors_info.append(scheduled_simulation.executor_info_at(tick))
+                del self.scheduled_simulations[executor.config.id]
+            else:
+                active_simulations.append(scheduled_simulation)
+        self.active_executor_simulations = [scheduled.simulation for scheduled in active_simulations]
+        self.controller.executors_info = ExecutorsInfoView(active_simulations, tick, self.stopped_executors_info)
+
+    @staticmethod
+    def get_simulation_end_index(config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                                 timestamps: np.ndarray) -> Optional[int]:
+        """
+        The executors simulations don't use the market data after their time limit, so it is not passed to them.
+
+        Returns:
+            Optional[int]: The index of the first row after the executor time limit, None if it has no time limit.
+        """
+        if isinstance(config, PositionExecutorConfig):
+            time_limit = config.triple_barrier_config.time_limit
+        else:
+            time_limit = getattr(config, "time_limit", None)
+        if not time_limit:
+            return None
+        return int(np.searchsorted(timestamps, config.timestamp + time_limit, side="right"))
+
     def update_executors_info(self, timestamp: float):
         active_executors_info = []
         simulations_to_remove = []
@@ -240,14 +325,19 @@ class BacktestingEngineBase:
             timestamp (pd.Timestamp): The current timestamp.
         """
         for executor in self.active_executor_simulations:
+            # The executors info is only built for the executor to stop
+            if executor.config.id != action.executor_id:
+                continue
             executor_info = executor.get_executor_info_at_timestamp(timestamp)
-            if executor_info.config.id == action.executor_id:
-                executor_info.status = RunnableStatus.TERMINATED
-                executor_info.close_type = CloseType.EARLY_STOP
-                executor_info.is_active = False
-                executor_info.close_timestamp = timestamp
-                self.stopped_executors_info.append(executor_info)
-                self.active_executor_simulations.remove(executor)
+            executor_info.status = RunnableStatus.TERMINATED
+            executor_info.close_type = CloseType.EARLY_STOP
+            executor_info.is_active = False
+            executor_info.close_timestamp = timestamp
+            self.stopped_executors_info.append(executor_info)
+            self.active_executor_simulations.remove(executor)
+            if self.vectorized:
+                self.scheduled_simulations.pop(executor.config.id, None)
+            break
 
     @staticmethod
     def summarize_results(executors_info: Dict, total_amount_quote: float = 1000):
@@ -0,0 +1,61 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Set
+
+import pandas as pd
+
+
+class BacktestingRows:
+    """
+    Row access to a backtesting DataFrame (market data or executor simulation) without building a pandas Series per
+    row. The columns are converted once, the first time they are read, to lists of Python scalars.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._column_names: List[str] = list(df.columns)
+        self._column_names_set: Set[str] = set(self._column_names)
+        self._columns: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def __getitem__(self, index: int) -> "BacktestingRow":
+        return BacktestingRow(self, index)
+
+    @property
+    def column_names(self) -> List[str]:
+        return self._column_names
+
+    def has_column(self, name: str) -> bool:
+        return name in self._column_names_set
+
+    def column(self, name: str) -> List[Any]:
+        values = self._columns.get(name)
+        if values is None:
+            values = self._df[name].tolist()
+            self._columns[name] = values
+        return values
+
+
+class BacktestingRow(Mapping):
+    """
+    A row of a backtesting DataFrame, it can be read as the `pd.Series` rows of `DataFrame.iterrows`.
+    """
+
+    __slots__ = ("_rows", "_index")
+
+    def __init__(self, rows: BacktestingRows, index: int):
+        self._rows = rows
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return self._rows.column(key)[self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows.column_names)
+
+    def __len__(self) -> int:
+        return len(self._rows.column_names)
+
+    def __contains__(self, key) -> bool:
+        return self._rows.has_column(key)
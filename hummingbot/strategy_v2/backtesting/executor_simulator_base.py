@@ -1,9 +1,12 @@
+import operator
 from decimal import Decimal
-from typing import Union
+from typing import Any, Callable, Dict, Mapping, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
+from hummingbot.strategy_v2.backtesting.backtesting_rows import BacktestingRows
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -15,6 +18,8 @@ class ExecutorSimulation(BaseModel):
     config: Union[PositionExecutorConfig, DCAExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
+    _timestamps: Optional[np.ndarray] = PrivateAttr(default=None)
+    _rows: Optional[BacktestingRows] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
@@ -25,10 +30,35 @@ class ExecutorSimulation(BaseModel):
             raise ValueError("executor_simulation must be a pandas DataFrame")
         return v
 
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        The timestamps of the simulation rows (sorted, as the market data the simulation is computed from).
+        """
+        if self._timestamps is None:
+            self._timestamps = self.executor_simulation['timestamp'].to_numpy(dtype=float)
+        return self._timestamps
+
+    @property
+    def rows(self) -> BacktestingRows:
+        if self._rows is None:
+            self._rows = BacktestingRows(self.executor_simulation)
+        return self._rows
+
+    def get_index_at_timestamp(self, timestamp: float) -> int:
+        """
+        :return: the index of the last simulation row up to the timestamp, -1 if the simulation starts after it
+        """
+        return int(np.searchsorted(self.timestamps, timestamp, side="right")) - 1
+
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
-        # Filter the DataFrame up to the specified timestamp
-        df_up_to_timestamp = self.executor_simulation[self.executor_simulation['timestamp'] <= timestamp]
-        if df_up_to_timestamp.empty:
+        return self.get_executor_info_at_index(self.get_index_at_timestamp(timestamp))
+
+    def get_executor_info_at_index(self, index: int) -> ExecutorInfo:
+        """
+        :param index: the index of the last simulation row to take into account (-1 if the simulation didn't start)
+        """
+        if index < 0:
             return ExecutorInfo(
                 id=self.config.id,
                 timestamp=self.config.timestamp,
@@ -44,8 +74,8 @@ class ExecutorSimulation(BaseModel):
                 custom_info={}
             )
 
-        last_entry = df_up_to_timestamp.iloc[-1]
-        is_active = last_entry['timestamp'] < self.executor_simulation['timestamp'].max()
+        last_entry = self.rows[index]
+        is_active = bool(self.timestamps[index] < self.timestamps[-1])
         return ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -63,7 +93,7 @@ class ExecutorSimulation(BaseModel):
             custom_info=self.get_custom_info(last_entry)
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def get_custom_info(self, last_entry: Mapping) -> dict:
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
@@ -74,8 +104,67 @@ class ExecutorSimulation(BaseModel):
 
 
 class ExecutorSimulatorBase:
-    """Base class for trading simulators."""
+    """
+    Base class for trading simulators.
+    The market data passed to the simulators is sorted by timestamp, the simulators rely on it to search it.
+    """
     def simulate(self, df: pd.DataFrame, config, trade_cost: float) -> ExecutorSimulation:
         """Simulates trading based on provided configuration and market data."""
         # This method should be generic enough to handle various trading strategies.
         raise NotImplementedError
+
+    @staticmethod
+    def compare(values: np.ndarray, comparison: Callable, threshold: Union[Decimal, float]) -> np.ndarray:
+        """
+        Compares the float values with a threshold as Python compares them with a Decimal (exactly), without comparing
+        each value as an object.
+
+        :param values: float values
+        :param comparison: one of `operator.lt`, `operator.le`, `operator.gt`, `operator.ge`
+        :param threshold: the Decimal (or float) threshold
+        """
+        if not isinstance(threshold, Decimal) or not threshold.is_finite():
+            return comparison(values, threshold)
+        float_threshold = float(threshold)
+        rounding = Decimal(float_threshold).compare(threshold)
+        if rounding == 0:
+            return comparison(values, float_threshold)
+        # The threshold lies strictly between two consecutive floats
+        if rounding > 0:
+            lower, upper = np.nextafter(float_threshold, -np.inf), float_threshold
+        else:
+            lower, upper = float_threshold, np.nextafter(float_threshold, np.inf)
+        if comparison in (operator.gt, operator.ge):
+            return values > lower
+        return values < upper
+
+    @staticmethod
+    def first_index(condition: np.ndarray) -> Optional[int]:
+        """Returns the index of the first row meeting the condition, None if no row meets it."""
+        if len(condition) == 0:
+            return None
+        index = int(np.argmax(condition))
+        return index if condition[index] else None
+
+    @classmethod
+    def first_timestamp(cls, timestamps: np.ndarray, condition: np.ndarray) -> float:
+        """Returns the timestamp of the first row meeting the condition, NaN if no row meets it."""
+        index = cls.first_index(condition)
+        return timestamps[index] if index is not None else np.nan
+
+    @staticmethod
+    def build_simulation_df(market_data: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Returns a copy of the market data with the simulation columns set, as assigning them one by one would (the
+        columns already in the market data are replaced in place, the new ones are appended in order).
+        """
+        if any(column in market_data.columns for column in columns):
+            simulation_df = market_data.copy()
+            for column, values in columns.items():
+                simulation_df[column] = values
+            return simulation_df
+        simulation_columns = pd.DataFrame(
+            {column: np.full(len(market_data), values) if np.isscalar(values) else values
+             for column, values in columns.items()},
+            index=market_data.index)
+        return pd.concat([market_data, simulation_columns], axis=1)
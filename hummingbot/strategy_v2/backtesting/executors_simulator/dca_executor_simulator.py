@@ -1,6 +1,8 @@
+import operator
 from decimal import Decimal
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
@@ -22,16 +24,22 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             raise NotImplementedError("Taker mode is not supported in DCAExecutorSimulator")
         potential_dca_stages = []
         side_multiplier = 1 if config.side == TradeType.BUY else -1
-        last_timestamp = df['timestamp'].max()
+        timestamps = df['timestamp'].to_numpy(dtype=float)
+        close = df['close'].to_numpy(dtype=float)
+        last_timestamp = timestamps[-1] if len(timestamps) > 0 else np.nan
         tl = config.time_limit if config.time_limit else None
         tl_timestamp = config.timestamp + tl if tl else last_timestamp
         # Filter dataframe based on the conditions
-        df_filtered = df[df['timestamp'] <= tl_timestamp].copy()
-        df_filtered['net_pnl_pct'] = 0.0
-        df_filtered['net_pnl_quote'] = 0.0
-        df_filtered['cum_fees_quote'] = 0.0
-        df_filtered['filled_amount_quote'] = 0.0
-        df_filtered['current_position_average_price'] = float(config.prices[0])
+        filtered_length = int(np.searchsorted(timestamps, tl_timestamp, side="right"))
+        timestamps = timestamps[:filtered_length]
+        close = close[:filtered_length]
+        simulation_columns = {
+            'net_pnl_pct': 0.0,
+            'net_pnl_quote': 0.0,
+            'cum_fees_quote': 0.0,
+            'filled_amount_quote': 0.0,
+            'current_position_average_price': float(config.prices[0]),
+        }
 
         for i in range(len(config.prices)):
             is_last_order = i == len(config.prices) - 1
@@ -39,27 +47,29 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
             amount = config.amounts_quote[i]
             break_even_price = DCAExecutorSimulator.break_even_price_at_index(config.prices, config.amounts_quote, i) if i > 0 else price
 
-            entry_condition = (df_filtered['close'] <= price) if config.side == TradeType.BUY else (df_filtered['close'] >= price)
-            entry_timestamp = df_filtered[entry_condition]['timestamp'].min()
-            if pd.isna(entry_timestamp):
+            entry_condition = self.compare(close, operator.le if config.side == TradeType.BUY else operator.ge, price)
+            entry_index = self.first_index(entry_condition)
+            if entry_index is None:
                 break
-            returns_df = df_filtered[df_filtered['timestamp'] >= entry_timestamp]
-            returns = returns_df['close'].pct_change().fillna(0)
-            cumulative_returns = (((1 + returns).cumprod() - 1) * side_multiplier) - trade_cost
+            stage_timestamps = timestamps[entry_index:]
+            stage_close = close[entry_index:]
+            returns = np.zeros(len(stage_close))
+            returns[1:] = stage_close[1:] / stage_close[:-1] - 1
+            cumulative_returns = ((np.cumprod(1 + returns) - 1) * side_multiplier) - trade_cost
             take_profit_timestamp = None
             stop_loss_timestamp = None
             next_order_timestamp = None
             if config.take_profit:
                 take_profit_price = break_even_price * (1 + config.take_profit * side_multiplier)
-                take_profit_condition = returns_df['close'] >= take_profit_price if config.side == TradeType.BUY else returns_df['close'] <= take_profit_price
-                take_profit_timestamp = returns_df[take_profit_condition]['timestamp'].min()
+                take_profit_condition = self.compare(stage_close, operator.ge if config.side == TradeType.BUY else operator.le, take_profit_price)
+                take_profit_timestamp = self.first_timestamp(stage_timestamps, take_profit_condition)
             if is_last_order and config.stop_loss:
                 stop_loss_price = break_even_price * (1 - config.stop_loss * side_multiplier)
-                stop_loss_condition = returns_df['close'] <= stop_loss_price if config.side == TradeType.BUY else returns_df['close'] >= stop_loss_price
-                stop_loss_timestamp = returns_df[stop_loss_condition]['timestamp'].min()
+                stop_loss_condition = self.compare(stage_close, operator.le if config.side == TradeType.BUY else operator.ge, stop_loss_price)
+                stop_loss_timestamp = self.first_timestamp(stage_timestamps, stop_loss_condition)
             else:
-                next_order_condition = returns_df['close'] <= config.prices[i + 1] if config.side == TradeType.BUY else returns_df['close'] >= config.prices[i + 1]
-                next_order_timestamp = returns_df[next_order_condition]['timestamp'].min()
+                next_order_condition = self.compare(stage_close, operator.le if config.side == TradeType.BUY else operator.ge, config.prices[i + 1])
+                next_order_timestamp = self.first_timestamp(stage_timestamps, next_order_condition)
             close_timestamp = min([timestamp for timestamp in [take_profit_timestamp, stop_loss_timestamp,
                                                                last_timestamp, next_order_timestamp] if not pd.isna(timestamp)])
             if close_timestamp == take_profit_timestamp:
@@ -70,11 +80,11 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
                 close_type = None
             else:
                 close_type = CloseType.TIME_LIMIT
-            df_filtered[f'filled_amount_quote_{i}'] = 0.0
-            df_filtered[f'net_pnl_quote_{i}'] = 0.0
+            simulation_columns[f'filled_amount_quote_{i}'] = 0.0
+            simulation_columns[f'net_pnl_quote_{i}'] = 0.0
             potential_dca_stages.append({
                 'level': i,
-                'entry_timestamp': entry_timestamp,
+                'entry_index': entry_index,
                 'price': float(price),
                 'amount': float(amount),
                 'break_even_price': float(break_even_price),
@@ -83,26 +93,36 @@ class DCAExecutorSimulator(ExecutorSimulatorBase):
                 'cumulative_returns': cumulative_returns
             })
         if len(potential_dca_stages) == 0:
+            df_filtered = self.build_simulation_df(df.iloc[:filtered_length], simulation_columns)
             return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
         close_type = None
 
+        stages_filled_amount_quote = [np.zeros(filtered_length) for _ in potential_dca_stages]
+        stages_net_pnl_quote = [np.zeros(filtered_length) for _ in potential_dca_stages]
+        current_position_average_price = np.full(filtered_length, float(config.prices[0]))
         for i, dca_stage in enumerate(potential_dca_stages):
-            if dca_stage['close_type'] is None:
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'filled_amount_quote_{i}'] = dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'net_pnl_quote_{i}'] = dca_stage['cumulative_returns'] * dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], 'current_position_average_price'] = dca_stage['break_even_price']
-            else:
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'filled_amount_quote_{i}'] = dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], f'net_pnl_quote_{i}'] = dca_stage['cumulative_returns'] * dca_stage['amount']
-                df_filtered.loc[df_filtered['timestamp'] >= dca_stage['entry_timestamp'], 'current_position_average_price'] = dca_stage['break_even_price']
+            entry_index = dca_stage['entry_index']
+            stages_filled_amount_quote[i][entry_index:] = dca_stage['amount']
+            stages_net_pnl_quote[i][entry_index:] = dca_stage['cumulative_returns'] * dca_stage['amount']
+            current_position_average_price[entry_index:] = dca_stage['break_even_price']
+            if dca_stage['close_type'] is not None:
                 close_type = dca_stage['close_type']
                 last_timestamp = dca_stage['close_timestamp']
                 break
-        df_filtered = df_filtered[df_filtered['timestamp'] <= last_timestamp].copy()
-        df_filtered['filled_amount_quote'] = sum([df_filtered[f'filled_amount_quote_{i}'] for i in range(len(potential_dca_stages))])
-        df_filtered['net_pnl_quote'] = sum([df_filtered[f'net_pnl_quote_{i}'] for i in range(len(potential_dca_stages))])
-        df_filtered['cum_fees_quote'] = trade_cost * df_filtered['filled_amount_quote']
-        df_filtered.loc[df_filtered["filled_amount_quote"] > 0, "net_pnl_pct"] = df_filtered["net_pnl_quote"] / df_filtered["filled_amount_quote"]
+
+        length = int(np.searchsorted(timestamps, last_timestamp, side="right"))
+        filled_amount_quote = sum([stage_filled_amount_quote[:length] for stage_filled_amount_quote in stages_filled_amount_quote])
+        net_pnl_quote = sum([stage_net_pnl_quote[:length] for stage_net_pnl_quote in stages_net_pnl_quote])
+        simulation_columns['net_pnl_pct'] = np.divide(net_pnl_quote, filled_amount_quote, out=np.zeros(length),
+                                                      where=filled_amount_quote > 0)
+        simulation_columns['net_pnl_quote'] = net_pnl_quote
+        simulation_columns['cum_fees_quote'] = trade_cost * filled_amount_quote
+        simulation_columns['filled_amount_quote'] = filled_amount_quote
+        simulation_columns['current_position_average_price'] = current_position_average_price[:length]
+        for i in range(len(potential_dca_stages)):
+            simulation_columns[f'filled_amount_quote_{i}'] = stages_filled_amount_quote[i][:length]
+            simulation_columns[f'net_pnl_quote_{i}'] = stages_net_pnl_quote[i][:length]
+        df_filtered = self.build_simulation_df(df.iloc[:length], simulation_columns)
 
         if close_type is None:
             close_type = CloseType.FAILED
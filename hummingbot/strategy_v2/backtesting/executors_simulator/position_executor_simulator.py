@@ -1,5 +1,7 @@
+import operator
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -10,12 +12,14 @@ from hummingbot.strategy_v2.models.executors import CloseType
 
 class PositionExecutorSimulator(ExecutorSimulatorBase):
     def simulate(self, df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        timestamps = df['timestamp'].to_numpy(dtype=float)
+        close = df['close'].to_numpy(dtype=float)
         if config.triple_barrier_config.open_order_type == OrderType.LIMIT:
-            entry_condition = (df['close'] < config.entry_price) if config.side == TradeType.BUY else (df['close'] > config.entry_price)
-            start_timestamp = df[entry_condition]['timestamp'].min()
+            entry_condition = self.compare(close, operator.lt if config.side == TradeType.BUY else operator.gt, config.entry_price)
+            start_index = self.first_index(entry_condition)
         else:
-            start_timestamp = df['timestamp'].min()
-        last_timestamp = df['timestamp'].max()
+            start_index = 0 if len(timestamps) > 0 else None
+        last_timestamp = timestamps[-1] if len(timestamps) > 0 else np.nan
 
         # Set up barriers
         tp = Decimal(config.triple_barrier_config.take_profit) if config.triple_barrier_config.take_profit else None
@@ -29,37 +33,51 @@ class PositionExecutorSimulator(ExecutorSimulatorBase):
         tl_timestamp = config.timestamp + tl if tl else last_timestamp
 
         # Filter dataframe based on the conditions
-        df_filtered = df[df['timestamp'] <= tl_timestamp].copy()
-        df_filtered['net_pnl_pct'] = 0.0
-        df_filtered['net_pnl_quote'] = 0.0
-        df_filtered['cum_fees_quote'] = 0.0
-        df_filtered['filled_amount_quote'] = 0.0
-        df_filtered["current_position_average_price"] = float(config.entry_price)
+        filtered_length = int(np.searchsorted(timestamps, tl_timestamp, side="right"))
+        timestamps = timestamps[:filtered_length]
+        simulation_columns = {
+            'net_pnl_pct': 0.0,
+            'net_pnl_quote': 0.0,
+            'cum_fees_quote': 0.0,
+            'filled_amount_quote': 0.0,
+            'current_position_average_price': float(config.entry_price),
+        }
 
-        if pd.isna(start_timestamp):
+        # The order is not filled if the entry price is not reached before the time limit
+        if start_index is None or start_index >= filtered_length:
+            df_filtered = self.build_simulation_df(df.iloc[:filtered_length], simulation_columns)
             return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
 
-        entry_price = df.loc[df['timestamp'] == start_timestamp, 'close'].values[0]
+        entry_price = close[start_index]
         side_multiplier = 1 if config.side == TradeType.BUY else -1
 
-        returns_df = df_filtered[df_filtered['timestamp'] >= start_timestamp]
-        returns = returns_df['close'].pct_change().fillna(0)
-        cumulative_returns = (((1 + returns).cumprod() - 1) * side_multiplier) - trade_cost
-        df_filtered.loc[df_filtered['timestamp'] >= start_timestamp, 'net_pnl_pct'] = cumulative_returns
-        df_filtered.loc[df_filtered['timestamp'] >= start_timestamp, 'filled_amount_quote'] = float(config.amount) * entry_price
-        df_filtered['net_pnl_quote'] = df_filtered['net_pnl_pct'] * df_filtered['filled_amount_quote']
-        df_filtered['cum_fees_quote'] = trade_cost * df_filtered['filled_amount_quote']
+        returns_close = close[start_index:filtered_length]
+        returns = np.zeros(len(returns_close))
+        returns[1:] = returns_close[1:] / returns_close[:-1] - 1
+        cumulative_returns = ((np.cumprod(1 + returns) - 1) * side_multiplier) - trade_cost
+        net_pnl_pct = np.zeros(filtered_length)
+        net_pnl_pct[start_index:] = cumulative_returns
+        filled_amount_quote = np.zeros(filtered_length)
+        filled_amount_quote[start_index:] = float(config.amount) * entry_price
+        simulation_columns['net_pnl_pct'] = net_pnl_pct
+        simulation_columns['net_pnl_quote'] = net_pnl_pct * filled_amount_quote
+        simulation_columns['cum_fees_quote'] = trade_cost * filled_amount_quote
+        simulation_columns['filled_amount_quote'] = filled_amount_quote
 
         # Make sure the trailing stop pct rises linearly to the net p/l pct when above the trailing stop trigger pct (if any)
+        trailing_stop = None
         if trailing_sl_trigger_pct is not None and trailing_sl_delta_pct is not None:
-            df_filtered.loc[(df_filtered['net_pnl_pct'] > trailing_sl_trigger_pct).cummax(), 'ts'] = (
-                df_filtered['net_pnl_pct'] - float(trailing_sl_delta_pct)
-            ).cummax()
+            trailing_stop_active = np.maximum.accumulate(self.compare(net_pnl_pct, operator.gt, trailing_sl_trigger_pct))
+            trailing_stop = np.where(trailing_stop_active,
+                                     np.maximum.accumulate(net_pnl_pct - float(trailing_sl_delta_pct)), np.nan)
+            simulation_columns['ts'] = trailing_stop
 
         # Determine the earliest close event
-        first_tp_timestamp = df_filtered[df_filtered['net_pnl_pct'] > tp]['timestamp'].min() if tp else None
-        first_sl_timestamp = df_filtered[df_filtered['net_pnl_pct'] < -sl]['timestamp'].min() if sl else None
-        first_trailing_sl_timestamp = df_filtered[(~df_filtered['ts'].isna()) & (df_filtered['net_pnl_pct'] < df_filtered['ts'])]['timestamp'].min() if trailing_sl_delta_pct and trailing_sl_trigger_pct else None
+        first_tp_timestamp = self.first_timestamp(timestamps, self.compare(net_pnl_pct, operator.gt, tp)) if tp else None
+        first_sl_timestamp = self.first_timestamp(timestamps, self.compare(net_pnl_pct, operator.lt, -sl)) if sl else None
+        first_trailing_sl_timestamp = self.first_timestamp(
+            timestamps, ~np.isnan(trailing_stop) & (net_pnl_pct < trailing_stop)
+        ) if trailing_sl_delta_pct and trailing_sl_trigger_pct else None
         close_timestamp = min([timestamp for timestamp in [first_tp_timestamp, first_sl_timestamp, tl_timestamp, first_trailing_sl_timestamp] if not pd.isna(timestamp)])
 
         # Determine the close type
@@ -73,7 +91,10 @@ class PositionExecutorSimulator(ExecutorSimulatorBase):
             close_type = CloseType.TIME_LIMIT
 
         # Set the final state of the DataFrame
-        df_filtered = df_filtered[df_filtered['timestamp'] <= close_timestamp]
+        length = int(np.searchsorted(timestamps, close_timestamp, side="right"))
+        df_filtered = self.build_simulation_df(
+            df.iloc[:length], {column: values if np.isscalar(values) else values[:length]
+                               for column, values in simulation_columns.items()})
 
         # Construct and return ExecutorSimulation object
         simulation = ExecutorSimulation(
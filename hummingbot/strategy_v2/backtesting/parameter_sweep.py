@@ -0,0 +1,273 @@
+import asyncio
+import csv
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Type
+
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.controllers_backtesting.directional_trading_backtesting import (
+    DirectionalTradingBacktesting,
+)
+from hummingbot.strategy_v2.backtesting.controllers_backtesting.market_making_backtesting import MarketMakingBacktesting
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+# The candles of the sweep, loaded once by the parent process and shared read-only with the workers (inherited
+# copy-on-write when the workers are forked, sent once per worker otherwise)
+_shared_candles_feeds: Dict[str, pd.DataFrame] = {}
+
+
+def _initialize_worker(candles_feeds: Optional[Dict[str, pd.DataFrame]]):
+    global _shared_candles_feeds
+    if candles_feeds is not None:
+        _shared_candles_feeds = candles_feeds
+
+
+async def _backtest(sweep_settings: Dict[str, Any], config_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Backtests a controller configuration on the shared candles.
+    :return: the results summary of the backtest
+    """
+    controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+        config_data, sweep_settings["controllers_module"])
+    engine_class = ParameterSweep.get_engine_class(controller_config)
+    engine = engine_class(vectorized=sweep_settings["vectorized"])
+    engine.backtesting_data_provider.update_backtesting_time(sweep_settings["start"], sweep_settings["end"])
+    engine.backtesting_data_provider.candles_feeds = dict(_shared_candles_feeds)
+    backtesting_result = await engine.run_backtesting(
+        controller_config=controller_config,
+        start=sweep_settings["start"],
+        end=sweep_settings["end"],
+        backtesting_resolution=sweep_settings["backtesting_resolution"],
+        trade_cost=sweep_settings["trade_cost"],
+    )
+    return backtesting_result["results"]
+
+
+def _run_backtesting(sweep_settings: Dict[str, Any], config_data: Dict[str, Any]) -> Dict[str, Any]:
+    return asyncio.run(_backtest(sweep_settings, config_data))
+
+
+class ParameterSweep:
+    """
+    Backtests many controller configurations (e.g. a grid of parameters) over the same period.
+
+    The candles are loaded once and shared read-only with a pool of worker processes, each worker backtests one
+    configuration at a time. The results summary of each backtest is appended to a CSV results table as soon as it is
+    available, one row per configuration. The configurations already in the results table are skipped, so an
+    interrupted sweep resumes where it stopped.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    ENGINE_CLASSES: Dict[str, Type[BacktestingEngineBase]] = {
+        "directional_trading": DirectionalTradingBacktesting,
+        "market_making": MarketMakingBacktesting,
+    }
+    RESULT_COLUMNS: List[str] = list(BacktestingEngineBase.summarize_results([]).keys())
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 configs: List[Dict[str, Any]],
+                 start: int,
+                 end: int,
+                 results_path: str,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 max_workers: Optional[int] = None,
+                 vectorized: bool = True,
+                 controllers_module: str = settings.CONTROLLERS_MODULE,
+                 candles_feeds: Optional[Dict[str, pd.DataFrame]] = None):
+        """
+        :param configs: the controller configurations to backtest, as loaded from their yml files
+        :param start: the start timestamp of the backtests
+        :param end: the end timestamp of the backtests
+        :param results_path: path of the CSV results table, created if it doesn't exist
+        :param backtesting_resolution: the interval of the candles the executors are simulated on
+        :param trade_cost: the cost per trade
+        :param max_workers: number of worker processes (defaults to the number of CPUs), 1 backtests in this process
+        :param vectorized: if True the backtests are run on the vectorized engine mode
+        :param controllers_module: the module the controllers are imported from
+        :param candles_feeds: the candles to backtest on by candles feed key, they are downloaded if not provided
+        """
+        self._settings: Dict[str, Any] = {
+            "start": start,
+            "end": end,
+            "backtesting_resolution": backtesting_resolution,
+            "trade_cost": trade_cost,
+            "vectorized": vectorized,
+            "controllers_module": controllers_module,
+        }
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        for config_data in configs:
+            config_key = self.config_key(config_data)
+            # The key replaces any id of the configuration, it identifies the backtest in the results table
+            self._configs[config_key] = {**config_data, "id": config_key}
+        self._parameters: List[str] = self.varying_parameters(configs)
+        self._results_path: str = results_path
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+        self._candles_feeds: Optional[Dict[str, pd.DataFrame]] = candles_feeds
+
+    @staticmethod
+    def expand_grid(base_config: Dict[str, Any], grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        :param base_config: the controller configuration shared by all the variants
+        :param grid: the values to sweep by configuration parameter
+        :return: a configuration for each combination of the parameters values
+        """
+        parameters = list(grid.keys())
+        return [{**base_config, **dict(zip(parameters, values))}
+                for values in itertools.product(*(grid[parameter] for parameter in parameters))]
+
+    @staticmethod
+    def varying_parameters(configs: List[Dict[str, Any]]) -> List[str]:
+        """
+        :return: the parameters that don't have the same value in all the configurations
+        """
+        parameters = sorted({parameter for config_data in configs for parameter in config_data} - {"id"})
+        return [parameter for parameter in parameters
+                if len({json.dumps(config_data.get(parameter), sort_keys=True, default=str)
+                        for config_data in configs}) > 1]
+
+    @classmethod
+    def get_engine_class(cls, controller_config: ControllerConfigBase) -> Type[BacktestingEngineBase]:
+        engine_class = cls.ENGINE_CLASSES.get(controller_config.controller_type)
+        if engine_class is None:
+            raise ValueError(f"Backtesting is not supported for {controller_config.controller_type} controllers.")
+        return engine_class
+
+    def config_key(self, config_data: Dict[str, Any]) -> str:
+        """
+        :return: an identifier of the backtest of the configuration (its id excluded) with the sweep settings
+        """
+        content = json.dumps({"config": {key: value for key, value in config_data.items() if key != "id"},
+                              "settings": {key: value for key, value in self._settings.items()
+                                           if key not in ("vectorized", "controllers_module")}},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    @property
+    def result_fieldnames(self) -> List[str]:
+        return ["config_key"] + self._parameters + self.RESULT_COLUMNS + ["config"]
+
+    def completed_config_keys(self) -> Set[str]:
+        if not os.path.exists(self._results_path):
+            return set()
+        with open(self._results_path, newline="") as results_file:
+            return {row["config_key"] for row in csv.DictReader(results_file)}
+
+    def pending_configs(self) -> Dict[str, Dict[str, Any]]:
+        completed_config_keys = self.completed_config_keys()
+        return {config_key: config_data for config_key, config_data in self._configs.items()
+                if config_key not in completed_config_keys}
+
+    async def load_candles(self, config_keys: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Loads once all the candles the configurations need.
+        """
+        if self._candles_feeds is not None:
+            return self._candles_feeds
+        data_provider = BacktestingDataProvider(connectors={})
+        data_provider.update_backtesting_time(self._settings["start"], self._settings["end"])
+        for config_key in config_keys:
+            controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(
+                self._configs[config_key], self._settings["controllers_module"])
+            candles_configs = [CandlesConfig(connector=controller_config.connector_name,
+                                             trading_pair=controller_config.trading_pair,
+                                             interval=self._settings["backtesting_resolution"])]
+            for candles_config in candles_configs + controller_config.candles_config:
+                await data_provider.initialize_candles_feed(candles_config)
+        return data_provider.candles_feeds
+
+    async def run(self) -> pd.DataFrame:
+        """
+        Backtests the configurations not in the results table yet.
+        :return: the results table, with the results of the previous runs
+        """
+        pending_configs = self.pending_configs()
+        skipped = len(self._configs) - len(pending_configs)
+        if skipped > 0:
+            self.logger().info(f"Skipping {skipped} configurations already backtested in {self._results_path}.")
+        if len(pending_configs) > 0:
+            candles_feeds = await self.load_candles(list(pending_configs.keys()))
+            await self._run_configs(pending_configs, candles_feeds)
+        return self.results()
+
+    def results(self) -> pd.DataFrame:
+        if not os.path.exists(self._results_path):
+            return pd.DataFrame(columns=self.result_fieldnames)
+        return pd.read_csv(self._results_path)
+
+    async def _run_configs(self, configs: Dict[str, Dict[str, Any]], candles_feeds: Dict[str, pd.DataFrame]):
+        global _shared_candles_feeds
+        if self._max_workers == 1:
+            _initialize_worker(candles_feeds)
+            for done_count, (config_key, config_data) in enumerate(configs.items(), start=1):
+                try:
+                    self._record_result(config_key, await _backtest(self._settings, config_data))
+                except Exception:
+                    self.logger().error(f"Error backtesting the configuration {config_key}.", exc_info=True)
+                self.logger().info(f"Backtested {done_count}/{len(configs)} configurations.")
+            return
+
+        use_fork = "fork" in multiprocessing.get_all_start_methods()
+        if use_fork:
+            # The forked workers inherit the candles without copying them
+            _shared_candles_feeds = candles_feeds
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self._max_workers,
+                                 mp_context=multiprocessing.get_context("fork" if use_fork else None),
+                                 initializer=_initialize_worker,
+                                 initargs=(None if use_fork else candles_feeds,)) as pool:
+            tasks: Dict[asyncio.Future, str] = {
+                loop.run_in_executor(pool, _run_backtesting, self._settings, config_data): config_key
+                for config_key, config_data in configs.items()
+            }
+            done_count = 0
+            pending: Set[asyncio.Future] = set(tasks)
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    config_key = tasks[task]
+                    try:
+                        self._record_result(config_key, task.result())
+                    except Exception:
+                        self.logger().error(f"Error backtesting the configuration {config_key}.", exc_info=True)
+                done_count += len(done)
+                self.logger().info(f"Backtested {done_count}/{len(configs)} configurations.")
+
+    def _record_result(self, config_key: str, results: Dict[str, Any]):
+        config_data = self._configs[config_key]
+        row = {"config_key": config_key, "config": json.dumps(config_data, default=str)}
+        row.update({parameter: json.dumps(config_data.get(parameter), default=str)
+                    if isinstance(config_data.get(parameter), (list, dict)) else config_data.get(parameter)
+                    for parameter in self._parameters})
+        row.update({column: json.dumps(value) if isinstance(value, dict) else value
+                    for column, value in results.items()})
+        write_header = not os.path.exists(self._results_path) or os.path.getsize(self._results_path) == 0
+        if write_header:
+            fieldnames = self.result_fieldnames
+        else:
+            # Resumed sweeps keep the columns of the existing table
+            with open(self._results_path, newline="") as results_file:
+                fieldnames = next(csv.reader(results_file))
+        with open(self._results_path, "a", newline="") as results_file:
+            writer = csv.DictWriter(results_file, fieldnames=fieldnames, extrasaction="ignore")
+            if write_header:
+                writer.writeheader()
+            writer.writerow(row)
@@ -0,0 +1,78 @@
+from collections.abc import Sequence
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class ScheduledSimulation:
+    """
+    An executor simulation indexed on the backtesting ticks.
+
+    The simulation row at each tick and the tick at which the executor terminates are computed once with
+    `np.searchsorted`, so following the executor during the backtest doesn't require scanning its simulation.
+    """
+
+    __slots__ = ("simulation", "first_tick", "end_tick", "_rows")
+
+    def __init__(self, simulation: ExecutorSimulation, first_tick: int, timestamps: np.ndarray):
+        """
+        :param simulation: the executor simulation
+        :param first_tick: the first tick the executor is followed at
+        :param timestamps: the timestamps of all the backtesting ticks
+        """
+        self.simulation = simulation
+        self.first_tick = first_tick
+        simulation_timestamps = simulation.timestamps
+        # The executor is terminated from the first tick at or after its last simulation row
+        last_tick = first_tick + int(np.searchsorted(timestamps[first_tick:], simulation_timestamps[-1], side="left"))
+        self._rows: np.ndarray = np.searchsorted(
+            simulation_timestamps, timestamps[first_tick:last_tick + 1], side="right") - 1
+        # ... or before the simulation starts
+        not_started = np.flatnonzero(self._rows < 0)
+        self.end_tick: int = first_tick + int(not_started[0]) if len(not_started) > 0 else last_tick
+
+    def row_at(self, tick: int) -> int:
+        return int(self._rows[tick - self.first_tick])
+
+    def executor_info_at(self, tick: int) -> ExecutorInfo:
+        return self.simulation.get_executor_info_at_index(self.row_at(tick))
+
+
+class ExecutorsInfoView(Sequence):
+    """
+    The executors info of the controller at a backtesting tick.
+
+    The info of the active executors is only built if the controller reads it, and once per tick. The terminated
+    executors info is shared with the engine, the view only exposes the executors terminated before the tick.
+    """
+
+    def __init__(self,
+                 active_simulations: List[ScheduledSimulation],
+                 tick: int,
+                 stopped_executors_info: List[ExecutorInfo]):
+        self._active_simulations = active_simulations
+        self._tick = tick
+        self._stopped_executors_info = stopped_executors_info
+        self._stopped_count = len(stopped_executors_info)
+        self._executors_info: Optional[List[ExecutorInfo]] = None
+
+    @property
+    def executors_info(self) -> List[ExecutorInfo]:
+        if self._executors_info is None:
+            self._executors_info = (
+                [simulation.executor_info_at(self._tick) for simulation in self._active_simulations]
+                + self._stopped_executors_info[:self._stopped_count]
+            )
+        return self._executors_info
+
+    def __getitem__(self, index):
+        return self.executors_info[index]
+
+    def __iter__(self) -> Iterator[ExecutorInfo]:
+        return iter(self.executors_info)
+
+    def __len__(self) -> int:
+        return len(self._active_simulations) + self._stopped_count
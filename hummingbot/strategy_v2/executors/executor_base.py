@@ -1,17 +1,15 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
-    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -20,6 +18,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -47,25 +46,8 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
-
-        # Pairs of market events and their corresponding event forwarders
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.BuyOrderCreated, self._create_buy_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_sell_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
-            (MarketEvent.OrderFailure, self._failed_order_forwarder),
-        ]
+        # Routers delivering the events of the orders placed by the executor, by connector name
+        self._order_event_routers: Dict[str, OrderEventRouter] = {}
 
     @property
     def status(self):
@@ -239,19 +221,20 @@ class ExecutorBase(RunnableBase):
 
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Registers the executor in the order event routers of the connectors, to receive the events of its orders.
         """
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.add_listener(event_pair[0], event_pair[1])
+        for connector_name, connector in self.connectors.items():
+            router = OrderEventRouter.for_connector(connector)
+            router.register_executor(self)
+            self._order_event_routers[connector_name] = router
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unregisters the executor from the order event routers of the connectors.
         """
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.remove_listener(event_pair[0], event_pair[1])
+        for router in self._order_event_routers.values():
+            router.unregister_executor(self)
+        self._order_event_routers.clear()
 
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
@@ -280,6 +263,20 @@ class ExecutorBase(RunnableBase):
         :param price: The price for the order.
         :return: The result of the order placement.
         """
+        router = self._order_event_routers.get(connector_name)
+        if router is None:
+            return self._place_order(connector_name, trading_pair, order_type, side, amount, position_action, price)
+        return router.place_order(self, lambda: self._place_order(
+            connector_name, trading_pair, order_type, side, amount, position_action, price))
+
+    def _place_order(self,
+                     connector_name: str,
+                     trading_pair: str,
+                     order_type: OrderType,
+                     side: TradeType,
+                     amount: Decimal,
+                     position_action: PositionAction,
+                     price: Decimal):
         if side == TradeType.BUY:
             return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
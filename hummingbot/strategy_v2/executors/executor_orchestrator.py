@@ -1,6 +1,7 @@
 import logging
+from contextlib import ExitStack, contextmanager
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
@@ -24,6 +25,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
 )
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_base import RunnableScheduler
 
 
 class ExecutorOrchestrator:
@@ -38,10 +40,25 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self,
+                 strategy: ScriptStrategyBase,
+                 executors_update_interval: float = 1.0,
+                 use_shared_scheduler: bool = False,
+                 executor_time_budget: float = 0.05):
+        """
+        :param strategy: The strategy the executors place orders for.
+        :param executors_update_interval: The interval at which the executors control task is executed, in seconds.
+        :param use_shared_scheduler: If True the executors of each controller are run by a single scheduler loop
+            instead of each executor running its own control loop task.
+        :param executor_time_budget: The time each executor control task is expected to complete within, in seconds,
+            when using the shared scheduler.
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
+        self.use_shared_scheduler = use_shared_scheduler
+        self.executor_time_budget = executor_time_budget
         self.executors = {}
+        self.schedulers: Dict[str, RunnableScheduler] = {}
 
     def stop(self):
         """
@@ -77,8 +94,23 @@ class ExecutorOrchestrator:
         """
         Execute a list of actions.
         """
-        for action in actions:
-            self.execute_action(action)
+        # The orders of the executors stopped and created together, e.g. to refresh the levels of a market making
+        # controller, are cancelled and created together
+        with self.batched_orders():
+            for action in actions:
+                self.execute_action(action)
+
+    @contextmanager
+    def batched_orders(self) -> Iterator[None]:
+        """
+        Group the orders created and cancelled by the executors in the context into batch requests, for the
+        connectors supporting them. The connectors batch the orders per task, so a scheduler tick never holds the
+        orders of the other schedulers or strategies.
+        """
+        with ExitStack() as stack:
+            for connector in self.strategy.connectors.values():
+                stack.enter_context(connector.batched_orders())
+            yield
 
     def create_executor(self, action: CreateExecutorAction):
         """
@@ -104,10 +136,23 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        if self.use_shared_scheduler:
+            executor.set_scheduler(self.get_scheduler(controller_id))
         executor.start()
         self.executors[controller_id].append(executor)
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
 
+    def get_scheduler(self, controller_id: str) -> RunnableScheduler:
+        """
+        Get the scheduler running the executors of the controller.
+        """
+        if controller_id not in self.schedulers:
+            self.schedulers[controller_id] = RunnableScheduler(
+                update_interval=self.executors_update_interval,
+                task_time_budget=self.executor_time_budget,
+                tick_context=self.batched_orders)
+        return self.schedulers[controller_id]
+
     def stop_executor(self, action: StopExecutorAction):
         """
         Stop an executor based on the action details.
@@ -0,0 +1,113 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class OrderEventRouter:
+    """
+    Routes the order events of a connector to the executor that placed the order.
+
+    The router listens to the connector order events once for all its executors, and dispatches each event with a
+    single lookup of the event client order id, instead of every executor listening to (and filtering) all the
+    connector events.
+    The events of unknown orders are dropped, except while an executor is placing an order: connectors can trigger the
+    order created event before returning the order id, so these events are held until the order id is returned, and
+    then routed to the executor if they are for its order.
+
+    There is one router per connector, shared by all the executors. The router stops listening to the connector when
+    its last executor is unregistered.
+    """
+
+    _routers: Dict[ConnectorBase, "OrderEventRouter"] = {}
+
+    # The executor method processing each event
+    EVENT_PROCESSORS: List[Tuple[MarketEvent, str]] = [
+        (MarketEvent.OrderCancelled, "process_order_canceled_event"),
+        (MarketEvent.BuyOrderCreated, "process_order_created_event"),
+        (MarketEvent.SellOrderCreated, "process_order_created_event"),
+        (MarketEvent.OrderFilled, "process_order_filled_event"),
+        (MarketEvent.BuyOrderCompleted, "process_order_completed_event"),
+        (MarketEvent.SellOrderCompleted, "process_order_completed_event"),
+        (MarketEvent.OrderFailure, "process_order_failed_event"),
+    ]
+
+    @classmethod
+    def for_connector(cls, connector: ConnectorBase) -> "OrderEventRouter":
+        router = cls._routers.get(connector)
+        if router is None:
+            router = cls(connector)
+            cls._routers[connector] = router
+        return router
+
+    def __init__(self, connector: ConnectorBase):
+        self._connector: ConnectorBase = connector
+        self._executors_orders: Dict["ExecutorBase", Set[str]] = {}
+        self._order_executors: Dict[str, "ExecutorBase"] = {}
+        # The events of unknown orders triggered during the current order placement
+        self._placement_events: Optional[List[Tuple[str, int, ConnectorBase, Any]]] = None
+        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
+            (event, SourceInfoEventForwarder(self._event_processor(method_name)))
+            for event, method_name in self.EVENT_PROCESSORS
+        ]
+
+    @property
+    def executors(self) -> List["ExecutorBase"]:
+        return list(self._executors_orders)
+
+    def register_executor(self, executor: "ExecutorBase"):
+        if len(self._executors_orders) == 0:
+            for event, forwarder in self._event_pairs:
+                self._connector.add_listener(event, forwarder)
+            self._routers[self._connector] = self
+        self._executors_orders.setdefault(executor, set())
+
+    def unregister_executor(self, executor: "ExecutorBase"):
+        for order_id in self._executors_orders.pop(executor, ()):
+            self._order_executors.pop(order_id, None)
+        if len(self._executors_orders) == 0:
+            for event, forwarder in self._event_pairs:
+                self._connector.remove_listener(event, forwarder)
+            if self._routers.get(self._connector) is self:
+                del self._routers[self._connector]
+
+    def register_order(self, executor: "ExecutorBase", order_id: str):
+        orders = self._executors_orders.get(executor)
+        if orders is not None:
+            orders.add(order_id)
+            self._order_executors[order_id] = executor
+
+    def place_order(self, executor: "ExecutorBase", place: Callable[[], str]) -> str:
+        """
+        Places an order of the executor and registers the order id returned. The events of that order triggered during
+        the placement are routed to the executor once the order id is known, the other unknown orders are dropped.
+        :param place: places the order and returns its client order id
+        """
+        previous_events, self._placement_events = self._placement_events, []
+        try:
+            order_id = place()
+        finally:
+            placement_events, self._placement_events = self._placement_events, previous_events
+        self.register_order(executor, order_id)
+        for method_name, event_tag, market, event in placement_events:
+            if event.order_id == order_id:
+                getattr(executor, method_name)(event_tag, market, event)
+            elif previous_events is not None:
+                # The order of an outer placement
+                previous_events.append((method_name, event_tag, market, event))
+        return order_id
+
+    def _event_processor(self, method_name: str) -> Callable:
+        def route(event_tag: int, market: ConnectorBase, event):
+            order_id = event.order_id
+            executor = self._order_executors.get(order_id)
+            if executor is not None:
+                getattr(executor, method_name)(event_tag, market, event)
+            elif self._placement_events is not None:
+                self._placement_events.append((method_name, event_tag, market, event))
+
+        return route
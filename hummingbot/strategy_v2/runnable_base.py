@@ -1,6 +1,10 @@
 import asyncio
 import logging
+import time
 from abc import ABC
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Callable, ContextManager, Dict, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
@@ -29,6 +33,7 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._scheduler: Optional["RunnableScheduler"] = None
 
     @property
     def status(self):
@@ -39,6 +44,15 @@ class RunnableBase(ABC):
         """
         return self._status
 
+    def set_scheduler(self, scheduler: Optional["RunnableScheduler"]):
+        """
+        Set a scheduler to run the control task from its loop, instead of from a control loop task of the component.
+        It has to be set before the component is started.
+
+        :param scheduler: The scheduler, or None to use the component control loop.
+        """
+        self._scheduler = scheduler
+
     def start(self):
         """
         Start the control loop of the smart component.
@@ -47,6 +61,12 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
+            self._start_control_loop()
+
+    def _start_control_loop(self):
+        if self._scheduler is not None:
+            self._scheduler.add(self)
+        else:
             safe_ensure_future(self.control_loop())
 
     def stop(self):
@@ -93,3 +113,133 @@ class RunnableBase(ABC):
         This method should be overridden in subclasses to provide specific behavior.
         """
         pass
+
+
+@dataclass
+class RunnableSchedulerStats:
+    """
+    Timing statistics of the ticks of a RunnableScheduler, in seconds.
+    The lag of a tick is the delay between the time the tick was scheduled for and the time it started.
+    """
+    ticks: int = 0
+    last_tick_duration: float = 0.0
+    max_tick_duration: float = 0.0
+    last_tick_lag: float = 0.0
+    max_tick_lag: float = 0.0
+    slow_tasks: int = 0
+
+    def record_tick(self, duration: float, lag: float):
+        self.ticks += 1
+        self.last_tick_duration = duration
+        self.max_tick_duration = max(self.max_tick_duration, duration)
+        self.last_tick_lag = lag
+        self.max_tick_lag = max(self.max_tick_lag, lag)
+
+
+class RunnableScheduler:
+    """
+    Runs the control task of many components from a single loop, instead of one control loop task per component.
+
+    On every tick (once per update interval) the control tasks of the components run one after the other, in the order
+    the components were started. Each task is expected to complete within the time budget, a warning is logged for the
+    components taking longer.
+    The scheduler starts its loop when the first component is added, and ends it when all the components are stopped.
+    """
+    _logger = None
+    SLOW_TASK_WARNING_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 update_interval: float = 0.5,
+                 task_time_budget: float = 0.05,
+                 tick_context: Callable[[], ContextManager] = nullcontext):
+        """
+        :param update_interval: The interval between two ticks, in seconds.
+        :param task_time_budget: The time each control task is expected to complete within, in seconds.
+        :param tick_context: Factory of the context the control tasks of a tick run in.
+        """
+        self.update_interval = update_interval
+        self.task_time_budget = task_time_budget
+        self.tick_context = tick_context
+        self.stats = RunnableSchedulerStats()
+        # The components run in insertion order, the value is whether on_start was already called
+        self._runnables: Dict[RunnableBase, bool] = {}
+        self._last_slow_task_warning: Dict[RunnableBase, float] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def runnables(self):
+        return list(self._runnables)
+
+    def add(self, runnable: RunnableBase):
+        self._runnables.setdefault(runnable, False)
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = safe_ensure_future(self._run())
+
+    def stop(self):
+        """
+        Stop the scheduler loop, the components still running are not stopped.
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+
+    async def _run(self):
+        next_tick = self._time()
+        while True:
+            tick_start = self._time()
+            with self.tick_context():
+                for runnable in list(self._runnables):
+                    await self._run_task(runnable)
+            tick_end = self._time()
+            self.stats.record_tick(duration=tick_end - tick_start, lag=max(0.0, tick_start - next_tick))
+            if len(self._runnables) == 0:
+                break
+            # Ticks that couldn't run on time are skipped instead of running in a burst
+            next_tick = max(next_tick + self.update_interval, tick_end)
+            await self._sleep(next_tick - tick_end)
+
+    async def _run_task(self, runnable: RunnableBase):
+        task_start = self._time()
+        try:
+            if not self._runnables[runnable]:
+                self._runnables[runnable] = True
+                runnable.on_start()
+            if runnable.terminated.is_set():
+                self._remove(runnable)
+                runnable.on_stop()
+            else:
+                await runnable.control_task()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+        finally:
+            self._check_task_time(runnable, self._time() - task_start)
+
+    def _remove(self, runnable: RunnableBase):
+        self._runnables.pop(runnable, None)
+        self._last_slow_task_warning.pop(runnable, None)
+
+    def _check_task_time(self, runnable: RunnableBase, task_time: float):
+        if task_time <= self.task_time_budget:
+            return
+        self.stats.slow_tasks += 1
+        now = self._time()
+        if now - self._last_slow_task_warning.get(runnable, -self.SLOW_TASK_WARNING_INTERVAL) >= \
+                self.SLOW_TASK_WARNING_INTERVAL:
+            self._last_slow_task_warning[runnable] = now
+            self.logger().warning(
+                f"{type(runnable).__name__} control task took {task_time * 1000:.1f} ms, over the "
+                f"{self.task_time_budget * 1000:.1f} ms budget, delaying the other components of the scheduler.")
+
+    @staticmethod
+    def _time() -> float:
+        return time.perf_counter()
+
+    @staticmethod
+    async def _sleep(delay: float):
+        await asyncio.sleep(delay)
@@ -0,0 +1,565 @@
+import math
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+NaN = float("nan")
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    # Same results as the division of the float64 series (x / 0 is +-inf and 0 / 0 is NaN)
+    if denominator == 0:
+        if numerator == 0 or math.isnan(numerator):
+            return NaN
+        return math.copysign(math.inf, numerator) * math.copysign(1, denominator)
+    return numerator / denominator
+
+
+def _non_zero_range(high: float, low: float) -> float:
+    # pandas_ta adds the epsilon to the whole series when one of the differences is zero, it is only added to the zero
+    # differences here, the other values differ by the epsilon at most
+    difference = high - low
+    return difference + sys.float_info.epsilon if difference == 0 else difference
+
+
+class _Incremental(ABC):
+    """
+    A calculation on a series of values updated with each new value or with the update of the last value, in constant
+    time.
+
+    The values before the last one are the committed state, the last value only produces a pending state that is
+    committed when a new value comes after it, so the last value can be updated any number of times.
+    """
+
+    def __init__(self):
+        self._pending = None
+        self.reset()
+
+    def reset(self):
+        self._pending = None
+
+    def update(self, is_new: bool, *values: float):
+        """
+        :param is_new: True if the values come after the last ones, False if they replace them
+        :return: the output of the calculation for the values
+        """
+        if is_new and self._pending is not None:
+            self._commit(self._pending)
+        output, self._pending = self._step(is_new, *values)
+        return output
+
+    @abstractmethod
+    def _step(self, is_new: bool, *values: float):
+        """
+        :return: the output for the values and the state to commit if the next values are new ones
+        """
+        raise NotImplementedError
+
+    def _commit(self, pending):
+        pass
+
+
+class _Previous(_Incremental):
+    """
+    The previous value of the series, NaN for the first one.
+    """
+
+    def reset(self):
+        super().reset()
+        self._previous = NaN
+
+    def _step(self, is_new: bool, value: float):
+        return self._previous, value
+
+    def _commit(self, value: float):
+        self._previous = value
+
+
+class _EMA(_Incremental):
+    """
+    Exponential moving average of pandas_ta: NaN for the first length - 1 values, the mean of the first length values
+    (ignoring the NaNs) then the recursive average with alpha = 2 / (length + 1).
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._alpha = 2 / (length + 1)
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self._count = 0
+        self._seed_sum = 0.0
+        self._seed_count = 0
+        self._value = NaN
+
+    def _step(self, is_new: bool, value: float):
+        count = self._count + 1
+        seed_sum, seed_count = self._seed_sum, self._seed_count
+        if count <= self._length:
+            if not math.isnan(value):
+                seed_sum += value
+                seed_count += 1
+            ema = seed_sum / seed_count if count == self._length and seed_count > 0 else NaN
+        elif math.isnan(self._value):
+            ema = value
+        elif math.isnan(value):
+            ema = self._value
+        else:
+            ema = (1 - self._alpha) * self._value + self._alpha * value
+        return ema, (count, seed_sum, seed_count, ema)
+
+    def _commit(self, state: tuple):
+        self._count, self._seed_sum, self._seed_count, self._value = state
+
+
+class _RMA(_Incremental):
+    """
+    Wilder's moving average of pandas_ta: the adjusted exponential average with alpha = 1 / length, NaN until length
+    values are not NaN.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._decay = 1 - 1 / length
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self._weighted_sum = 0.0
+        self._weight = 0.0
+        self._count = 0
+
+    def _step(self, is_new: bool, value: float):
+        weighted_sum = self._weighted_sum * self._decay
+        weight = self._weight * self._decay
+        count = self._count
+        if not math.isnan(value):
+            weighted_sum += value
+            weight += 1
+            count += 1
+        rma = weighted_sum / weight if count >= self._length else NaN
+        return rma, (weighted_sum, weight, count)
+
+    def _commit(self, state: tuple):
+        self._weighted_sum, self._weight, self._count = state
+
+
+class _Rolling(_Incremental):
+    """
+    Mean and standard deviation of the last length values, NaN until there are length values.
+
+    The sums are kept relative to a recent value to limit the cancellation, and recalculated from the window every
+    length values so the rounding errors don't accumulate. A window of equal values has exactly that mean and a zero
+    standard deviation, like the pandas rolling functions.
+    """
+
+    def __init__(self, length: int, ddof: int = 0):
+        self._length = length
+        self._ddof = ddof
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self._values = deque(maxlen=self._length - 1)
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+        self._same_values_count = 0
+        self._commits_count = 0
+
+    def _step(self, is_new: bool, value: float):
+        same_values_count = self._same_values_count + 1 if self._values and self._values[-1] == value else 1
+        if len(self._values) < self._length - 1:
+            return (NaN, NaN), (value, same_values_count)
+        if same_values_count >= self._length:
+            return (value, 0.0 if self._length > self._ddof else NaN), (value, same_values_count)
+        difference = value - self._shift
+        total = self._sum + difference
+        total_of_squares = self._sum_of_squares + difference * difference
+        mean = self._shift + total / self._length
+        variance = _divide(max(total_of_squares - total * total / self._length, 0.0), self._length - self._ddof)
+        return (mean, math.sqrt(variance)), (value, same_values_count)
+
+    def _commit(self, state: tuple):
+        value, self._same_values_count = state
+        if self._values.maxlen == 0:
+            return
+        if not self._values:
+            self._shift = value
+        elif len(self._values) == self._values.maxlen:
+            difference = self._values[0] - self._shift
+            self._sum -= difference
+            self._sum_of_squares -= difference * difference
+        self._values.append(value)
+        difference = value - self._shift
+        self._sum += difference
+        self._sum_of_squares += difference * difference
+        self._commits_count += 1
+        if self._commits_count % self._length == 0:
+            self._shift = value
+            differences = [previous_value - value for previous_value in self._values]
+            self._sum = math.fsum(differences)
+            self._sum_of_squares = math.fsum(difference * difference for difference in differences)
+
+
+class _TrueRange(_Incremental):
+    """
+    True range of pandas_ta, NaN for the first candle.
+    """
+
+    def __init__(self):
+        self._previous_close = _Previous()
+        super().__init__()
+
+    def reset(self):
+        super().reset()
+        self._previous_close.reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        previous_close = self._previous_close.update(is_new, close)
+        if math.isnan(previous_close):
+            return NaN, None
+        return max(abs(_non_zero_range(high, low)), abs(high - previous_close), abs(previous_close - low)), None
+
+
+class IncrementalIndicator(_Incremental):
+    """
+    Base class of the indicators calculated incrementally from the candles: each candle updates the state of the
+    indicator in constant time, and the last candle can be updated in place until the next candle comes (like the
+    candle in progress of the candles feeds).
+
+    The values are the ones of the pandas_ta indicator with the same name and parameters, calculated over all the
+    candles since the first one (or the last reset). The columns are named like the pandas_ta ones.
+    """
+
+    def reset(self):
+        super().reset()
+        self._timestamp: Optional[float] = None
+        self._values: Tuple[float, ...] = tuple(NaN for _ in self.columns)
+
+    @property
+    @abstractmethod
+    def columns(self) -> List[str]:
+        raise NotImplementedError
+
+    @property
+    def values(self) -> Tuple[float, ...]:
+        """
+        :return: the values of the indicator for the last candle, in the order of the columns
+        """
+        return self._values
+
+    def update_candle(self, timestamp: float, high: float, low: float, close: float) -> Tuple[float, ...]:
+        """
+        Adds a candle, or updates the last one if it has the same timestamp.
+        :return: the values of the indicator for the candle
+        """
+        if self._timestamp is not None and timestamp < self._timestamp:
+            raise ValueError(f"The candle {timestamp} is older than the last candle {self._timestamp}.")
+        is_new = self._timestamp is None or timestamp > self._timestamp
+        self._timestamp = timestamp
+        self._values = self.update(is_new, high, low, close)
+        return self._values
+
+
+class SMA(IncrementalIndicator):
+    def __init__(self, length: int = 10):
+        self._length = length
+        self._rolling = _Rolling(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"SMA_{self._length}"]
+
+    def reset(self):
+        self._rolling.reset()
+        super().reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        mean, _ = self._rolling.update(is_new, close)
+        return (mean,), None
+
+
+class EMA(IncrementalIndicator):
+    def __init__(self, length: int = 10):
+        self._length = length
+        self._ema = _EMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self._length}"]
+
+    def reset(self):
+        self._ema.reset()
+        super().reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        return (self._ema.update(is_new, close),), None
+
+
+class RSI(IncrementalIndicator):
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self._length = length
+        self._scalar = float(scalar)
+        self._previous_close = _Previous()
+        self._positive_average = _RMA(length)
+        self._negative_average = _RMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self._length}"]
+
+    def reset(self):
+        self._previous_close.reset()
+        self._positive_average.reset()
+        self._negative_average.reset()
+        super().reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        change = close - self._previous_close.update(is_new, close)
+        positive_average = self._positive_average.update(is_new, change if not change < 0 else 0.0)
+        negative_average = self._negative_average.update(is_new, change if not change > 0 else 0.0)
+        return (_divide(self._scalar * positive_average, positive_average + abs(negative_average)),), None
+
+
+class MACD(IncrementalIndicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        self._fast, self._slow, self._signal = fast, slow, signal
+        self._fast_ema = _EMA(fast)
+        self._slow_ema = _EMA(slow)
+        self._signal_ema = _EMA(signal)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        properties = f"_{self._fast}_{self._slow}_{self._signal}"
+        return [f"MACD{properties}", f"MACDh{properties}", f"MACDs{properties}"]
+
+    def reset(self):
+        self._fast_ema.reset()
+        self._slow_ema.reset()
+        self._signal_ema.reset()
+        super().reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        macd = self._fast_ema.update(is_new, close) - self._slow_ema.update(is_new, close)
+        if math.isnan(macd):
+            # The signal starts with the first valid MACD
+            return (NaN, NaN, NaN), None
+        signal = self._signal_ema.update(is_new, macd)
+        return (macd, macd - signal, signal), None
+
+
+class BollingerBands(IncrementalIndicator):
+    def __init__(self, length: int = 5, std: float = 2.0, ddof: int = 0):
+        self._length = length
+        self._std = float(std)
+        self._rolling = _Rolling(length, ddof=ddof if 0 <= ddof < length else 1)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        properties = f"_{self._length}_{self._std}"
+        return [f"BBL{properties}", f"BBM{properties}", f"BBU{properties}", f"BBB{properties}", f"BBP{properties}"]
+
+    def reset(self):
+        self._rolling.reset()
+        super().reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        mid, standard_deviation = self._rolling.update(is_new, close)
+        deviations = self._std * standard_deviation
+        lower, upper = mid - deviations, mid + deviations
+        upper_lower_range = _non_zero_range(upper, lower)
+        bandwidth = _divide(100 * upper_lower_range, mid)
+        percent = _divide(_non_zero_range(close, lower), upper_lower_range)
+        return (lower, mid, upper, bandwidth, percent), None
+
+
+class ATR(IncrementalIndicator):
+    def __init__(self, length: int = 14, mamode: str = "rma"):
+        self._length = length
+        self._mamode = mamode.lower()
+        if self._mamode not in ("rma", "ema"):
+            raise ValueError(f"The moving average {mamode} is not supported, use rma or ema.")
+        self._true_range = _TrueRange()
+        self._average = _RMA(length) if self._mamode == "rma" else _EMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"ATR{self._mamode[0]}_{self._length}"]
+
+    def reset(self):
+        self._true_range.reset()
+        self._average.reset()
+        super().reset()
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        return (self._average.update(is_new, self._true_range.update(is_new, high, low, close)),), None
+
+
+class NATR(ATR):
+    def __init__(self, length: int = 14, scalar: float = 100, mamode: str = "ema"):
+        self._scalar = float(scalar)
+        super().__init__(length=length, mamode=mamode)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self._length}"]
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        (atr,), _ = super()._step(is_new, high, low, close)
+        return (_divide(self._scalar, close) * atr,), None
+
+
+class SuperTrend(IncrementalIndicator):
+    def __init__(self, length: int = 7, multiplier: float = 3.0):
+        self._length = length
+        self._multiplier = float(multiplier)
+        self._atr = ATR(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        properties = f"_{self._length}_{self._multiplier}"
+        return [f"SUPERT{properties}", f"SUPERTd{properties}", f"SUPERTl{properties}", f"SUPERTs{properties}"]
+
+    def reset(self):
+        self._atr.reset()
+        super().reset()
+        self._count = 0
+        self._direction = 1
+        self._upper_band = NaN
+        self._lower_band = NaN
+
+    def _step(self, is_new: bool, high: float, low: float, close: float):
+        (atr,) = self._atr.update(is_new, high, low, close)
+        hl2 = 0.5 * (high + low)
+        upper_band = hl2 + self._multiplier * atr
+        lower_band = hl2 - self._multiplier * atr
+        if self._count == 0:
+            return (0.0, 1.0, NaN, NaN), (1, 1, upper_band, lower_band)
+        if close > self._upper_band:
+            direction = 1
+        elif close < self._lower_band:
+            direction = -1
+        else:
+            direction = self._direction
+            if direction > 0 and lower_band < self._lower_band:
+                lower_band = self._lower_band
+            if direction < 0 and upper_band > self._upper_band:
+                upper_band = self._upper_band
+        if direction > 0:
+            values = (lower_band, 1.0, lower_band, NaN)
+        else:
+            values = (upper_band, -1.0, NaN, upper_band)
+        return values, (self._count + 1, direction, upper_band, lower_band)
+
+    def _commit(self, state: tuple):
+        self._count, self._direction, self._upper_band, self._lower_band = state
+
+
+class CandlesIndicators:
+    """
+    A set of incremental indicators fed with the candles of a candles feed.
+
+    Each update only feeds the indicators with the candles that changed since the previous update, matched by
+    timestamp: the last candle when the feed updated it in place and the new candles. The values of the indicators
+    are kept for the candles of the last DataFrame, so the update only costs the new candles instead of recalculating
+    the indicators over all the candles like pandas_ta does on every tick.
+
+    The incremental values are the ones of pandas_ta calculated over all the candles since the first update. They only
+    differ from pandas_ta calculated over the last DataFrame for the indicators with an exponential moving average,
+    initialized with the mean of the first candles of the DataFrame by pandas_ta (the difference decays with the
+    number of candles). With pandas_ta_compatible, the indicators are recalculated over all the candles of the
+    DataFrame on each update and the values are the ones of pandas_ta on that DataFrame, to verify the indicators.
+    """
+
+    def __init__(self, indicators: Sequence[IncrementalIndicator], pandas_ta_compatible: bool = False):
+        self._indicators = list(indicators)
+        self._pandas_ta_compatible = pandas_ta_compatible
+        self._columns = [column for indicator in self._indicators for column in indicator.columns]
+        self._history = CandlesBuffer(columns=["timestamp"] + self._columns, maxlen=0)
+        self._first_timestamp: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+
+    @property
+    def indicators(self) -> List[IncrementalIndicator]:
+        return self._indicators
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def pandas_ta_compatible(self) -> bool:
+        return self._pandas_ta_compatible
+
+    def reset(self):
+        for indicator in self._indicators:
+            indicator.reset()
+        self._history.clear()
+        self._first_timestamp = None
+        self._last_timestamp = None
+
+    def update(self, candles_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Feeds the indicators with the candles added or updated since the last update.
+        :param candles_df: the candles sorted by timestamp, with the timestamp, high, low and close columns
+        :return: the candles with a column by indicator value
+        """
+        timestamps = candles_df["timestamp"].to_numpy(dtype=float)
+        if len(timestamps) > self._history.maxlen:
+            history = CandlesBuffer(columns=self._history.columns, maxlen=len(timestamps))
+            history.extend(self._history)
+            self._history = history
+        if (self._pandas_ta_compatible
+                or (self._first_timestamp is not None and len(timestamps) > 0 and timestamps[0] < self._first_timestamp)):
+            # The candles before the first one fed (e.g. filled after the first update) change all the values
+            self.reset()
+        start = 0 if self._last_timestamp is None else int(np.searchsorted(timestamps, self._last_timestamp, "left"))
+        highs = candles_df["high"].to_numpy(dtype=float)
+        lows = candles_df["low"].to_numpy(dtype=float)
+        closes = candles_df["close"].to_numpy(dtype=float)
+        for index in range(start, len(timestamps)):
+            self._update_candle(timestamps[index], highs[index], lows[index], closes[index])
+        return self._with_indicators(candles_df, timestamps)
+
+    def _update_candle(self, timestamp: float, high: float, low: float, close: float):
+        values = [timestamp]
+        for indicator in self._indicators:
+            values.extend(indicator.update_candle(timestamp, high, low, close))
+        if timestamp == self._last_timestamp:
+            self._history[-1] = values
+        else:
+            self._history.append(values)
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+        self._last_timestamp = timestamp
+
+    def _with_indicators(self, candles_df: pd.DataFrame, timestamps: np.ndarray) -> pd.DataFrame:
+        history_timestamps = self._history.column("timestamp")
+        start = len(history_timestamps) - len(timestamps)
+        if start >= 0 and np.array_equal(history_timestamps[start:], timestamps):
+            values = np.array([self._history.column(column)[start:] for column in self._columns]).T
+        else:
+            positions = np.searchsorted(history_timestamps, timestamps).clip(max=max(len(history_timestamps) - 1, 0))
+            found = history_timestamps[positions] == timestamps if len(history_timestamps) > 0 else False
+            values = np.where(found, [self._history.column(column)[positions] for column in self._columns], NaN).T
+        indicators_df = pd.DataFrame(values, columns=self._columns, index=candles_df.index)
+        if candles_df.columns.isin(self._columns).any():
+            candles_df = candles_df.drop(columns=self._columns, errors="ignore")
+        return pd.concat([candles_df, indicators_df], axis=1)
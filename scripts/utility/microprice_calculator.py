@@ -103,7 +103,7 @@ class MicropricePMM(ScriptStrategyBase):
         return f'{self.path_to_data}/microprice_{self.trading_pair}_{self.exchange}_{datetime.datetime.now().strftime("%Y-%m-%d")}.csv'
 
     def get_bid_ask(self):
-        bids, asks = self.connectors[self.exchange].get_order_book(self.trading_pair).snapshot
+        bids, asks = self.connectors[self.exchange].get_order_book(self.trading_pair).get_snapshot(1)
         # if size > 0, return average of range
         best_ask = asks.iloc[0].price
         ask_volume = asks.iloc[0].amount
@@ -99,6 +99,14 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | False                |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | ∟ order_book_recording_enabled    | False                |\n"
+                           "    | json_codec                        | auto                 |\n"
+                           "    | connection_pool                   |                      |\n"
+                           "    | ∟ connection_limit_per_host       | 50                   |\n"
+                           "    | ∟ keepalive_timeout               | 30.0                 |\n"
+                           "    | ∟ dns_cache_ttl                   | 300                  |\n"
+                           "    | ∟ per_host_sessions               | True                 |\n"
+                           "    | candles_cache                     | True                 |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
@@ -11,8 +11,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import PerformanceTracker
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
+from hummingbot.core.data_type.common import PositionAction
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
@@ -86,6 +89,7 @@ class HistoryCommandTest(unittest.TestCase):
                 leverage=1,
                 trade_fee=trade_fee.to_json(),
                 exchange_trade_id="someExchangeId",
+                position=PositionAction.NIL.value,
             )
         ]
         return trades
@@ -106,6 +110,33 @@ class HistoryCommandTest(unittest.TestCase):
             )
         )
 
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances", new_callable=AsyncMock)
+    def test_verify_performance_report_compares_the_incremental_performance(self, get_current_balances_mock):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BTC-USDT"] = Decimal("2")
+        RateOracle._shared_instance = rate_oracle
+        self.addCleanup(setattr, RateOracle, "_shared_instance", None)
+        get_current_balances_mock.return_value = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+        trades = self.get_trades()
+        performance_tracker = PerformanceTracker(start_timestamp=0)
+        for trade in trades:
+            performance_tracker.add_trade_fill(trade)
+
+        differences = self.async_run_with_timeout(
+            self.app.verify_performance_report(start_time=time.time(), trades=trades,
+                                               performance_tracker=performance_tracker))
+
+        self.assertEqual([], differences)
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg="\nThe incremental performance matches the recalculated performance of 1 trades."))
+
+        performance_tracker.add_trade_fill(self.get_trades()[0])
+        differences = self.async_run_with_timeout(
+            self.app.verify_performance_report(start_time=time.time(), trades=trades,
+                                               performance_tracker=performance_tracker))
+
+        self.assertIn("binance / BTC-USDT: num_buys is 2 incrementally and 1 recalculated", differences)
+
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
     def test_list_trades(self, notify_mock):
         self.client_config_map.db_mode = DBSqliteMode()
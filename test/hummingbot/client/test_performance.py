@@ -1,14 +1,16 @@
 import asyncio
+import json
 import time
 import unittest
 from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics, PerformanceTracker
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
@@ -341,3 +343,136 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+
+class PerformanceAccumulatorUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+        self.timestamp = 1640001112223
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self, order_id, trade_type, price, amount, position=PositionAction.NIL.value, trade_fee=None):
+        self.timestamp += 1
+        trade_fee = trade_fee or AddedToCostTradeFee(percent=Decimal("0.001"))
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=self.timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"trade{self.timestamp}",
+            position=position,
+        )
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, metrics: PerformanceMetrics):
+        for field in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                      "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                      "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price",
+                      "cur_price", "hold_value", "cur_value", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertAlmostEqual(getattr(expected, field), getattr(metrics, field), places=8, msg=field)
+        self.assertAlmostEqual(expected.trade_pnl, metrics.trade_pnl, places=8)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+
+    def test_metrics_match_the_full_calculation_for_spot_trades(self):
+        trades = [
+            self.trade_fill("buy1", "BUY", 100, 10),
+            self.trade_fill("sell1", "SELL", 120, 4, trade_fee=DeductedFromReturnsTradeFee(
+                percent=Decimal("0.002"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill("sell1", "SELL", 121, 11),
+        ]
+        accumulator = PerformanceAccumulator(trading_pair=trading_pair)
+        for trade in trades:
+            accumulator.add_trade_fill(trade)
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        metrics = self.async_run_with_timeout(accumulator.metrics(cur_bals))
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+
+        self.assertFalse(accumulator.is_derivative)
+        self.assertEqual(self.timestamp, accumulator.last_fill_timestamp)
+        self.assert_same_metrics(expected, metrics)
+
+    def test_metrics_match_the_full_calculation_for_derivative_trades(self):
+        trades = [
+            self.trade_fill("long_open", "BUY", 10, 60, position="OPEN"),
+            self.trade_fill("short_open", "SELL", 20, 100, position="OPEN"),
+            self.trade_fill("long_open", "BUY", 11, 40, position="OPEN"),
+            self.trade_fill("long_close", "SELL", 15, 50, position="CLOSE"),
+            self.trade_fill("short_close", "BUY", 15, 100, position="CLOSE"),
+            self.trade_fill("long_close", "SELL", 16, 50, position="CLOSE"),
+            self.trade_fill("second_long_open", "BUY", 12, 10, position="OPEN"),
+        ]
+        accumulator = PerformanceAccumulator(trading_pair=trading_pair)
+        for trade in trades:
+            accumulator.add_trade_fill(trade)
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        metrics = self.async_run_with_timeout(accumulator.metrics(cur_bals))
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+
+        self.assertTrue(accumulator.is_derivative)
+        # Long: (15.5 - 10.5) * 100, short: (20 - 15) * 100
+        self.assertEqual(Decimal("1000"), accumulator.closed_positions_pnl)
+        self.assert_same_metrics(expected, metrics)
+
+    def test_snapshot_restores_the_accumulated_performance(self):
+        accumulator = PerformanceAccumulator(trading_pair=trading_pair)
+        accumulator.add_trade_fill(self.trade_fill("long_open", "BUY", 10, 100, position="OPEN"))
+        accumulator.add_trade_fill(self.trade_fill("long_close", "SELL", 15, 50, position="CLOSE"))
+
+        restored = PerformanceAccumulator.from_json(json.loads(json.dumps(accumulator.to_json())))
+        trade = self.trade_fill("long_close", "SELL", 17, 50, position="CLOSE")
+        for accumulated in (accumulator, restored):
+            accumulated.add_trade_fill(trade)
+
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        self.assertEqual(Decimal("600"), restored.closed_positions_pnl)
+        self.assertEqual(accumulator.to_json(), restored.to_json())
+        self.assert_same_metrics(self.async_run_with_timeout(accumulator.metrics(cur_bals)),
+                                 self.async_run_with_timeout(restored.metrics(cur_bals)))
+
+    def test_tracker_accumulates_the_fills_by_market_and_trading_pair(self):
+        tracker = PerformanceTracker(start_timestamp=1640001112000)
+        event = OrderFilledEvent(timestamp=1640001113,
+                                 order_id="buy1",
+                                 trading_pair=trading_pair,
+                                 trade_type=TradeType.BUY,
+                                 order_type=OrderType.LIMIT,
+                                 price=Decimal("100"),
+                                 amount=Decimal("1"),
+                                 trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.1"))]))
+        tracker.add_order_filled_event(market="binance", event=event, timestamp=1640001113000)
+        tracker.add_order_filled_event(market="kucoin", event=event, timestamp=1640001114000)
+        tracker.add_trade_fill(self.trade_fill("sell1", "SELL", 110, 1))
+
+        restored = PerformanceTracker.from_json(json.loads(json.dumps(tracker.to_json())))
+
+        for tracked in (tracker, restored):
+            self.assertEqual(3, tracked.num_trades)
+            self.assertEqual(1640001112000, tracked.start_timestamp)
+            self.assertEqual(1640001114000, tracked.last_fill_timestamp)
+            self.assertEqual([("binance", trading_pair), ("kucoin", trading_pair)], list(tracked.accumulators))
+            binance_performance = tracked.accumulators[("binance", trading_pair)]
+            self.assertEqual(1, binance_performance.num_buys)
+            self.assertEqual(1, binance_performance.num_sells)
+            self.assertEqual(Decimal("0.1") + Decimal("0.11"), binance_performance.fees[quote])
@@ -67,18 +67,25 @@ class InterfaceUtilsTest(unittest.TestCase):
             "CPU:    30%, Mem:   512.00 B (1.00 KB), Threads:   2, ",
             mock_monitor.log.call_args_list[0].args[0])
 
+    @staticmethod
+    def set_performances(mock_app: MagicMock, num_trades: int, performances: dict):
+        mock_app.markets_recorder.performance_tracker.num_trades = num_trades
+        mock_app.markets_recorder.performance_tracker.accumulators = {
+            market_info: MagicMock(metrics=AsyncMock(side_effect=metrics))
+            for market_info, metrics in performances.items()
+        }
+
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        self.set_performances(mock_app, 1, {
+            ("ExchangeA", "HBOT-USDT"): [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
+                                         MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]})
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]
         mock_sleep.side_effect = [None, asyncio.CancelledError()]
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -88,20 +95,16 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 2.00%', mock_result.log.call_args_list[2].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="HBOT-BTC")
-        ]
+        self.set_performances(mock_app, 2, {
+            ("ExchangeA", "HBOT-USDT"): [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2"))],
+            ("ExchangeA", "HBOT-BTC"): [MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]})
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -110,20 +113,16 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 2, Total P&L: N/A, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="BTC-USDT")
-        ]
+        self.set_performances(mock_app, 2, {
+            ("ExchangeA", "HBOT-USDT"): [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2"))],
+            ("ExchangeA", "BTC-USDT"): [MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]})
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -138,6 +137,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=False)}
+        self.set_performances(mock_app, 0, {})
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -151,7 +151,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = []
+        self.set_performances(mock_app, 0, {})
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -49,3 +49,18 @@ class BinanceAuthTests(TestCase):
         self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(expected_signature, configured_request.params["signature"])
         self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
+
+    def test_add_ws_api_auth_to_params(self):
+        mock_time_provider = MagicMock()
+        mock_time_provider.time.return_value = 1234567890.000
+
+        auth = BinanceAuth(api_key=self._api_key, secret_key=self._secret, time_provider=mock_time_provider)
+        params = auth.add_ws_api_auth_to_params({"symbol": "LTCBTC", "side": "BUY", "quantity": "1"})
+
+        encoded_params = f"apiKey={self._api_key}&quantity=1&side=BUY&symbol=LTCBTC&timestamp=1234567890000"
+        expected_signature = hmac.new(
+            self._secret.encode("utf-8"),
+            encoded_params.encode("utf-8"),
+            hashlib.sha256).hexdigest()
+        self.assertEqual(["apiKey", "quantity", "side", "symbol", "timestamp", "signature"], list(params))
+        self.assertEqual(expected_signature, params["signature"])
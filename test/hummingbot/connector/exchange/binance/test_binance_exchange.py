@@ -1157,6 +1157,91 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    def test_create_ws_order_entry_transport_only_when_enabled(self):
+        self.assertIsNone(self.exchange._create_ws_order_entry_transport())
+
+        exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+            binance_ws_order_entry=True,
+        )
+        transport = exchange._create_ws_order_entry_transport()
+
+        self.assertEqual(web_utils.wss_api_url(), transport._ws_url)
+
+    def test_place_order_through_ws(self):
+        transport = AsyncMock()
+        transport.request.return_value = {
+            "id": "1",
+            "status": 200,
+            "result": {"symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                       "orderId": 28,
+                       "clientOrderId": "OID1",
+                       "transactTime": 1640780000123},
+        }
+
+        o_id, transact_time = self.async_run_with_timeout(self.exchange._place_order_through_ws(
+            transport=transport,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("2"),
+        ))
+
+        self.assertEqual("28", o_id)
+        self.assertEqual(1640780000123 * 1e-3, transact_time)
+        # The request is signed once the throttler lets it through
+        payload = transport.request.call_args.kwargs["payload"]()
+        self.assertEqual(CONSTANTS.WS_API_ORDER_PLACE_METHOD, payload["method"])
+        self.assertEqual(CONSTANTS.ORDER_PATH_URL, transport.request.call_args.kwargs["throttler_limit_id"])
+        self.assertEqual("OID1", payload["params"]["newClientOrderId"])
+        self.assertEqual("2", payload["params"]["price"])
+        self.assertEqual("testAPIKey", payload["params"]["apiKey"])
+        self.assertIn("signature", payload["params"])
+
+        transport.request.return_value = {
+            "id": "2", "status": 400, "error": {"code": -2010, "msg": "Account has insufficient balance."}}
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._place_order_through_ws(
+                transport=transport,
+                order_id="OID2",
+                trading_pair=self.trading_pair,
+                amount=Decimal("1"),
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal("2"),
+            ))
+
+    def test_place_cancel_through_ws(self):
+        order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="28",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            price=Decimal("2"),
+            creation_timestamp=1640780000,
+        )
+        transport = AsyncMock()
+        transport.request.return_value = {
+            "id": "1", "status": 200, "result": {"origClientOrderId": "OID1", "orderId": 28, "status": "CANCELED"}}
+
+        self.assertTrue(self.async_run_with_timeout(
+            self.exchange._place_cancel_through_ws(transport=transport, order_id="OID1", tracked_order=order)))
+        self.assertEqual(CONSTANTS.WS_API_ORDER_CANCEL_METHOD, transport.request.call_args.kwargs["payload"]()["method"])
+
+        transport.request.return_value = {
+            "id": "2", "status": 400, "error": {"code": -2011, "msg": "Unknown order sent."}}
+        with self.assertRaises(IOError) as context:
+            self.async_run_with_timeout(
+                self.exchange._place_cancel_through_ws(transport=transport, order_id="OID1", tracked_order=order))
+        self.assertTrue(self.exchange._is_order_not_found_during_cancelation_error(context.exception))
+
     def test_format_trading_rules__min_notional_present(self):
         trading_rules = [{
             "symbol": "COINALPHAHBOT",
@@ -1,6 +1,9 @@
 import unittest
 
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, api_keys_from_connector_config_map
 from hummingbot.connector.exchange.binance import binance_utils as utils
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 
 
 class BinanceUtilTestCases(unittest.TestCase):
@@ -42,3 +45,14 @@ class BinanceUtilTestCases(unittest.TestCase):
         }
 
         self.assertTrue(utils.is_exchange_information_valid(invalid_info_4))
+
+    def test_ws_order_entry_config_is_passed_to_the_connector(self):
+        config_map = ClientConfigAdapter(utils.BinanceConfigMap(binance_api_key="key", binance_api_secret="secret"))
+        self.assertFalse(config_map.binance_ws_order_entry)
+
+        config_map.binance_ws_order_entry = "Yes"
+        exchange = BinanceExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                   trading_pairs=[self.trading_pair],
+                                   **api_keys_from_connector_config_map(config_map))
+
+        self.assertIsNotNone(exchange._create_ws_order_entry_transport())
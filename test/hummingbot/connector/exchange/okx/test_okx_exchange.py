@@ -15,7 +15,8 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
 
@@ -546,12 +547,20 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both orders are cancelled with a single batch request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": successful_order.client_order_id, "ordId": successful_order.exchange_order_id,
+                 "sCode": "0", "sMsg": ""},
+                {"clOrdId": erroneous_order.client_order_id, "ordId": erroneous_order.exchange_order_id,
+                 "sCode": "1", "sMsg": "Error"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1284,3 +1293,83 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    @aioresponses()
+    def test_batch_order_create_sends_the_orders_in_a_single_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        orders = self.exchange.batch_order_create(orders_to_create=[
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=True, base_currency=self.base_asset,
+                       quote_currency=self.quote_asset, price=Decimal("10000"), quantity=Decimal("100")),
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=False, base_currency=self.base_asset,
+                       quote_currency=self.quote_asset, price=Decimal("10100"), quantity=Decimal("100")),
+        ])
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": orders[0].client_order_id, "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": orders[1].client_order_id, "ordId": "", "tag": "", "sCode": "51008",
+                 "sMsg": "Order failed. Insufficient balance"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders], [data["clOrdId"] for data in request_data])
+        self.assertEqual(["buy", "sell"], [data["side"] for data in request_data])
+        self.assertEqual([Decimal("10000"), Decimal("10100")], [Decimal(data["px"]) for data in request_data])
+
+        created_order = self.exchange.in_flight_orders[orders[0].client_order_id]
+        self.assertEqual("EOID1", created_order.exchange_order_id)
+        self.assertEqual(OrderState.OPEN, created_order.current_state)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual([orders[1].client_order_id],
+                         [event.order_id for event in self.order_failure_logger.event_log])
+
+    @aioresponses()
+    def test_orders_cancelled_in_batched_orders_context_are_sent_in_a_single_request(self, mock_api):
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ("11", "12"):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"E{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "0",
+            "msg": "",
+            "data": [
+                {"clOrdId": "11", "ordId": "E11", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "12", "ordId": "E12", "sCode": "51401", "sMsg": "Order has been cancelled"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+
+        with self.exchange.batched_orders():
+            self.exchange.cancel(trading_pair=self.trading_pair, client_order_id="11")
+            self.exchange.cancel(trading_pair=self.trading_pair, client_order_id="12")
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        request_data = json.loads(cancel_requests[0].kwargs["data"])
+        self.assertEqual(
+            [{"clOrdId": "11", "instId": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)},
+             {"clOrdId": "12", "instId": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)}],
+            request_data)
+        self.assertTrue(all(order.is_pending_cancel_confirmation for order in self.exchange.in_flight_orders.values()))
@@ -0,0 +1,187 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.fill_model import (
+    ConstantLatency,
+    EmpiricalLatency,
+    FillModel,
+    LogNormalLatency,
+    QueuePositionFillModel,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
+
+
+class FillModelTest(unittest.TestCase):
+    trading_pair = "BTC-USDT"
+
+    def setUp(self):
+        super().setUp()
+        self.start = 1_700_000_000
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(100, 3, 1), OrderBookRow(99, 2, 1)],
+                                       [OrderBookRow(101, 1, 1), OrderBookRow(102, 4, 1)], 1)
+
+    def trade(self, trade_type: TradeType, price: float, amount: float, timestamp: float = 0) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(self.trading_pair, timestamp or self.start, trade_type, price, amount)
+
+    def test_default_model_fills_the_orders_crossed(self):
+        model = FillModel()
+
+        self.assertTrue(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 99.5, 1), self.order_book))
+        self.assertFalse(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 100, 10), self.order_book))
+        self.assertTrue(model.is_filled_by_trade("sell", False, 101, self.trade(TradeType.BUY, 101.5, 1),
+                                                 self.order_book))
+        self.assertTrue(model.is_filled_by_cross("buy", self.start))
+        self.assertEqual(0, model.cancel_latency())
+
+    def test_queue_position_is_the_level_amount(self):
+        model = QueuePositionFillModel()
+        model.add_order("buy-1", self.trading_pair, True, 100, 1, self.start)
+        model.add_order("buy-2", self.trading_pair, True, 100.5, 1, self.start)
+
+        model.update(self.start, {self.trading_pair: self.order_book})
+
+        self.assertEqual(3, model.queue_ahead("buy-1"))
+        self.assertEqual(0, model.queue_ahead("buy-2"))
+
+    def test_trades_at_the_price_consume_the_queue_first(self):
+        model = QueuePositionFillModel()
+        model.add_order("buy", self.trading_pair, True, 100, 1, self.start)
+        model.update(self.start, {self.trading_pair: self.order_book})
+
+        self.assertFalse(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 100, 2),
+                                                  self.order_book))
+        self.assertEqual(1, model.queue_ahead("buy"))
+        self.assertFalse(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 100, 1.5),
+                                                  self.order_book))
+        self.assertEqual(0, model.queue_ahead("buy"))
+        self.assertTrue(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 100, 0.5),
+                                                 self.order_book))
+
+    def test_trade_through_the_price_fills_the_order(self):
+        model = QueuePositionFillModel()
+        model.add_order("buy", self.trading_pair, True, 100, 1, self.start)
+
+        self.assertTrue(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 99, 0.1),
+                                                 self.order_book))
+
+    def test_cancels_at_the_level_move_the_order_up_the_queue(self):
+        model = QueuePositionFillModel()
+        model.add_order("buy", self.trading_pair, True, 100, 1, self.start)
+        model.update(self.start, {self.trading_pair: self.order_book})
+
+        # Orders added behind do not change the position, then 1 of the 4 ahead is cancelled or traded
+        self.order_book.apply_diffs([OrderBookRow(100, 4, 2)], [], 2)
+        model.update(self.start + 1, {self.trading_pair: self.order_book})
+        self.assertEqual(3, model.queue_ahead("buy"))
+        self.assertFalse(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 100, 1),
+                                                  self.order_book))
+        self.order_book.apply_diffs([OrderBookRow(100, 2, 3)], [], 3)
+        model.update(self.start + 2, {self.trading_pair: self.order_book})
+
+        # The trade is not counted as a cancel, the other unit is cancelled: 1 / 3 of it was ahead of the order
+        self.assertAlmostEqual(2 - 2 / 3, model.queue_ahead("buy"))
+
+        # 3 / 4 of the level is cancelled
+        self.order_book.apply_diffs([OrderBookRow(100, 0.5, 4)], [], 4)
+        model.update(self.start + 3, {self.trading_pair: self.order_book})
+
+        self.assertAlmostEqual(1 / 3, model.queue_ahead("buy"))
+
+    def test_order_entry_latency(self):
+        model = QueuePositionFillModel(order_entry_latency=ConstantLatency(0.5))
+        model.add_order("buy", self.trading_pair, True, 100, 1, self.start)
+
+        model.update(self.start, {self.trading_pair: self.order_book})
+        self.assertIsNone(model.queue_ahead("buy"))
+        self.assertFalse(model.is_filled_by_cross("buy", self.start))
+        self.assertFalse(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 99, 1, self.start + 0.2),
+                                                  self.order_book))
+
+        self.assertTrue(model.is_filled_by_trade("buy", True, 100, self.trade(TradeType.SELL, 99, 1, self.start + 0.5),
+                                                 self.order_book))
+        self.assertEqual(3, model.queue_ahead("buy"))
+        self.assertTrue(model.is_filled_by_cross("buy", self.start + 1))
+
+        model.remove_order("buy")
+
+        self.assertIsNone(model.queue_ahead("buy"))
+
+    def test_latency_distributions_are_deterministic(self):
+        samples = [LogNormalLatency(median=0.05, sigma=0.5, minimum=0.01, seed=1).sample() for _ in range(3)]
+
+        self.assertEqual(samples, [LogNormalLatency(median=0.05, sigma=0.5, minimum=0.01, seed=1).sample()
+                                   for _ in range(3)])
+        self.assertTrue(all(sample > 0.01 for sample in samples))
+        latency = EmpiricalLatency([0.1, 0.2])
+        self.assertTrue({latency.sample() for _ in range(20)}.issubset({0.1, 0.2}))
+        with self.assertRaises(ValueError):
+            EmpiricalLatency([])
+
+
+class PaperTradeExchangeFillModelTest(unittest.TestCase):
+    trading_pair = "BTC-USDT"
+
+    def setUp(self):
+        super().setUp()
+        self.start = 1_700_000_000
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(100, 3, 1)], [OrderBookRow(101, 1, 1)], 1)
+        tracker._order_books[self.trading_pair] = self.order_book
+        tracker._order_books_initialized.set()
+        self.fill_model = QueuePositionFillModel(cancel_latency=ConstantLatency(2))
+        self.exchange = PaperTradeExchange(ClientConfigAdapter(ClientConfigMap()), tracker, ExchangeBase, "binance",
+                                           fill_model=self.fill_model)
+        self.exchange.set_balance("USDT", Decimal(1000))
+        self.assertTrue(self.exchange.ready)
+        self.fills = EventLogger()
+        self.cancels = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fills)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancels)
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start, self.start + 100)
+        self.clock.add_iterator(self.exchange)
+        self.clock.backtest_til(self.start + 1)
+
+    def apply_trade(self, price: float, amount: float, timestamp: float):
+        self.order_book.apply_trade(OrderBookTradeEvent(self.trading_pair, timestamp, TradeType.SELL, price, amount))
+
+    def test_limit_order_filled_after_the_queue_ahead(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(100))
+        self.clock.backtest_til(self.start + 2)
+
+        self.apply_trade(100, 3, self.start + 2.5)
+        self.assertEqual(0, len(self.fills.event_log))
+
+        self.apply_trade(100, 1, self.start + 2.6)
+        self.assertEqual([order_id], [event.order_id for event in self.fills.event_log])
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertIsNone(self.fill_model.queue_ahead(order_id))
+
+    def test_order_can_be_filled_during_the_cancel_latency(self):
+        first_order_id = self.exchange.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(100))
+        second_order_id = self.exchange.buy(self.trading_pair, Decimal(1), OrderType.LIMIT, Decimal(99))
+        self.clock.backtest_til(self.start + 2)
+        self.exchange.cancel(self.trading_pair, first_order_id)
+        self.exchange.cancel(self.trading_pair, second_order_id)
+
+        self.apply_trade(99.5, 1, self.start + 3.5)
+
+        self.assertEqual([first_order_id], [event.order_id for event in self.fills.event_log])
+        self.assertEqual(1, len(self.exchange.limit_orders))
+
+        self.clock.backtest_til(self.start + 4)
+
+        self.assertEqual([second_order_id], [event.order_id for event in self.cancels.event_log])
+        self.assertEqual(0, len(self.exchange.limit_orders))
@@ -267,6 +267,128 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking_starts(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        # The orders cached and then evicted from the cache are no longer found
+        self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual(order, self.tracker.fetch_order_by_exchange_order_id("someExchangeOrderId"))
+        self.tracker._cached_orders.clear()
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_order_by_exchange_order_id("someExchangeOrderId"))
+
+    def test_fetch_order_by_exchange_order_id_of_orders_not_started_with_start_tracking_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.active_orders[order.client_order_id] = order
+
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual({order.client_order_id: order}, self.tracker.fetch_orders_by_trading_pair(self.trading_pair))
+
+    def test_fetch_orders_by_trading_pair(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            for i, trading_pair in enumerate([self.trading_pair, "OTHER-HBOT", self.trading_pair])
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(orders[2].client_order_id)
+
+        self.assertEqual({orders[0].client_order_id: orders[0], orders[2].client_order_id: orders[2]},
+                         self.tracker.fetch_orders_by_trading_pair(self.trading_pair))
+        self.assertEqual({orders[1].client_order_id: orders[1]}, self.tracker.fetch_orders_by_trading_pair("OTHER-HBOT"))
+        self.assertEqual({}, self.tracker.fetch_orders_by_trading_pair("UNKNOWN-HBOT"))
+
+        del self.tracker._cached_orders[orders[2].client_order_id]
+
+        self.assertEqual({orders[0].client_order_id: orders[0]},
+                         self.tracker.fetch_orders_by_trading_pair(self.trading_pair))
+
+    def test_index_of_orders_no_longer_tracked_is_swept(self):
+        for i in range(3 * ClientOrderTracker.MAX_CACHE_SIZE):
+            order: InFlightOrder = InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                exchange_order_id=f"someExchangeOrderId_{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            self.tracker.start_tracking_order(order)
+            self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertLessEqual(len(self.tracker._indexed_orders), 2 * ClientOrderTracker.MAX_CACHE_SIZE)
+        self.assertLessEqual(len(self.tracker._orders_by_exchange_order_id), 2 * ClientOrderTracker.MAX_CACHE_SIZE)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId_0"))
+        self.assertIsNotNone(self.tracker.fetch_order(exchange_order_id=order.exchange_order_id))
+
+    def test_order_views_are_read_only_and_can_be_iterated_while_updated(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            for i in range(3)
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(orders[0].client_order_id)
+
+        all_orders = self.tracker.all_orders
+
+        self.assertEqual(3, len(all_orders))
+        self.assertEqual({order.client_order_id: order for order in orders}, all_orders)
+        self.assertEqual(orders[0], all_orders[orders[0].client_order_id])
+        self.assertEqual(1, len(self.tracker.cached_orders))
+        with self.assertRaises(TypeError):
+            all_orders["someClientOrderId"] = orders[0]
+
+        for client_order_id, order in all_orders.items():
+            self.tracker.stop_tracking_order(client_order_id)
+        for order in self.tracker.all_updatable_orders.values():
+            self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertEqual(0, len(self.tracker.all_updatable_orders))
+        self.assertEqual(3, len(self.tracker.all_fillable_orders))
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
@@ -357,6 +479,41 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.assertEqual(event_logged.trading_pair, order.trading_pair)
         self.assertEqual(event_logged.type, order.order_type)
 
+    def test_process_order_update_records_the_update_timestamp_only_if_the_order_is_updated(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        self.tracker.start_tracking_order(order)
+        unchanged_order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(unchanged_order_update))
+
+        self.assertIsNone(self.tracker.last_order_update_timestamp(order.client_order_id))
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.PARTIALLY_FILLED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        self.assertEqual(self.connector.current_timestamp,
+                         self.tracker.last_order_update_timestamp(order.client_order_id))
+
     def test_process_order_update_trigger_order_creation_event_without_client_order_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
@@ -0,0 +1,456 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List, Optional, Tuple, Union
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.web_assistant.ws_request_transport import WSRequestNotSentError
+
+
+class ExchangePyBaseOrderUpdatesTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.exchange._set_current_timestamp(1640780000)
+        self.requests_in_flight = 0
+        self.max_requests_in_flight = 0
+        self.status_requests: List[str] = []
+        self.fills_requests: List[str] = []
+
+    def start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    def set_user_stream_last_recv_time(self, timestamp: float):
+        self.exchange._user_stream_tracker.data_source._ws_assistant = MagicMock(last_recv_time=timestamp)
+
+    def order_update(self, order: InFlightOrder, new_state: OrderState) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=new_state,
+        )
+
+    def trade_update(self, order: InFlightOrder) -> TradeUpdate:
+        return TradeUpdate(
+            trade_id=f"T{order.client_order_id}",
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            fee=AddedToCostTradeFee(),
+            fill_base_amount=Decimal("0.5"),
+            fill_quote_amount=Decimal("5000"),
+            fill_price=Decimal("10000"),
+            fill_timestamp=self.exchange.current_timestamp,
+        )
+
+    async def request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
+        self.status_requests.append(tracked_order.client_order_id)
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        await asyncio.sleep(0.01)
+        self.requests_in_flight -= 1
+        return self.order_update(tracked_order, OrderState.OPEN)
+
+    async def all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
+        self.fills_requests.append(order.client_order_id)
+        await asyncio.sleep(0.01)
+        return [self.trade_update(order)]
+
+    async def test_order_status_requests_are_concurrent(self):
+        self.exchange.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS = 5
+        self.exchange._request_order_status = self.request_order_status
+        orders = self.start_tracking_orders(12)
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(sorted(order.client_order_id for order in orders), sorted(self.status_requests))
+        self.assertEqual(5, self.max_requests_in_flight)
+        await asyncio.sleep(0)
+        self.assertTrue(all(order.current_state == OrderState.OPEN for order in orders))
+
+    async def test_order_status_request_errors_are_handled_per_order(self):
+        orders = self.start_tracking_orders(2)
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            if tracked_order.client_order_id == "OID0":
+                raise IOError("Order does not exist")
+            return self.order_update(tracked_order, OrderState.OPEN)
+
+        self.exchange._request_order_status = request_order_status
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records[orders[0].client_order_id])
+        self.assertNotIn(orders[1].client_order_id, self.exchange._order_tracker._order_not_found_records)
+
+    async def test_bulk_order_status_request_leaves_the_missing_orders_to_single_requests(self):
+        self.exchange._request_order_status = self.request_order_status
+        orders = self.start_tracking_orders(3)
+        self.exchange._request_orders_status = AsyncMock(return_value=[
+            self.order_update(orders[0], OrderState.OPEN),
+            OrderUpdate(exchange_order_id=orders[1].exchange_order_id, trading_pair=self.trading_pair,
+                        update_timestamp=self.exchange.current_timestamp, new_state=OrderState.PARTIALLY_FILLED),
+        ])
+
+        await self.exchange._update_orders()
+
+        self.assertEqual([orders[2].client_order_id], self.status_requests)
+
+        self.exchange._request_orders_status = AsyncMock(side_effect=IOError("Rate limit exceeded"))
+        self.status_requests.clear()
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(3, len(self.status_requests))
+
+    async def test_orders_confirmed_by_the_user_stream_are_not_requested(self):
+        self.exchange._request_order_status = self.request_order_status
+        orders = self.start_tracking_orders(2)
+        self.exchange._last_poll_timestamp = self.exchange.current_timestamp - 10
+        self.set_user_stream_last_recv_time(self.exchange.current_timestamp - 1)
+        await self.exchange._order_tracker._process_order_update(self.order_update(orders[0], OrderState.OPEN))
+
+        await self.exchange._update_orders()
+
+        self.assertEqual([orders[1].client_order_id], self.status_requests)
+
+        # The confirmation is too old
+        self.status_requests.clear()
+        self.exchange._set_current_timestamp(
+            self.exchange.current_timestamp + self.exchange.ORDER_UPDATE_CONFIRMATION_INTERVAL)
+        self.set_user_stream_last_recv_time(self.exchange.current_timestamp - 1)
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(2, len(self.status_requests))
+
+    async def test_orders_confirmed_while_the_user_stream_is_down_are_requested(self):
+        self.exchange._request_order_status = self.request_order_status
+        orders = self.start_tracking_orders(1)
+        await self.exchange._order_tracker._process_order_update(self.order_update(orders[0], OrderState.OPEN))
+
+        await self.exchange._update_orders()
+
+        self.assertEqual([orders[0].client_order_id], self.status_requests)
+
+    async def test_fills_requested_order_by_order_without_bulk_support(self):
+        self.exchange._all_trade_updates_for_order = self.all_trade_updates_for_order
+        orders = self.start_tracking_orders(3)
+
+        await self.exchange._update_orders_fills(orders=orders)
+
+        self.assertEqual(3, len(self.fills_requests))
+        self.assertTrue(all(order.executed_amount_base == Decimal("0.5") for order in orders))
+
+    async def test_fills_requested_with_trades_since_last_poll(self):
+        self.exchange._all_trade_updates_for_order = self.all_trade_updates_for_order
+        orders = self.start_tracking_orders(3)
+        requested_timestamps: List[float] = []
+
+        async def all_trade_updates_since(timestamp: float) -> Optional[List[TradeUpdate]]:
+            requested_timestamps.append(timestamp)
+            return [self.trade_update(orders[1])]
+
+        self.exchange._all_trade_updates_since = all_trade_updates_since
+        self.exchange._time_synchronizer.time = lambda: 1640780100
+
+        await self.exchange._update_orders_fills(orders=orders)
+        await self.exchange._update_orders_fills(orders=orders)
+
+        self.assertEqual([], self.fills_requests)
+        self.assertEqual([1640780000, 1640780100], requested_timestamps)
+        self.assertEqual([Decimal(0), Decimal("0.5"), Decimal(0)], [order.executed_amount_base for order in orders])
+
+
+class ExchangePyBaseBatchOrdersTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._trading_rules[self.trading_pair] = TradingRule(
+            trading_pair=self.trading_pair,
+            min_order_size=Decimal("0.01"),
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.01"),
+        )
+        self.batches: List[List[str]] = []
+        self.placed_orders: List[str] = []
+        self.cancelled_orders: List[str] = []
+        for max_size_property in ("batch_order_create_max_size", "batch_order_cancel_max_size"):
+            patcher = patch.object(BinanceExchange, max_size_property, new_callable=PropertyMock, return_value=2)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.exchange._place_order = self.place_order
+        self.exchange._place_cancel = self.place_cancel
+
+    async def place_order(self, order_id: str, **kwargs) -> Tuple[str, float]:
+        self.placed_orders.append(order_id)
+        return f"E{order_id}", self.exchange.current_timestamp
+
+    async def place_cancel(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        self.cancelled_orders.append(order_id)
+        return True
+
+    async def place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        self.batches.append([order.client_order_id for order in orders])
+        return [IOError("Insufficient balance") if order.amount > 1 else (f"E{order.client_order_id}", 1640780001)
+                for order in orders]
+
+    async def place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        self.batches.append([order.client_order_id for order in orders])
+        return [order.client_order_id != "OID1" for order in orders]
+
+    def start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"EOID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    async def test_orders_created_in_batched_orders_context_are_sent_in_batches(self):
+        self.exchange._place_orders_batch = self.place_orders_batch
+
+        with self.exchange.batched_orders():
+            order_ids = [self.exchange.buy(self.trading_pair, Decimal(amount), OrderType.LIMIT, Decimal("100"))
+                         for amount in ("1", "2", "1")]
+            with self.exchange.batched_orders():
+                order_ids.append(self.exchange.sell(self.trading_pair, Decimal("0.001"), OrderType.LIMIT,
+                                                    Decimal("100")))
+            self.assertEqual(0, len(self.exchange.in_flight_orders))
+        await asyncio.sleep(0.01)
+
+        # The order below the minimum size is not sent
+        self.assertEqual([order_ids[:2], order_ids[2:3]], self.batches)
+        self.assertEqual([], self.placed_orders)
+        self.assertEqual([order_ids[0], order_ids[2]], list(self.exchange.in_flight_orders))
+        self.assertTrue(all(order.current_state == OrderState.OPEN and order.exchange_order_id == f"E{order_id}"
+                            for order_id, order in self.exchange.in_flight_orders.items()))
+
+    async def test_batched_orders_context_only_holds_the_orders_of_its_task(self):
+        self.exchange._place_orders_batch = self.place_orders_batch
+        other_task_order_ids = []
+        created_in_context = asyncio.Event()
+
+        async def other_task():
+            other_task_order_ids.append(
+                self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100")))
+            await created_in_context.wait()
+            # The batch of the context the task was created in is already sent
+            other_task_order_ids.append(
+                self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100")))
+
+        with self.exchange.batched_orders():
+            task = asyncio.ensure_future(other_task())
+            order_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+                         for _ in range(2)]
+            await asyncio.sleep(0.01)
+            self.assertEqual(other_task_order_ids, self.placed_orders)
+        created_in_context.set()
+        await task
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([order_ids], self.batches)
+        self.assertEqual(other_task_order_ids, self.placed_orders)
+
+    async def test_batch_request_failure_fails_all_its_orders(self):
+        self.exchange._place_orders_batch = AsyncMock(side_effect=IOError("Rate limit exceeded"))
+
+        orders = self.exchange.batch_order_create([
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=is_buy, base_currency="COINALPHA",
+                       quote_currency="HBOT", price=Decimal("100"), quantity=Decimal("1"))
+            for is_buy in (True, False)
+        ])
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(2, len({order.client_order_id for order in orders}))
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+
+    async def test_orders_without_result_in_batch_response_fail(self):
+        self.exchange._place_orders_batch = AsyncMock(return_value=[("EOID0", 1640780001)])
+
+        with self.exchange.batched_orders():
+            order_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+                         for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([order_ids[0]], list(self.exchange.in_flight_orders))
+        self.assertEqual(OrderState.OPEN, self.exchange.in_flight_orders[order_ids[0]].current_state)
+
+    async def test_orders_without_result_in_batch_cancel_response_fail(self):
+        self.exchange._place_cancels_batch = AsyncMock(return_value=[True])
+        orders = self.start_tracking_orders(2)
+
+        cancellation_results = await self.exchange.cancel_all(timeout_seconds=1)
+
+        self.assertEqual([CancellationResult("OID0", True), CancellationResult("OID1", False)],
+                         sorted(cancellation_results, key=lambda result: result.order_id))
+        self.assertEqual([True, False], [order.is_cancelled for order in orders])
+
+    async def test_single_order_and_unsupported_batches_are_sent_one_by_one(self):
+        self.exchange._place_orders_batch = self.place_orders_batch
+
+        with self.exchange.batched_orders():
+            order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([order_id], self.placed_orders)
+
+        with patch.object(BinanceExchange, "batch_order_create_max_size", new_callable=PropertyMock, return_value=0):
+            with self.exchange.batched_orders():
+                order_ids = [self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+                             for _ in range(2)]
+                await asyncio.sleep(0.01)
+                self.assertEqual([order_id] + order_ids, self.placed_orders)
+
+        self.assertEqual([], self.batches)
+
+    async def test_orders_cancelled_in_batched_orders_context_are_sent_in_batches(self):
+        self.exchange._place_cancels_batch = self.place_cancels_batch
+        orders = self.start_tracking_orders(3)
+
+        with self.exchange.batched_orders():
+            for order in orders:
+                self.exchange.cancel(self.trading_pair, order.client_order_id)
+            self.exchange.cancel(self.trading_pair, "unknown")
+        await asyncio.sleep(0.01)
+
+        self.assertEqual([["OID0", "OID1"], ["OID2"]], self.batches)
+        self.assertEqual([True, False, True], [order.is_cancelled for order in orders])
+
+    async def test_cancel_all_cancels_in_batches(self):
+        orders = self.start_tracking_orders(3)
+
+        async def place_cancels_batch(orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+            if len(orders) == 1:
+                raise IOError("Order does not exist")
+            return await self.place_cancels_batch(orders)
+
+        self.exchange._place_cancels_batch = place_cancels_batch
+
+        cancellation_results = await self.exchange.cancel_all(timeout_seconds=1)
+
+        self.assertEqual([["OID0", "OID1"]], self.batches)
+        self.assertEqual([], self.cancelled_orders)
+        self.assertEqual(CancellationResult(orders[0].client_order_id, True), cancellation_results[0])
+        self.assertEqual({CancellationResult(order.client_order_id, False) for order in orders[1:]},
+                         set(cancellation_results[1:]))
+
+
+class ExchangePyBaseWSOrderEntryTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._trading_rules[self.trading_pair] = TradingRule(
+            trading_pair=self.trading_pair,
+            min_order_size=Decimal("0.01"),
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.01"),
+        )
+        self.transport = MagicMock(is_connected=True)
+        self.exchange._ws_order_entry_transport = self.transport
+        self.exchange._place_order = AsyncMock(return_value=("EOID-REST", 1640780001))
+        self.exchange._place_cancel = AsyncMock(return_value=True)
+        self.exchange._place_order_through_ws = AsyncMock(return_value=("EOID-WS", 1640780001))
+        self.exchange._place_cancel_through_ws = AsyncMock(return_value=True)
+
+    def start_tracking_order(self) -> InFlightOrder:
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        return self.exchange.in_flight_orders["OID1"]
+
+    async def test_orders_are_placed_and_cancelled_through_the_connected_transport(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual("EOID-WS", self.exchange.in_flight_orders[order_id].exchange_order_id)
+        self.assertEqual(self.transport, self.exchange._place_order_through_ws.call_args.kwargs["transport"])
+        self.exchange._place_order.assert_not_called()
+
+        self.exchange.cancel(self.trading_pair, order_id)
+        await asyncio.sleep(0.01)
+
+        self.exchange._place_cancel_through_ws.assert_called_once()
+        self.exchange._place_cancel.assert_not_called()
+
+    async def test_requests_not_sent_through_the_transport_fall_back_to_rest(self):
+        self.exchange._place_order_through_ws.side_effect = WSRequestNotSentError("Not connected")
+        self.exchange._place_cancel_through_ws.side_effect = WSRequestNotSentError("Not connected")
+
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        await asyncio.sleep(0.01)
+
+        self.assertEqual("EOID-REST", self.exchange.in_flight_orders[order_id].exchange_order_id)
+
+        self.transport.is_connected = False
+        order = self.start_tracking_order()
+        self.exchange.cancel(self.trading_pair, order.client_order_id)
+        await asyncio.sleep(0.01)
+
+        self.exchange._place_cancel_through_ws.assert_not_called()
+        self.exchange._place_cancel.assert_called_once_with(order.client_order_id, order)
+        self.assertTrue(order.is_cancelled)
+
+    async def test_requests_lost_after_being_sent_are_not_sent_again(self):
+        self.exchange._place_order_through_ws.side_effect = ConnectionError("Connection closed")
+
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        await asyncio.sleep(0.01)
+
+        self.exchange._place_order.assert_not_called()
+        self.assertNotIn(order_id, self.exchange.in_flight_orders)
@@ -7,12 +7,16 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceAccumulator
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -72,7 +76,10 @@ class MarketsRecorderTests(TestCase):
         self.ready = True
         self.trading_pairs = [self.trading_pair]
 
-        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        # The records are written from the recorder writer thread, all the threads must share the in-memory DB
+        engine_mock.return_value = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
         self.manager = SQLConnectionManager(
             ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
         )
@@ -85,6 +92,9 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -168,6 +178,7 @@ class MarketsRecorderTests(TestCase):
         )
 
         recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+        recorder.flush()
 
         with self.manager.get_new_session() as session:
             query = session.query(Order)
@@ -209,6 +220,7 @@ class MarketsRecorderTests(TestCase):
         )
 
         recorder._did_create_order(MarketEvent.SellOrderCreated.value, self, event)
+        recorder.flush()
 
         with self.manager.get_new_session() as session:
             query = session.query(Order)
@@ -264,6 +276,7 @@ class MarketsRecorderTests(TestCase):
         )
 
         recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder.flush()
 
         with self.manager.get_new_session() as session:
             query = session.query(Order)
@@ -324,6 +337,7 @@ class MarketsRecorderTests(TestCase):
         )
 
         recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder.flush()
 
         with self.manager.get_new_session() as session:
             query = session.query(Order)
@@ -378,6 +392,7 @@ class MarketsRecorderTests(TestCase):
             order_type=create_event.type)
 
         recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+        recorder.flush()
 
         with self.manager.get_new_session() as session:
             query = session.query(Order)
@@ -434,3 +449,203 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+        self.assertEqual([[3, 1, 3], [2, 1, 2], [1, 1, 1]], market_data[0].order_book["bid"])
+        self.assertEqual([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], market_data[0].order_book["ask"])
+        self.assertTrue(all(type(level[2]) is int
+                            for level in market_data[0].order_book["bid"] + market_data[0].order_book["ask"]))
+
+    def test_order_book_recording_enabled(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(order_book_recording_enabled=True),
+        )
+        self.name = "binance"
+        self.order_book_tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=self.trading_pairs)
+
+        recorder._start_order_book_recording()
+
+        self.assertIsInstance(self.order_book_tracker.recorder, OrderBookRecorder)
+        self.assertEqual("binance", self.order_book_tracker.recorder.connector_name)
+
+        recorder._stop_order_book_recording()
+
+        self.assertIsNone(self.order_book_tracker.recorder)
+
+    def test_market_states_saved_once_per_flush_for_all_the_order_events(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        market = MagicMock()
+        market.display_name = self.display_name
+        tracking_states = PropertyMock(return_value={"OID1": {"amount": "1"}})
+        type(market).tracking_states = tracking_states
+
+        for order_id in ("OID1", "OID2"):
+            event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=order_id,
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"E{order_id}",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, market, event)
+
+        self.assertEqual(0, tracking_states.call_count)
+
+        recorder.flush()
+        recorder.flush()
+
+        self.assertEqual(1, tracking_states.call_count)
+        with self.manager.get_new_session() as session:
+            market_states = recorder.get_market_states(self.config_file_path, market, session=session)
+            self.assertEqual({"OID1": {"amount": "1"}}, market_states.saved_state)
+            self.assertEqual(2, session.query(Order).count())
+
+    def test_stop_writes_all_pending_records(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        self.tracking_states = {"OID1": {"amount": "1"}}
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        with patch.object(recorder, "append_to_csv") as append_to_csv_mock:
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder.stop()
+
+            self.assertEqual(1, append_to_csv_mock.call_count)
+
+        with self.manager.get_new_session() as session:
+            order = session.query(Order).one()
+            self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+            self.assertEqual(["TradeId1"], [trade_fill.exchange_trade_id for trade_fill in order.trade_fills])
+            market_states = recorder.get_market_states(self.config_file_path, self, session=session)
+            self.assertEqual(self.tracking_states, market_states.saved_state)
+
+    def create_recorder(self, performance_start_timestamp: int) -> MarketsRecorder:
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            performance_start_timestamp=performance_start_timestamp,
+        )
+
+    def fill_event(self, timestamp: float, order_id: str, trade_type: TradeType, price: int) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id=f"Trade{order_id}",
+        )
+
+    def test_performance_tracked_from_the_fills_since_the_start(self):
+        recorder = self.create_recorder(performance_start_timestamp=1642000000000)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                 self.fill_event(1641990000, "OID0", TradeType.BUY, 900))
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                 self.fill_event(1642010000, "OID1", TradeType.BUY, 1000))
+        recorder.flush()
+
+        # The fills are accumulated as they happen, the trades in the database since the start are loaded once
+        self.assertEqual(2, recorder.performance_tracker.num_trades)
+        self.assertEqual(1, self.create_recorder(performance_start_timestamp=1642000000000).performance_tracker.num_trades)
+
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                 self.fill_event(1642020000, "OID2", TradeType.SELL, 1100))
+        performance = recorder.performance_tracker.accumulators[(self.display_name, self.trading_pair)]
+        self.assertEqual(2, performance.num_buys)
+        self.assertEqual(1, performance.num_sells)
+        self.assertEqual(Decimal("30"), performance.fees[self.quote])
+
+    def test_performance_restored_from_the_snapshot_saved_on_stop(self):
+        recorder = self.create_recorder(performance_start_timestamp=1642000000000)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                 self.fill_event(1642010000, "OID1", TradeType.BUY, 1000))
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            snapshot = recorder._get_performance_snapshot(1642000000000, session=session)
+            self.assertEqual(1642010000000, snapshot.timestamp)
+            self.assertEqual(recorder.performance_tracker.to_json(), snapshot.snapshot)
+            # A trade recorded after the snapshot
+            session.add(TradeFill(config_file_path=self.config_file_path,
+                                  strategy=self.strategy_name,
+                                  market=self.display_name,
+                                  symbol=self.trading_pair,
+                                  base_asset=self.base,
+                                  quote_asset=self.quote,
+                                  timestamp=1642020000000,
+                                  order_id="OID2",
+                                  trade_type=TradeType.SELL.name,
+                                  order_type=OrderType.LIMIT.name,
+                                  price=1100,
+                                  amount=1,
+                                  trade_fee=AddedToCostTradeFee().to_json(),
+                                  exchange_trade_id="TradeOID2"))
+            session.commit()
+
+        with patch.object(PerformanceAccumulator, "add_trade_fill", autospec=True,
+                          side_effect=PerformanceAccumulator.add_trade_fill) as add_trade_fill_mock:
+            restored_recorder = self.create_recorder(performance_start_timestamp=1642000000000)
+
+        self.assertEqual(1, add_trade_fill_mock.call_count)
+        performance = restored_recorder.performance_tracker.accumulators[(self.display_name, self.trading_pair)]
+        self.assertEqual(1, performance.num_buys)
+        self.assertEqual(1, performance.num_sells)
+        self.assertEqual(Decimal("-1000"), performance.b_vol_quote)
+        self.assertEqual(Decimal("1100"), performance.s_vol_quote)
+        # Without a snapshot for the start all the trades since the start are loaded
+        self.assertEqual(1, self.create_recorder(performance_start_timestamp=1642010000001).performance_tracker.num_trades)
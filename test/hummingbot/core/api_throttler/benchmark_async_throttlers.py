@@ -0,0 +1,59 @@
+"""
+Microbenchmark of the capacity checks of AsyncThrottler and SlidingWindowThrottler.
+
+Each throttler is pre-loaded with the acquisitions of a busy connector (hundreds of logged tasks spread over several
+linked limits) and then the time to acquire an additional request that is within capacity is measured.
+
+Run it with:
+    PYTHONPATH=. python test/hummingbot/core/api_throttler/benchmark_async_throttlers.py
+"""
+import asyncio
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+GLOBAL_LIMIT_ID = "global"
+ORDERS_LIMIT_ID = "orders"
+ENDPOINT_IDS = [f"/endpoint_{i}" for i in range(10)]
+
+RATE_LIMITS: List[RateLimit] = [
+    RateLimit(limit_id=GLOBAL_LIMIT_ID, limit=100_000, time_interval=60),
+    RateLimit(limit_id=ORDERS_LIMIT_ID, limit=100_000, time_interval=10),
+] + [
+    RateLimit(limit_id=endpoint_id, limit=100_000, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(GLOBAL_LIMIT_ID, 2), LinkedLimitWeightPair(ORDERS_LIMIT_ID)])
+    for endpoint_id in ENDPOINT_IDS
+]
+
+
+async def fill(throttler: AsyncThrottlerBase, requests: int):
+    for i in range(requests):
+        await throttler.execute_task(ENDPOINT_IDS[i % len(ENDPOINT_IDS)]).acquire()
+
+
+async def measure(throttler: AsyncThrottlerBase, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        await throttler.execute_task(ENDPOINT_IDS[i % len(ENDPOINT_IDS)]).acquire()
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    loop = asyncio.new_event_loop()
+    print(f"{'logged tasks':>12} {'AsyncThrottler':>18} {'SlidingWindow':>18} {'speedup':>8}")
+    for logged_tasks in (100, 300, 1_000, 3_000):
+        results = []
+        for throttler_class in (AsyncThrottler, SlidingWindowThrottler):
+            throttler = throttler_class(rate_limits=RATE_LIMITS)
+            loop.run_until_complete(fill(throttler, logged_tasks))
+            results.append(loop.run_until_complete(measure(throttler, 200)))
+        print(f"{logged_tasks:>12} {results[0] * 1e6:>15.1f} us {results[1] * 1e6:>15.1f} us {results[0] / results[1]:>7.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, request_priority
+from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_REQUEST_PRIORITY,
+    LinkedLimitWeightPair,
+    RateLimit,
+    RequestPriority,
+)
+from hummingbot.core.api_throttler.sliding_window_throttler import (
+    RateLimitWindow,
+    SlidingWindowRequestContext,
+    SlidingWindowThrottler,
+)
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class RateLimitWindowTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.window = RateLimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1.0), safety_margin_pct=0)
+
+    def test_record_and_flush(self):
+        self.window.record(now=100.0, weight=1)
+        self.window.record(now=100.5, weight=2)
+        self.assertEqual(3, self.window.used)
+        self.assertFalse(self.window.has_capacity(1))
+
+        self.window.flush(now=100.9)
+        self.assertEqual(3, self.window.used)
+        self.window.flush(now=101.0)
+        self.assertEqual(2, self.window.used)
+        self.assertTrue(self.window.has_capacity(1))
+        self.window.flush(now=101.5)
+        self.assertEqual(0, self.window.used)
+
+    def test_time_to_capacity(self):
+        self.window.record(now=100.0, weight=1)
+        self.window.record(now=100.5, weight=2)
+
+        self.assertEqual(0, self.window.time_to_capacity(now=100.5, weight=0))
+        self.assertAlmostEqual(0.5, self.window.time_to_capacity(now=100.5, weight=1))
+        self.assertAlmostEqual(1.0, self.window.time_to_capacity(now=100.5, weight=2))
+        self.assertIsNone(self.window.time_to_capacity(now=100.5, weight=4))
+
+    def test_period_includes_safety_margin(self):
+        window = RateLimitWindow(RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=10.0), safety_margin_pct=0.05)
+        self.assertAlmostEqual(10.5, window.period)
+
+
+class SlidingWindowThrottlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+
+    def test_throttler_is_an_async_throttler(self):
+        self.assertIsInstance(self.throttler, AsyncThrottlerBase)
+        self.assertEqual({limit.limit_id for limit in self.rate_limits}, set(self.throttler._windows))
+
+    def test_init_with_rate_limits_share_pct(self):
+        throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("50"))
+        self.assertEqual(5, throttler.get_window(throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID]).limit)
+
+    def test_execute_task_records_acquisitions_on_all_related_limits(self):
+        async def task():
+            async with self.throttler.execute_task(limit_id=TEST_PATH_URL):
+                pass
+
+        self.ev_loop.run_until_complete(task())
+
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].used)
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].used)
+        self.assertEqual(0, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+
+    def test_set_rate_limits_keeps_used_capacity(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+
+        new_limits = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=2, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+        ]
+        self.throttler.set_rate_limits(new_limits)
+
+        self.assertEqual({TEST_POOL_ID, TEST_PATH_URL}, set(self.throttler._windows))
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].used)
+        self.assertEqual(2, self.throttler._windows[TEST_POOL_ID].limit)
+        self.assertTrue(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    @patch.object(SlidingWindowRequestContext, "_sleep")
+    @patch.object(SlidingWindowRequestContext, "_time")
+    def test_acquire_waits_until_capacity_is_freed(self, time_mock, sleep_mock):
+        current_time = [1640000000.0]
+        time_mock.side_effect = lambda: current_time[0]
+        sleep_delays = []
+
+        async def sleep(delay: float):
+            sleep_delays.append(delay)
+            current_time[0] += delay
+
+        sleep_mock.side_effect = sleep
+
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+        current_time[0] += 1.0
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+
+        # The second request sleeps once, until the first acquisition leaves the 5.25s window (5s + 5% margin)
+        self.assertEqual(1, len(sleep_delays))
+        self.assertAlmostEqual(4.25, sleep_delays[0])
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].used)
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.throttler.execute_task(TEST_PATH_URL).acquire(), 1.0)
+            )
+
+    def test_execute_task_uses_priority_of_the_context(self):
+        self.assertEqual(DEFAULT_REQUEST_PRIORITY, self.throttler.execute_task(TEST_PATH_URL)._priority)
+
+        with request_priority(RequestPriority.CANCEL):
+            self.assertEqual(RequestPriority.CANCEL, self.throttler.execute_task(TEST_PATH_URL)._priority)
+            context = self.throttler.execute_task(TEST_PATH_URL, priority=RequestPriority.BALANCE)
+            self.assertEqual(RequestPriority.BALANCE, context._priority)
+
+        self.assertEqual(DEFAULT_REQUEST_PRIORITY, self.throttler.execute_task(TEST_PATH_URL)._priority)
+
+    def test_status_polling_requests_keep_capacity_for_other_requests(self):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=5.0)], polling_capacity_pct=0.8)
+        for _ in range(8):
+            self.ev_loop.run_until_complete(
+                throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.STATUS_POLLING).acquire())
+
+        self.assertFalse(throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.STATUS_POLLING).within_capacity())
+        self.assertTrue(throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.MARKET_DATA).within_capacity())
+        self.assertTrue(throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.CANCEL).within_capacity())
+
+    def test_status_polling_requests_never_get_less_than_their_weight(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0)])
+        self.assertTrue(throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.STATUS_POLLING).within_capacity())
+
+    @patch.object(SlidingWindowRequestContext, "_sleep")
+    @patch.object(SlidingWindowRequestContext, "_time")
+    def test_waiting_requests_acquire_by_priority(self, time_mock, sleep_mock):
+        current_time = [1640000000.0]
+        time_mock.side_effect = lambda: current_time[0]
+
+        async def sleep(delay: float):
+            await asyncio.sleep(0)
+
+        sleep_mock.side_effect = sleep
+        acquired = []
+
+        async def request(priority: RequestPriority):
+            await self.throttler.execute_task(TEST_PATH_URL, priority=priority).acquire()
+            acquired.append(priority)
+
+        async def requests():
+            await self.throttler.execute_task(TEST_PATH_URL).acquire()
+            tasks = [
+                asyncio.ensure_future(request(priority)) for priority in
+                (RequestPriority.STATUS_POLLING, RequestPriority.MARKET_DATA, RequestPriority.CANCEL)
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual([], acquired)
+            waiting = self.throttler._windows[TEST_PATH_URL]._waiting
+            self.assertEqual(1, waiting[RequestPriority.CANCEL])
+
+            # Each time the capacity is freed, the waiting request with the highest priority takes it
+            pending = tasks
+            while pending:
+                current_time[0] += 6
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED, timeout=1)
+
+        self.ev_loop.run_until_complete(requests())
+
+        self.assertEqual([RequestPriority.CANCEL, RequestPriority.MARKET_DATA, RequestPriority.STATUS_POLLING], acquired)
+        self.assertEqual([0] * len(RequestPriority), self.throttler._windows[TEST_PATH_URL]._waiting)
+
+    def test_waiting_requests_only_block_the_limits_without_capacity(self):
+        throttler = SlidingWindowThrottler(rate_limits=[
+            RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+        ])
+
+        async def requests():
+            await throttler.execute_task(TEST_PATH_URL).acquire()
+            task = asyncio.ensure_future(throttler.execute_task(TEST_PATH_URL, priority=RequestPriority.CANCEL).acquire())
+            await asyncio.sleep(0)
+            self.assertEqual(1, throttler._windows[TEST_PATH_URL]._waiting[RequestPriority.CANCEL])
+            self.assertEqual(0, throttler._windows[TEST_POOL_ID]._waiting[RequestPriority.CANCEL])
+
+            # The pool still has capacity, the request waiting on the path limit doesn't block it
+            self.assertTrue(throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.MARKET_DATA).within_capacity())
+            await asyncio.wait_for(
+                throttler.execute_task(TEST_POOL_ID, priority=RequestPriority.MARKET_DATA).acquire(), timeout=1)
+            task.cancel()
+
+        self.ev_loop.run_until_complete(requests())
+
+    @patch.object(SlidingWindowRequestContext, "_sleep")
+    def test_requests_blocked_by_higher_priority_are_woken_up_without_polling(self, sleep_mock):
+        never_freed = asyncio.Event()
+        sleep_delays = []
+
+        async def sleep(delay: float):
+            sleep_delays.append(delay)
+            await never_freed.wait()
+
+        sleep_mock.side_effect = sleep
+
+        async def requests():
+            await self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).acquire()
+            await self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire()
+            # The pool doesn't have capacity for another weighted task 1, but it has for a task 2
+            blocking_task = asyncio.ensure_future(
+                self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID, priority=RequestPriority.CANCEL).acquire())
+            await asyncio.sleep(0)
+            waiting_task = asyncio.ensure_future(
+                self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, priority=RequestPriority.STATUS_POLLING).acquire())
+            await asyncio.sleep(0)
+            self.assertFalse(waiting_task.done())
+
+            blocking_task.cancel()
+            await asyncio.wait_for(waiting_task, timeout=1)
+
+        self.ev_loop.run_until_complete(requests())
+
+        # Only the request waiting for capacity slept, the lower priority request was woken up by the throttler
+        self.assertEqual(1, len(sleep_delays))
+        self.assertEqual([0] * len(RequestPriority), self.throttler._windows[TEST_WEIGHTED_POOL_ID]._waiting)
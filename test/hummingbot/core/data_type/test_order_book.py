@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 
 import logging
+import math
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+
 import numpy as np
 
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
 
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
@@ -50,6 +56,164 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    @staticmethod
+    def _depth_books():
+        bids_array = np.array([[100 - i * 0.7, 1.3 + (i % 5) * 0.11, 1] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i * 0.3, 0.9 + (i % 7) * 0.23, 1] for i in range(50)], dtype=np.float64)
+        native_book = OrderBook()
+        native_book.apply_numpy_snapshot(bids_array, asks_array)
+        # The composite book has no recorded trades, so its row based queries must match the native ones
+        row_book = CompositeOrderBook()
+        row_book.apply_numpy_snapshot(bids_array, asks_array)
+        return native_book, row_book
+
+    def assertQueryResultEqual(self, expected, actual):
+        for field in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value = getattr(expected, field)
+            actual_value = getattr(actual, field)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value), field)
+            else:
+                self.assertEqual(expected_value, actual_value, field)
+
+    def test_native_depth_queries_match_row_iteration(self):
+        native_book, row_book = self._depth_books()
+
+        for is_buy in (True, False):
+            for volume in (0, 0.5, 1.3, 7.77, 25, 1000):
+                self.assertQueryResultEqual(row_book.get_price_for_volume(is_buy, volume),
+                                            native_book.get_price_for_volume(is_buy, volume))
+                if volume > 0:
+                    self.assertQueryResultEqual(row_book.get_vwap_for_volume(is_buy, volume),
+                                                native_book.get_vwap_for_volume(is_buy, volume))
+                else:
+                    self.assertRaises(ZeroDivisionError, native_book.get_vwap_for_volume, is_buy, volume)
+                self.assertQueryResultEqual(row_book.get_quote_volume_for_base_amount(is_buy, volume),
+                                            native_book.get_quote_volume_for_base_amount(is_buy, volume))
+                self.assertQueryResultEqual(row_book.get_price_for_quote_volume(is_buy, volume * 100),
+                                            native_book.get_price_for_quote_volume(is_buy, volume * 100))
+            for price in (50, 90.5, 100, 101, 105.2, 200):
+                self.assertQueryResultEqual(row_book.get_volume_for_price(is_buy, price),
+                                            native_book.get_volume_for_price(is_buy, price))
+                self.assertQueryResultEqual(row_book.get_quote_volume_for_price(is_buy, price),
+                                            native_book.get_quote_volume_for_price(is_buy, price))
+
+    def test_batched_depth_queries(self):
+        native_book, row_book = self._depth_books()
+        volumes = [25, 0.5, float("nan"), 1000, 7.77, 0.5]
+
+        for is_buy in (True, False):
+            prices = native_book.get_price_for_volumes(is_buy, volumes)
+            vwaps = native_book.get_vwap_for_volumes(is_buy, volumes)
+            row_prices = row_book.get_price_for_volumes(is_buy, volumes)
+
+            self.assertEqual(len(volumes), len(prices))
+            self.assertEqual(len(volumes), len(vwaps))
+            for volume, price, vwap, row_price in zip(volumes, prices, vwaps, row_prices):
+                self.assertQueryResultEqual(native_book.get_price_for_volume(is_buy, volume), price)
+                self.assertQueryResultEqual(native_book.get_vwap_for_volume(is_buy, volume), vwap)
+                self.assertQueryResultEqual(price, row_price)
+
+    def test_top_n_levels_to_numpy(self):
+        native_book, row_book = self._depth_books()
+
+        bids, asks = native_book.top_n(5)
+        self.assertEqual((5, 3), bids.shape)
+        self.assertEqual(np.float64, bids.dtype)
+        self.assertTrue(bids.flags.c_contiguous)
+        self.assertEqual([100, 1.3, 1], bids[0].tolist())
+        self.assertEqual([101, 0.9, 1], asks[0].tolist())
+        self.assertTrue(np.all(np.diff(bids[:, 0]) < 0))
+        self.assertTrue(np.all(np.diff(asks[:, 0]) > 0))
+
+        row_bids, row_asks = row_book.top_n(5)
+        np.testing.assert_array_equal(bids, row_bids)
+        np.testing.assert_array_equal(asks, row_asks)
+
+        full_bids, full_asks = native_book.snapshot
+        np.testing.assert_array_equal(full_bids.values, native_book.to_numpy(True))
+        np.testing.assert_array_equal(full_asks.head(5).values, asks)
+        self.assertEqual((50, 3), native_book.to_numpy(False, 1000).shape)
+        self.assertEqual((0, 3), native_book.to_numpy(False, 0).shape)
+
+    def test_to_numpy_reuses_output_buffer(self):
+        native_book, row_book = self._depth_books()
+        buffer = np.zeros((10, 3), dtype=np.float64)
+
+        levels = native_book.to_numpy(True, 3, out=buffer)
+        self.assertEqual((3, 3), levels.shape)
+        self.assertTrue(np.shares_memory(levels, buffer))
+        self.assertEqual([100, 1.3, 1], buffer[0].tolist())
+        self.assertEqual([0, 0, 0], buffer[3].tolist())
+
+        levels = native_book.to_numpy(False, None, out=buffer)
+        self.assertEqual((10, 3), levels.shape)
+        levels = row_book.to_numpy(False, 3, out=buffer)
+        np.testing.assert_array_equal(native_book.to_numpy(False, 3), levels)
+
+        self.assertRaises(ValueError, native_book.to_numpy, True, 3, np.zeros((10, 2)))
+        self.assertRaises(ValueError, native_book.to_numpy, True, 3, np.zeros((10, 3), dtype=np.float32))
+
+    def test_apply_exchange_native_levels(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_levels([["10.5", "1", "3"], ["10", "2"]], [[11, 1.5]], 1)
+        order_book.apply_diff_levels([["10.5", "0"], ["10.1", "0.5"]], [("11.2", "4")], 2)
+
+        self.assertEqual([OrderBookRow(10.1, 0.5, 2), OrderBookRow(10, 2, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11, 1.5, 1), OrderBookRow(11.2, 4, 2)], list(order_book.ask_entries()))
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual(1, order_book.snapshot_uid)
+
+    def test_apply_messages_caches_parsed_levels(self):
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 1, "bids": [["10", "1"]], "asks": [["11", "1"]]},
+            timestamp=1)
+        diff = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [["10", "0"], ["9", "3"]], "asks": []},
+            timestamp=2)
+        order_book = OrderBook()
+
+        self.assertIsNone(diff.parsed_levels)
+        order_book.apply_snapshot_message(snapshot)
+        order_book.apply_diff_message(diff)
+        levels = diff.parsed_levels
+        self.assertEqual(diff.bids, levels.bids)
+        self.assertEqual(diff.asks, levels.asks)
+
+        # Replaying the diffs reuses the levels parsed when the diff was first applied
+        order_book.restore_from_snapshot_and_diffs(snapshot, [diff])
+        self.assertIs(levels, diff.parsed_levels)
+        self.assertEqual([OrderBookRow(9, 3, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11, 1, 1)], list(order_book.ask_entries()))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_apply_message_with_custom_rows(self):
+        class CustomRowsMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(float(price), float(amount), update_id)
+                        for price, amount, update_id in self.content["data"]]
+
+        message = CustomRowsMessage(
+            OrderBookMessageType.SNAPSHOT, {"update_id": 7, "data": [("10", "1", 5)], "asks": [["11", "2"]]})
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(message)
+
+        self.assertEqual([OrderBookRow(10, 1, 5)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11, 2, 7)], list(order_book.ask_entries()))
+
+    def test_depth_queries_on_empty_book(self):
+        order_book = OrderBook()
+
+        result = order_book.get_price_for_volume(True, 1)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+        result = order_book.get_vwap_for_volumes(False, [1, 2])
+        self.assertTrue(all(math.isnan(r.result_price) for r in result))
+        self.assertEqual(0, order_book.get_quote_volume_for_base_amount(True, 1).result_volume)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,260 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookRecordReader
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+def diff_message(trading_pair: str, update_id: int, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": trading_pair,
+        "first_update_id": update_id - 1,
+        "update_id": update_id,
+        "bids": [["99.5", "1.25"], ["99", "0"]],
+        "asks": [["100.5", "2"]],
+    }, timestamp=timestamp)
+
+
+def snapshot_message(trading_pair: str, update_id: int, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": trading_pair,
+        "update_id": update_id,
+        "bids": [[100 - level, level] for level in range(1, 6)],
+        "asks": [[100 + level, level] for level in range(1, 4)],
+    }, timestamp=timestamp)
+
+
+def trade_message(trading_pair: str, trade_id: str, timestamp: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": trading_pair,
+        "trade_type": float(TradeType.SELL.value),
+        "trade_id": trade_id,
+        "update_id": 0,
+        "price": "100.25",
+        "amount": "0.5",
+    }, timestamp=timestamp)
+
+
+class OrderBookRecorderTest(unittest.TestCase):
+    start = 1_700_000_000 - 1_700_000_000 % 3600
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = OrderBookRecorder(connector_name="binance", root_path=self.temp_dir.name, chunk_size=4)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def reader(self, **kwargs) -> OrderBookRecordReader:
+        return OrderBookRecordReader.from_directory("binance", root_path=self.temp_dir.name, **kwargs)
+
+    def record_messages(self, count: int, start: float):
+        messages = []
+        for index in range(count):
+            received = start + index
+            if index % 3 == 0:
+                message = snapshot_message("BTC-USDT", index, received - 0.5)
+            elif index % 3 == 1:
+                message = diff_message("ETH-USDT", index, received - 0.5)
+            else:
+                message = trade_message("BTC-USDT", f"trade-{index}", received - 0.5)
+            self.recorder.record(message, received=received)
+            messages.append((received, message))
+        return messages
+
+    def assert_messages_equal(self, expected, result):
+        self.assertEqual(len(expected), len(result))
+        for (expected_received, expected_message), (received, message) in zip(expected, result):
+            self.assertEqual(expected_received, received)
+            self.assertEqual(expected_message.type, message.type)
+            self.assertEqual(expected_message.timestamp, message.timestamp)
+            self.assertEqual(expected_message.trading_pair, message.trading_pair)
+            self.assertEqual(expected_message.update_id, message.update_id)
+            if message.type is OrderBookMessageType.TRADE:
+                self.assertEqual(expected_message.trade_id, message.trade_id)
+                self.assertEqual(float(expected_message.content["price"]), message.content["price"])
+                self.assertEqual(float(expected_message.content["amount"]), message.content["amount"])
+                self.assertEqual(expected_message.content["trade_type"], message.content["trade_type"])
+            else:
+                self.assertEqual(expected_message.first_update_id, message.first_update_id)
+                self.assertEqual(expected_message.bids, message.bids)
+                self.assertEqual(expected_message.asks, message.asks)
+
+    def test_recorded_messages_are_replayed(self):
+        messages = self.record_messages(10, self.start)
+        self.recorder.close()
+        self.recorder.join()
+
+        self.assert_messages_equal(messages, list(self.reader().messages()))
+
+    def test_messages_are_written_by_chunks(self):
+        self.record_messages(10, self.start)
+        self.recorder.join()
+
+        # The last 2 messages are not written until the recorder is flushed
+        self.assertEqual(8, len(list(self.reader().messages())))
+        self.assertEqual([4, 4], [len(chunk.messages["received"]) for chunk in self.reader().chunks()])
+
+        self.recorder.flush()
+        self.recorder.join()
+
+        self.assertEqual(10, len(list(self.reader().messages())))
+
+    def test_chunks_are_written_by_the_writer_thread(self):
+        writer_threads = []
+        write_chunk = self.recorder._write_chunk
+
+        def record_thread_and_write_chunk(*args):
+            writer_threads.append(threading.current_thread())
+            write_chunk(*args)
+
+        self.recorder._write_chunk = record_thread_and_write_chunk
+        self.record_messages(8, self.start)
+        self.recorder.join()
+
+        self.assertEqual(2, len(writer_threads))
+        self.assertNotIn(threading.current_thread(), writer_threads)
+        self.assertEqual(8, len(list(self.reader().messages())))
+
+    def test_close_stops_the_writer_thread(self):
+        # The threads of the recorders of the other tests are ignored
+        other_threads = set(threading.enumerate())
+
+        def writer_threads():
+            return [thread for thread in threading.enumerate()
+                    if thread not in other_threads and thread.name.startswith("OrderBookRecorder-binance")]
+
+        self.record_messages(4, self.start)
+        self.assertEqual(1, len(writer_threads()))
+
+        self.recorder.close()
+        self.recorder.join()
+
+        self.assertEqual([], writer_threads())
+
+        self.record_messages(4, self.start + 1)
+        self.recorder.close()
+
+        self.assertEqual([], writer_threads())
+        self.assertEqual(8, len(list(self.reader().messages())))
+
+    def test_messages_are_written_after_the_flush_interval(self):
+        recorder = OrderBookRecorder(connector_name="binance", root_path=self.temp_dir.name, flush_interval=10)
+        recorder.record(diff_message("BTC-USDT", 1, self.start), received=self.start)
+        recorder.record(diff_message("BTC-USDT", 2, self.start + 5), received=self.start + 5)
+        recorder.join()
+
+        self.assertEqual(0, len(list(self.reader().messages())))
+
+        recorder.record(diff_message("BTC-USDT", 3, self.start + 10), received=self.start + 10)
+        recorder.join()
+
+        self.assertEqual(3, len(list(self.reader().messages())))
+
+    def test_files_rotate_every_hour(self):
+        messages = self.record_messages(6, self.start + 3600 - 3)
+        self.recorder.close()
+        self.recorder.join()
+
+        self.assertEqual([self.recorder.file_path(self.start), self.recorder.file_path(self.start + 3600)],
+                         self.reader().paths)
+        self.assert_messages_equal(messages[:3], list(OrderBookRecordReader([self.reader().paths[0]]).messages()))
+        self.assertEqual([self.recorder.file_path(self.start + 3600)], self.reader(start=self.start + 3600).paths)
+        self.assertEqual([self.recorder.file_path(self.start)], self.reader(end=self.start + 3599).paths)
+
+    def test_read_a_period_and_trading_pairs(self):
+        messages = self.record_messages(12, self.start)
+        self.recorder.close()
+        self.recorder.join()
+
+        result = list(self.reader().messages(start=self.start + 2, end=self.start + 9, trading_pairs=["BTC-USDT"]))
+
+        self.assert_messages_equal([(received, message) for received, message in messages[2:10]
+                                    if message.trading_pair == "BTC-USDT"], result)
+
+    def test_trades_df(self):
+        self.record_messages(12, self.start)
+        self.recorder.close()
+        self.recorder.join()
+
+        trades = self.reader().trades_df(end=self.start + 8)
+
+        self.assertEqual(["trade-2", "trade-5", "trade-8"], trades["trade_id"].tolist())
+        self.assertEqual({"BTC-USDT"}, set(trades["trading_pair"]))
+        self.assertEqual({"SELL"}, set(trades["trade_type"]))
+        self.assertEqual([100.25] * 3, trades["price"].tolist())
+        self.assertTrue(self.reader().trades_df(start=self.start + 100).empty)
+
+    def test_chunk_partially_written_is_replaced(self):
+        messages = self.record_messages(4, self.start)
+        self.recorder.join()
+        path = self.recorder.file_path(self.start)
+        valid_size = os.path.getsize(path)
+        with open(path, "ab") as file:
+            file.write(b"HBCK\x10\x00\x00\x00{\"messages\"")
+
+        self.assertEqual(valid_size, OrderBookRecordReader.valid_size(path))
+        self.assert_messages_equal(messages, list(self.reader().messages()))
+
+        recorder = OrderBookRecorder(connector_name="binance", root_path=self.temp_dir.name)
+        recorder.record(diff_message("BTC-USDT", 10, self.start + 10), received=self.start + 10)
+        recorder.close()
+        recorder.join()
+
+        self.assertEqual(5, len(list(self.reader().messages())))
+
+    def test_record_order_book(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 5), OrderBookRow(98, 2, 5)], [OrderBookRow(101, 3, 5)], 5)
+
+        self.recorder.record_order_book("BTC-USDT", order_book, received=self.start)
+        self.recorder.close()
+        self.recorder.join()
+
+        (received, message), = self.reader().messages()
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, message.type)
+        self.assertEqual(5, message.update_id)
+        self.assertEqual([(99, 1), (98, 2)], [(row.price, row.amount) for row in message.bids])
+        self.assertEqual([(101, 3)], [(row.price, row.amount) for row in message.asks])
+
+
+class OrderBookTrackerRecordingTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=["BTC-USDT"])
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(99, 1, 5)], [OrderBookRow(101, 3, 5)], 5)
+        self.tracker._order_books["BTC-USDT"] = self.order_book
+        self.recorder = OrderBookRecorder(connector_name="binance", root_path=self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    async def test_tracker_records_the_order_books_and_the_trades(self):
+        self.tracker.recorder = self.recorder
+        self.tracker._order_books_initialized.set()
+        task = asyncio.create_task(self.tracker._emit_trade_event_loop())
+        self.tracker._order_book_trade_stream.put_nowait(trade_message("BTC-USDT", "1", 1_700_000_000))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        self.tracker.recorder = None
+        self.recorder.join()
+
+        messages = [message for _, message in
+                    OrderBookRecordReader.from_directory("binance", root_path=self.temp_dir.name).messages()]
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE],
+                         [message.type for message in messages])
+        self.assertEqual(100.25, self.order_book.last_trade_price)
@@ -0,0 +1,87 @@
+import asyncio
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookRecordReader
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookReplayDataSourceTest(IsolatedAsyncioWrapperTestCase):
+    start = 1_700_000_000 - 1_700_000_000 % 3600
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        recorder = OrderBookRecorder(connector_name="binance", root_path=self.temp_dir.name)
+        messages = [
+            (OrderBookMessageType.DIFF, {"bids": [[99.5, 1]], "asks": []}),
+            (OrderBookMessageType.SNAPSHOT, {"bids": [[99, 1]], "asks": [[101, 1]]}),
+            (OrderBookMessageType.DIFF, {"bids": [[100, 1]], "asks": []}),
+            (OrderBookMessageType.TRADE, {"trade_type": float(TradeType.BUY.value), "trade_id": "1", "price": 101,
+                                          "amount": 0.5}),
+            (OrderBookMessageType.DIFF, {"bids": [], "asks": [[100.5, 2]]}),
+        ]
+        for index, (message_type, content) in enumerate(messages):
+            received = self.start + index * 0.01
+            recorder.record(OrderBookMessage(message_type, {"trading_pair": "BTC-USDT", "update_id": index, **content},
+                                             timestamp=received), received=received)
+        recorder.close()
+        recorder.join()
+        self.reader = OrderBookRecordReader.from_directory("binance", root_path=self.temp_dir.name)
+        self.tracker = None
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_messages_start_with_the_snapshot(self):
+        data_source = OrderBookReplayDataSource(["BTC-USDT"], self.reader)
+
+        messages = [message for _, message in data_source.messages()]
+
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF, OrderBookMessageType.TRADE,
+                          OrderBookMessageType.DIFF], [message.type for message in messages])
+        self.assertEqual([], [message for _, message in OrderBookReplayDataSource(["ETH-USDT"], self.reader).messages()])
+        with self.assertRaises(ValueError):
+            OrderBookReplayDataSource(["BTC-USDT"], self.reader, speed=-1)
+
+    async def test_started_tracker_replays_the_messages(self):
+        data_source = OrderBookReplayDataSource(["BTC-USDT"], self.reader, speed=None)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=["BTC-USDT"])
+
+        self.tracker.start()
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+        await asyncio.sleep(0.1)
+
+        order_book = self.tracker.order_books["BTC-USDT"]
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual(100.5, order_book.get_price(True))
+        self.assertEqual(101, order_book.last_trade_price)
+        self.assertEqual({"BTC-USDT": 101}, await data_source.get_last_traded_prices(["BTC-USDT", "ETH-USDT"]))
+
+    async def test_messages_are_streamed_at_the_replay_speed(self):
+        data_source = OrderBookReplayDataSource(["BTC-USDT"], self.reader, speed=0.1)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=["BTC-USDT"])
+
+        self.tracker.start()
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+        await asyncio.sleep(0.01)
+
+        # The first diff is streamed right away, the next messages 0.1 seconds after each other
+        self.assertEqual(100, self.tracker.order_books["BTC-USDT"].get_price(False))
+        self.assertEqual(101, self.tracker.order_books["BTC-USDT"].get_price(True))
+
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(100.5, self.tracker.order_books["BTC-USDT"].get_price(True))
+
+    async def test_no_snapshot_recorded(self):
+        data_source = OrderBookReplayDataSource(["ETH-USDT"], self.reader)
+
+        with self.assertRaises(ValueError):
+            await data_source.get_new_order_book("ETH-USDT")
@@ -0,0 +1,70 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerInitializationTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [f"COIN{i}-HBOT" for i in range(6)]
+        self.snapshot_releases: Dict[str, asyncio.Event] = {pair: asyncio.Event() for pair in self.trading_pairs}
+        self.requested_pairs: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        data_source = MagicMock()
+        data_source.get_new_order_book.side_effect = self._get_new_order_book
+        self.tracker = OrderBookTracker(
+            data_source=data_source, trading_pairs=self.trading_pairs, max_concurrent_initializations=3)
+        self.tracker._track_single_book = AsyncMock()
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested_pairs.append(trading_pair)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await self.snapshot_releases[trading_pair].wait()
+        self.in_flight -= 1
+        return OrderBook()
+
+    async def test_order_books_initialized_concurrently_up_to_the_configured_limit(self):
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.trading_pairs[:3], self.requested_pairs)
+        self.assertFalse(self.tracker.ready)
+
+        for trading_pair in self.trading_pairs:
+            self.snapshot_releases[trading_pair].set()
+        await asyncio.wait_for(init_task, timeout=1)
+
+        self.assertEqual(3, self.max_in_flight)
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+
+    async def test_each_order_book_is_ready_as_soon_as_initialized(self):
+        init_task = asyncio.create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.snapshot_releases[self.trading_pairs[1]].set()
+        await asyncio.wait_for(self.tracker.wait_order_book_ready(self.trading_pairs[1]), timeout=1)
+
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertEqual([self.trading_pairs[1]], self.tracker.ready_trading_pairs)
+        self.assertIn(self.trading_pairs[1], self.tracker.order_books)
+        self.assertFalse(self.tracker.ready)
+        # A slot was released, so the next pair snapshot is requested
+        self.assertIn(self.trading_pairs[3], self.requested_pairs)
+
+        init_task.cancel()
+        self.tracker.stop()
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+    def test_default_concurrency(self):
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=self.trading_pairs)
+        self.assertEqual(OrderBookTracker.MAX_CONCURRENT_INITIALIZATIONS, tracker._max_concurrent_initializations)
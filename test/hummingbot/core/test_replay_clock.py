@@ -0,0 +1,161 @@
+import tempfile
+import time
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookRecordReader
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.replay_clock import ReplayClock
+
+
+class BestBidRecorder(PyTimeIterator):
+    def __init__(self, tracker: OrderBookTracker, trading_pair: str):
+        super().__init__()
+        self.tracker = tracker
+        self.trading_pair = trading_pair
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        order_book = self.tracker.order_books.get(self.trading_pair)
+        self.ticks.append((timestamp, None if order_book is None else order_book.get_price(False)))
+
+
+class ReplayClockTest(unittest.TestCase):
+    start = 1_700_000_000 - 1_700_000_000 % 3600
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = OrderBookRecorder(connector_name="binance", root_path=self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def record(self, received: float, message_type: OrderBookMessageType, content: dict, trading_pair="BTC-USDT"):
+        content = {"trading_pair": trading_pair, "update_id": int(received * 10), **content}
+        self.recorder.record(OrderBookMessage(message_type, content, timestamp=received), received=received)
+
+    def record_book(self, start: float, trading_pair: str = "BTC-USDT"):
+        self.record(start, OrderBookMessageType.SNAPSHOT, {"bids": [[99, 1], [98, 1]], "asks": [[101, 1]]},
+                    trading_pair)
+        self.record(start + 2.5, OrderBookMessageType.DIFF, {"bids": [[100, 1]], "asks": []}, trading_pair)
+        self.record(start + 4, OrderBookMessageType.DIFF, {"bids": [[100, 0]], "asks": []}, trading_pair)
+        self.record(start + 5.5, OrderBookMessageType.TRADE,
+                    {"trade_type": float(TradeType.SELL.value), "trade_id": "1", "price": 98.5, "amount": 0.5},
+                    trading_pair)
+
+    def tracker(self, trading_pairs: List[str], connector_name: str = "binance") -> OrderBookTracker:
+        reader = OrderBookRecordReader.from_directory(connector_name, root_path=self.temp_dir.name)
+        return OrderBookTracker(data_source=OrderBookReplayDataSource(trading_pairs, reader),
+                                trading_pairs=trading_pairs)
+
+    def test_messages_are_applied_between_the_ticks(self):
+        self.record(self.start - 10, OrderBookMessageType.DIFF, {"bids": [[99.5, 1]], "asks": []})
+        self.record_book(self.start)
+        self.recorder.close()
+        self.recorder.join()
+        tracker = self.tracker(["BTC-USDT"])
+        clock = ReplayClock([tracker])
+        best_bids = BestBidRecorder(tracker, "BTC-USDT")
+        clock.add_iterator(best_bids)
+
+        clock.backtest()
+
+        # The diff received before the snapshot is ignored, the tick at 4 sees the diff received at 4
+        self.assertEqual([(self.start + 1, 99), (self.start + 2, 99), (self.start + 3, 100), (self.start + 4, 99),
+                          (self.start + 5, 99), (self.start + 6, 99)], best_bids.ticks)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(98.5, tracker.order_books["BTC-USDT"].last_trade_price)
+        self.assertIsNone(clock.next_message_timestamp)
+
+    def test_backtest_til_replays_up_to_the_timestamp(self):
+        self.record_book(self.start)
+        self.recorder.close()
+        self.recorder.join()
+        tracker = self.tracker(["BTC-USDT"])
+        clock = ReplayClock([tracker], tick_size=0.5, start_time=self.start - 100)
+
+        clock.backtest_til(self.start + 3)
+
+        self.assertEqual(self.start + 3, clock.current_timestamp)
+        self.assertEqual(100, tracker.order_books["BTC-USDT"].get_price(False))
+        self.assertEqual(self.start + 4, clock.next_message_timestamp)
+
+        clock.backtest_til(self.start + 20)
+
+        self.assertEqual(self.start + 20, clock.current_timestamp)
+        self.assertEqual(99, tracker.order_books["BTC-USDT"].get_price(False))
+
+    def test_messages_of_several_trackers_are_replayed_in_order(self):
+        self.record_book(self.start, "BTC-USDT")
+        self.recorder.close()
+        self.recorder.join()
+        self.recorder = OrderBookRecorder(connector_name="kucoin", root_path=self.temp_dir.name)
+        self.record_book(self.start + 1.5, "ETH-USDT")
+        self.recorder.close()
+        self.recorder.join()
+        binance_tracker = self.tracker(["BTC-USDT"])
+        kucoin_tracker = self.tracker(["ETH-USDT"], connector_name="kucoin")
+        clock = ReplayClock([binance_tracker, kucoin_tracker])
+        binance_best_bids = BestBidRecorder(binance_tracker, "BTC-USDT")
+        kucoin_best_bids = BestBidRecorder(kucoin_tracker, "ETH-USDT")
+        clock.add_iterator(binance_best_bids)
+        clock.add_iterator(kucoin_best_bids)
+
+        clock.backtest()
+
+        self.assertEqual([99, 99, 100, 99, 99, 99, 99], [price for _, price in binance_best_bids.ticks])
+        self.assertEqual([None, 99, 99, 100, 100, 99, 99], [price for _, price in kucoin_best_bids.ticks])
+
+    def test_replay_at_speed_multiplier(self):
+        self.record_book(self.start)
+        self.recorder.close()
+        self.recorder.join()
+        clock = ReplayClock([self.tracker(["BTC-USDT"])], tick_size=0.5, speed=100)
+
+        start_time = time.perf_counter()
+        clock.backtest()
+
+        self.assertGreaterEqual(time.perf_counter() - start_time, 5.5 / 100)
+        self.assertEqual(self.start + 5.5, clock.current_timestamp)
+
+    def test_trackers_must_replay_records(self):
+        with self.assertRaises(ValueError):
+            ReplayClock([OrderBookTracker(data_source=MagicMock(), trading_pairs=["BTC-USDT"])])
+        with self.assertRaises(ValueError):
+            ReplayClock([self.tracker(["BTC-USDT"])], speed=0)
+
+    def test_paper_trade_limit_order_filled_by_recorded_trade(self):
+        self.record_book(self.start)
+        self.recorder.close()
+        self.recorder.join()
+        tracker = self.tracker(["BTC-USDT"])
+        exchange = PaperTradeExchange(ClientConfigAdapter(ClientConfigMap()), tracker, ExchangeBase, "binance")
+        exchange.set_balance("USDT", Decimal(1000))
+        fills = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fills)
+        clock = ReplayClock([tracker])
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start + 2)
+        self.assertTrue(exchange.ready)
+        exchange.buy("BTC-USDT", Decimal("0.5"), OrderType.LIMIT, Decimal(99))
+        clock.backtest()
+
+        self.assertEqual(1, len(fills.event_log))
+        self.assertEqual(Decimal(99), fills.event_log[0].price)
+        # The trade received at 5.5 fills the order before the tick at 6
+        self.assertEqual(self.start + 5, fills.event_log[0].timestamp)
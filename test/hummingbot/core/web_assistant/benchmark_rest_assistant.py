@@ -0,0 +1,110 @@
+"""
+Microbenchmark of the per-request overhead added by RESTAssistant on top of the HTTP call.
+
+The connection returns immediately, so the measured time is the cost of building, encoding, copying and
+authenticating the request and throttling it. The previous implementation (deep copy of every request, stdlib JSON
+encoding and processors awaited even when there are none) is reproduced by LegacyRESTAssistant for comparison.
+
+Run it with:
+    PYTHONPATH=. python test/hummingbot/core/web_assistant/benchmark_rest_assistant.py
+"""
+import asyncio
+import json
+import time
+from copy import deepcopy
+from typing import Optional
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, get_json_codec
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+URL = "https://api.exchange.com/api/v3/order"
+ORDER = {
+    "symbol": "COINALPHAHBOT",
+    "side": "BUY",
+    "type": "LIMIT",
+    "timeInForce": "GTC",
+    "quantity": "12.50000000",
+    "price": "10050.10000000",
+    "newClientOrderId": "HBOTBCBUT6e0b5e9d2c8f1d8bc2a0d2c1e3c",
+    "extra": {"tags": ["a", "b", "c"], "nested": {"depth": [1, 2, 3, 4, 5]}},
+}
+
+
+class InstantResponse:
+    status = 200
+
+
+class InstantConnection:
+    async def call(self, request: RESTRequest) -> RESTResponse:
+        return InstantResponse()
+
+
+class HeaderAuth(AuthBase):
+    async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+        headers = request.headers or {}
+        headers["X-API-KEY"] = "key"
+        request.headers = headers
+        return request
+
+    async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+        return request
+
+
+class LegacyRESTAssistant(RESTAssistant):
+    async def execute_request_and_get_response(self, url: str, throttler_limit_id: str, data=None,
+                                               method: RESTMethod = RESTMethod.GET, is_auth_required: bool = False,
+                                               headers: Optional[dict] = None, **kwargs) -> RESTResponse:
+        headers = headers or {}
+        local_headers = {
+            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
+        local_headers.update(headers)
+        data = json.dumps(data) if data is not None else data
+        request = RESTRequest(method=method, url=url, data=data, headers=local_headers,
+                              is_auth_required=is_auth_required, throttler_limit_id=throttler_limit_id)
+        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+            response = await self.call(request=request)
+            if 400 <= response.status:
+                raise IOError(f"HTTP status is {response.status}.")
+            return response
+
+    async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        request = deepcopy(request)
+        request = await self._pre_process_request(request)
+        request = await self._authenticate(request)
+        resp = await self._connection.call(request)
+        resp = await self._post_process_response(resp)
+        return resp
+
+
+async def measure(assistant: RESTAssistant, requests: int, is_auth_required: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await assistant.execute_request_and_get_response(
+            url=URL, throttler_limit_id=URL, data=ORDER, method=RESTMethod.POST, is_auth_required=is_auth_required)
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    loop = asyncio.new_event_loop()
+    requests = 20_000
+    print(f"{'request':>10} {'legacy':>12} {'stdlib codec':>14} {get_json_codec().name + ' codec':>14}")
+    for is_auth_required in (False, True):
+        results = []
+        for assistant_class, codec in ((LegacyRESTAssistant, None),
+                                       (RESTAssistant, JSONCodec()),
+                                       (RESTAssistant, get_json_codec())):
+            throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=URL, limit=10 ** 9, time_interval=1)])
+            assistant = assistant_class(
+                connection=InstantConnection(), throttler=throttler, auth=HeaderAuth(), json_codec=codec)
+            results.append(loop.run_until_complete(measure(assistant, requests, is_auth_required)))
+        label = "signed" if is_auth_required else "public"
+        print(f"{label:>10} " + " ".join(f"{result * 1e6:>11.1f}us" for result in results))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionPoolMetrics,
+    ConnectionPoolSettings,
+    get_default_connection_pool_settings,
+    set_default_connection_pool_settings,
+)
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+
+
+class ConnectionPoolTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.default_settings = get_default_connection_pool_settings()
+
+    def tearDown(self) -> None:
+        set_default_connection_pool_settings(self.default_settings)
+        super().tearDown()
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.release_responses = asyncio.Event()
+        self.request_received = asyncio.Event()
+        app = web.Application()
+        app.router.add_get("/slow", self._slow_handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+        await super().asyncTearDown()
+
+    async def _slow_handler(self, request: web.Request) -> web.Response:
+        self.request_received.set()
+        await self.release_responses.wait()
+        return web.json_response({"ok": True})
+
+    def test_build_connector(self):
+        connector = ConnectionPoolSettings(limit_per_host=3, keepalive_timeout=10, dns_cache_ttl=0).build_connector()
+
+        self.assertEqual(3, connector.limit_per_host)
+        self.assertFalse(connector.use_dns_cache)
+        self.assertFalse(connector.force_close)
+
+        connector = ConnectionPoolSettings(keepalive_timeout=0).build_connector(limit_per_host=0)
+
+        self.assertEqual(0, connector.limit_per_host)
+        self.assertTrue(connector.use_dns_cache)
+        self.assertTrue(connector.force_close)
+
+    def test_metrics_ratios_without_traffic(self):
+        metrics = ConnectionPoolMetrics()
+
+        self.assertEqual(0, metrics.occupancy)
+        self.assertEqual(0, metrics.average_queue_wait)
+
+    async def test_factory_uses_default_settings(self):
+        set_default_connection_pool_settings(ConnectionPoolSettings(limit_per_host=7))
+        factory = ConnectionsFactory()
+
+        session = factory._get_rest_session("https://api.test.com/ticker")
+
+        self.assertEqual(7, session.connector.limit_per_host)
+        await factory.close()
+
+    async def test_metrics_track_occupancy_and_queue_wait(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(limit_per_host=1))
+        connection = await factory.get_rest_connection()
+        url = str(self.server.make_url("/slow"))
+
+        async def get():
+            response = await connection.call(RESTRequest(method=RESTMethod.GET, url=url))
+            return await response.json()
+
+        requests = [asyncio.create_task(get()) for _ in range(2)]
+        # The first request holds the only connection of the host, the second one waits for it
+        await asyncio.wait_for(self.request_received.wait(), timeout=5)
+        metrics = factory.pool_metrics[url.rpartition("/")[0]]
+        while metrics.queued == 0:
+            await asyncio.sleep(0)
+
+        self.assertEqual(2, metrics.requests)
+        self.assertEqual(2, metrics.in_flight)
+        self.assertEqual(1, metrics.queued)
+        self.assertEqual(1, metrics.occupancy)
+
+        self.release_responses.set()
+        self.assertEqual([{"ok": True}] * 2, await asyncio.gather(*requests))
+
+        self.assertEqual(0, metrics.in_flight)
+        self.assertEqual(2, metrics.max_in_flight)
+        self.assertEqual(0, metrics.queued)
+        self.assertEqual(1, metrics.queued_requests)
+        self.assertGreater(metrics.max_queue_wait, 0)
+        self.assertEqual(metrics.max_queue_wait, metrics.average_queue_wait)
+        self.assertEqual(1, metrics.connections_created)
+        self.assertEqual(1, metrics.connections_reused)
+        await factory.close()
@@ -2,12 +2,9 @@ import asyncio
 import unittest
 from typing import Awaitable
 
-from hummingbot.core.web_assistant.connections.connections_factory import (
-    ConnectionsFactory
-)
-from hummingbot.core.web_assistant.connections.rest_connection import (
-    RESTConnection
-)
+from hummingbot.core.web_assistant.connections.connection_pool import ConnectionPoolSettings
+from hummingbot.core.web_assistant.connections.connections_factory import WS_SESSION_KEY, ConnectionsFactory
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -34,3 +31,45 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_rest_sessions_by_host(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(limit_per_host=5, dns_cache_ttl=60))
+
+        async def get_sessions():
+            return (factory._get_rest_session("https://api.test.com/api/v3/order?symbol=COINALPHAHBOT"),
+                    factory._get_rest_session("https://api.test.com/api/v3/ticker"),
+                    factory._get_rest_session("https://other.test.com:8443/api/v3/ticker"))
+
+        session, same_host_session, other_host_session = self.async_run_with_timeout(get_sessions())
+
+        self.assertIs(session, same_host_session)
+        self.assertIsNot(session, other_host_session)
+        self.assertEqual(5, session.connector.limit_per_host)
+        self.assertEqual(0, session.connector.limit)
+        self.assertEqual({"https://api.test.com", "https://other.test.com:8443"}, set(factory.pool_metrics))
+        self.assertEqual(5, factory.pool_metrics["https://api.test.com"].limit_per_host)
+
+        self.async_run_with_timeout(factory.close())
+        self.assertTrue(session.closed)
+        self.assertTrue(other_host_session.closed)
+
+    def test_rest_sessions_shared_when_per_host_sessions_disabled(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(per_host_sessions=False))
+
+        async def get_sessions():
+            return (factory._get_rest_session("https://api.test.com/api/v3/ticker"),
+                    factory._get_rest_session("https://other.test.com/api/v3/ticker"))
+
+        session, other_host_session = self.async_run_with_timeout(get_sessions())
+
+        self.assertIs(session, other_host_session)
+        self.async_run_with_timeout(factory.close())
+
+    def test_ws_connections_do_not_use_the_rest_pools(self):
+        factory = ConnectionsFactory(pool_settings=ConnectionPoolSettings(limit_per_host=5))
+
+        ws_connection = self.async_run_with_timeout(factory.get_ws_connection())
+
+        self.assertEqual([WS_SESSION_KEY], list(factory.pool_metrics))
+        self.assertEqual(0, ws_connection._client_session.connector.limit_per_host)
+        self.async_run_with_timeout(factory.close())
@@ -6,7 +6,13 @@ from typing import Awaitable
 import aiohttp
 from aioresponses import aioresponses
 
-from hummingbot.core.web_assistant.connections.data_types import EndpointRESTRequest, RESTMethod, RESTResponse
+from hummingbot.core.web_assistant.connections.data_types import (
+    EndpointRESTRequest,
+    RESTMethod,
+    RESTRequest,
+    RESTResponse,
+    WSResponse,
+)
 
 
 class DataTypesTest(unittest.TestCase):
@@ -25,6 +31,25 @@ class DataTypesTest(unittest.TestCase):
 
         self.assertEqual("GET", method_str)
 
+    def test_rest_request_copy(self):
+        request = RESTRequest(
+            method=RESTMethod.GET,
+            url="https://some.url",
+            params={"one": 1},
+            headers={"content-type": "application/json"},
+            is_auth_required=True,
+        )
+
+        request_copy = request.copy()
+        request_copy.params["signature"] = "signature"
+        request_copy.headers["key"] = "key"
+
+        self.assertEqual(request.url, request_copy.url)
+        self.assertTrue(request_copy.is_auth_required)
+        self.assertEqual({"one": 1}, request.params)
+        self.assertEqual({"content-type": "application/json"}, request.headers)
+        self.assertEqual({"one": 1, "signature": "signature"}, request_copy.params)
+
     @aioresponses()
     def test_rest_response_properties(self, mocked_api):
         url = "https://some.url"
@@ -67,6 +92,24 @@ class DataTypesTest(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_ws_response_decodes_raw_data_on_access(self):
+        response = WSResponse(raw='{"one": 1}')
+
+        self.assertEqual('{"one": 1}', response.raw)
+        self.assertEqual({"one": 1}, response.data)
+        self.assertEqual(WSResponse({"one": 1}), response)
+
+        response.data = {"two": 2}
+
+        self.assertEqual({"two": 2}, response.data)
+
+    def test_ws_response_with_decoded_data(self):
+        response = WSResponse({"one": 1})
+
+        self.assertIsNone(response.raw)
+        self.assertEqual({"one": 1}, response.data)
+        self.assertEqual("WSResponse(data={'one': 1})", str(response))
+
 
 class EndpointRESTRequestDummy(EndpointRESTRequest):
     @property
@@ -0,0 +1,77 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant.connections import json_codec
+from hummingbot.core.web_assistant.connections.json_codec import (
+    AUTO_JSON_CODEC,
+    JSONCodec,
+    OrjsonCodec,
+    SimdjsonCodec,
+    UjsonCodec,
+    get_json_codec,
+    set_default_json_codec,
+)
+
+
+class JSONCodecTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_default_json_codec(AUTO_JSON_CODEC)
+        super().tearDown()
+
+    def test_stdlib_codec(self):
+        codec = JSONCodec()
+        payload = {"symbol": "COINALPHA-HBOT", "amount": 1.5, "ids": [1, 2]}
+
+        self.assertEqual(json.dumps(payload), codec.dumps(payload))
+        self.assertEqual(payload, codec.loads(json.dumps(payload)))
+        self.assertEqual(payload, codec.loads(json.dumps(payload).encode()))
+
+    def test_ujson_codec(self):
+        codec = UjsonCodec()
+        payload = {"url": "/api/v3/order", "amount": 1.5, "ids": [1, 2]}
+
+        self.assertEqual(payload, json.loads(codec.dumps(payload)))
+        self.assertIn("/api/v3/order", codec.dumps(payload))
+        self.assertEqual(payload, codec.loads(json.dumps(payload)))
+        with self.assertRaises(ValueError):
+            codec.loads("not a json")
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_orjson_codec(self):
+        codec = OrjsonCodec()
+        payload = {"symbol": "COINALPHA-HBOT", "amount": 1.5, "ids": [1, 2]}
+
+        self.assertIsInstance(codec.dumps(payload), str)
+        self.assertEqual(payload, json.loads(codec.dumps(payload)))
+        self.assertEqual(payload, codec.loads(json.dumps(payload)))
+        self.assertEqual(payload, codec.loads(json.dumps(payload).encode()))
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_orjson_codec_falls_back_to_stdlib_for_unsupported_payloads(self):
+        codec = OrjsonCodec()
+
+        self.assertEqual(json.dumps({"nonce": 2 ** 70}), codec.dumps({"nonce": 2 ** 70}))
+        self.assertEqual({"1": "one"}, json.loads(codec.dumps({1: "one"})))
+        self.assertTrue(codec.loads('{"price": NaN}')["price"] != codec.loads('{"price": NaN}')["price"])
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads("not a json")
+
+    def test_get_json_codec(self):
+        self.assertEqual(JSONCodec, type(get_json_codec(JSONCodec.name)))
+        self.assertEqual(UjsonCodec, type(get_json_codec(UjsonCodec.name)))
+        # Unknown codecs default to the standard library
+        self.assertEqual(JSONCodec, type(get_json_codec("unknown")))
+
+    @patch.object(json_codec, "simdjson", None)
+    def test_get_json_codec_not_installed_returns_stdlib_codec(self):
+        self.assertEqual(JSONCodec, type(get_json_codec(SimdjsonCodec.name)))
+
+    @patch.object(json_codec, "orjson", None)
+    def test_auto_json_codec_selects_fastest_installed_codec(self):
+        self.assertEqual(UjsonCodec, type(get_json_codec(AUTO_JSON_CODEC)))
+
+    def test_set_default_json_codec(self):
+        set_default_json_codec(JSONCodec.name)
+
+        self.assertEqual(JSONCodec, type(get_json_codec()))
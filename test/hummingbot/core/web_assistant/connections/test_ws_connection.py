@@ -2,7 +2,7 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 
@@ -121,6 +121,34 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decodes_text_frames_lazily(self, ws_connect_mock):
+        json_codec = MagicMock()
+        json_codec.loads.return_value = {"one": 1}
+        ws_connection = WSConnection(self.client_session, json_codec=json_codec)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        message = json.dumps({"one": 1})
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=message)
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual(message, response.raw)
+        json_codec.loads.assert_not_called()
+        self.assertEqual({"one": 1}, response.data)
+        self.assertEqual({"one": 1}, response.data)
+        json_codec.loads.assert_called_once_with(message)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_returns_text_frames_that_are_not_json_as_received(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
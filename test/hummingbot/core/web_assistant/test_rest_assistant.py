@@ -2,12 +2,14 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, Optional
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -100,3 +102,71 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+        # The authentication is applied to a copy of the request
+        self.assertIsNone(auth_req.headers)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_does_not_copy_requests_that_are_not_processed(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]))
+        req = RESTRequest(method=RESTMethod.GET, url=url, is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertIs(req, call_request)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_encodes_data_with_json_codec(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        mocked_call.side_effect = register_request_and_return
+        json_codec = MagicMock()
+        json_codec.dumps.return_value = '{"one":1}'
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler, json_codec=json_codec)
+        headers = {"X-Custom": "value"}
+
+        self.async_run_with_timeout(assistant.execute_request_and_get_response(
+            url=url, throttler_limit_id=url, data={"one": 1}, method=RESTMethod.POST, headers=headers))
+
+        json_codec.dumps.assert_called_once_with({"one": 1})
+        self.assertEqual('{"one":1}', call_request.data)
+        self.assertEqual({"Content-Type": "application/json", "X-Custom": "value"}, call_request.headers)
+        self.assertEqual({"X-Custom": "value"}, headers)
+
+    @aioresponses()
+    def test_execute_request_with_priority(self, mocked_api):
+        url = "https://www.test.com/url"
+        resp = {"one": 1}
+        mocked_api.post(url, body=json.dumps(resp).encode())
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection=connection, throttler=throttler)
+
+        with patch.object(throttler, "execute_task", wraps=throttler.execute_task) as execute_task_mock:
+            ret = self.async_run_with_timeout(assistant.execute_request(
+                url=url, throttler_limit_id=url, method=RESTMethod.POST, priority=RequestPriority.CANCEL))
+
+        self.assertEqual(resp, ret)
+        execute_task_mock.assert_called_once_with(limit_id=url, priority=RequestPriority.CANCEL)
@@ -24,6 +24,7 @@ class WebAssistantsFactoryTest(unittest.TestCase):
         rest_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
 
         self.assertIsInstance(rest_assistant, RESTAssistant)
+        self.assertIs(rest_assistant, self.async_run_with_timeout(factory.get_rest_assistant()))
 
     def test_get_ws_assistant(self):
         factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
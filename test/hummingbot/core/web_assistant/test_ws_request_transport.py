@@ -0,0 +1,127 @@
+import asyncio
+import json
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_request_transport import WSRequestNotSentError, WSRequestTransport
+
+
+class WSRequestTransportTest(IsolatedAsyncioWrapperTestCase):
+    ws_url = "wss://some.url/ws-api"
+    limit_id = "order"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=self.limit_id, limit=10, time_interval=1)])
+        self.transport = WSRequestTransport(api_factory=WebAssistantsFactory(throttler=self.throttler),
+                                            ws_url=self.ws_url,
+                                            request_timeout=1)
+        self.unmatched_messages = []
+        self.transport._process_unmatched_message = AsyncMock(
+            side_effect=lambda message: self.unmatched_messages.append(message))
+
+    async def asyncTearDown(self) -> None:
+        self.transport.stop()
+        await super().asyncTearDown()
+
+    async def start_transport(self, ws_connect_mock: AsyncMock) -> AsyncMock:
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.transport.start()
+        await asyncio.wait_for(self.transport.wait_connected(), timeout=1)
+        return ws_connect_mock.return_value
+
+    async def sent_requests(self, websocket_mock: AsyncMock, count: int):
+        sent = self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock)
+        while len(sent) < count:
+            await asyncio.sleep(0)
+        return sent
+
+    def add_response(self, websocket_mock: AsyncMock, response: dict):
+        self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock, json.dumps(response))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_responses_are_matched_to_their_request_by_id(self, ws_connect_mock):
+        websocket_mock = await self.start_transport(ws_connect_mock)
+
+        first = asyncio.create_task(self.transport.request({"method": "order.place"}, throttler_limit_id=self.limit_id))
+        second = asyncio.create_task(self.transport.request({"method": "order.cancel"},
+                                                            throttler_limit_id=self.limit_id))
+        sent = await self.sent_requests(websocket_mock, 2)
+
+        self.assertEqual([{"id": "1", "method": "order.place"}, {"id": "2", "method": "order.cancel"}], sent)
+        self.add_response(websocket_mock, {"event": "executionReport"})
+        self.add_response(websocket_mock, {"id": "2", "result": "cancelled"})
+        self.add_response(websocket_mock, {"id": "1", "result": "placed"})
+
+        self.assertEqual({"id": "1", "result": "placed"}, await asyncio.wait_for(first, timeout=1))
+        self.assertEqual({"id": "2", "result": "cancelled"}, await asyncio.wait_for(second, timeout=1))
+        self.assertEqual([{"event": "executionReport"}], self.unmatched_messages)
+        self.assertEqual(0, self.transport.pending_requests_count)
+        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(self.ws_url, ws_connect_mock.call_args.args[0])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_payload_function_is_called_after_the_throttler_wait(self, ws_connect_mock):
+        websocket_mock = await self.start_transport(ws_connect_mock)
+        throttled = []
+        execute_task = self.throttler.execute_task
+
+        def throttled_execute_task(limit_id: str):
+            throttled.append(limit_id)
+            return execute_task(limit_id=limit_id)
+
+        self.throttler.execute_task = throttled_execute_task
+
+        def payload():
+            self.assertEqual([self.limit_id], throttled)
+            return {"method": "order.place", "signature": "signed"}
+
+        request = asyncio.create_task(self.transport.request(payload, throttler_limit_id=self.limit_id))
+        sent = await self.sent_requests(websocket_mock, 1)
+        self.add_response(websocket_mock, {"id": "1", "result": "placed"})
+
+        self.assertEqual([{"id": "1", "method": "order.place", "signature": "signed"}], sent)
+        self.assertEqual({"id": "1", "result": "placed"}, await asyncio.wait_for(request, timeout=1))
+
+    async def test_request_not_sent_while_disconnected(self):
+        self.assertFalse(self.transport.is_connected)
+
+        with self.assertRaises(WSRequestNotSentError):
+            await self.transport.request({"method": "order.place"}, throttler_limit_id=self.limit_id)
+
+        self.assertEqual(0, len(self.throttler._task_logs))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_request_timeout(self, ws_connect_mock):
+        await self.start_transport(ws_connect_mock)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.transport.request({"method": "order.place"}, throttler_limit_id=self.limit_id, timeout=0.01)
+
+        self.assertEqual(0, self.transport.pending_requests_count)
+        self.assertTrue(self.transport.is_connected)
+
+    @patch("hummingbot.core.web_assistant.ws_request_transport.WSRequestTransport._sleep")
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_pending_requests_fail_when_the_connection_is_closed(self, ws_connect_mock, sleep_mock):
+        sleep_mock.side_effect = asyncio.CancelledError
+        websocket_mock = await self.start_transport(ws_connect_mock)
+
+        request = asyncio.create_task(self.transport.request({"method": "order.place"},
+                                                             throttler_limit_id=self.limit_id))
+        await self.sent_requests(websocket_mock, 1)
+        self.mocking_assistant.add_websocket_aiohttp_exception(websocket_mock, ConnectionError("Connection reset"))
+
+        # The request could have reached the exchange, it must not be sent again through another transport
+        with self.assertRaises(ConnectionError) as context:
+            await asyncio.wait_for(request, timeout=1)
+        self.assertNotIsInstance(context.exception, WSRequestNotSentError)
+        self.assertFalse(self.transport.is_connected)
+
+        with self.assertRaises(WSRequestNotSentError):
+            await self.transport.request({"method": "order.place"}, throttler_limit_id=self.limit_id)
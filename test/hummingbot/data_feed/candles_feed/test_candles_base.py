@@ -84,7 +84,7 @@ class TestCandlesBase(unittest.TestCase, ABC):
 
     def test_ready_property(self):
         self.assertFalse(self.data_feed.ready)
-        self.data_feed._candles.extend(range(self.max_records))
+        self.data_feed._candles.extend([[timestamp] + [0] * 9 for timestamp in range(self.max_records)])
         self.assertTrue(self.data_feed.ready)
 
     def test_candles_df_property(self):
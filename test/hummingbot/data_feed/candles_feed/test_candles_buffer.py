@@ -0,0 +1,113 @@
+import unittest
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+def candle(timestamp: float) -> list:
+    return [timestamp] + [timestamp + index for index in range(1, len(CandlesBase.columns))]
+
+
+class CandlesBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.buffer = CandlesBuffer(columns=CandlesBase.columns, maxlen=3)
+
+    def assert_same_as_deque(self, expected: deque):
+        self.assertEqual(len(expected), len(self.buffer))
+        self.assertEqual([list(row) for row in expected], [row.tolist() for row in self.buffer])
+        pd.testing.assert_frame_equal(pd.DataFrame(expected, columns=CandlesBase.columns, dtype=float),
+                                      self.buffer.to_df())
+
+    def test_append_keeps_the_last_candles(self):
+        expected = deque(maxlen=3)
+        for timestamp in range(20):
+            self.buffer.append(candle(timestamp))
+            expected.append(candle(timestamp))
+            self.assert_same_as_deque(expected)
+
+        self.assertEqual(3, self.buffer.maxlen)
+        self.assertEqual(19, self.buffer[-1][0])
+        self.assertEqual(17, self.buffer[0][0])
+        with self.assertRaises(IndexError):
+            self.buffer[3]
+
+    def test_extend_and_extendleft(self):
+        expected = deque(maxlen=3)
+        self.buffer.append(candle(10))
+        expected.append(candle(10))
+
+        self.buffer.extendleft([candle(9), candle(8)])
+        expected.extendleft([candle(9), candle(8)])
+        self.assert_same_as_deque(expected)
+
+        self.buffer.extendleft([candle(7)])
+        expected.extendleft([candle(7)])
+        self.assert_same_as_deque(expected)
+
+        self.buffer.extend([candle(11), candle(12)])
+        expected.extend([candle(11), candle(12)])
+        self.assert_same_as_deque(expected)
+
+        self.buffer.clear()
+        self.assertEqual(0, len(self.buffer))
+        self.assertTrue(self.buffer.to_df().empty)
+
+    def test_candles_must_have_all_the_columns(self):
+        with self.assertRaises(ValueError):
+            self.buffer.extend(range(3))
+
+    def test_dataframe_is_cached_until_a_candle_is_added(self):
+        self.buffer.extend([candle(1), candle(2)])
+        df = self.buffer.to_df()
+        cached_df = self.buffer._df
+
+        self.buffer[-1] = candle(2.5)
+
+        # The update of the last candle is visible without rebuilding the DataFrame
+        self.assertEqual(2.5, df["timestamp"].iloc[-1])
+        self.buffer.to_df()
+        self.assertIs(cached_df, self.buffer._df)
+        self.assertTrue(np.shares_memory(df["close"].to_numpy(), self.buffer.column("close")))
+
+        self.buffer.append(candle(3))
+
+        self.assertEqual([1, 2.5, 3], self.buffer.to_df()["timestamp"].tolist())
+        self.assertEqual([1, 2.5], df["timestamp"].tolist())
+
+    def test_previous_dataframes_are_not_overwritten(self):
+        dfs = []
+        for timestamp in range(10):
+            self.buffer.append(candle(timestamp))
+            dfs.append((timestamp, self.buffer.to_df()))
+
+        for timestamp, df in dfs:
+            self.assertEqual(list(range(max(timestamp - 2, 0), timestamp + 1)), df["timestamp"].tolist())
+
+    def test_columns_added_to_the_dataframe_are_not_cached(self):
+        self.buffer.append(candle(1))
+        df = self.buffer.to_df()
+        df["signal"] = 1
+
+        self.assertNotIn("signal", self.buffer.to_df().columns)
+
+    def test_dataframe_is_read_only(self):
+        self.buffer.extend([candle(1), candle(2)])
+        df = self.buffer.to_df()
+
+        with self.assertRaises(ValueError):
+            df.loc[0, "close"] = 10
+        with self.assertRaises(ValueError):
+            df["close"].to_numpy()[0] = 10
+        self.assertEqual(candle(1)[CandlesBase.columns.index("close")], self.buffer.column("close")[0])
+
+    def test_column_is_read_only(self):
+        self.buffer.extend([candle(1), candle(2)])
+        close = self.buffer.column("close")
+
+        self.assertEqual([5.0, 6.0], close.tolist())
+        with self.assertRaises(ValueError):
+            close[0] = 0
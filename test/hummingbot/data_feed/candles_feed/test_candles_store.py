@@ -0,0 +1,196 @@
+import asyncio
+import re
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from aioresponses import CallbackResult, aioresponses
+
+from hummingbot.data_feed.candles_feed import candles_store
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+
+def build_candles_df(timestamps) -> pd.DataFrame:
+    timestamps = np.asarray(timestamps, dtype=float)
+    return pd.DataFrame({column: timestamps if column == "timestamp" else timestamps / 60 + index
+                         for index, column in enumerate(CandlesBase.columns)})
+
+
+class CandlesStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_read_empty_store(self):
+        self.assertTrue(self.store.read("binance", "BTC-USDT", "1m").empty)
+        self.assertEqual([(0, 600)], self.store.get_missing_ranges("binance", "BTC-USDT", "1m", 0, 600))
+
+    def test_write_and_read(self):
+        self.store.write("binance", "BTC-USDT", "1m", build_candles_df(range(0, 600, 60)), 0, 540)
+
+        pd.testing.assert_frame_equal(build_candles_df(range(120, 360, 60)),
+                                      self.store.read("binance", "BTC-USDT", "1m", 120, 300))
+        self.assertTrue(self.store.read("binance", "ETH-USDT", "1m").empty)
+
+    def test_write_keeps_only_the_candles_of_the_range(self):
+        self.store.write("binance", "BTC-USDT", "1m", build_candles_df(range(0, 600, 60)), 120, 300)
+
+        pd.testing.assert_frame_equal(build_candles_df(range(120, 360, 60)), self.store.read("binance", "BTC-USDT", "1m"))
+        self.assertEqual([(120, 300)], self.store.get_covered_ranges("binance", "BTC-USDT", "1m"))
+
+    def test_write_merges_the_ranges(self):
+        self.store.write("binance", "BTC-USDT", "1m", build_candles_df(range(600, 1200, 60)), 600, 1140)
+        self.store.write("binance", "BTC-USDT", "1m", build_candles_df(range(0, 300, 60)), 0, 240)
+
+        self.assertEqual([(0, 240), (600, 1140)], self.store.get_covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual([(241, 599), (1141, 1500)],
+                         self.store.get_missing_ranges("binance", "BTC-USDT", "1m", 120, 1500))
+
+        self.store.write("binance", "BTC-USDT", "1m", build_candles_df(range(240, 660, 60)), 241, 599)
+
+        self.assertEqual([(0, 1140)], self.store.get_covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual([], self.store.get_missing_ranges("binance", "BTC-USDT", "1m", 120, 1140))
+        pd.testing.assert_frame_equal(build_candles_df(range(0, 1200, 60)), self.store.read("binance", "BTC-USDT", "1m"))
+
+    def test_write_replaces_the_candles_with_the_same_timestamp(self):
+        self.store.write("binance", "BTC-USDT", "1m", build_candles_df(range(0, 300, 60)), 0, 240)
+        updated_candles = build_candles_df([120])
+        updated_candles["close"] = 1.0
+        self.store.write("binance", "BTC-USDT", "1m", updated_candles, 120, 120)
+
+        candles = self.store.read("binance", "BTC-USDT", "1m")
+        self.assertEqual(list(range(0, 300, 60)), candles["timestamp"].tolist())
+        self.assertEqual(1.0, candles["close"].iloc[2])
+
+    def test_default_candles_store(self):
+        with patch.object(candles_store, "_default_candles_store", None), \
+                patch.object(candles_store, "_candles_store_enabled", True), \
+                patch.object(candles_store, "data_path", return_value=self.temp_dir.name):
+            self.assertEqual(f"{self.temp_dir.name}/candles", candles_store.get_default_candles_store().root_path)
+            candles_store.set_default_candles_store(None)
+            self.assertIsNone(candles_store.get_default_candles_store())
+            candles_store.set_default_candles_store(self.store)
+            self.assertIs(self.store, candles_store.get_default_candles_store())
+
+
+class CandlesFeedWithStoreTest(unittest.TestCase):
+    """
+    Fetches the candles from a local stand-in of the Binance klines endpoint serving one candle per minute.
+    """
+
+    start_time = 1_700_000_000 - 1_700_000_000 % 60
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(self.temp_dir.name)
+        self.data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        self.data_feed.candles_store = self.store
+        self.requests = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 5):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def klines_callback(self, url, **kwargs):
+        params = kwargs["params"]
+        self.requests.append(params)
+        end_time = params["endTime"] // 1000
+        last_timestamp = end_time - end_time % 60
+        timestamps = range(last_timestamp - 60 * (params["limit"] - 1), last_timestamp + 1, 60)
+        return CallbackResult(payload=[
+            [timestamp * 1000, "1", "2", "0.5", str(timestamp / 60), "10", timestamp * 1000 + 59999, "100", 5, "4", "40",
+             "0"]
+            for timestamp in timestamps
+        ])
+
+    def get_historical_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        return self.async_run_with_timeout(self.data_feed.get_historical_candles(HistoricalCandlesConfig(
+            connector_name="binance", trading_pair="BTC-USDT", interval="1m", start_time=start_time,
+            end_time=end_time)))
+
+    @aioresponses()
+    def test_historical_candles_are_fetched_once(self, mock_api):
+        mock_api.get(re.compile(r"^https://api\.binance\.com/api/v3/klines"), callback=self.klines_callback,
+                     repeat=True)
+        end_time = self.start_time + 60 * 1500
+
+        candles = self.get_historical_candles(self.start_time, end_time)
+
+        self.assertEqual(list(range(self.start_time, end_time + 1, 60)), candles["timestamp"].tolist())
+        self.assertEqual([(self.start_time, end_time)], self.store.get_covered_ranges("binance", "BTC-USDT", "1m"))
+        requests_count = len(self.requests)
+
+        cached_candles = self.get_historical_candles(self.start_time + 600, end_time - 600)
+
+        self.assertEqual(requests_count, len(self.requests))
+        pd.testing.assert_frame_equal(candles.iloc[10:-10].reset_index(drop=True), cached_candles)
+
+    @aioresponses()
+    def test_only_the_missing_ranges_are_fetched(self, mock_api):
+        mock_api.get(re.compile(r"^https://api\.binance\.com/api/v3/klines"), callback=self.klines_callback,
+                     repeat=True)
+        self.get_historical_candles(self.start_time + 6000, self.start_time + 12000)
+        self.requests.clear()
+
+        candles = self.get_historical_candles(self.start_time, self.start_time + 18000)
+
+        self.assertEqual(list(range(self.start_time, self.start_time + 18001, 60)), candles["timestamp"].tolist())
+        self.assertEqual(2, len(self.requests))
+        # Each missing range is fetched up to one interval after its end
+        self.assertEqual({(self.start_time + 5999 + 60) * 1000, (self.start_time + 18000 + 60) * 1000},
+                         {request["endTime"] for request in self.requests})
+        self.assertEqual([(self.start_time, self.start_time + 18000)],
+                         self.store.get_covered_ranges("binance", "BTC-USDT", "1m"))
+
+    @aioresponses()
+    def test_candles_in_progress_are_not_stored(self, mock_api):
+        mock_api.get(re.compile(r"^https://api\.binance\.com/api/v3/klines"), callback=self.klines_callback,
+                     repeat=True)
+        end_time = self.start_time + 600
+
+        with patch.object(BinanceSpotCandles, "_time", return_value=end_time + 30):
+            candles = self.get_historical_candles(self.start_time, end_time)
+
+        self.assertEqual(end_time, candles["timestamp"].iloc[-1])
+        self.assertEqual([(self.start_time, end_time - 30)], self.store.get_covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual(end_time - 60, self.store.read("binance", "BTC-USDT", "1m")["timestamp"].iloc[-1])
+
+    @aioresponses()
+    def test_fill_historical_candles_reads_the_store_first(self, mock_api):
+        mock_api.get(re.compile(r"^https://api\.binance\.com/api/v3/klines"), callback=self.klines_callback,
+                     repeat=True)
+        self.data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=100)
+        self.data_feed.candles_store = self.store
+        ws_candle_timestamp = self.start_time + 6000
+        ws_candle = build_candles_df([ws_candle_timestamp]).to_numpy()[0]
+
+        self.data_feed._candles.append(ws_candle)
+        self.data_feed._ws_candle_available.set()
+        self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual(list(range(ws_candle_timestamp - 99 * 60, ws_candle_timestamp + 1, 60)),
+                         self.data_feed.candles_df["timestamp"].tolist())
+        covered_ranges = self.store.get_covered_ranges("binance", "BTC-USDT", "1m")
+        self.assertEqual(1, len(covered_ranges))
+        self.assertLessEqual(covered_ranges[0][0], ws_candle_timestamp - 99 * 60)
+        self.assertEqual(ws_candle_timestamp - 1, covered_ranges[0][1])
+
+        self.data_feed._candles.clear()
+        self.data_feed._candles.append(ws_candle)
+        self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual(100, len(self.data_feed.candles_df))
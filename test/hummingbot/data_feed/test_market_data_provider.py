@@ -59,12 +59,16 @@ class TestMarketDataProvider(unittest.TestCase):
 
     def test_get_order_book_snapshot(self):
         mock_order_book = MagicMock()
-        mock_order_book.snapshot = (pd.DataFrame(), pd.DataFrame())
+        mock_order_book.get_snapshot.return_value = (pd.DataFrame(), pd.DataFrame())
         self.mock_connector.get_order_book.return_value = mock_order_book
         snapshot = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT")
         self.assertIsInstance(snapshot, tuple)
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
+        mock_order_book.get_snapshot.assert_called_with(None)
+
+        self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT", depth=5)
+        mock_order_book.get_snapshot.assert_called_with(5)
 
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.batched_sql_writer import BatchedSQLWriter
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class BatchedSQLWriterTests(TestCase):
+    level = 0
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.log_records = []
+        engine_mock.return_value = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.writer = BatchedSQLWriter(self.manager)
+        self.writer.logger().setLevel(1)
+        self.writer.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.writer.stop()
+        self.writer.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    @staticmethod
+    def _market_state(market: str) -> MarketState:
+        return MarketState(config_file_path="test_config", market=market, timestamp=1, saved_state={})
+
+    def _stored_markets(self):
+        with self.manager.get_new_session() as session:
+            return [market_state.market for market_state in session.query(MarketState).order_by(MarketState.id)]
+
+    def test_operations_queued_during_a_transaction_are_written_in_the_next_one(self):
+        write_started = threading.Event()
+        release_write = threading.Event()
+        transactions = []
+
+        def blocking_write(session):
+            write_started.set()
+            release_write.wait(1)
+            session.add(self._market_state("market_0"))
+
+        def write(market: str):
+            def operation(session):
+                transactions.append(session)
+                session.add(self._market_state(market))
+            return operation
+
+        self.writer.submit(blocking_write)
+        write_started.wait(1)
+        for i in range(1, 4):
+            self.writer.submit(write(f"market_{i}"))
+        self.assertEqual(4, self.writer.pending_operations)
+
+        release_write.set()
+        self.writer.flush()
+
+        self.assertEqual(0, self.writer.pending_operations)
+        self.assertEqual(["market_0", "market_1", "market_2", "market_3"], self._stored_markets())
+        self.assertEqual(1, len(set(transactions)))
+
+    def test_wait_until_written_does_not_block_the_event_loop(self):
+        release_write = threading.Event()
+
+        def blocking_write(session):
+            release_write.wait(1)
+            session.add(self._market_state("market_0"))
+
+        async def wait_until_written():
+            self.writer.submit(blocking_write)
+            wait_task = asyncio.ensure_future(self.writer.wait_until_written())
+            await asyncio.sleep(0.01)
+            # The event loop keeps running while the write is pending
+            self.assertFalse(wait_task.done())
+            release_write.set()
+            await asyncio.wait_for(wait_task, timeout=1)
+
+        ev_loop = asyncio.new_event_loop()
+        try:
+            ev_loop.run_until_complete(wait_until_written())
+        finally:
+            ev_loop.close()
+
+        self.assertEqual(0, self.writer.pending_operations)
+        self.assertEqual(["market_0"], self._stored_markets())
+
+    def test_failed_operation_does_not_discard_the_rest_of_the_batch(self):
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def blocking_write(session):
+            write_started.set()
+            release_write.wait(1)
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        self.writer.submit(blocking_write)
+        write_started.wait(1)
+        self.writer.submit(lambda session: session.add(self._market_state("market_1")))
+        self.writer.submit(failing_write)
+        self.writer.submit(lambda session: session.add(self._market_state("market_2")))
+        release_write.set()
+        self.writer.flush()
+
+        self.assertEqual(["market_1", "market_2"], self._stored_markets())
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error while writing to the database."))
+
+    def test_callbacks_run_after_commit(self):
+        committed_markets = []
+        self.writer.submit(lambda session: (session.add(self._market_state("market_1")),
+                                            lambda: committed_markets.extend(self._stored_markets()))[1])
+        self.writer.flush()
+
+        self.assertEqual(["market_1"], committed_markets)
+
+    def test_stop_writes_pending_operations_and_submit_restarts_the_writer(self):
+        self.writer.submit(lambda session: session.add(self._market_state("market_1")))
+        self.writer.stop()
+
+        self.assertEqual(["market_1"], self._stored_markets())
+        self.assertEqual(0, self.writer.pending_operations)
+
+        self.writer.submit(lambda session: session.add(self._market_state("market_2")))
+        self.writer.flush()
+
+        self.assertEqual(["market_1", "market_2"], self._stored_markets())
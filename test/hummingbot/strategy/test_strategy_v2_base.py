@@ -52,6 +52,19 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         self.strategy.tick(self.start_timestamp + 10)
         self.assertTrue(self.strategy.ready_to_trade)
 
+    def test_use_shared_scheduler_is_passed_to_the_executor_orchestrator(self):
+        for use_shared_scheduler in (False, True):
+            config = StrategyV2ConfigBase(markets={self.connector_name: {self.trading_pair}},
+                                          candles_config=[],
+                                          use_shared_scheduler=use_shared_scheduler)
+            with patch('asyncio.create_task', return_value=AsyncMock()):
+                with patch("hummingbot.strategy.strategy_v2_base.StrategyV2Base.listen_to_executor_actions",
+                           return_value=AsyncMock()):
+                    with patch('hummingbot.strategy.strategy_v2_base.MarketDataProvider'):
+                        strategy = StrategyV2Base({self.connector_name: self.connector}, config=config)
+
+            self.assertEqual(use_shared_scheduler, strategy.executor_orchestrator.use_shared_scheduler)
+
     def test_init_markets(self):
         StrategyV2Base.init_markets(self.strategy_config)
         self.assertIn(self.connector_name, StrategyV2Base.markets)
@@ -0,0 +1,166 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting import DirectionalTradingBacktesting, MarketMakingBacktesting
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.controllers.market_making_controller_base import (
+    MarketMakingControllerBase,
+    MarketMakingControllerConfigBase,
+)
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+def build_candles(length: int = 600) -> pd.DataFrame:
+    random_generator = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(random_generator.normal(0, 0.003, length)))
+    return pd.DataFrame({
+        "timestamp": 1_700_000_000 + 60.0 * np.arange(length),
+        "open": close,
+        "high": close * 1.001,
+        "low": close * 0.999,
+        "close": close,
+        "volume": random_generator.random(length),
+    })
+
+
+CANDLES = build_candles()
+
+
+class MomentumController(DirectionalTradingControllerBase):
+    async def update_processed_data(self):
+        features = CANDLES.copy()
+        momentum = features["close"].pct_change(10)
+        features["signal"] = np.where(momentum > 0.01, 1, np.where(momentum < -0.01, -1, 0))
+        self.processed_data["features"] = features
+
+
+class MomentumDCAController(MomentumController):
+    def get_executor_config(self, trade_type: TradeType, price: Decimal, amount: Decimal):
+        price_step = Decimal("-0.003") if trade_type == TradeType.BUY else Decimal("0.003")
+        return DCAExecutorConfig(
+            timestamp=self.market_data_provider.time(),
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            side=trade_type,
+            prices=[price * (1 + price_step * level) for level in range(3)],
+            amounts_quote=[amount * price / 3] * 3,
+            take_profit=Decimal("0.01"),
+            stop_loss=Decimal("0.02"),
+            time_limit=self.config.time_limit,
+        )
+
+
+class SimpleMarketMakingController(MarketMakingControllerBase):
+    def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
+        return PositionExecutorConfig(
+            timestamp=self.market_data_provider.time(),
+            level_id=level_id,
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            entry_price=price,
+            amount=amount,
+            triple_barrier_config=self.config.triple_barrier_config,
+            leverage=self.config.leverage,
+            side=self.get_trade_type_from_level_id(level_id),
+        )
+
+
+class BacktestingEngineBaseTest(unittest.TestCase):
+    @staticmethod
+    def directional_config(**kwargs) -> DirectionalTradingControllerConfigBase:
+        return DirectionalTradingControllerConfigBase(
+            id="directional", controller_name="momentum", connector_name="binance", trading_pair="ETH-USDT",
+            total_amount_quote=Decimal(1000), max_executors_per_side=2, cooldown_time=600, **kwargs)
+
+    @staticmethod
+    def market_making_config() -> MarketMakingControllerConfigBase:
+        return MarketMakingControllerConfigBase(
+            id="market_making", controller_name="simple", connector_name="binance", trading_pair="ETH-USDT",
+            total_amount_quote=Decimal(1000), buy_spreads=[0.002, 0.005], sell_spreads=[0.002, 0.005],
+            executor_refresh_time=600, cooldown_time=300, stop_loss=Decimal("0.02"), take_profit=Decimal("0.005"),
+            time_limit=3600)
+
+    @staticmethod
+    def simulate(engine: BacktestingEngineBase, controller_class, config) -> List[ExecutorInfo]:
+        engine.backtesting_data_provider.update_backtesting_time(int(CANDLES["timestamp"].iloc[0]),
+                                                                 int(CANDLES["timestamp"].iloc[-1]))
+        engine.backtesting_data_provider.candles_feeds = {"binance_ETH-USDT_1m": CANDLES}
+        engine.backtesting_resolution = "1m"
+        engine.controller = controller_class(config=config, market_data_provider=engine.backtesting_data_provider,
+                                             actions_queue=None)
+        asyncio.get_event_loop().run_until_complete(engine.controller.update_processed_data())
+        return engine.simulate_execution(trade_cost=0.0006)
+
+    def assert_same_executors_info(self, executors_info: List[ExecutorInfo], expected: List[ExecutorInfo]):
+        def comparable(executor_info: ExecutorInfo) -> dict:
+            # The executors ids are random
+            executor_info_dict = executor_info.to_dict()
+            executor_info_dict.pop("id")
+            executor_info_dict["config"].pop("id")
+            return executor_info_dict
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual([comparable(executor_info) for executor_info in expected],
+                         [comparable(executor_info) for executor_info in executors_info])
+
+    def assert_vectorized_simulation_is_the_same(self, engine_class, controller_class, config_factory):
+        executors_info = self.simulate(engine_class(), controller_class, config_factory())
+        vectorized_executors_info = self.simulate(engine_class(vectorized=True), controller_class, config_factory())
+
+        self.assertIsInstance(vectorized_executors_info, list)
+        self.assert_same_executors_info(vectorized_executors_info, executors_info)
+        self.assertEqual(BacktestingEngineBase.summarize_results(executors_info),
+                         BacktestingEngineBase.summarize_results(vectorized_executors_info))
+
+    def test_vectorized_directional_trading_simulation(self):
+        self.assert_vectorized_simulation_is_the_same(
+            DirectionalTradingBacktesting, MomentumController,
+            lambda: self.directional_config(stop_loss=Decimal("0.02"), take_profit=Decimal("0.01"), time_limit=3600 * 3))
+
+    def test_vectorized_simulation_with_trailing_stop_and_no_time_limit(self):
+        self.assert_vectorized_simulation_is_the_same(
+            DirectionalTradingBacktesting, MomentumController,
+            lambda: self.directional_config(stop_loss=Decimal("0.03"), take_profit=Decimal("0.02"), time_limit=None,
+                                            trailing_stop="0.008,0.002"))
+
+    def test_vectorized_dca_simulation(self):
+        self.assert_vectorized_simulation_is_the_same(
+            DirectionalTradingBacktesting, MomentumDCAController,
+            lambda: self.directional_config(time_limit=3600 * 4))
+
+    def test_vectorized_market_making_simulation(self):
+        self.assert_vectorized_simulation_is_the_same(
+            MarketMakingBacktesting, SimpleMarketMakingController, self.market_making_config)
+
+    def test_vectorized_simulation_early_stops_refreshed_executors(self):
+        executors_info = self.simulate(MarketMakingBacktesting(vectorized=True), SimpleMarketMakingController,
+                                       self.market_making_config())
+
+        early_stopped = [executor_info for executor_info in executors_info
+                         if executor_info.close_type == CloseType.EARLY_STOP]
+        self.assertGreater(len(early_stopped), 0)
+        self.assertTrue(all(not executor_info.is_active for executor_info in early_stopped))
+
+    def test_simulation_end_index(self):
+        timestamps = np.array([0.0, 60.0, 120.0, 180.0])
+        config = DCAExecutorConfig(timestamp=0, connector_name="binance", trading_pair="ETH-USDT",
+                                   side=TradeType.BUY, prices=[Decimal(100)], amounts_quote=[Decimal(10)],
+                                   time_limit=120)
+
+        self.assertEqual(3, BacktestingEngineBase.get_simulation_end_index(config, timestamps))
+
+        config.time_limit = None
+        self.assertIsNone(BacktestingEngineBase.get_simulation_end_index(config, timestamps))
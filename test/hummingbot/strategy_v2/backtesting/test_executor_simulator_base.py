@@ -0,0 +1,98 @@
+import operator
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ExecutorSimulationTest(unittest.TestCase):
+    def setUp(self):
+        self.config = PositionExecutorConfig(timestamp=60, connector_name="binance", trading_pair="ETH-USDT",
+                                             side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(1))
+        self.simulation = ExecutorSimulation(
+            config=self.config,
+            executor_simulation=pd.DataFrame({
+                "timestamp": [60.0, 120.0, 180.0],
+                "close": [100.0, 101.0, 102.0],
+                "net_pnl_pct": [0.0, 0.01, 0.02],
+                "net_pnl_quote": [0.0, 1.0, 2.0],
+                "cum_fees_quote": [0.1, 0.1, 0.1],
+                "filled_amount_quote": [100.0, 100.0, 100.0],
+            }, index=[7, 8, 9]),
+            close_type=CloseType.TAKE_PROFIT)
+
+    def test_executor_info_before_the_simulation_starts(self):
+        executor_info = self.simulation.get_executor_info_at_timestamp(30)
+
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(Decimal(0), executor_info.net_pnl_quote)
+        self.assertFalse(executor_info.is_active)
+
+    def test_executor_info_while_the_executor_is_active(self):
+        executor_info = self.simulation.get_executor_info_at_timestamp(150)
+
+        self.assertEqual(RunnableStatus.RUNNING, executor_info.status)
+        self.assertEqual(Decimal(1), executor_info.net_pnl_quote)
+        self.assertTrue(executor_info.is_active)
+        self.assertTrue(executor_info.is_trading)
+        self.assertIsNone(executor_info.close_type)
+        self.assertEqual(101.0, executor_info.custom_info["close_price"])
+        self.assertIsNone(executor_info.custom_info["current_position_average_price"])
+
+    def test_executor_info_once_the_executor_is_closed(self):
+        executor_info = self.simulation.get_executor_info_at_timestamp(1000)
+
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(CloseType.TAKE_PROFIT, executor_info.close_type)
+        self.assertEqual(180.0, executor_info.close_timestamp)
+        self.assertEqual(Decimal(2), executor_info.net_pnl_quote)
+        self.assertFalse(executor_info.is_trading)
+
+
+class ExecutorSimulatorBaseTest(unittest.TestCase):
+    def test_compare_with_decimal_threshold_is_exact(self):
+        value = 0.1
+        # The thresholds closest to the float value, below and above it
+        thresholds = [Decimal(value), Decimal(value) - Decimal("1e-25"), Decimal(value) + Decimal("1e-25")]
+        values = np.array([np.nextafter(value, -np.inf), value, np.nextafter(value, np.inf)])
+
+        for threshold in thresholds:
+            for comparison in (operator.lt, operator.le, operator.gt, operator.ge):
+                expected = [comparison(v, threshold) for v in values.tolist()]
+                self.assertEqual(expected, ExecutorSimulatorBase.compare(values, comparison, threshold).tolist())
+
+    def test_first_index_and_timestamp(self):
+        timestamps = np.array([60.0, 120.0, 180.0])
+
+        self.assertEqual(1, ExecutorSimulatorBase.first_index(np.array([False, True, True])))
+        self.assertIsNone(ExecutorSimulatorBase.first_index(np.array([False, False, False])))
+        self.assertIsNone(ExecutorSimulatorBase.first_index(np.array([], dtype=bool)))
+        self.assertEqual(180.0, ExecutorSimulatorBase.first_timestamp(timestamps, np.array([False, False, True])))
+        self.assertTrue(np.isnan(ExecutorSimulatorBase.first_timestamp(timestamps, np.array([False, False, False]))))
+
+    def test_build_simulation_df(self):
+        market_data = pd.DataFrame({"timestamp": [60.0, 120.0], "close": [100.0, 101.0]}, index=[3, 4])
+
+        simulation_df = ExecutorSimulatorBase.build_simulation_df(
+            market_data, {"net_pnl_pct": np.array([0.0, 0.01]), "filled_amount_quote": 0.0})
+
+        expected = market_data.copy()
+        expected["net_pnl_pct"] = [0.0, 0.01]
+        expected["filled_amount_quote"] = 0.0
+        pd.testing.assert_frame_equal(expected, simulation_df)
+
+    def test_build_simulation_df_replaces_market_data_columns(self):
+        market_data = pd.DataFrame({"timestamp": [60.0, 120.0], "ts": [1.0, 2.0], "close": [100.0, 101.0]})
+
+        simulation_df = ExecutorSimulatorBase.build_simulation_df(market_data, {"ts": np.array([3.0, 4.0])})
+
+        self.assertEqual(["timestamp", "ts", "close"], list(simulation_df.columns))
+        self.assertEqual([3.0, 4.0], simulation_df["ts"].tolist())
+        self.assertEqual([1.0, 2.0], market_data["ts"].tolist())
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.backtesting import parameter_sweep
+from hummingbot.strategy_v2.backtesting.parameter_sweep import ParameterSweep
+
+
+def build_candles(length: int = 300) -> pd.DataFrame:
+    random_generator = np.random.default_rng(2)
+    close = 100 * np.exp(np.cumsum(random_generator.normal(0, 0.003, length)))
+    return pd.DataFrame({
+        "timestamp": 1_700_000_000 + 60.0 * np.arange(length),
+        "open": close,
+        "high": close * 1.001,
+        "low": close * 0.999,
+        "close": close,
+        "volume": random_generator.random(length),
+    })
+
+
+class ParameterSweepTest(unittest.TestCase):
+    def setUp(self):
+        self.candles = build_candles()
+        self.start = int(self.candles["timestamp"].iloc[0])
+        self.end = int(self.candles["timestamp"].iloc[-1])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.temp_dir.name, "results.csv")
+        self.base_config = {
+            "controller_name": "pmm_simple",
+            "controller_type": "market_making",
+            "connector_name": "binance",
+            "trading_pair": "ETH-USDT",
+            "total_amount_quote": 1000,
+            "buy_spreads": [0.002, 0.005],
+            "sell_spreads": [0.002, 0.005],
+            "executor_refresh_time": 600,
+            "stop_loss": 0.02,
+            "time_limit": 3600,
+        }
+        self.configs = ParameterSweep.expand_grid(self.base_config, {"take_profit": [0.003, 0.006],
+                                                                     "cooldown_time": [60, 300]})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def sweep(self, configs, max_workers: int = 1) -> ParameterSweep:
+        return ParameterSweep(configs=configs, start=self.start, end=self.end, results_path=self.results_path,
+                              max_workers=max_workers, candles_feeds={"binance_ETH-USDT_1m": self.candles})
+
+    def test_expand_grid(self):
+        self.assertEqual(4, len(self.configs))
+        self.assertEqual({(0.003, 60), (0.003, 300), (0.006, 60), (0.006, 300)},
+                         {(config["take_profit"], config["cooldown_time"]) for config in self.configs})
+        self.assertTrue(all(config["stop_loss"] == 0.02 for config in self.configs))
+        self.assertEqual(["cooldown_time", "take_profit"], ParameterSweep.varying_parameters(self.configs))
+
+    def test_config_key_ignores_the_config_id(self):
+        sweep = self.sweep(self.configs)
+
+        self.assertEqual(sweep.config_key(self.configs[0]), sweep.config_key({"id": "other", **self.configs[0]}))
+        self.assertNotEqual(sweep.config_key(self.configs[0]), sweep.config_key(self.configs[1]))
+
+    def test_config_id_is_replaced_by_the_config_key(self):
+        sweep = self.sweep([{"id": "other", **self.configs[0]}])
+
+        self.assertEqual([(sweep.config_key(self.configs[0]), sweep.config_key(self.configs[0]))],
+                         [(config_key, config_data["id"]) for config_key, config_data in sweep.pending_configs().items()])
+
+    def test_run_records_a_row_per_config(self):
+        results = asyncio.run(self.sweep(self.configs).run())
+
+        self.assertEqual(4, len(results))
+        self.assertEqual(["config_key", "cooldown_time", "take_profit"], list(results.columns[:3]))
+        self.assertIn("net_pnl_quote", results.columns)
+        self.assertTrue((results["total_executors"] > 0).all())
+        config = json.loads(results["config"].iloc[0])
+        self.assertEqual(results["config_key"].iloc[0], config["id"])
+
+    def test_run_resumes_the_sweep(self):
+        asyncio.run(self.sweep(self.configs[:2]).run())
+
+        with patch.object(parameter_sweep, "_backtest", wraps=parameter_sweep._backtest) as mock:
+            results = asyncio.run(self.sweep(self.configs).run())
+
+        self.assertEqual(2, mock.call_count)
+        self.assertEqual(4, len(results))
+        self.assertEqual(4, results["config_key"].nunique())
+
+    def test_failed_configs_are_not_recorded(self):
+        configs = self.configs[:1] + [{**self.base_config, "controller_name": "unknown"}]
+
+        with self.assertLogs(ParameterSweep.logger(), level="ERROR"):
+            results = asyncio.run(self.sweep(configs).run())
+
+        self.assertEqual(1, len(results))
+
+    def test_run_in_worker_processes(self):
+        results = asyncio.run(self.sweep(self.configs, max_workers=2).run())
+        sequential_results_path = os.path.join(self.temp_dir.name, "sequential.csv")
+        sequential_sweep = ParameterSweep(configs=self.configs, start=self.start, end=self.end,
+                                          results_path=sequential_results_path, max_workers=1,
+                                          candles_feeds={"binance_ETH-USDT_1m": self.candles})
+        sequential_results = asyncio.run(sequential_sweep.run())
+
+        pd.testing.assert_frame_equal(sequential_results.sort_values("config_key").reset_index(drop=True),
+                                      results.sort_values("config_key").reset_index(drop=True))
@@ -0,0 +1,77 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_rows import BacktestingRows
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.vectorized_simulation import ExecutorsInfoView, ScheduledSimulation
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class VectorizedSimulationTest(unittest.TestCase):
+    def setUp(self):
+        self.timestamps = 60.0 * np.arange(10)
+        config = PositionExecutorConfig(timestamp=120, connector_name="binance", trading_pair="ETH-USDT",
+                                        side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(1))
+        self.simulation = ExecutorSimulation(
+            config=config,
+            executor_simulation=pd.DataFrame({
+                "timestamp": self.timestamps[2:6],
+                "close": [100.0, 101.0, 102.0, 103.0],
+                "net_pnl_pct": [0.0, 0.01, 0.02, 0.03],
+                "net_pnl_quote": [0.0, 1.0, 2.0, 3.0],
+                "cum_fees_quote": [0.0, 0.0, 0.0, 0.0],
+                "filled_amount_quote": [100.0, 100.0, 100.0, 100.0],
+            }),
+            close_type=CloseType.TIME_LIMIT)
+
+    def test_scheduled_simulation(self):
+        scheduled_simulation = ScheduledSimulation(self.simulation, first_tick=3, timestamps=self.timestamps)
+
+        self.assertEqual(5, scheduled_simulation.end_tick)
+        self.assertEqual(1, scheduled_simulation.row_at(3))
+        self.assertEqual(3, scheduled_simulation.row_at(5))
+        self.assertTrue(scheduled_simulation.executor_info_at(4).is_active)
+        self.assertFalse(scheduled_simulation.executor_info_at(5).is_active)
+        for tick in range(3, 6):
+            self.assertEqual(self.simulation.get_executor_info_at_timestamp(self.timestamps[tick]),
+                             scheduled_simulation.executor_info_at(tick))
+
+    def test_scheduled_simulation_terminated_before_it_starts(self):
+        scheduled_simulation = ScheduledSimulation(self.simulation, first_tick=1, timestamps=self.timestamps)
+
+        self.assertEqual(1, scheduled_simulation.end_tick)
+
+    def test_executors_info_view_is_built_when_read(self):
+        scheduled_simulation = ScheduledSimulation(self.simulation, first_tick=3, timestamps=self.timestamps)
+        stopped_executors_info = [self.simulation.get_executor_info_at_timestamp(1000)]
+
+        with patch.object(ScheduledSimulation, "executor_info_at", wraps=scheduled_simulation.executor_info_at) as mock:
+            view = ExecutorsInfoView([scheduled_simulation], tick=4, stopped_executors_info=stopped_executors_info)
+            # Executors stopped after the view is created are not part of it
+            stopped_executors_info.append(self.simulation.get_executor_info_at_timestamp(1000))
+
+            self.assertEqual(2, len(view))
+            mock.assert_not_called()
+            executors_info = list(view)
+            self.assertEqual(2, len(executors_info))
+            self.assertTrue(executors_info[0].is_active)
+            self.assertFalse(view[1].is_active)
+            mock.assert_called_once()
+
+    def test_backtesting_rows(self):
+        rows = BacktestingRows(pd.DataFrame({"timestamp": [60.0, 120.0], "signal": [0, 1]}, index=[5, 6]))
+        row = rows[1]
+
+        self.assertEqual(2, len(rows))
+        self.assertEqual(120.0, row["timestamp"])
+        self.assertEqual(1, row["signal"])
+        self.assertIn("signal", row)
+        self.assertNotIn("close", row)
+        self.assertIsNone(row.get("close"))
+        self.assertEqual({"timestamp": 120.0, "signal": 1}, dict(row))
@@ -18,6 +18,7 @@ from hummingbot.core.event.events import (
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
 
@@ -152,6 +153,28 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.stop()
         self.assertEqual(RunnableStatus.TERMINATED, self.component.status)
 
+    def test_placed_order_events_routed_to_the_executor(self):
+        connector = self.strategy.connectors["connector1"]
+        self.component.register_events()
+        router = OrderEventRouter.for_connector(connector)
+
+        buy_order_id = self.component.place_order(
+            connector_name="connector1",
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            side=TradeType.BUY,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+        )
+
+        self.assertEqual([self.component], router.executors)
+        self.assertIs(self.component, router._order_executors[buy_order_id])
+
+        self.component.unregister_events()
+
+        self.assertEqual([], router.executors)
+        self.assertNotIn(buy_order_id, router._order_executors)
+
     @patch.object(ExecutorBase, "get_net_pnl_pct")
     @patch.object(ExecutorBase, "get_net_pnl_quote")
     @patch.object(ExecutorBase, "get_cum_fees_quote")
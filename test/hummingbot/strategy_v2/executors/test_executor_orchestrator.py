@@ -75,6 +75,49 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.executors["test"]), 4)
 
+    @patch.object(PositionExecutor, "start")
+    def test_executors_of_a_controller_share_a_scheduler(self, position_start_mock: MagicMock):
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy, executors_update_interval=2.0,
+                                            use_shared_scheduler=True)
+        actions = [
+            CreateExecutorAction(
+                executor_config=PositionExecutorConfig(
+                    timestamp=1234, connector_name="binance", trading_pair="ETH-USDT", side=TradeType.BUY,
+                    entry_price=Decimal(100), amount=Decimal(10)),
+                controller_id=controller_id)
+            for controller_id in ("test", "test", "other")
+        ]
+
+        orchestrator.execute_actions(actions)
+
+        self.assertEqual({"test", "other"}, set(orchestrator.schedulers))
+        self.assertEqual(2.0, orchestrator.schedulers["test"].update_interval)
+        test_executors = orchestrator.executors["test"]
+        self.assertIs(orchestrator.schedulers["test"], test_executors[0]._scheduler)
+        self.assertIs(orchestrator.schedulers["test"], test_executors[1]._scheduler)
+        self.assertIs(orchestrator.schedulers["other"], orchestrator.executors["other"][0]._scheduler)
+
+    @patch.object(PositionExecutor, "start")
+    def test_actions_are_executed_in_a_batched_orders_context(self, position_start_mock: MagicMock):
+        batched_orders_context = self.mock_strategy.connectors["binance"].batched_orders.return_value
+        position_start_mock.side_effect = lambda: self.assertFalse(batched_orders_context.__exit__.called)
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy, use_shared_scheduler=True)
+        actions = [
+            CreateExecutorAction(
+                executor_config=PositionExecutorConfig(
+                    timestamp=1234, connector_name="binance", trading_pair="ETH-USDT", side=TradeType.BUY,
+                    entry_price=Decimal(100), amount=Decimal(10)),
+                controller_id="test")
+            for _ in range(2)
+        ]
+
+        orchestrator.execute_actions(actions)
+
+        self.assertEqual(2, position_start_mock.call_count)
+        self.assertEqual(1, batched_orders_context.__enter__.call_count)
+        self.assertEqual(1, batched_orders_context.__exit__.call_count)
+        self.assertEqual(orchestrator.batched_orders, orchestrator.schedulers["test"].tick_context)
+
     @patch.object(MarketsRecorder, "store_or_update_executor")
     def test_execute_actions_store_executor_active(self, store_or_update_executor_mock: MagicMock):
         position_executor = MagicMock(spec=PositionExecutor)
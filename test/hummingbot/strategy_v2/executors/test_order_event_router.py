@@ -0,0 +1,120 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy_v2.executors.order_event_router import OrderEventRouter
+
+
+class OrderEventRouterTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = PubSub()
+        self.router = OrderEventRouter.for_connector(self.connector)
+        self.executor_1 = MagicMock()
+        self.executor_2 = MagicMock()
+
+    def tearDown(self) -> None:
+        for executor in self.router.executors:
+            self.router.unregister_executor(executor)
+        super().tearDown()
+
+    @staticmethod
+    def _fill_event(order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1234567890,
+            order_id=order_id,
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    @staticmethod
+    def _created_event(order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1234567890,
+            type=OrderType.LIMIT,
+            trading_pair="ETH-USDT",
+            amount=Decimal("1"),
+            price=Decimal("1000"),
+            order_id=order_id,
+            creation_timestamp=1234567890,
+        )
+
+    def test_one_listener_per_connector_for_all_the_executors(self):
+        self.router.register_executor(self.executor_1)
+        self.router.register_executor(self.executor_2)
+
+        self.assertIs(self.router, OrderEventRouter.for_connector(self.connector))
+        for event, _ in OrderEventRouter.EVENT_PROCESSORS:
+            self.assertEqual(1, len(self.connector.get_listeners(event)))
+
+    def test_events_routed_only_to_the_executor_that_owns_the_order(self):
+        self.router.register_executor(self.executor_1)
+        self.router.register_executor(self.executor_2)
+        self.router.register_order(self.executor_1, "OID1")
+        self.router.register_order(self.executor_2, "OID2")
+
+        fill_event = self._fill_event("OID2")
+        self.connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID3"))
+
+        self.executor_1.process_order_filled_event.assert_not_called()
+        self.executor_2.process_order_filled_event.assert_called_once_with(
+            MarketEvent.OrderFilled.value, self.connector, fill_event)
+
+    def test_events_triggered_while_placing_an_order_routed_to_the_placing_executor(self):
+        self.router.register_executor(self.executor_1)
+        self.router.register_executor(self.executor_2)
+        created_event = self._created_event("OID1")
+
+        def place() -> str:
+            self.connector.trigger_event(MarketEvent.BuyOrderCreated, created_event)
+            self.executor_2.process_order_created_event.assert_not_called()
+            return "OID1"
+
+        self.assertEqual("OID1", self.router.place_order(self.executor_2, place))
+        fill_event = self._fill_event("OID1")
+        self.connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+
+        self.executor_1.process_order_created_event.assert_not_called()
+        self.executor_2.process_order_created_event.assert_called_once_with(
+            MarketEvent.BuyOrderCreated.value, self.connector, created_event)
+        self.executor_2.process_order_filled_event.assert_called_once_with(
+            MarketEvent.OrderFilled.value, self.connector, fill_event)
+
+    def test_events_of_other_orders_triggered_while_placing_an_order_are_dropped(self):
+        self.router.register_executor(self.executor_1)
+
+        def place() -> str:
+            self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID2"))
+            return "OID1"
+
+        self.router.place_order(self.executor_1, place)
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID2"))
+
+        self.executor_1.process_order_filled_event.assert_not_called()
+        self.router.unregister_executor(self.executor_1)
+        self.assertEqual({}, self.router._order_executors)
+
+    def test_unregister_last_executor_stops_listening_to_the_connector(self):
+        self.router.register_executor(self.executor_1)
+        self.router.register_executor(self.executor_2)
+        self.router.register_order(self.executor_1, "OID1")
+
+        self.router.unregister_executor(self.executor_1)
+        self.connector.trigger_event(MarketEvent.OrderFilled, self._fill_event("OID1"))
+
+        self.executor_1.process_order_filled_event.assert_not_called()
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+        self.router.unregister_executor(self.executor_2)
+
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        self.assertIsNot(self.router, OrderEventRouter.for_connector(self.connector))
@@ -1,9 +1,12 @@
 import asyncio
+import time
+from contextlib import contextmanager
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List
 
 from hummingbot.strategy_v2.models.base import RunnableStatus
-from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_base import RunnableBase, RunnableScheduler
 
 
 class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
@@ -25,3 +28,114 @@ class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.start()
         await asyncio.sleep(0.05)
         self.is_logged("Test", "error")
+
+
+class RecordingRunnable(RunnableBase):
+    def __init__(self, name: str, calls: List[str], task_time: float = 0.0):
+        super().__init__(update_interval=0.1)
+        self.name = name
+        self.calls = calls
+        self.task_time = task_time
+
+    def on_start(self):
+        self.calls.append(f"{self.name}.on_start")
+
+    def on_stop(self):
+        self.calls.append(f"{self.name}.on_stop")
+
+    async def control_task(self):
+        self.calls.append(f"{self.name}.control_task")
+        if self.task_time > 0:
+            time.sleep(self.task_time)
+
+
+class TestRunnableScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = RunnableScheduler(update_interval=0.05, task_time_budget=0.01)
+        self.set_loggers(loggers=[self.scheduler.logger()])
+        self.calls: List[str] = []
+
+    async def asyncTearDown(self):
+        self.scheduler.stop()
+        await super().asyncTearDown()
+
+    async def test_runnables_run_in_start_order_from_a_single_loop(self):
+        runnables = [RecordingRunnable(name, self.calls) for name in ("first", "second")]
+        for runnable in runnables:
+            runnable.set_scheduler(self.scheduler)
+            runnable.start()
+        loop_task = self.scheduler._loop_task
+
+        await asyncio.sleep(0.07)
+
+        self.assertIs(loop_task, self.scheduler._loop_task)
+        self.assertEqual(["first.on_start", "first.control_task", "second.on_start", "second.control_task",
+                          "first.control_task", "second.control_task"], self.calls)
+        self.assertEqual(2, self.scheduler.stats.ticks)
+
+    async def test_stopped_runnable_removed_after_on_stop(self):
+        runnables = [RecordingRunnable(name, self.calls) for name in ("first", "second")]
+        for runnable in runnables:
+            runnable.set_scheduler(self.scheduler)
+            runnable.start()
+        await asyncio.sleep(0.01)
+
+        runnables[0].stop()
+        await asyncio.sleep(0.05)
+
+        self.assertIn("first.on_stop", self.calls)
+        self.assertEqual([runnables[1]], self.scheduler.runnables)
+
+        runnables[1].stop()
+        await asyncio.sleep(0.06)
+
+        self.assertEqual([], self.scheduler.runnables)
+        self.assertTrue(self.scheduler._loop_task.done())
+
+    async def test_slow_task_reported_once_per_interval(self):
+        runnable = RecordingRunnable("slow", self.calls, task_time=0.02)
+        runnable.set_scheduler(self.scheduler)
+        runnable.start()
+
+        await asyncio.sleep(0.12)
+
+        self.assertGreaterEqual(self.scheduler.stats.slow_tasks, 2)
+        self.assertGreaterEqual(self.scheduler.stats.max_tick_duration, 0.02)
+        warnings = [record for record in self.log_records
+                    if record.levelname == "WARNING" and "RecordingRunnable control task took" in record.getMessage()]
+        self.assertEqual(1, len(warnings))
+
+    async def test_task_exception_logged_and_other_runnables_keep_running(self):
+        failing = RecordingRunnable("failing", self.calls)
+        other = RecordingRunnable("other", self.calls)
+
+        async def raise_exception():
+            raise Exception("Test")
+
+        failing.control_task = raise_exception
+        for runnable in (failing, other):
+            runnable.set_scheduler(self.scheduler)
+            runnable.start()
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertIn("other.control_task", self.calls)
+
+    async def test_tick_runs_in_the_tick_context(self):
+        @contextmanager
+        def tick_context():
+            self.calls.append("enter")
+            yield
+            self.calls.append("exit")
+
+        self.scheduler.tick_context = tick_context
+        for name in ("first", "second"):
+            runnable = RecordingRunnable(name, self.calls)
+            runnable.set_scheduler(self.scheduler)
+            runnable.start()
+
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(["enter", "first.on_start", "first.control_task", "second.on_start", "second.control_task",
+                          "exit"], self.calls)
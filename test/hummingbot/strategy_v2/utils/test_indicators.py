@@ -0,0 +1,248 @@
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.utils.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    NATR,
+    RSI,
+    SMA,
+    BollingerBands,
+    CandlesIndicators,
+    SuperTrend,
+)
+
+try:
+    import pandas_ta
+except ImportError:
+    pandas_ta = None
+
+
+# Vectorized calculations of the pandas_ta (0.3.14b) indicators, used as reference
+
+def non_zero_range(high: pd.Series, low: pd.Series) -> pd.Series:
+    difference = high - low
+    if difference.eq(0).any():
+        difference += sys.float_info.epsilon
+    return difference
+
+
+def ema(close: pd.Series, length: int) -> pd.Series:
+    close = close.copy()
+    sma_nth = close[0:length].mean()
+    close[:length - 1] = np.nan
+    close.iloc[length - 1] = sma_nth
+    return close.ewm(span=length, adjust=False).mean()
+
+
+def rma(close: pd.Series, length: int) -> pd.Series:
+    return close.ewm(alpha=1 / length, min_periods=length).mean()
+
+
+def true_range(candles: pd.DataFrame) -> pd.Series:
+    previous_close = candles["close"].shift(1)
+    ranges = pd.concat([non_zero_range(candles["high"], candles["low"]), candles["high"] - previous_close,
+                        previous_close - candles["low"]], axis=1)
+    result = ranges.abs().max(axis=1)
+    result.iloc[:1] = np.nan
+    return result
+
+
+def macd(close: pd.Series, fast: int, slow: int, signal: int) -> pd.DataFrame:
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(macd_line.loc[macd_line.first_valid_index():], signal)
+    return pd.DataFrame({"MACD": macd_line, "MACDh": macd_line - signal_line, "MACDs": signal_line})
+
+
+def bbands(close: pd.Series, length: int, std: float) -> pd.DataFrame:
+    mid = close.rolling(length).mean()
+    deviations = std * close.rolling(length).var(0).apply(np.sqrt)
+    lower, upper = mid - deviations, mid + deviations
+    upper_lower_range = non_zero_range(upper, lower)
+    return pd.DataFrame({"BBL": lower, "BBM": mid, "BBU": upper, "BBB": 100 * upper_lower_range / mid,
+                         "BBP": non_zero_range(close, lower) / upper_lower_range})
+
+
+def rsi(close: pd.Series, length: int) -> pd.Series:
+    negative = close.diff(1)
+    positive = negative.copy()
+    positive[positive < 0] = 0
+    negative[negative > 0] = 0
+    positive_average = rma(positive, length)
+    return 100 * positive_average / (positive_average + rma(negative, length).abs())
+
+
+def supertrend(candles: pd.DataFrame, length: int, multiplier: float) -> pd.DataFrame:
+    close = candles["close"]
+    m = close.size
+    direction, trend = [1] * m, [0] * m
+    long, short = [np.nan] * m, [np.nan] * m
+    hl2 = 0.5 * (candles["high"] + candles["low"])
+    matr = multiplier * rma(true_range(candles), length)
+    upper_band = hl2 + matr
+    lower_band = hl2 - matr
+    for i in range(1, m):
+        if close.iloc[i] > upper_band.iloc[i - 1]:
+            direction[i] = 1
+        elif close.iloc[i] < lower_band.iloc[i - 1]:
+            direction[i] = -1
+        else:
+            direction[i] = direction[i - 1]
+            if direction[i] > 0 and lower_band.iloc[i] < lower_band.iloc[i - 1]:
+                lower_band.iloc[i] = lower_band.iloc[i - 1]
+            if direction[i] < 0 and upper_band.iloc[i] > upper_band.iloc[i - 1]:
+                upper_band.iloc[i] = upper_band.iloc[i - 1]
+        if direction[i] > 0:
+            trend[i] = long[i] = lower_band.iloc[i]
+        else:
+            trend[i] = short[i] = upper_band.iloc[i]
+    return pd.DataFrame({"SUPERT": trend, "SUPERTd": direction, "SUPERTl": long, "SUPERTs": short},
+                        index=close.index, dtype=float)
+
+
+def reference_indicators(candles: pd.DataFrame) -> pd.DataFrame:
+    close = candles["close"]
+    return pd.concat([
+        ema(true_range(candles), 14).mul(100 / close).rename("NATR_14"),
+        rma(true_range(candles), 10).rename("ATRr_10"),
+        macd(close, 12, 26, 9).add_suffix("_12_26_9"),
+        bbands(close, 20, 2.0).add_suffix("_20_2.0"),
+        rsi(close, 14).rename("RSI_14"),
+        supertrend(candles, 10, 3.0).add_suffix("_10_3.0"),
+        close.rolling(5).mean().rename("SMA_5"),
+        ema(close, 5).rename("EMA_5"),
+    ], axis=1)
+
+
+def build_indicators(pandas_ta_compatible: bool = False) -> CandlesIndicators:
+    return CandlesIndicators([NATR(length=14), ATR(length=10), MACD(fast=12, slow=26, signal=9),
+                              BollingerBands(length=20, std=2), RSI(length=14), SuperTrend(length=10, multiplier=3),
+                              SMA(length=5), EMA(length=5)],
+                             pandas_ta_compatible=pandas_ta_compatible)
+
+
+def build_candles(size: int, seed: int = 0) -> pd.DataFrame:
+    random = np.random.default_rng(seed)
+    close = 100 + np.cumsum(random.normal(0, 1, size))
+    high = close + random.random(size)
+    low = close - random.random(size)
+    # Candles without trades, with the same close
+    high[100:130] = low[100:130] = close[100:130] = close[100]
+    return pd.DataFrame({"timestamp": np.arange(size) * 60.0, "open": close, "high": high, "low": low,
+                         "close": close, "volume": 1.0})
+
+
+class IndicatorsTest(unittest.TestCase):
+    def assert_indicators_equal(self, expected: pd.DataFrame, result: pd.DataFrame):
+        pd.testing.assert_frame_equal(expected, result[expected.columns], check_names=False, rtol=1e-9)
+
+    def test_columns_are_named_like_pandas_ta(self):
+        self.assertEqual(["NATR_14", "ATRr_10", "MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9", "BBL_20_2.0",
+                          "BBM_20_2.0", "BBU_20_2.0", "BBB_20_2.0", "BBP_20_2.0", "RSI_14", "SUPERT_10_3.0",
+                          "SUPERTd_10_3.0", "SUPERTl_10_3.0", "SUPERTs_10_3.0", "SMA_5", "EMA_5"],
+                         build_indicators().columns)
+        self.assertEqual(["MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"], MACD(fast=26, slow=12).columns)
+
+    def test_indicators_match_the_pandas_ta_calculations(self):
+        candles = build_candles(1000)
+
+        result = build_indicators().update(candles)
+
+        self.assertEqual(list(candles.columns) + build_indicators().columns, list(result.columns))
+        pd.testing.assert_frame_equal(candles, result[candles.columns])
+        self.assert_indicators_equal(reference_indicators(candles), result)
+
+    def test_candles_are_fed_incrementally(self):
+        candles = build_candles(600)
+        expected = reference_indicators(candles)
+        indicators = build_indicators()
+        indicators.update(candles.iloc[:100])
+
+        for end in range(101, 600):
+            # The last candle is updated several times before the next one starts
+            in_progress_candle = candles.iloc[end - 100:end].copy()
+            in_progress_candle.iloc[-1, 1:5] = in_progress_candle.iloc[-2]["close"]
+            indicators.update(in_progress_candle)
+            result = indicators.update(candles.iloc[end - 100:end])
+
+            self.assert_indicators_equal(expected.iloc[end - 100:end], result)
+
+    def test_several_new_candles_and_missing_candles(self):
+        candles = build_candles(300)
+        expected = reference_indicators(candles)
+        indicators = build_indicators()
+        indicators.update(candles.iloc[:50])
+
+        result = indicators.update(candles.iloc[20:80])
+        self.assert_indicators_equal(expected.iloc[20:80], result)
+
+        # The values are kept for as many candles as the longest DataFrame, the older candles have no values
+        result = indicators.update(candles.iloc[[10, 70, 79]])
+        self.assertTrue(np.isnan(result["RSI_14"].iloc[0]))
+        self.assert_indicators_equal(expected.iloc[[70, 79]], result.iloc[1:])
+
+    def test_older_candles_restart_the_indicators(self):
+        candles = build_candles(300)
+        indicators = build_indicators()
+        indicators.update(candles.iloc[200:])
+
+        result = indicators.update(candles)
+
+        self.assert_indicators_equal(reference_indicators(candles), result)
+
+    def test_pandas_ta_compatible_mode_recalculates_over_the_candles(self):
+        candles = build_candles(600)
+        incremental_indicators = build_indicators()
+        compatible_indicators = build_indicators(pandas_ta_compatible=True)
+        incremental_indicators.update(candles.iloc[:300])
+
+        window = candles.iloc[200:400]
+        incremental_result = incremental_indicators.update(window)
+        compatible_result = compatible_indicators.update(window)
+
+        self.assert_indicators_equal(reference_indicators(window), compatible_result)
+        # The rolling indicators only depend on the last candles, the exponential averages depend on the first one
+        pd.testing.assert_series_equal(compatible_result["BBP_20_2.0"].iloc[19:],
+                                       incremental_result["BBP_20_2.0"].iloc[19:], rtol=1e-9)
+        self.assertFalse(np.allclose(compatible_result["MACD_12_26_9"].iloc[-1],
+                                     incremental_result["MACD_12_26_9"].iloc[-1], rtol=1e-9))
+
+    def test_indicator_values(self):
+        indicator = SMA(length=2)
+
+        self.assertTrue(np.isnan(indicator.update_candle(0, 1, 1, 1)).all())
+        self.assertEqual((1.5,), indicator.update_candle(60, 2, 2, 2))
+        self.assertEqual((2.0,), indicator.update_candle(60, 3, 3, 3))
+        self.assertEqual((3.5,), indicator.update_candle(120, 4, 4, 4))
+        self.assertEqual((3.5,), indicator.values)
+        with self.assertRaises(ValueError):
+            indicator.update_candle(60, 1, 1, 1)
+
+        indicator.reset()
+
+        self.assertTrue(np.isnan(indicator.update_candle(60, 1, 1, 1)).all())
+
+    def test_empty_candles(self):
+        result = build_indicators().update(build_candles(200).iloc[:0])
+
+        self.assertTrue(result.empty)
+        self.assertIn("RSI_14", result.columns)
+
+    @unittest.skipIf(pandas_ta is None, "pandas_ta is not installed")
+    def test_pandas_ta_compatible_mode_matches_pandas_ta(self):
+        candles = build_candles(500)
+
+        result = build_indicators(pandas_ta_compatible=True).update(candles)
+
+        expected = pd.concat([
+            pandas_ta.natr(candles["high"], candles["low"], candles["close"], length=14, talib=False),
+            pandas_ta.macd(candles["close"], fast=12, slow=26, signal=9, talib=False),
+            pandas_ta.bbands(candles["close"], length=20, std=2, talib=False),
+            pandas_ta.rsi(candles["close"], length=14, talib=False),
+            pandas_ta.supertrend(candles["high"], candles["low"], candles["close"], length=10, multiplier=3),
+        ], axis=1)
+        pd.testing.assert_frame_equal(expected, result[expected.columns], check_dtype=False, rtol=1e-6)